@@ -0,0 +1 @@
+"""Offline performance benchmarks for Nebulus Atom and Nebulus Swarm."""
@@ -0,0 +1,546 @@
+"""Import-time and cold-start benchmarks.
+
+Every measurement runs in a fresh interpreter so it includes the full
+import cost a user, the Overlord or a minion container pays:
+
+- ``import:<module>``: ``-X importtime`` cumulative time of the entry module
+- ``cli:<command>``: typer CLI start to exit
+- ``overlord:ready``: process start until ``/health`` answers
+- ``minion:first-llm-call``: process start until the first chat
+  completion request reaches a local stub LLM server
+
+Nothing touches the network beyond localhost. Medians are compared with
+the stored baselines; a benchmark regresses when it is both ``threshold``
+slower relatively and ``min_delta`` seconds slower absolutely.
+
+Usage:
+    python -m benchmarks.startup                    # run and compare
+    python -m benchmarks.startup --update-baseline  # record new baselines
+    python -m benchmarks.startup --only import --runs 3
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines.json"
+
+DEFAULT_RUNS = 5
+DEFAULT_THRESHOLD = 0.25  # 25% slower than baseline
+DEFAULT_MIN_DELTA = 0.1  # ...and at least 100ms slower
+READY_TIMEOUT = 60.0
+
+IMPORT_MODULES = (
+    "nebulus_atom.main",
+    "nebulus_swarm.overlord.main",
+    "nebulus_swarm.minion.main",
+)
+
+CLI_COMMANDS = (
+    ("--help",),
+    ("overlord", "status"),
+    ("mirror", "status"),
+)
+
+_CLI_RUNNER = """
+import sys
+from nebulus_atom.main import app
+sys.argv = ["atom", *sys.argv[1:]]
+app()
+"""
+
+_OVERLORD_RUNNER = """
+import asyncio
+from nebulus_swarm.config import SwarmConfig
+from nebulus_swarm.overlord.main import Overlord
+
+async def serve():
+    overlord = Overlord(SwarmConfig.from_env(), stub_mode=True)
+    await overlord._setup_health_server()
+    await asyncio.Event().wait()
+
+asyncio.run(serve())
+"""
+
+# Mirrors Minion._do_work up to the agent's first LLM request
+_MINION_RUNNER = """
+import asyncio
+from pathlib import Path
+from nebulus_swarm.minion.main import MinionConfig
+from nebulus_swarm.minion.agent import LLMConfig, MinionAgent, ToolExecutor, MINION_TOOLS
+from nebulus_swarm.minion.agent.prompt_builder import IssueContext, build_system_prompt
+
+config = MinionConfig.from_env()
+prompt = build_system_prompt(
+    IssueContext(
+        repo="bench/repo", number=1, title="Benchmark", body="Say done.",
+        labels=[], author="bench",
+    )
+)
+executor = ToolExecutor(workspace=Path.cwd())
+agent = MinionAgent(
+    llm_config=LLMConfig(
+        base_url=config.nebulus_base_url, model=config.nebulus_model, timeout=30
+    ),
+    system_prompt=prompt,
+    tools=MINION_TOOLS,
+    tool_executor=lambda name, args: executor.execute(name, args),
+    turn_limit=1,
+)
+asyncio.run(agent.run_async())
+"""
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class BenchResult:
+    """Samples for one benchmark."""
+
+    name: str
+    samples: List[float] = field(default_factory=list)
+
+    @property
+    def median(self) -> float:
+        """Median of the samples in seconds."""
+        return statistics.median(self.samples)
+
+
+@dataclass
+class Regression:
+    """A benchmark slower than its baseline beyond the threshold."""
+
+    name: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.current:.3f}s vs baseline {self.baseline:.3f}s "
+            f"(+{self.current - self.baseline:.3f}s)"
+        )
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """Parse ``python -X importtime`` output.
+
+    Args:
+        stderr: Captured stderr of the interpreter.
+
+    Returns:
+        Records in output order; depth 0 is a top-level import.
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:") :].split("|", 2)
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip(" ")
+        records.append(
+            ImportRecord(
+                name=stripped,
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return records
+
+
+def find_regressions(
+    results: Dict[str, float],
+    baselines: Dict[str, float],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta: float = DEFAULT_MIN_DELTA,
+) -> List[Regression]:
+    """Compare medians against baselines.
+
+    Benchmarks without a baseline are not judged.
+
+    Args:
+        results: Benchmark name to median seconds.
+        baselines: Benchmark name to baseline seconds.
+        threshold: Allowed relative slowdown.
+        min_delta: Slowdowns below this many seconds are noise.
+
+    Returns:
+        Regressions, in result order.
+    """
+    regressions = []
+    for name, current in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        if current > baseline * (1 + threshold) and current - baseline > min_delta:
+            regressions.append(Regression(name, baseline, current))
+    return regressions
+
+
+def load_baselines(path: Path = BASELINE_PATH) -> Dict[str, float]:
+    """Load stored baselines, or an empty mapping if there are none."""
+    try:
+        with open(path) as f:
+            return json.load(f).get("baselines", {})
+    except FileNotFoundError:
+        return {}
+
+
+def save_baselines(results: Dict[str, float], path: Path = BASELINE_PATH) -> None:
+    """Store medians as the new baselines, keeping unmeasured entries."""
+    baselines = load_baselines(path)
+    baselines.update({name: round(value, 4) for name, value in results.items()})
+    payload = {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "baselines": dict(sorted(baselines.items())),
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+        f.write("\n")
+
+
+def _env(home: Path, **extra: str) -> Dict[str, str]:
+    """Environment for a benchmark child: repo importable, private HOME."""
+    env = dict(os.environ, HOME=str(home), PYTHONPATH=str(REPO_ROOT))
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    env.update(extra)
+    return env
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_import(module: str, home: Path, output_dir: Optional[Path] = None) -> float:
+    """Time importing a module, saving its import tree if asked.
+
+    Returns:
+        Cumulative import time of the module in seconds.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=home,
+        env=_env(home),
+        timeout=READY_TIMEOUT,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    records = parse_importtime(proc.stderr)
+    top = [r for r in records if r.name == module and r.depth == 0]
+    if not top:
+        raise RuntimeError(f"No importtime record for {module}")
+    if output_dir is not None:
+        (output_dir / f"importtime-{module}.txt").write_text(proc.stderr)
+    return top[-1].cumulative_us / 1e6
+
+
+def measure_cli(args: tuple, home: Path) -> float:
+    """Time an atom CLI command from interpreter start to exit."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", _CLI_RUNNER, *args],
+        capture_output=True,
+        text=True,
+        cwd=home,
+        env=_env(home),
+        timeout=READY_TIMEOUT,
+    )
+    elapsed = time.perf_counter() - start
+    if "Traceback" in proc.stderr:
+        raise RuntimeError(f"atom {' '.join(args)} crashed:\n{proc.stderr[-2000:]}")
+    return elapsed
+
+
+def measure_overlord_ready(home: Path) -> float:
+    """Time from Overlord process start until its health endpoint answers.
+
+    The Overlord runs in stub mode with placeholder Slack tokens; only the
+    health server is started, so no external service is contacted.
+    """
+    port = _free_port()
+    env = _env(
+        home,
+        OVERLORD_HEALTH_PORT=str(port),
+        OVERLORD_STATE_DB=str(home / "state.db"),
+        SLACK_BOT_TOKEN="xoxb-benchmark",
+        SLACK_APP_TOKEN="xapp-benchmark",
+        LOG_LEVEL="WARNING",
+    )
+    url = f"http://127.0.0.1:{port}/health"
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", _OVERLORD_RUNNER],
+        cwd=home,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        while time.perf_counter() - start < READY_TIMEOUT:
+            if proc.poll() is not None:
+                raise RuntimeError(
+                    f"Overlord exited early:\n{proc.stderr.read().decode()[-2000:]}"
+                )
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError, OSError):
+                time.sleep(0.005)
+        raise TimeoutError(f"Overlord not ready after {READY_TIMEOUT}s")
+    finally:
+        proc.kill()
+        proc.wait()
+        proc.stderr.close()
+
+
+class StubLLMServer:
+    """Local OpenAI-compatible server that completes every task at once.
+
+    Records when the first chat completion request arrives.
+    """
+
+    def __init__(self):
+        self.first_request = threading.Event()
+        self.first_request_at: Optional[float] = None
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):  # noqa: N802 - http.server hook
+                if stub.first_request_at is None:
+                    stub.first_request_at = time.perf_counter()
+                    stub.first_request.set()
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                body = json.dumps(stub.completion()).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI base URL of the stub."""
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+
+    @staticmethod
+    def completion() -> dict:
+        """A chat completion calling task_complete."""
+        return {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": "bench",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "tool_calls",
+                    "message": {
+                        "role": "assistant",
+                        "content": None,
+                        "tool_calls": [
+                            {
+                                "id": "call_bench",
+                                "type": "function",
+                                "function": {
+                                    "name": "task_complete",
+                                    "arguments": json.dumps({"summary": "done"}),
+                                },
+                            }
+                        ],
+                    },
+                }
+            ],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+
+    def reset(self) -> None:
+        """Forget the previous request before the next run."""
+        self.first_request.clear()
+        self.first_request_at = None
+
+    def __enter__(self) -> "StubLLMServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def measure_minion_first_llm_call(home: Path, stub: StubLLMServer) -> float:
+    """Time from minion process start until its first LLM request lands."""
+    stub.reset()
+    env = _env(
+        home,
+        NEBULUS_BASE_URL=stub.base_url,
+        NEBULUS_MODEL="bench",
+        OPENAI_API_KEY="not-needed",
+        LOG_LEVEL="WARNING",
+    )
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", _MINION_RUNNER],
+        cwd=home,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        while not stub.first_request.wait(0.01):
+            if proc.poll() is not None:
+                raise RuntimeError(
+                    "Minion exited before calling the LLM:\n"
+                    f"{proc.stderr.read().decode()[-2000:]}"
+                )
+            if time.perf_counter() - start > READY_TIMEOUT:
+                proc.kill()
+                raise TimeoutError(f"No LLM request after {READY_TIMEOUT}s")
+        return stub.first_request_at - start
+    finally:
+        if proc.poll() is None:
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        proc.stderr.close()
+
+
+def run_benchmarks(
+    runs: int = DEFAULT_RUNS,
+    only: Optional[List[str]] = None,
+    output_dir: Optional[Path] = None,
+) -> List[BenchResult]:
+    """Run the suite.
+
+    Args:
+        runs: Samples per benchmark; the median is reported.
+        only: Optional name prefixes to select benchmarks.
+        output_dir: Where to write import trees; not written if None.
+
+    Returns:
+        One result per selected benchmark.
+    """
+    with tempfile.TemporaryDirectory(prefix="nebulus-bench-") as tmp:
+        home = Path(tmp)
+        benches: Dict[str, Callable[[], float]] = {}
+        for module in IMPORT_MODULES:
+            benches[f"import:{module}"] = lambda m=module: measure_import(
+                m, home, output_dir
+            )
+        for args in CLI_COMMANDS:
+            benches[f"cli:{' '.join(args)}"] = lambda a=args: measure_cli(a, home)
+        benches["overlord:ready"] = lambda: measure_overlord_ready(home)
+
+        stub = StubLLMServer()
+        benches["minion:first-llm-call"] = lambda: measure_minion_first_llm_call(
+            home, stub
+        )
+
+        selected = {
+            name: bench
+            for name, bench in benches.items()
+            if not only or any(name.startswith(prefix) for prefix in only)
+        }
+        results = []
+        with stub:
+            for name, bench in selected.items():
+                result = BenchResult(name)
+                for _ in range(runs):
+                    result.samples.append(bench())
+                results.append(result)
+        return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point. Returns 1 if any benchmark regressed."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument(
+        "--only", nargs="*", help="Benchmark name prefixes, e.g. import cli"
+    )
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Directory for results.json and importtime trees",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store these medians as the new baselines",
+    )
+    args = parser.parse_args(argv)
+
+    if args.output is not None:
+        args.output.mkdir(parents=True, exist_ok=True)
+    results = run_benchmarks(args.runs, args.only, args.output)
+    medians = {result.name: result.median for result in results}
+    baselines = load_baselines(args.baseline)
+
+    width = max(len(name) for name in medians)
+    for result in results:
+        baseline = baselines.get(result.name)
+        compared = f"  baseline {baseline:.3f}s" if baseline is not None else ""
+        print(
+            f"{result.name:<{width}}  {result.median:.3f}s  "
+            f"(min {min(result.samples):.3f}s){compared}"
+        )
+
+    if args.output is not None:
+        with open(args.output / "results.json", "w") as f:
+            json.dump([asdict(result) for result in results], f, indent=2)
+
+    if args.update_baseline:
+        save_baselines(medians, args.baseline)
+        print(f"Baselines written to {args.baseline}")
+        return 0
+
+    regressions = find_regressions(medians, baselines, args.threshold, args.min_delta)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,6 @@ from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.markdown import Markdown
 
 focus_app = typer.Typer(help="Ecosystem-aware queries with business context.")
 
@@ -86,6 +85,8 @@ def focus_query(
         )
 
         if result.success:
+            from rich.markdown import Markdown
+
             console.print()
             console.print(Markdown(result.output))
         else:
@@ -100,6 +101,8 @@ def focus_show() -> None:
     """Display parsed ecosystem context."""
     from pathlib import Path
 
+    from rich.markdown import Markdown
+
     from nebulus_swarm.overlord.focus import build_focus_context
     from nebulus_swarm.overlord.registry import load_config
 
@@ -159,6 +159,14 @@ def queue_sync(
     token_budget: Optional[int] = typer.Option(
         None, "--token-budget", help="Default token budget for synced tasks"
     ),
+    concurrency: int = typer.Option(
+        4, "--concurrency", "-j", help="Projects fetched in parallel"
+    ),
+    reconcile: bool = typer.Option(
+        True,
+        "--reconcile/--no-reconcile",
+        help="Fail backlog tasks whose issue was closed or unlabeled",
+    ),
 ) -> None:
     """Sync GitHub issues into the work queue."""
     from nebulus_swarm.overlord.queue_sync import sync_github_issues
@@ -180,12 +188,16 @@ def queue_sync(
         label=label,
         project_filter=project,
         token_budget=token_budget,
+        concurrency=concurrency,
+        reconcile=reconcile,
     )
 
     console.print(
         f"[green]Sync complete:[/green] "
         f"{result.new_count} new, "
         f"{result.updated_count} updated, "
+        f"{result.closed_count} closed, "
+        f"{result.reopened_count} reopened, "
         f"{result.skipped_count} skipped"
     )
     if result.errors:
@@ -2,8 +2,6 @@ import os
 import asyncio
 import typer
 from typing import List, Optional
-from nebulus_atom.services.doc_service import DocService
-from rich.markdown import Markdown
 from rich.console import Console
 
 # Silence HuggingFace warnings
@@ -26,11 +24,29 @@ mirror_app = typer.Typer(help="Manage bare-clone mirrors of ecosystem repos.")
 app.add_typer(mirror_app, name="mirror")
 
 
+def _format_bytes(num: int) -> str:
+    """Render a byte count for the mirror tables."""
+    size = float(num)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
 @mirror_app.command("init")
 def mirror_init(
     project: Optional[str] = typer.Option(
         None, "--project", "-p", help="Init a single project mirror"
     ),
+    concurrency: Optional[int] = typer.Option(
+        None, "--concurrency", "-j", help="Maximum parallel clones"
+    ),
+    filter_blobs: Optional[bool] = typer.Option(
+        None,
+        "--filter-blobs/--no-filter-blobs",
+        help="Create blobless partial clones (--filter=blob:none)",
+    ),
 ) -> None:
     """Initialize bare-clone mirrors for ecosystem repos."""
     from nebulus_swarm.overlord.mirrors import MirrorManager
@@ -47,6 +63,11 @@ def mirror_init(
         console.print("[yellow]No projects registered.[/yellow]")
         return
 
+    if concurrency is not None:
+        config.mirrors.concurrency = max(1, concurrency)
+    if filter_blobs is not None:
+        config.mirrors.filter_blobs = filter_blobs
+
     mgr = MirrorManager(config)
 
     if project:
@@ -68,6 +89,20 @@ def mirror_sync(
     project: Optional[str] = typer.Option(
         None, "--project", "-p", help="Sync a single project mirror"
     ),
+    concurrency: Optional[int] = typer.Option(
+        None, "--concurrency", "-j", help="Maximum parallel fetches"
+    ),
+    timeout: Optional[int] = typer.Option(
+        None, "--timeout", help="Per-project fetch timeout in seconds"
+    ),
+    prune: Optional[bool] = typer.Option(
+        None, "--prune/--no-prune", help="Prune deleted remote refs"
+    ),
+    filter_blobs: Optional[bool] = typer.Option(
+        None,
+        "--filter-blobs/--no-filter-blobs",
+        help="Fetch with --filter=blob:none on partial clones",
+    ),
 ) -> None:
     """Fetch updates for ecosystem mirror clones."""
     from nebulus_swarm.overlord.mirrors import MirrorManager
@@ -84,20 +119,32 @@ def mirror_sync(
         console.print("[yellow]No projects registered.[/yellow]")
         return
 
+    if concurrency is not None:
+        config.mirrors.concurrency = max(1, concurrency)
+    if timeout is not None:
+        config.mirrors.timeout_seconds = timeout
+    if prune is not None:
+        config.mirrors.prune = prune
+    if filter_blobs is not None:
+        config.mirrors.filter_blobs = filter_blobs
+
     mgr = MirrorManager(config)
 
     if project:
         if project not in config.projects:
             console.print(f"[red]Unknown project: {project}[/red]")
             return
-        ok = mgr.sync_project(project)
-        status = "[green]done[/green]" if ok else "[red]failed[/red]"
-        console.print(f"Mirror sync {project}: {status}")
+        results = {project: mgr.sync_project_detailed(project)}
     else:
-        results = mgr.sync_all()
-        for name, ok in results.items():
-            status = "[green]done[/green]" if ok else "[red]failed[/red]"
-            console.print(f"  {name}: {status}")
+        results = mgr.sync_all_detailed()
+
+    for name, result in results.items():
+        status = "[green]done[/green]" if result.success else "[red]failed[/red]"
+        console.print(
+            f"  {name}: {status} "
+            f"[dim]({result.duration_seconds:.1f}s, "
+            f"{_format_bytes(result.bytes_fetched)})[/dim]"
+        )
 
 
 @mirror_app.command("status")
@@ -127,6 +174,8 @@ def mirror_status() -> None:
     table.add_column("Exists")
     table.add_column("Last Fetch")
     table.add_column("Refs")
+    table.add_column("Last Sync")
+    table.add_column("Fetched")
 
     for name, state in states.items():
         if state.exists:
@@ -137,11 +186,23 @@ def mirror_status() -> None:
                 else "[dim]unknown[/dim]"
             )
             refs_str = str(state.ref_count)
+            if state.last_sync_seconds is None:
+                sync_str = "[dim]-[/dim]"
+            else:
+                color = "green" if state.last_sync_ok else "red"
+                sync_str = f"[{color}]{state.last_sync_seconds:.1f}s[/{color}]"
+            fetched_str = (
+                _format_bytes(state.last_bytes_fetched)
+                if state.last_bytes_fetched is not None
+                else "-"
+            )
         else:
             exists_str = "[red]no[/red]"
             fetch_str = "-"
             refs_str = "-"
-        table.add_row(name, exists_str, fetch_str, refs_str)
+            sync_str = "-"
+            fetched_str = "-"
+        table.add_row(name, exists_str, fetch_str, refs_str, sync_str, fetched_str)
 
     console.print(table)
 
@@ -190,6 +251,10 @@ def docs(
     """
     Access embedded documentation.
     """
+    from rich.markdown import Markdown
+
+    from nebulus_atom.services.doc_service import DocService
+
     service = DocService()
     console = Console()
 
@@ -352,6 +417,12 @@ def audit(
     output: Optional[str] = typer.Option(
         None, "--output", "-o", help="Output file for export"
     ),
+    full: bool = typer.Option(
+        False, "--full", help="Verify from genesis instead of the last checkpoint"
+    ),
+    workers: int = typer.Option(
+        os.cpu_count() or 1, "--workers", "-w", help="Processes hashing blocks"
+    ),
 ):
     """
     Manage the audit trail for compliance.
@@ -373,7 +444,7 @@ def audit(
     trail = AuditTrail(str(db_path), signing_key)
 
     if action == "verify":
-        is_valid, issues = trail.verify_integrity()
+        is_valid, issues = trail.verify_integrity(full=full, workers=workers)
         if is_valid:
             console.print("[green]Audit trail integrity verified.[/green]")
         else:
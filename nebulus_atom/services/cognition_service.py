@@ -5,7 +5,9 @@ Provides deliberate reasoning, task analysis, and self-critique capabilities
 for more reliable handling of complex tasks.
 """
 
+import dataclasses
 import re
+from collections import OrderedDict
 from typing import List, Optional, Tuple
 
 from nebulus_atom.models.cognition import (
@@ -115,6 +117,26 @@ MULTI_STEP_INDICATORS = [
     "including",
 ]
 
+# A file path or a quoted identifier makes a request specific
+SPECIFIC_DETAIL_PATTERN = re.compile(r'[/\\][\w.-]+|`[\w_]+`|"[\w_]+"')
+
+# Number of analyses memoized per service
+ANALYSIS_CACHE_SIZE = 256
+
+
+@dataclasses.dataclass
+class _TaskAnalysis:
+    """The input-dependent part of a CognitionResult, as memoized."""
+
+    complexity: TaskComplexity
+    ambiguity_score: float
+    clarification_needed: bool
+    clarifications: Tuple[ClarificationQuestion, ...]
+    estimated_steps: int
+    risks: Tuple[str, ...]
+    confidence: float
+    approach: str
+
 
 class CognitionService:
     """
@@ -127,6 +149,7 @@ class CognitionService:
     def __init__(self) -> None:
         """Initialize the cognition service."""
         self._thought_history: List[ThoughtRecord] = []
+        self._analysis_cache: "OrderedDict[tuple, _TaskAnalysis]" = OrderedDict()
 
     def analyze_task(
         self,
@@ -150,6 +173,54 @@ class CognitionService:
         # Normalize input
         input_lower = user_input.lower().strip()
 
+        # Analyses depend only on the normalized input and on the failure
+        # context's warnings and penalty
+        cache_key = (
+            input_lower,
+            tuple(failure_context.warning_messages) if failure_context else (),
+            failure_context.total_penalty if failure_context else 0.0,
+        )
+        analysis = self._analysis_cache.get(cache_key)
+        if analysis is None:
+            analysis = self._analyze(input_lower, failure_context)
+            self._analysis_cache[cache_key] = analysis
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        else:
+            self._analysis_cache.move_to_end(cache_key)
+
+        # Generate reasoning chain based on complexity; it quotes the input
+        # as given, so it is not memoized
+        reasoning_chain = self._generate_reasoning(
+            user_input, analysis.complexity, analysis.ambiguity_score
+        )
+
+        result = CognitionResult(
+            task_complexity=analysis.complexity,
+            reasoning_chain=reasoning_chain,
+            recommended_approach=analysis.approach,
+            confidence=analysis.confidence,
+            clarification_needed=analysis.clarification_needed
+            and analysis.confidence < 0.7,
+            clarification_questions=[
+                ClarificationQuestion(q.question, list(q.options), q.importance)
+                for q in analysis.clarifications
+            ],
+            estimated_steps=analysis.estimated_steps,
+            potential_risks=list(analysis.risks),
+        )
+
+        logger.info(
+            f"Task analysis complete: complexity={analysis.complexity.value}, "
+            f"confidence={analysis.confidence:.2f}, steps={analysis.estimated_steps}"
+        )
+
+        return result
+
+    def _analyze(
+        self, input_lower: str, failure_context: Optional[FailureContext]
+    ) -> _TaskAnalysis:
+        """Run the input-dependent analysis stages."""
         # Classify complexity
         complexity = self._classify_complexity(input_lower)
 
@@ -159,11 +230,6 @@ class CognitionService:
         # Estimate steps
         estimated_steps = self._estimate_steps(input_lower, complexity)
 
-        # Generate reasoning chain based on complexity
-        reasoning_chain = self._generate_reasoning(
-            user_input, complexity, ambiguity_score
-        )
-
         # Identify potential risks
         risks = self._identify_risks(input_lower, complexity)
 
@@ -179,7 +245,7 @@ class CognitionService:
         clarifications = []
         if clarification_needed:
             clarifications = self._generate_clarifications(
-                user_input, complexity, ambiguous_phrases
+                input_lower, complexity, ambiguous_phrases
             )
 
         # Calculate overall confidence
@@ -191,35 +257,26 @@ class CognitionService:
         # Generate recommended approach
         approach = self._recommend_approach(complexity, estimated_steps, confidence)
 
-        result = CognitionResult(
-            task_complexity=complexity,
-            reasoning_chain=reasoning_chain,
-            recommended_approach=approach,
-            confidence=confidence,
-            clarification_needed=clarification_needed and confidence < 0.7,
-            clarification_questions=clarifications,
+        return _TaskAnalysis(
+            complexity=complexity,
+            ambiguity_score=ambiguity_score,
+            clarification_needed=clarification_needed,
+            clarifications=tuple(clarifications),
             estimated_steps=estimated_steps,
-            potential_risks=risks,
-        )
-
-        logger.info(
-            f"Task analysis complete: complexity={complexity.value}, "
-            f"confidence={confidence:.2f}, steps={estimated_steps}"
+            risks=tuple(risks),
+            confidence=confidence,
+            approach=approach,
         )
 
-        return result
-
     def _classify_complexity(self, input_lower: str) -> TaskComplexity:
         """Classify task complexity based on keywords and patterns."""
         # Check for high complexity indicators
-        for indicator in COMPLEXITY_INDICATORS["high"]:
-            if indicator in input_lower:
-                return TaskComplexity.COMPLEX
+        if any(map(input_lower.__contains__, COMPLEXITY_INDICATORS["high"])):
+            return TaskComplexity.COMPLEX
 
         # Check for medium complexity indicators
-        for indicator in COMPLEXITY_INDICATORS["medium"]:
-            if indicator in input_lower:
-                return TaskComplexity.MODERATE
+        if any(map(input_lower.__contains__, COMPLEXITY_INDICATORS["medium"])):
+            return TaskComplexity.MODERATE
 
         # Check for explicit low complexity indicators
         for indicator in COMPLEXITY_INDICATORS["low"]:
@@ -242,20 +299,13 @@ class CognitionService:
         Returns:
             Tuple of (ambiguity_score 0-1, list of ambiguous phrases found)
         """
-        found_indicators = []
-
-        for indicator in AMBIGUITY_INDICATORS:
-            if indicator in input_lower:
-                found_indicators.append(indicator)
+        found_indicators = list(filter(input_lower.__contains__, AMBIGUITY_INDICATORS))
 
         # Score based on number of indicators and input specificity
         base_score = min(len(found_indicators) * 0.15, 0.6)
 
         # Increase score if task lacks specific details
-        has_specific_path = bool(re.search(r"[/\\][\w.-]+", input_lower))
-        has_specific_name = bool(re.search(r'`[\w_]+`|"[\w_]+"', input_lower))
-
-        if not has_specific_path and not has_specific_name:
+        if not SPECIFIC_DETAIL_PATTERN.search(input_lower):
             base_score += 0.2
 
         return min(base_score, 1.0), found_indicators
@@ -270,9 +320,7 @@ class CognitionService:
         }[complexity]
 
         # Adjust for multi-step indicators
-        additional_steps = sum(
-            1 for indicator in MULTI_STEP_INDICATORS if indicator in input_lower
-        )
+        additional_steps = sum(map(input_lower.__contains__, MULTI_STEP_INDICATORS))
 
         return min(base_steps + additional_steps, 10)
 
@@ -1,6 +1,8 @@
 import os
-import docker
 from nebulus_atom.utils.logger import setup_logger
+from nebulus_swarm.lazy_import import lazy_import
+
+docker = lazy_import("docker")
 
 logger = setup_logger(__name__)
 
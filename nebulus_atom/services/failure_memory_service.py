@@ -3,15 +3,20 @@ Failure memory service for tracking tool errors and recognizing patterns.
 
 Persists tool failures in SQLite, classifies errors by type, tracks
 resolution rates, and feeds failure context into the cognition system.
+Per-pattern counts are kept in memory, and writes reach SQLite on a
+background thread, so building a context never touches the database.
 """
 
 import json
 import os
+import queue
 import re
 import sqlite3
+import threading
 import time
 import uuid
-from typing import List, Optional
+import weakref
+from typing import Dict, List, Optional, Tuple
 
 from nebulus_atom.models.failure_memory import (
     FailureContext,
@@ -37,16 +42,85 @@ _ERROR_CLASSIFIERS = [
 ]
 
 
+class _FailureWriter:
+    """Applies writes to the failures table on a background thread.
+
+    Statements run in submission order; whatever is queued when the thread
+    wakes up is committed as one transaction.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        """Initialize with SQLite database path."""
+        self.db_path = db_path
+        self._queue: "queue.Queue[Optional[Tuple[str, tuple]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, sql: str, params: tuple) -> None:
+        """Queue a statement, starting the writer thread if needed."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="failure-memory-writer", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((sql, params))
+
+    def flush(self) -> None:
+        """Block until every queued statement has been committed."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Commit queued statements and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _run(self) -> None:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            while True:
+                batch = [self._queue.get()]
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                statements = [item for item in batch if item is not None]
+                try:
+                    with conn:
+                        for sql, params in statements:
+                            conn.execute(sql, params)
+                except sqlite3.Error as e:
+                    logger.error(f"Failed to persist failure memory: {e}")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if len(statements) < len(batch):
+                    return
+        finally:
+            conn.close()
+
+
 class FailureMemoryService:
     """Tracks tool failures and builds pattern-based context for cognition."""
 
     def __init__(self, db_path: str = "nebulus_atom/data/failure_memory.db") -> None:
         """Initialize with SQLite database path."""
         self.db_path = db_path
+        # tool_name -> error_type -> [occurrences, resolved]
+        self._patterns: Dict[str, Dict[str, List[int]]] = {}
+        self._lock = threading.Lock()
         self._ensure_db()
+        self._writer = _FailureWriter(db_path)
+        # Commit pending writes when the service is collected or at exit
+        weakref.finalize(self, self._writer.close)
 
     def _ensure_db(self) -> None:
-        """Create the failures table if it doesn't exist."""
+        """Create the failures table if needed and load the pattern counts."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -65,9 +139,31 @@ class FailureMemoryService:
             )
             """
         )
+        # Covers the pattern aggregation and the latest-unresolved lookup
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_failures_pattern "
+            "ON failures(tool_name, error_type, resolved, timestamp)"
+        )
         conn.commit()
+        cursor.execute(
+            "SELECT tool_name, error_type, COUNT(*), SUM(resolved) "
+            "FROM failures GROUP BY tool_name, error_type"
+        )
+        for tool_name, error_type, count, resolved in cursor.fetchall():
+            self._patterns.setdefault(tool_name, {})[error_type] = [
+                count,
+                int(resolved or 0),
+            ]
         conn.close()
 
+    def flush(self) -> None:
+        """Block until all recorded changes are written to the database."""
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Write pending changes and stop the background writer."""
+        self._writer.close()
+
     def record_failure(
         self,
         session_id: str,
@@ -98,9 +194,13 @@ class FailureMemoryService:
             args_context=sanitized,
         )
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
+        with self._lock:
+            counts = self._patterns.setdefault(tool_name, {}).setdefault(
+                error_type, [0, 0]
+            )
+            counts[0] += 1
+
+        self._writer.submit(
             "INSERT INTO failures "
             "(id, session_id, timestamp, tool_name, error_type, error_message, args_context, recovery_attempted, resolved) "
             "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
@@ -116,8 +216,6 @@ class FailureMemoryService:
                 0,
             ),
         )
-        conn.commit()
-        conn.close()
 
         logger.info(
             f"Recorded failure: tool={tool_name}, type={error_type}, "
@@ -135,20 +233,22 @@ class FailureMemoryService:
         Returns:
             True if a row was updated, False otherwise.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE failures SET resolved = 1 "
-            "WHERE id = ("
-            "  SELECT id FROM failures "
-            "  WHERE tool_name = ? AND error_type = ? AND resolved = 0 "
-            "  ORDER BY timestamp DESC LIMIT 1"
-            ")",
-            (tool_name, error_type),
-        )
-        updated = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
+        with self._lock:
+            counts = self._patterns.get(tool_name, {}).get(error_type)
+            updated = counts is not None and counts[1] < counts[0]
+            if updated:
+                counts[1] += 1
+
+        if updated:
+            self._writer.submit(
+                "UPDATE failures SET resolved = 1 "
+                "WHERE id = ("
+                "  SELECT id FROM failures "
+                "  WHERE tool_name = ? AND error_type = ? AND resolved = 0 "
+                "  ORDER BY timestamp DESC LIMIT 1"
+                ")",
+                (tool_name, error_type),
+            )
 
         if updated:
             logger.debug(f"Marked resolved: tool={tool_name}, error_type={error_type}")
@@ -166,26 +266,14 @@ class FailureMemoryService:
         Returns:
             FailurePattern with counts.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        if error_type:
-            cursor.execute(
-                "SELECT COUNT(*), SUM(resolved) FROM failures "
-                "WHERE tool_name = ? AND error_type = ?",
-                (tool_name, error_type),
-            )
-        else:
-            cursor.execute(
-                "SELECT COUNT(*), SUM(resolved) FROM failures WHERE tool_name = ?",
-                (tool_name,),
-            )
-
-        row = cursor.fetchone()
-        conn.close()
+        with self._lock:
+            by_type = self._patterns.get(tool_name, {})
+            if error_type:
+                count, resolved = by_type.get(error_type, (0, 0))
+            else:
+                count = sum(counts[0] for counts in by_type.values())
+                resolved = sum(counts[1] for counts in by_type.values())
 
-        count = row[0] or 0
-        resolved = int(row[1] or 0)
         return FailurePattern(
             tool_name=tool_name,
             error_type=error_type or "all",
@@ -204,37 +292,25 @@ class FailureMemoryService:
         Returns:
             FailureContext with patterns and warnings.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        if tool_names:
-            placeholders = ",".join("?" for _ in tool_names)
-            cursor.execute(
-                f"SELECT tool_name, error_type, COUNT(*), SUM(resolved) "
-                f"FROM failures "
-                f"WHERE tool_name IN ({placeholders}) "
-                f"GROUP BY tool_name, error_type",
-                tool_names,
-            )
-        else:
-            cursor.execute(
-                "SELECT tool_name, error_type, COUNT(*), SUM(resolved) "
-                "FROM failures "
-                "GROUP BY tool_name, error_type"
-            )
-
-        rows = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            tools = sorted(set(tool_names) if tool_names else self._patterns)
+            rows = [
+                (tool_name, error_type, *counts)
+                for tool_name in tools
+                for error_type, counts in sorted(
+                    self._patterns.get(tool_name, {}).items()
+                )
+            ]
 
         patterns = []
         warnings = []
 
-        for row in rows:
+        for tool_name, error_type, count, resolved in rows:
             pattern = FailurePattern(
-                tool_name=row[0],
-                error_type=row[1],
-                occurrence_count=row[2],
-                resolved_count=int(row[3] or 0),
+                tool_name=tool_name,
+                error_type=error_type,
+                occurrence_count=count,
+                resolved_count=resolved,
             )
             if pattern.occurrence_count > 0:
                 patterns.append(pattern)
@@ -308,9 +384,11 @@ class FailureMemoryServiceManager:
     """Manages a singleton FailureMemoryService instance."""
 
     def __init__(self) -> None:
-        """Initialize the manager."""
-        self.service = FailureMemoryService()
+        """Initialize the manager; the service is created on first use."""
+        self.service: Optional[FailureMemoryService] = None
 
     def get_service(self, session_id: str = "default") -> FailureMemoryService:
         """Get the FailureMemoryService instance."""
+        if self.service is None:
+            self.service = FailureMemoryService()
         return self.service
@@ -1,9 +1,13 @@
 import os
 from contextlib import AsyncExitStack
 from typing import Dict, Any, List, Optional
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
 from nebulus_atom.utils.logger import setup_logger
+from nebulus_swarm.lazy_import import lazy_import
+
+# The MCP SDK is only needed once a server is connected
+ClientSession = lazy_import("mcp", "ClientSession")
+StdioServerParameters = lazy_import("mcp", "StdioServerParameters")
+stdio_client = lazy_import("mcp.client.stdio", "stdio_client")
 
 logger = setup_logger(__name__)
 
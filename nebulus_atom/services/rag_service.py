@@ -1,13 +1,15 @@
 import os
 import asyncio
-import chromadb
-from sentence_transformers import SentenceTransformer
 from typing import List, Dict, Any
 import uuid
 import time
-from transformers import logging as transformers_logging
 
-transformers_logging.set_verbosity_error()
+from nebulus_swarm.lazy_import import lazy_import
+
+# Vector store and embedding stack are imported on first use
+chromadb = lazy_import("chromadb")
+SentenceTransformer = lazy_import("sentence_transformers", "SentenceTransformer")
+transformers_logging = lazy_import("transformers", "logging")
 
 
 class RagService:
@@ -47,6 +49,11 @@ class RagService:
                         sys.stdout = old_stdout
                         sys.stderr = old_stderr
 
+            try:
+                transformers_logging.set_verbosity_error()
+            except ImportError:
+                pass  # Only quiets logging; the model import reports real gaps
+
             with suppress_output():
                 self._model_instance = SentenceTransformer(self._embedding_model_name)
         return self._model_instance
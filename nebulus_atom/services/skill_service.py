@@ -1,17 +1,96 @@
+import ast
+import hashlib
+import json
 import os
-import pkgutil
 import importlib
 import importlib.util
-import inspect
 import shutil
 import sys
-from typing import List, Dict, Callable, Any
+import time
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import List, Dict, Callable, Any, Optional
 from nebulus_atom.config import Config
 from nebulus_atom.utils.logger import setup_logger
 from nebulus_atom.utils.sandbox import sandbox
 
 logger = setup_logger(__name__)
 
+# Per-directory cache of generated tool definitions, kept next to the
+# bytecode cache so it travels with the skills it describes
+TOOL_CACHE_DIR = "__pycache__"
+TOOL_CACHE_FILE = "nebulus_skill_tools.json"
+
+# Files modified this close to the last time they were hashed are re-hashed,
+# since an edit within the filesystem's mtime granularity keeps the mtime
+RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass
+class _SkillFile:
+    """A skill source file and the tool definitions generated from it."""
+
+    path: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    checked_ns: int
+    # (function name, description, parameters) per public function
+    tools: List[tuple] = field(default_factory=list)
+    module: Optional[ModuleType] = None
+
+
+class _LazySkill:
+    """Callable that imports its skill module on first use."""
+
+    def __init__(self, service: "SkillService", path: str, func_name: str):
+        self._service = service
+        self._path = path
+        self._func_name = func_name
+
+    def resolve(self) -> Callable:
+        module = self._service._import_module(self._path)
+        return getattr(module, self._func_name)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+
+def _tool_spec(node: ast.FunctionDef | ast.AsyncFunctionDef) -> tuple:
+    """Builds (name, description, parameters) for a function from its AST."""
+    doc = ast.get_docstring(node) or "No description provided."
+    params = {"type": "object", "properties": {}, "required": []}
+
+    args = node.args
+    positional = args.posonlyargs + args.args
+    first_default = len(positional) - len(args.defaults)
+    entries = [(arg, i >= first_default) for i, arg in enumerate(positional)]
+    if args.vararg:
+        entries.append((args.vararg, False))
+    entries += [
+        (arg, default is not None)
+        for arg, default in zip(args.kwonlyargs, args.kw_defaults)
+    ]
+    if args.kwarg:
+        entries.append((args.kwarg, False))
+
+    for arg, has_default in entries:
+        param_type = "string"
+        annotation = arg.annotation
+        if isinstance(annotation, ast.Name) and annotation.id == "int":
+            param_type = "integer"
+        elif isinstance(annotation, ast.Name) and annotation.id == "bool":
+            param_type = "boolean"
+
+        params["properties"][arg.arg] = {
+            "type": param_type,
+            "description": f"Parameter {arg.arg}",
+        }
+        if not has_default:
+            params["required"].append(arg.arg)
+
+    return (node.name, doc, params)
+
 
 class SkillService:
     def __init__(self, skills_dir: str = "nebulus_atom/skills"):
@@ -19,9 +98,18 @@ class SkillService:
         self.global_skills_dir = Config.GLOBAL_SKILLS_PATH
         self.skills: Dict[str, Callable] = {}
         self.tool_definitions: List[Dict] = []
+        # Skill files seen so far, keyed by path
+        self._files: Dict[str, _SkillFile] = {}
+        self._module_names: Dict[str, str] = {}
 
     def load_skills(self):
-        """Scans local and global skills directories and loads all valid skill functions."""
+        """Scans local and global skills directories and registers their skill functions.
+
+        Only files whose size or mtime changed since the last scan are read,
+        and only those whose content hash changed are parsed. Tool
+        definitions are generated from the source without importing it; a
+        skill module is imported when one of its functions first runs.
+        """
         self.skills = {}
         self.tool_definitions = []
 
@@ -30,54 +118,191 @@ class SkillService:
             if not os.path.exists(d):
                 os.makedirs(d, exist_ok=True)
 
+        seen: set = set()
+
         # 1. Load Local Skills
-        self._load_from_path(self.skills_dir, package_prefix="nebulus_atom.skills")
+        seen |= self._load_from_path(
+            self.skills_dir, package_prefix="nebulus_atom.skills"
+        )
 
         # 2. Load Global Skills
-        self._load_from_path(self.global_skills_dir, namespace="global")
+        seen |= self._load_from_path(self.global_skills_dir, namespace="global")
+
+        for path in set(self._files) - seen:
+            del self._files[path]
+            self._module_names.pop(path, None)
 
     def _load_from_path(
         self, path: str, package_prefix: str = None, namespace: str = None
-    ):
-        """Helper to load modules from a specific path."""
+    ) -> set:
+        """Registers the skills in one directory. Returns the file paths seen."""
+        seen = set()
         try:
-            importlib.invalidate_caches()
-            for _, name, _ in pkgutil.iter_modules([path]):
-                try:
-                    module = None
-                    if package_prefix:
-                        try:
-                            module_name = f"{package_prefix}.{name}"
-                            module = importlib.import_module(module_name)
-                            importlib.reload(module)
-                        except (ImportError, ModuleNotFoundError):
-                            pass
-
-                    if not module:
-                        file_path = os.path.join(path, f"{name}.py")
-                        spec = importlib.util.spec_from_file_location(name, file_path)
-                        if spec and spec.loader:
-                            module = importlib.util.module_from_spec(spec)
-                            sys.modules[name] = module
-                            spec.loader.exec_module(module)
-
-                    if module:
-                        for attr_name, attr_value in inspect.getmembers(module):
-                            if inspect.isfunction(
-                                attr_value
-                            ) and not attr_name.startswith("_"):
-                                reg_name = (
-                                    f"{namespace}.{attr_name}"
-                                    if namespace
-                                    else attr_name
-                                )
-                                self._register_skill(reg_name, attr_value)
-                except Exception as e:
-                    logger.error(
-                        "Failed to load skill module %s from %s: %s", name, path, e
-                    )
-        except Exception as e:
+            entries = sorted(
+                entry
+                for entry in os.listdir(path)
+                if entry.endswith(".py") and entry != "__init__.py"
+            )
+        except OSError as e:
             logger.error("Error scanning path %s: %s", path, e)
+            return seen
+
+        disk_cache = self._read_tool_cache(path)
+        dirty = False
+
+        for filename in entries:
+            file_path = os.path.join(path, filename)
+            name = filename[:-3]
+            try:
+                skill_file, changed = self._refresh_file(
+                    file_path, disk_cache.get(filename)
+                )
+            except Exception as e:
+                logger.error(
+                    "Failed to load skill module %s from %s: %s", name, path, e
+                )
+                continue
+
+            seen.add(file_path)
+            self._module_names[file_path] = (
+                f"{package_prefix}.{name}" if package_prefix else name
+            )
+            if changed or filename not in disk_cache:
+                disk_cache[filename] = {
+                    "mtime_ns": skill_file.mtime_ns,
+                    "size": skill_file.size,
+                    "sha256": skill_file.sha256,
+                    "checked_ns": skill_file.checked_ns,
+                    "tools": skill_file.tools,
+                }
+                dirty = True
+
+            for func_name, doc, params in skill_file.tools:
+                reg_name = f"{namespace}.{func_name}" if namespace else func_name
+                self._register_skill(
+                    reg_name, _LazySkill(self, file_path, func_name), doc, params
+                )
+
+        for filename in set(disk_cache) - set(entries):
+            del disk_cache[filename]
+            dirty = True
+        if dirty:
+            self._write_tool_cache(path, disk_cache)
+        return seen
+
+    def _refresh_file(self, file_path: str, cached: Optional[dict]) -> tuple:
+        """Returns (skill file, whether it changed), reparsing only if needed."""
+        stat = os.stat(file_path)
+        current = self._files.get(file_path)
+        if current is None and cached is not None:
+            try:
+                current = _SkillFile(
+                    path=file_path,
+                    mtime_ns=cached["mtime_ns"],
+                    size=cached["size"],
+                    sha256=cached["sha256"],
+                    checked_ns=cached["checked_ns"],
+                    tools=[tuple(tool) for tool in cached["tools"]],
+                )
+            except (KeyError, TypeError):
+                current = None  # Unreadable entry; parse the file afresh
+
+        if (
+            current is not None
+            and current.mtime_ns == stat.st_mtime_ns
+            and current.size == stat.st_size
+            and current.mtime_ns + RACY_WINDOW_NS < current.checked_ns
+        ):
+            self._files[file_path] = current
+            return current, False
+
+        checked_ns = time.time_ns()
+        with open(file_path, "rb") as f:
+            source = f.read()
+        digest = hashlib.sha256(source).hexdigest()
+        if current is not None and current.sha256 == digest:
+            # Touched but not edited
+            current.mtime_ns = stat.st_mtime_ns
+            current.size = stat.st_size
+            current.checked_ns = checked_ns
+            self._files[file_path] = current
+            return current, True
+
+        tree = ast.parse(source, filename=file_path)
+        skill_file = _SkillFile(
+            path=file_path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            sha256=digest,
+            checked_ns=checked_ns,
+            tools=[
+                _tool_spec(node)
+                for node in tree.body
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and not node.name.startswith("_")
+            ],
+        )
+        self._files[file_path] = skill_file
+        return skill_file, True
+
+    def _import_module(self, file_path: str) -> ModuleType:
+        """Imports a skill module, or re-imports it if its file has changed."""
+        skill_file = self._files.get(file_path)
+        if skill_file is not None and skill_file.module is not None:
+            return skill_file.module
+
+        module_name = self._module_names[file_path]
+        module = None
+        if "." in module_name:
+            try:
+                importlib.invalidate_caches()
+                imported = module_name in sys.modules
+                module = importlib.import_module(module_name)
+                # Only trust the package import if it is this very file
+                if not getattr(module, "__file__", None) or not os.path.samefile(
+                    module.__file__, file_path
+                ):
+                    module = None
+                elif imported:
+                    module = importlib.reload(module)
+            except (ImportError, ModuleNotFoundError):
+                module = None
+
+        if module is None:
+            bare_name = module_name.rpartition(".")[2]
+            spec = importlib.util.spec_from_file_location(bare_name, file_path)
+            if not spec or not spec.loader:
+                raise ImportError(f"Cannot load skill module from {file_path}")
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[bare_name] = module
+            spec.loader.exec_module(module)
+
+        if skill_file is not None:
+            skill_file.module = module
+        return module
+
+    @staticmethod
+    def _read_tool_cache(path: str) -> dict:
+        cache_path = os.path.join(path, TOOL_CACHE_DIR, TOOL_CACHE_FILE)
+        try:
+            with open(cache_path) as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_tool_cache(path: str, cache: dict) -> None:
+        cache_dir = os.path.join(path, TOOL_CACHE_DIR)
+        cache_path = os.path.join(cache_dir, TOOL_CACHE_FILE)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not write skill tool cache %s: %s", cache_path, e)
 
     def publish_skill(self, name: str) -> str:
         """Moves a local skill to the global library."""
@@ -94,30 +319,17 @@ class SkillService:
         except Exception as e:
             return f"Error publishing skill: {str(e)}"
 
-    def _register_skill(self, name: str, func: Callable):
-        """Parses a function to create a tool definition."""
-        doc = inspect.getdoc(func) or "No description provided."
-        sig = inspect.signature(func)
-
-        params = {"type": "object", "properties": {}, "required": []}
-
-        for param_name, param in sig.parameters.items():
-            param_type = "string"
-            if param.annotation is int:
-                param_type = "integer"
-            elif param.annotation is bool:
-                param_type = "boolean"
-
-            params["properties"][param_name] = {
-                "type": param_type,
-                "description": f"Parameter {param_name}",
-            }
-            if param.default == inspect.Parameter.empty:
-                params["required"].append(param_name)
-
+    def _register_skill(
+        self, name: str, func: Callable, description: str, parameters: Dict
+    ):
+        """Registers a skill function and its tool definition."""
         tool_def = {
             "type": "function",
-            "function": {"name": name, "description": doc, "parameters": params},
+            "function": {
+                "name": name,
+                "description": description,
+                "parameters": parameters,
+            },
         }
 
         self.skills[name] = func
@@ -126,12 +338,22 @@ class SkillService:
     def get_tool_definitions(self) -> List[Dict]:
         return self.tool_definitions
 
-    @sandbox
     def execute_skill(self, name: str, args: Dict[str, Any]) -> str:
         if name not in self.skills:
             raise ValueError(f"Skill {name} not found")
 
         func = self.skills[name]
+        if isinstance(func, _LazySkill):
+            # Import outside the sandbox, as loading always has
+            try:
+                func = func.resolve()
+            except Exception as e:
+                logger.error("Failed to load skill %s: %s", name, e)
+                return f"Error executing skill {name}: {str(e)}"
+        return self._run_skill(name, func, args)
+
+    @sandbox
+    def _run_skill(self, name: str, func: Callable, args: Dict[str, Any]) -> str:
         try:
             result = func(**args)
             return str(result)
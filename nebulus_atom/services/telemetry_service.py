@@ -80,7 +80,9 @@ class TelemetryService:
 
 class TelemetryServiceManager:
     def __init__(self):
-        self.service = TelemetryService()
+        self.service = None
 
     def get_service(self, session_id: str = "default") -> TelemetryService:
+        if not self.service:
+            self.service = TelemetryService()
         return self.service
@@ -34,6 +34,18 @@ class GitHubConfig:
     needs_attention_label: str = "needs-attention"
 
 
+@dataclass
+class WebhookConfig:
+    """GitHub webhook receiver configuration."""
+
+    secret: str = field(default_factory=lambda: os.getenv("GITHUB_WEBHOOK_SECRET", ""))
+
+    @property
+    def enabled(self) -> bool:
+        """Webhooks are only accepted when a signing secret is configured."""
+        return bool(self.secret)
+
+
 @dataclass
 class MinionConfig:
     """Minion container configuration."""
@@ -124,6 +136,12 @@ class OverlordLLMConfig:
     context_ttl_minutes: int = field(
         default_factory=lambda: int(os.getenv("OVERLORD_LLM_CONTEXT_TTL", "30"))
     )
+    cache_size: int = field(
+        default_factory=lambda: int(os.getenv("OVERLORD_LLM_CACHE_SIZE", "256"))
+    )
+    cache_ttl_seconds: float = field(
+        default_factory=lambda: float(os.getenv("OVERLORD_LLM_CACHE_TTL", "600"))
+    )
 
 
 @dataclass
@@ -196,6 +214,7 @@ class SwarmConfig:
     reviewer: ReviewerConfig = field(default_factory=ReviewerConfig)
     overlord_llm: OverlordLLMConfig = field(default_factory=OverlordLLMConfig)
     routing: RoutingConfig = field(default_factory=RoutingConfig)
+    webhook: WebhookConfig = field(default_factory=WebhookConfig)
 
     # Overlord settings
     state_db_path: str = field(
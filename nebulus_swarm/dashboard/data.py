@@ -1,13 +1,14 @@
 """Data client for Swarm Dashboard.
 
-Hybrid data source: polls Overlord HTTP API for real-time data,
-reads state.db directly for historical data and analytics.
+Polls the Overlord HTTP API for real-time and historical data. The
+state.db file is only opened directly when the Overlord is unreachable.
 """
 
 import logging
 import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
 
 import requests
 
@@ -17,6 +18,8 @@ logger = logging.getLogger(__name__)
 
 # Cache TTL in seconds
 API_CACHE_TTL = 5
+# Metrics change only when work completes; Streamlit reruns reuse them
+METRICS_CACHE_TTL = 30
 
 
 @dataclass
@@ -25,11 +28,12 @@ class CachedResponse:
 
     data: Any
     fetched_at: float = field(default_factory=time.time)
+    ttl: float = API_CACHE_TTL
 
     @property
     def is_stale(self) -> bool:
         """Check if the cached data is older than the TTL."""
-        return (time.time() - self.fetched_at) > API_CACHE_TTL
+        return (time.time() - self.fetched_at) > self.ttl
 
 
 class SwarmDataClient:
@@ -126,16 +130,22 @@ class SwarmDataClient:
         return self.get_health() is not None
 
     # ------------------------------------------------------------------
-    # Historical data (SQLite)
+    # Historical data (Overlord HTTP API, state.db as fallback)
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _query_path(path: str, **params: Any) -> str:
+        """Build an API path with the non-empty params as a query string."""
+        query = urlencode({k: v for k, v in params.items() if v is not None})
+        return f"{path}?{query}" if query else path
+
     def get_work_history(
         self,
         repo: Optional[str] = None,
         status: Optional[str] = None,
         limit: int = 50,
     ) -> List[dict]:
-        """Get work history from state database.
+        """Get the most recent work history records.
 
         Args:
             repo: Filter by repository.
@@ -145,13 +155,45 @@ class SwarmDataClient:
         Returns:
             List of work history records, empty list on error.
         """
+        return self.get_work_history_page(repo=repo, status=status, limit=limit)[
+            "items"
+        ]
+
+    def get_work_history_page(
+        self,
+        repo: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> dict:
+        """Get one page of work history, newest first.
+
+        Args:
+            repo: Filter by repository.
+            status: Filter by status.
+            limit: Page size.
+            cursor: ``next_cursor`` from the previous page, None for the first.
+
+        Returns:
+            Dict with ``items`` and ``next_cursor``; an empty page on error.
+        """
+        page = self._fetch_api(
+            self._query_path(
+                "/history", repo=repo, status=status, limit=limit, cursor=cursor
+            )
+        )
+        if page is not None:
+            return page
+
         if not self.state:
-            return []
+            return {"items": [], "next_cursor": None}
         try:
-            return self.state.get_work_history(repo=repo, status=status, limit=limit)
+            return self.state.get_work_history_page(
+                repo=repo, status=status, limit=limit, cursor=cursor
+            )
         except Exception as e:
             logger.warning(f"Failed to read work history: {e}")
-            return []
+            return {"items": [], "next_cursor": None}
 
     def get_distinct_repos(self) -> List[str]:
         """Get list of distinct repositories from work history.
@@ -159,6 +201,10 @@ class SwarmDataClient:
         Returns:
             Sorted list of repo names, empty list on error.
         """
+        data = self._fetch_api("/history/repos")
+        if data is not None:
+            return data.get("repos", [])
+
         if not self.state:
             return []
         try:
@@ -168,7 +214,9 @@ class SwarmDataClient:
             return []
 
     def get_metrics(self, days: Optional[int] = None) -> dict:
-        """Compute aggregate metrics from work history.
+        """Get aggregate metrics over work history, computed in SQL.
+
+        Results are cached for METRICS_CACHE_TTL seconds per time range.
 
         Args:
             days: Number of days to look back. None for all time.
@@ -177,107 +225,22 @@ class SwarmDataClient:
             Dict with total, completed, failed, timeout counts,
             completion_rate, avg_duration, daily_stats.
         """
-        if not self.state:
-            return self._empty_metrics()
+        key = f"metrics:{days}"
+        cached = self._cache.get(key)
+        if cached and not cached.is_stale:
+            return cached.data
 
-        try:
-            # Get all history within the time range
-            history = self.state.get_work_history(limit=10000)
-
-            if days is not None:
-                cutoff = time.time() - (days * 86400)
-                history = [
-                    h
-                    for h in history
-                    if h.get("completed_at")
-                    and self._iso_to_timestamp(h["completed_at"]) >= cutoff
-                ]
-
-            if not history:
+        metrics = self._fetch_api(self._query_path("/metrics", days=days))
+        if metrics is None:
+            if not self.state:
                 return self._empty_metrics()
-
-            total = len(history)
-            completed = sum(1 for h in history if h["status"] == "completed")
-            failed = sum(1 for h in history if h["status"] == "failed")
-            timeout = sum(1 for h in history if h["status"] == "timeout")
-
-            durations = [
-                h["duration_seconds"]
-                for h in history
-                if h.get("duration_seconds") is not None
-            ]
-
-            avg_duration = sum(durations) / len(durations) if durations else 0
-            sorted_durations = sorted(durations)
-            median_duration = (
-                sorted_durations[len(sorted_durations) // 2] if sorted_durations else 0
-            )
-
-            # Daily breakdown
-            daily: Dict[str, Dict[str, int]] = {}
-            for h in history:
-                if h.get("completed_at"):
-                    day = h["completed_at"][:10]  # YYYY-MM-DD
-                    if day not in daily:
-                        daily[day] = {
-                            "completed": 0,
-                            "failed": 0,
-                            "timeout": 0,
-                            "total_duration": 0,
-                            "count": 0,
-                        }
-                    daily[day][h["status"]] = daily[day].get(h["status"], 0) + 1
-                    if h.get("duration_seconds"):
-                        daily[day]["total_duration"] += h["duration_seconds"]
-                        daily[day]["count"] += 1
-
-            # Compute daily averages
-            daily_stats = []
-            for day in sorted(daily.keys()):
-                d = daily[day]
-                count = d["count"]
-                daily_stats.append(
-                    {
-                        "date": day,
-                        "completed": d["completed"],
-                        "failed": d["failed"],
-                        "timeout": d.get("timeout", 0),
-                        "avg_duration": (
-                            d["total_duration"] / count if count > 0 else 0
-                        ),
-                    }
-                )
-
-            # Failure analysis
-            error_types: Dict[str, Dict[str, Any]] = {}
-            for h in history:
-                if h["status"] != "completed" and h.get("error_message"):
-                    # Extract error type from "type: message" format
-                    err_msg = h["error_message"]
-                    err_type = (
-                        err_msg.split(":")[0].strip() if ":" in err_msg else "unknown"
-                    )
-                    if err_type not in error_types:
-                        error_types[err_type] = {"count": 0, "last_message": ""}
-                    error_types[err_type]["count"] += 1
-                    error_types[err_type]["last_message"] = err_msg
-
-            return {
-                "total": total,
-                "completed": completed,
-                "failed": failed,
-                "timeout": timeout,
-                "completion_rate": completed / total if total > 0 else 0,
-                "avg_duration": avg_duration,
-                "median_duration": median_duration,
-                "min_duration": min(durations) if durations else 0,
-                "max_duration": max(durations) if durations else 0,
-                "daily_stats": daily_stats,
-                "error_types": error_types,
-            }
-        except Exception as e:
-            logger.warning(f"Failed to compute metrics: {e}")
-            return self._empty_metrics()
+            try:
+                metrics = self.state.get_metrics(days=days)
+            except Exception as e:
+                logger.warning(f"Failed to compute metrics: {e}")
+                return self._empty_metrics()
+        self._cache[key] = CachedResponse(data=metrics, ttl=METRICS_CACHE_TTL)
+        return metrics
 
     @staticmethod
     def _empty_metrics() -> dict:
@@ -295,14 +258,3 @@ class SwarmDataClient:
             "daily_stats": [],
             "error_types": {},
         }
-
-    @staticmethod
-    def _iso_to_timestamp(iso_str: str) -> float:
-        """Convert ISO datetime string to Unix timestamp."""
-        from datetime import datetime
-
-        try:
-            dt = datetime.fromisoformat(iso_str)
-            return dt.timestamp()
-        except (ValueError, TypeError):
-            return 0.0
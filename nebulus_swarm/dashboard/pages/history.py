@@ -1,5 +1,7 @@
 """Work History page - filterable log of completed work."""
 
+from typing import Optional
+
 import pandas as pd
 import streamlit as st
 
@@ -28,14 +30,25 @@ def render(client: SwarmDataClient) -> None:
     repo_filter = None if selected_repo == "All" else selected_repo
     status_filter = None if selected_status == "All" else selected_status
 
-    history = client.get_work_history(
-        repo=repo_filter, status=status_filter, limit=limit
+    # Cursors of the pages visited so far; None is the first page. Any
+    # filter change starts again from the newest records.
+    filters = (repo_filter, status_filter, limit)
+    if st.session_state.get("history_filters") != filters:
+        st.session_state["history_filters"] = filters
+        st.session_state["history_cursors"] = [None]
+    cursors = st.session_state["history_cursors"]
+
+    page = client.get_work_history_page(
+        repo=repo_filter, status=status_filter, limit=limit, cursor=cursors[-1]
     )
+    history = page["items"]
 
     if not history:
         st.info("No work history yet.")
         return
 
+    _render_pager(cursors, page["next_cursor"])
+
     # Build DataFrame
     df = pd.DataFrame(history)
 
@@ -76,6 +89,21 @@ def render(client: SwarmDataClient) -> None:
     )
 
 
+def _render_pager(cursors: list, next_cursor: Optional[str]) -> None:
+    """Render previous/next page buttons over the session cursor stack."""
+    col1, col2, col3 = st.columns([1, 1, 4])
+    with col1:
+        if st.button("← Newer", disabled=len(cursors) == 1):
+            cursors.pop()
+            st.rerun()
+    with col2:
+        if st.button("Older →", disabled=next_cursor is None):
+            cursors.append(next_cursor)
+            st.rerun()
+    with col3:
+        st.caption(f"Page {len(cursors)}")
+
+
 def _format_history_df(df: pd.DataFrame) -> pd.DataFrame:
     """Format history DataFrame for display."""
     display = df.copy()
@@ -0,0 +1,435 @@
+"""Shared, rate-limit-aware GitHub API access.
+
+GitHubQueue, the Minion GitHubClient and PRReviewer all talk to GitHub
+through one SharedGitHub per token instead of building their own PyGithub
+clients. The shared instance provides:
+
+- a single pooled PyGithub client (connections reused across callers),
+- quota tracking from ``X-RateLimit-*`` response headers, with no extra
+  ``/rate_limit`` calls,
+- a token bucket that paces requests over the remaining quota window and
+  serves waiters by priority (merges and PR creation before scans),
+- a short-TTL cache for GET-style lookups such as repositories and PRs.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import IntEnum
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from github import Auth, Github
+from github.GithubException import RateLimitExceededException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Connections kept per client; sized for the reviewer's parallel fetches
+DEFAULT_POOL_SIZE = 10
+# Requests that may be issued back to back before pacing kicks in
+DEFAULT_BURST = 20
+# Default lifetime of cached GET results, in seconds
+DEFAULT_CACHE_TTL = 30.0
+# Repository metadata changes rarely
+REPO_CACHE_TTL = 300.0
+# Longest a caller waits for budget before the request is refused
+DEFAULT_ACQUIRE_TIMEOUT = 30.0
+
+
+class GitHubPriority(IntEnum):
+    """Request priority; lower values are served first."""
+
+    WRITE = 0  # merges, PR creation
+    REVIEW = 1  # reviews, comments, label changes
+    SCAN = 2  # queue scans and other background reads
+
+
+# Requests held back for higher priorities (a SCAN never spends the last 100)
+PRIORITY_RESERVE: Dict[GitHubPriority, int] = {
+    GitHubPriority.WRITE: 0,
+    GitHubPriority.REVIEW: 25,
+    GitHubPriority.SCAN: 100,
+}
+
+
+@dataclass
+class Quota:
+    """Rate limit state as last reported by GitHub."""
+
+    remaining: int
+    limit: int
+    reset_at: datetime
+
+    @property
+    def seconds_until_reset(self) -> float:
+        """Seconds until the quota window resets (never negative)."""
+        return max(0.0, (self.reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RequestBudget:
+    """Priority token bucket paced to the remaining quota.
+
+    Tokens refill so the remaining quota is spread evenly over the time
+    left in the window. A caller may only spend a token if no
+    higher-priority caller is waiting and the request would not dip into
+    that priority's reserve.
+    """
+
+    def __init__(
+        self,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the budget.
+
+        Args:
+            burst: Bucket capacity.
+            clock: Monotonic clock, injectable for tests.
+        """
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._rate = 5000 / 3600  # default primary limit until headers arrive
+        self._updated = clock()
+        self._quota: Optional[Quota] = None
+        self._cond = threading.Condition()
+        self._waiting: Dict[GitHubPriority, int] = {p: 0 for p in GitHubPriority}
+
+    @property
+    def quota(self) -> Optional[Quota]:
+        """Last known quota, or None if not yet observed or already reset."""
+        quota = self._quota
+        if quota is None or quota.seconds_until_reset <= 0:
+            return None
+        return quota
+
+    def update(self, remaining: int, limit: int, reset_at: datetime) -> None:
+        """Feed quota from response headers and re-derive the refill rate.
+
+        Args:
+            remaining: ``X-RateLimit-Remaining``.
+            limit: ``X-RateLimit-Limit``.
+            reset_at: ``X-RateLimit-Reset`` as a datetime.
+        """
+        with self._cond:
+            self._refill()
+            self._quota = Quota(remaining=remaining, limit=limit, reset_at=reset_at)
+            window = max(self._quota.seconds_until_reset, 1.0)
+            self._rate = max(remaining, 0) / window
+            self._cond.notify_all()
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill. Caller holds the lock."""
+        now = self._clock()
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def _within_reserve(self, priority: GitHubPriority, cost: int) -> bool:
+        """Check the reserve for a priority. Caller holds the lock."""
+        quota = self.quota
+        if quota is None:
+            return True
+        return quota.remaining - cost >= PRIORITY_RESERVE[priority]
+
+    def _outranked(self, priority: GitHubPriority) -> bool:
+        """True if a higher-priority caller is waiting. Caller holds the lock."""
+        return any(self._waiting[p] for p in GitHubPriority if p < priority)
+
+    def acquire(
+        self,
+        priority: GitHubPriority = GitHubPriority.REVIEW,
+        cost: int = 1,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Wait for permission to make ``cost`` requests.
+
+        Args:
+            priority: Request priority.
+            cost: Number of requests about to be made.
+            timeout: Maximum seconds to wait; None waits indefinitely.
+
+        Returns:
+            True if granted, False on timeout.
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._cond:
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    self._refill()
+                    if (
+                        self._tokens >= cost
+                        and self._within_reserve(priority, cost)
+                        and not self._outranked(priority)
+                    ):
+                        self._tokens -= cost
+                        if self._quota is not None:
+                            self._quota.remaining -= cost
+                        return True
+
+                    if not self._within_reserve(priority, cost):
+                        # Only the window reset frees reserved quota
+                        quota = self.quota
+                        wait = quota.seconds_until_reset if quota else 1.0
+                        if deadline is not None and self._clock() + wait > deadline:
+                            return False
+                    elif self._rate > 0:
+                        wait = max((cost - self._tokens) / self._rate, 0.01)
+                    else:
+                        wait = 1.0
+
+                    if deadline is not None:
+                        remaining = deadline - self._clock()
+                        if remaining <= 0:
+                            return False
+                        wait = min(wait, remaining)
+                    self._cond.wait(wait)
+            finally:
+                self._waiting[priority] -= 1
+                self._cond.notify_all()
+
+
+class TTLCache:
+    """Thread-safe cache of loader results with per-entry expiry."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """Initialize the cache.
+
+        Args:
+            clock: Monotonic clock, injectable for tests.
+        """
+        self._clock = clock
+        self._entries: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(
+        self, key: Tuple[Any, ...], loader: Callable[[], T], ttl: float
+    ) -> T:
+        """Return a cached value or load and cache it.
+
+        Args:
+            key: Cache key.
+            loader: Called on a miss.
+            ttl: Seconds the loaded value stays valid.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = loader()
+        with self._lock:
+            self._entries[key] = (now + ttl, value)
+        return value
+
+    def invalidate(self, *prefix: Any) -> None:
+        """Drop entries whose key starts with ``prefix`` (all if empty)."""
+        with self._lock:
+            for key in [k for k in self._entries if k[: len(prefix)] == prefix]:
+                del self._entries[key]
+
+
+class SharedGitHub:
+    """One pooled, budgeted PyGithub client shared by all callers of a token."""
+
+    def __init__(
+        self,
+        token: str,
+        client_factory: Callable[..., Github] = Github,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ):
+        """Initialize the shared client.
+
+        Args:
+            token: GitHub token.
+            client_factory: PyGithub client class or factory.
+            pool_size: HTTP connections kept in the pool.
+        """
+        self.token = token
+        self.client = client_factory(auth=Auth.Token(token), pool_size=pool_size)
+        self.budget = RequestBudget()
+        self.cache = TTLCache()
+        self._refs = 0
+
+    def acquire(
+        self,
+        priority: GitHubPriority = GitHubPriority.REVIEW,
+        cost: int = 1,
+        timeout: Optional[float] = DEFAULT_ACQUIRE_TIMEOUT,
+    ) -> bool:
+        """Sync quota from the last response, then wait for budget.
+
+        Args:
+            priority: Request priority.
+            cost: Number of requests about to be made.
+            timeout: Maximum seconds to wait; None waits indefinitely.
+
+        Returns:
+            True if granted, False on timeout.
+        """
+        self._sync_quota()
+        return self.budget.acquire(priority, cost, timeout)
+
+    def require(
+        self,
+        priority: GitHubPriority = GitHubPriority.REVIEW,
+        cost: int = 1,
+        timeout: Optional[float] = DEFAULT_ACQUIRE_TIMEOUT,
+    ) -> None:
+        """Like ``acquire``, but raise instead of returning False.
+
+        Callers already handle GithubException, so running out of budget
+        fails the operation the same way a 403 rate-limit response would.
+
+        Args:
+            priority: Request priority.
+            cost: Number of requests about to be made.
+            timeout: Maximum seconds to wait.
+
+        Raises:
+            RateLimitExceededException: If no budget is granted in time.
+        """
+        if not self.acquire(priority, cost, timeout):
+            raise RateLimitExceededException(
+                429,
+                {"message": f"No {priority.name} budget within {timeout}s"},
+                None,
+            )
+
+    def _sync_quota(self) -> None:
+        """Copy PyGithub's header-derived quota into the budget."""
+        requester = getattr(self.client, "requester", None)
+        try:
+            remaining, limit = requester.rate_limiting
+            reset = int(requester.rate_limiting_resettime)
+        except (AttributeError, TypeError, ValueError):
+            return
+        if not isinstance(remaining, int) or limit < 0 or reset <= 0:
+            return
+        reset_at = datetime.fromtimestamp(reset, tz=timezone.utc)
+        quota = self.budget.quota
+        if quota is None or quota.reset_at != reset_at or remaining < quota.remaining:
+            self.budget.update(remaining, limit, reset_at)
+
+    def record_headers(self, headers: Dict[str, Any]) -> None:
+        """Feed quota from raw (lower-cased) response headers.
+
+        Used by callers that bypass PyGithub's object layer.
+
+        Args:
+            headers: Response headers.
+        """
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        self.budget.update(
+            int(remaining),
+            int(headers.get("x-ratelimit-limit", 0) or 0),
+            datetime.fromtimestamp(int(reset), tz=timezone.utc),
+        )
+
+    def quota(self) -> Optional[Quota]:
+        """Current quota from response headers, if known."""
+        self._sync_quota()
+        return self.budget.quota
+
+    def cached(
+        self,
+        key: Tuple[Any, ...],
+        loader: Callable[[], T],
+        ttl: float = DEFAULT_CACHE_TTL,
+        priority: GitHubPriority = GitHubPriority.REVIEW,
+    ) -> T:
+        """Budgeted GET with a short-lived cache.
+
+        Args:
+            key: Cache key.
+            loader: Performs the request on a miss.
+            ttl: Seconds the result stays valid.
+            priority: Priority used if the request is made.
+
+        Returns:
+            Cached or freshly loaded value.
+        """
+
+        def load() -> T:
+            self.require(priority)
+            return loader()
+
+        return self.cache.get_or_load(key, load, ttl)
+
+    def get_repo(
+        self, repo_name: str, priority: GitHubPriority = GitHubPriority.REVIEW
+    ) -> Any:
+        """Get a repository, cached for REPO_CACHE_TTL.
+
+        Args:
+            repo_name: Repository in owner/name format.
+            priority: Priority used if the request is made.
+
+        Returns:
+            PyGithub Repository.
+        """
+        return self.cached(
+            ("repo", repo_name),
+            lambda: self.client.get_repo(repo_name),
+            ttl=REPO_CACHE_TTL,
+            priority=priority,
+        )
+
+
+_shared: Dict[Tuple[str, Any], SharedGitHub] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_github(
+    token: str, client_factory: Callable[..., Github] = Github
+) -> SharedGitHub:
+    """Get the process-wide SharedGitHub for a token.
+
+    Each call takes a reference; pair it with ``release_shared_github``.
+
+    Args:
+        token: GitHub token.
+        client_factory: PyGithub client class or factory.
+
+    Returns:
+        The SharedGitHub for (token, client_factory).
+    """
+    key = (token, client_factory)
+    with _shared_lock:
+        shared = _shared.get(key)
+        if shared is None:
+            shared = _shared[key] = SharedGitHub(token, client_factory)
+        shared._refs += 1
+        return shared
+
+
+def release_shared_github(shared: SharedGitHub) -> None:
+    """Drop a reference; closes the client when the last user releases it.
+
+    Args:
+        shared: Instance returned by ``get_shared_github``.
+    """
+    with _shared_lock:
+        shared._refs -= 1
+        if shared._refs > 0:
+            return
+        for key, value in list(_shared.items()):
+            if value is shared:
+                del _shared[key]
+    shared.client.close()
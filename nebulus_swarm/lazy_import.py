@@ -0,0 +1,75 @@
+"""Deferred imports for heavy optional dependencies.
+
+chromadb, openai, docker and friends each take hundreds of milliseconds to
+import. Modules that only need them on some code paths bind a proxy at
+module level instead, so the name stays patchable in tests while the real
+import happens on first use.
+"""
+
+import importlib
+import threading
+from typing import Any, Optional
+
+
+class LazyImport:
+    """Proxy for a module, or an attribute of one, imported on first use."""
+
+    def __init__(self, module: str, attr: Optional[str] = None):
+        """Initialize the proxy.
+
+        Args:
+            module: Dotted module name, e.g. "openai".
+            attr: Optional attribute of the module to resolve, e.g. "OpenAI".
+        """
+        self._module = module
+        self._attr = attr
+        self._target: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the underlying import has happened."""
+        return self._target is not None
+
+    def resolve(self) -> Any:
+        """Import and return the proxied module or attribute.
+
+        Raises:
+            ImportError: If the dependency is not installed.
+        """
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    target = importlib.import_module(self._module)
+                    if self._attr is not None:
+                        target = getattr(target, self._attr)
+                    self._target = target
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names not set in __init__; private and dunder
+        # lookups (copy, pickle, inspect) must not trigger the import
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        name = f"{self._module}.{self._attr}" if self._attr else self._module
+        state = "loaded" if self.loaded else "deferred"
+        return f"<LazyImport {name} ({state})>"
+
+
+def lazy_import(module: str, attr: Optional[str] = None) -> LazyImport:
+    """Defer importing a module, or one of its attributes, until first use.
+
+    Args:
+        module: Dotted module name.
+        attr: Optional attribute to resolve from the module.
+
+    Returns:
+        Proxy that imports on first attribute access or call.
+    """
+    return LazyImport(module, attr)
@@ -1,6 +1,11 @@
 """Minion agent components."""
 
-from nebulus_swarm.minion.agent.llm_client import LLMClient, LLMConfig, LLMResponse
+from nebulus_swarm.minion.agent.llm_client import (
+    AsyncLLMClient,
+    LLMClient,
+    LLMConfig,
+    LLMResponse,
+)
 from nebulus_swarm.minion.agent.minion_agent import (
     AgentResult,
     AgentStatus,
@@ -21,6 +26,7 @@ from nebulus_swarm.minion.agent.tools import (
 )
 
 __all__ = [
+    "AsyncLLMClient",
     "LLMClient",
     "LLMConfig",
     "LLMResponse",
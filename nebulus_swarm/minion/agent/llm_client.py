@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from openai import OpenAI
+from nebulus_swarm.lazy_import import lazy_import
+from nebulus_swarm.overlord.llm_pool import backoff_delay, is_transient_error
 
 if TYPE_CHECKING:
-    from nebulus_swarm.overlord.llm_pool import LLMPool
+    from nebulus_swarm.overlord.llm_pool import AsyncLLMPool, LLMPool, Priority
 
 logger = logging.getLogger(__name__)
 
+AsyncOpenAI = lazy_import("openai", "AsyncOpenAI")
+OpenAI = lazy_import("openai", "OpenAI")
+
 
 @dataclass
 class LLMConfig:
@@ -24,6 +30,7 @@ class LLMConfig:
     timeout: int = 600
     temperature: float = 0.3
     max_tokens: int = 4096
+    max_retries: int = 2  # retries for transient errors (429/503/timeouts)
 
 
 @dataclass
@@ -41,18 +48,80 @@ class LLMResponse:
         return len(self.tool_calls) > 0
 
 
+def _build_request(
+    config: LLMConfig,
+    messages: List[Dict[str, Any]],
+    tools: Optional[List[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """Build chat completion kwargs shared by the sync and async clients."""
+    kwargs: Dict[str, Any] = {
+        "model": config.model,
+        "messages": messages,
+        "temperature": config.temperature,
+        "max_tokens": config.max_tokens,
+    }
+
+    if tools:
+        kwargs["tools"] = tools
+        kwargs["tool_choice"] = "auto"
+
+    return kwargs
+
+
+def _to_llm_response(response: Any) -> LLMResponse:
+    """Convert an OpenAI chat completion into an LLMResponse."""
+    choice = response.choices[0]
+    message = choice.message
+
+    # Extract tool calls if present
+    tool_calls = []
+    if message.tool_calls:
+        for tc in message.tool_calls:
+            tool_calls.append(
+                {
+                    "id": tc.id,
+                    "name": tc.function.name,
+                    "arguments": tc.function.arguments,
+                }
+            )
+
+    # Extract usage info
+    usage = None
+    if response.usage:
+        usage = {
+            "prompt_tokens": response.usage.prompt_tokens,
+            "completion_tokens": response.usage.completion_tokens,
+            "total_tokens": response.usage.total_tokens,
+        }
+
+    return LLMResponse(
+        content=message.content or "",
+        tool_calls=tool_calls,
+        finish_reason=choice.finish_reason,
+        usage=usage,
+    )
+
+
 class LLMClient:
     """Wrapper around OpenAI SDK for Nebulus/local LLM servers."""
 
-    def __init__(self, config: LLMConfig, pool: Optional[LLMPool] = None):
+    def __init__(
+        self,
+        config: LLMConfig,
+        pool: Optional[LLMPool] = None,
+        priority: Optional[Priority] = None,
+    ):
         """Initialize LLM client.
 
         Args:
             config: LLM configuration.
             pool: Optional LLM connection pool for concurrent access control.
+            priority: Pool lane for this client's requests. Defaults to
+                ``Priority.NORMAL``.
         """
         self.config = config
         self._pool = pool
+        self._priority = priority
         if pool:
             self._client = pool.client
         else:
@@ -60,6 +129,7 @@ class LLMClient:
                 base_url=config.base_url,
                 api_key=config.api_key,
                 timeout=config.timeout,
+                max_retries=0,  # chat() owns retries
             )
 
     def chat(
@@ -69,6 +139,10 @@ class LLMClient:
     ) -> LLMResponse:
         """Send a chat completion request.
 
+        Transient failures are retried up to ``config.max_retries`` times
+        with jittered exponential backoff; the pool slot is released while
+        backing off.
+
         Args:
             messages: Conversation history.
             tools: Optional tool definitions.
@@ -79,58 +153,52 @@ class LLMClient:
         Raises:
             RuntimeError: If pool acquisition times out.
         """
+        attempt = 0
+        while True:
+            try:
+                return self._chat_once(messages, tools)
+            except Exception as e:
+                if attempt >= self.config.max_retries or not is_transient_error(e):
+                    raise
+                delay = backoff_delay(attempt)
+                attempt += 1
+                logger.warning(
+                    f"LLM request failed ({type(e).__name__}), "
+                    f"retry {attempt}/{self.config.max_retries} in {delay:.1f}s"
+                )
+                if self._pool:
+                    self._pool.record_retry()
+                time.sleep(delay)
+
+    def _chat_once(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+    ) -> LLMResponse:
+        """Make a single chat completion request through the pool."""
         if self._pool:
-            if not self._pool.acquire():
+            acquired = (
+                self._pool.acquire(self._priority)
+                if self._priority is not None
+                else self._pool.acquire()
+            )
+            if not acquired:
                 raise RuntimeError("LLM pool: timed out waiting for slot")
 
+        started = time.monotonic()
         try:
-            kwargs = {
-                "model": self.config.model,
-                "messages": messages,
-                "temperature": self.config.temperature,
-                "max_tokens": self.config.max_tokens,
-            }
-
-            if tools:
-                kwargs["tools"] = tools
-                kwargs["tool_choice"] = "auto"
-
+            kwargs = _build_request(self.config, messages, tools)
             logger.debug(f"Sending chat request with {len(messages)} messages")
 
             response = self._client.chat.completions.create(**kwargs)
-            choice = response.choices[0]
-            message = choice.message
-
-            # Extract tool calls if present
-            tool_calls = []
-            if message.tool_calls:
-                for tc in message.tool_calls:
-                    tool_calls.append(
-                        {
-                            "id": tc.id,
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments,
-                        }
-                    )
-
-            # Extract usage info
-            usage = None
-            if response.usage:
-                usage = {
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "total_tokens": response.usage.total_tokens,
-                }
 
-            return LLMResponse(
-                content=message.content or "",
-                tool_calls=tool_calls,
-                finish_reason=choice.finish_reason,
-                usage=usage,
-            )
-        except Exception:
             if self._pool:
-                self._pool.record_error()
+                self._pool.record_success(time.monotonic() - started)
+
+            return _to_llm_response(response)
+        except Exception as e:
+            if self._pool:
+                self._pool.record_error(e)
             raise
         finally:
             if self._pool:
@@ -153,3 +221,122 @@ class LLMClient:
 
         response = self.chat(messages)
         return response.content
+
+
+class AsyncLLMClient:
+    """asyncio counterpart of LLMClient built on AsyncOpenAI."""
+
+    def __init__(
+        self,
+        config: LLMConfig,
+        pool: Optional[AsyncLLMPool] = None,
+        priority: Optional[Priority] = None,
+    ):
+        """Initialize async LLM client.
+
+        Args:
+            config: LLM configuration.
+            pool: Optional async LLM pool for concurrent access control.
+            priority: Pool lane for this client's requests. Defaults to
+                ``Priority.NORMAL``.
+        """
+        self.config = config
+        self._pool = pool
+        self._priority = priority
+        if pool:
+            self._client = pool.client
+        else:
+            self._client = AsyncOpenAI(
+                base_url=config.base_url,
+                api_key=config.api_key,
+                timeout=config.timeout,
+                max_retries=0,  # chat() owns retries
+            )
+
+    async def chat(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> LLMResponse:
+        """Send a chat completion request without blocking the event loop.
+
+        Transient failures are retried like ``LLMClient.chat``.
+
+        Args:
+            messages: Conversation history.
+            tools: Optional tool definitions.
+
+        Returns:
+            LLMResponse with content and/or tool calls.
+
+        Raises:
+            RuntimeError: If pool acquisition times out.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await self._chat_once(messages, tools)
+            except Exception as e:
+                if attempt >= self.config.max_retries or not is_transient_error(e):
+                    raise
+                delay = backoff_delay(attempt)
+                attempt += 1
+                logger.warning(
+                    f"LLM request failed ({type(e).__name__}), "
+                    f"retry {attempt}/{self.config.max_retries} in {delay:.1f}s"
+                )
+                if self._pool:
+                    self._pool.record_retry()
+                await asyncio.sleep(delay)
+
+    async def _chat_once(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+    ) -> LLMResponse:
+        """Make a single chat completion request through the pool."""
+        if self._pool:
+            acquired = (
+                await self._pool.acquire(self._priority)
+                if self._priority is not None
+                else await self._pool.acquire()
+            )
+            if not acquired:
+                raise RuntimeError("LLM pool: timed out waiting for slot")
+
+        started = time.monotonic()
+        try:
+            kwargs = _build_request(self.config, messages, tools)
+            logger.debug(f"Sending async chat request with {len(messages)} messages")
+
+            response = await self._client.chat.completions.create(**kwargs)
+
+            if self._pool:
+                self._pool.record_success(time.monotonic() - started)
+
+            return _to_llm_response(response)
+        except Exception as e:
+            if self._pool:
+                self._pool.record_error(e)
+            raise
+        finally:
+            if self._pool:
+                self._pool.release()
+
+    async def simple_chat(self, prompt: str, system: Optional[str] = None) -> str:
+        """Simple single-turn chat without tools.
+
+        Args:
+            prompt: User prompt.
+            system: Optional system message.
+
+        Returns:
+            Response content string.
+        """
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+
+        response = await self.chat(messages)
+        return response.content
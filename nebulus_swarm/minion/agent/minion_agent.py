@@ -1,14 +1,23 @@
 """Minion agent - the autonomous coding brain."""
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
-
-from nebulus_swarm.minion.agent.llm_client import LLMClient, LLMConfig, LLMResponse
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from nebulus_swarm.minion.agent.llm_client import (
+    AsyncLLMClient,
+    LLMClient,
+    LLMConfig,
+    LLMResponse,
+)
 from nebulus_swarm.minion.agent.response_parser import ResponseParser
 
+if TYPE_CHECKING:
+    from nebulus_swarm.overlord.llm_pool import AsyncLLMPool, LLMPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,6 +74,8 @@ class MinionAgent:
         tool_executor: ToolExecutorFn,
         turn_limit: int = DEFAULT_TURN_LIMIT,
         error_threshold: int = DEFAULT_ERROR_THRESHOLD,
+        pool: Optional["LLMPool"] = None,
+        async_pool: Optional["AsyncLLMPool"] = None,
     ):
         """Initialize the Minion agent.
 
@@ -75,8 +86,21 @@ class MinionAgent:
             tool_executor: Function to execute tools.
             turn_limit: Maximum number of turns before stopping.
             error_threshold: Consecutive errors before stopping.
+            pool: Optional shared LLM pool; minion requests use the
+                background lane so interactive work is served first.
+            async_pool: Optional shared async LLM pool used by run_async().
         """
-        self.llm = LLMClient(llm_config)
+        if pool is not None or async_pool is not None:
+            from nebulus_swarm.overlord.llm_pool import Priority
+
+            background = Priority.BACKGROUND
+        else:
+            background = None
+        self.llm = LLMClient(llm_config, pool=pool, priority=background)
+        self._llm_config = llm_config
+        self._async_pool = async_pool
+        self._async_priority = background
+        self._async_llm: Optional[AsyncLLMClient] = None
         self.system_prompt = system_prompt
         self.tools = tools
         self.tool_executor = tool_executor
@@ -109,6 +133,17 @@ class MinionAgent:
         self._result = None
         logger.info(f"Injected message into agent history: {text[:100]}...")
 
+    @property
+    def async_llm(self) -> AsyncLLMClient:
+        """Async LLM client, created on first use by run_async()."""
+        if self._async_llm is None:
+            self._async_llm = AsyncLLMClient(
+                self._llm_config,
+                pool=self._async_pool,
+                priority=self._async_priority,
+            )
+        return self._async_llm
+
     def run(self) -> AgentResult:
         """Run the agent loop until completion or limit.
 
@@ -117,12 +152,7 @@ class MinionAgent:
         Returns:
             AgentResult with status and details.
         """
-        # Initialize with system prompt only on first run
-        if not self._messages:
-            logger.info("Starting agent loop")
-            self._messages = [{"role": "system", "content": self.system_prompt}]
-        else:
-            logger.info("Resuming agent loop")
+        self._begin_run()
 
         while not self._completed and self._turn_count < self.turn_limit:
             self._turn_count += 1
@@ -138,17 +168,81 @@ class MinionAgent:
                     return result
 
             except Exception as e:
-                logger.exception(f"Error in agent turn: {e}")
-                self._consecutive_errors += 1
-
-                if self._consecutive_errors >= self.error_threshold:
-                    return AgentResult(
-                        status=AgentStatus.ERROR,
-                        summary=f"Too many consecutive errors: {e}",
-                        error=str(e),
-                        turns_used=self._turn_count,
+                error_result = self._handle_turn_error(e)
+                if error_result:
+                    return error_result
+
+        return self._finish_run()
+
+    async def run_async(self) -> AgentResult:
+        """Async variant of run() for callers on an event loop.
+
+        LLM calls go through AsyncLLMClient and tool execution runs in a
+        worker thread, so heartbeats and other tasks keep running while
+        the agent waits. Can be resumed after inject_message().
+
+        Returns:
+            AgentResult with status and details.
+        """
+        self._begin_run()
+
+        while not self._completed and self._turn_count < self.turn_limit:
+            self._turn_count += 1
+            logger.info(f"Agent turn {self._turn_count}/{self.turn_limit}")
+
+            try:
+                response = await self.async_llm.chat(self._messages, self.tools)
+
+                tool_calls = self._record_response(response)
+                result = None
+                for tool_call in tool_calls:
+                    tool_result = await asyncio.to_thread(
+                        self._execute_tool_call, tool_call
                     )
+                    result = self._handle_tool_result(tool_call, tool_result)
+                    if result:
+                        break
+                if result:
+                    return result
+
+            except Exception as e:
+                error_result = self._handle_turn_error(e)
+                if error_result:
+                    return error_result
+
+        return self._finish_run()
+
+    def _begin_run(self) -> None:
+        """Initialize history with the system prompt on the first run."""
+        if not self._messages:
+            logger.info("Starting agent loop")
+            self._messages = [{"role": "system", "content": self.system_prompt}]
+        else:
+            logger.info("Resuming agent loop")
 
+    def _handle_turn_error(self, error: Exception) -> Optional[AgentResult]:
+        """Count a failed turn and stop once the error threshold is hit.
+
+        Args:
+            error: Exception raised during the turn.
+
+        Returns:
+            AgentResult if the agent should stop, None to continue.
+        """
+        logger.exception(f"Error in agent turn: {error}")
+        self._consecutive_errors += 1
+
+        if self._consecutive_errors >= self.error_threshold:
+            return AgentResult(
+                status=AgentStatus.ERROR,
+                summary=f"Too many consecutive errors: {error}",
+                error=str(error),
+                turns_used=self._turn_count,
+            )
+        return None
+
+    def _finish_run(self) -> AgentResult:
+        """Build the result once the loop exits without an early return."""
         # Hit turn limit
         if not self._completed:
             logger.warning(f"Agent hit turn limit ({self.turn_limit})")
@@ -173,6 +267,23 @@ class MinionAgent:
         Returns:
             AgentResult if agent is done, None to continue.
         """
+        for tool_call in self._record_response(response):
+            result = self._execute_tool_call(tool_call)
+            agent_result = self._handle_tool_result(tool_call, result)
+            if agent_result:
+                return agent_result
+
+        return None
+
+    def _record_response(self, response: LLMResponse) -> List[Dict[str, Any]]:
+        """Append the assistant turn to history and return its tool calls.
+
+        Args:
+            response: LLM response.
+
+        Returns:
+            Tool calls to execute; empty if the agent was prompted to continue.
+        """
         if response.content:
             logger.debug(f"Assistant: {response.content[:200]}...")
 
@@ -218,41 +329,51 @@ class MinionAgent:
                     "content": "Please continue with the task. Use tools to make progress, or call task_complete when done. Output your tool call as a JSON object with 'name' and 'arguments' fields.",
                 }
             )
-            return None
+            return []
 
-        # Execute tool calls
-        for tool_call in tool_calls:
-            result = self._execute_tool_call(tool_call)
+        return tool_calls
 
-            # Check for completion tools
-            if result.name == "task_complete":
-                return self._handle_task_complete(tool_call, result)
-            elif result.name == "task_blocked":
-                return self._handle_task_blocked(tool_call, result)
+    def _handle_tool_result(
+        self, tool_call: Dict[str, Any], result: ToolResult
+    ) -> Optional[AgentResult]:
+        """Record a tool result and decide whether the agent is done.
 
-            # Add tool result to history
-            self._messages.append(
-                {
-                    "role": "tool",
-                    "tool_call_id": result.tool_call_id,
-                    "content": result.output
-                    if result.success
-                    else f"Error: {result.error}",
-                }
-            )
+        Args:
+            tool_call: Tool call from LLM.
+            result: Tool execution result.
 
-            # Track errors
-            if not result.success:
-                self._consecutive_errors += 1
-                if self._consecutive_errors >= self.error_threshold:
-                    return AgentResult(
-                        status=AgentStatus.ERROR,
-                        summary="Too many consecutive tool errors",
-                        error=result.error,
-                        turns_used=self._turn_count,
-                    )
-            else:
-                self._consecutive_errors = 0
+        Returns:
+            AgentResult if agent is done, None to continue.
+        """
+        # Check for completion tools
+        if result.name == "task_complete":
+            return self._handle_task_complete(tool_call, result)
+        elif result.name == "task_blocked":
+            return self._handle_task_blocked(tool_call, result)
+
+        # Add tool result to history
+        self._messages.append(
+            {
+                "role": "tool",
+                "tool_call_id": result.tool_call_id,
+                "content": result.output
+                if result.success
+                else f"Error: {result.error}",
+            }
+        )
+
+        # Track errors
+        if not result.success:
+            self._consecutive_errors += 1
+            if self._consecutive_errors >= self.error_threshold:
+                return AgentResult(
+                    status=AgentStatus.ERROR,
+                    summary="Too many consecutive tool errors",
+                    error=result.error,
+                    turns_used=self._turn_count,
+                )
+        else:
+            self._consecutive_errors = 0
 
         return None
 
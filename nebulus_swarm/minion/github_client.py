@@ -4,10 +4,16 @@ import logging
 from dataclasses import dataclass
 from typing import List, Optional
 
-from github import Auth, Github
+from github import Github
 from github.GithubException import GithubException
 from github.Repository import Repository
 
+from nebulus_swarm.integrations.github_api import (
+    GitHubPriority,
+    get_shared_github,
+    release_shared_github,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,11 +73,11 @@ class GitHubClient:
             token: GitHub personal access token or app token.
         """
         self.token = token
-        auth = Auth.Token(token)
-        self._client = Github(auth=auth)
+        self._api = get_shared_github(token, client_factory=Github)
+        self._client = self._api.client
 
     def get_repo(self, repo_name: str) -> Repository:
-        """Get a repository by name.
+        """Get a repository by name (cached briefly by the shared client).
 
         Args:
             repo_name: Repository in 'owner/name' format.
@@ -79,7 +85,7 @@ class GitHubClient:
         Returns:
             Repository object.
         """
-        return self._client.get_repo(repo_name)
+        return self._api.get_repo(repo_name)
 
     def get_issue(self, repo_name: str, issue_number: int) -> IssueDetails:
         """Fetch issue details including comments.
@@ -94,6 +100,7 @@ class GitHubClient:
         logger.info(f"Fetching issue {repo_name}#{issue_number}")
 
         repo = self.get_repo(repo_name)
+        self._api.require(GitHubPriority.REVIEW, cost=2)
         issue = repo.get_issue(issue_number)
 
         # Get comments
@@ -136,6 +143,7 @@ class GitHubClient:
         logger.info(f"Creating PR: {head_branch} -> {base_branch}")
 
         repo = self.get_repo(repo_name)
+        self._api.require(GitHubPriority.WRITE)
 
         try:
             pr = repo.create_pull(
@@ -175,6 +183,10 @@ class GitHubClient:
             remove_labels: Labels to remove.
         """
         repo = self.get_repo(repo_name)
+        self._api.require(
+            GitHubPriority.REVIEW,
+            cost=1 + len(add_labels or []) + len(remove_labels or []),
+        )
         issue = repo.get_issue(issue_number)
 
         if add_labels:
@@ -202,6 +214,7 @@ class GitHubClient:
             body: Comment text.
         """
         repo = self.get_repo(repo_name)
+        self._api.require(GitHubPriority.REVIEW, cost=2)
         issue = repo.get_issue(issue_number)
         issue.create_comment(body)
         logger.debug(f"Added comment to #{issue_number}")
@@ -234,5 +247,5 @@ class GitHubClient:
         )
 
     def close(self) -> None:
-        """Close the GitHub client connection."""
-        self._client.close()
+        """Release the shared GitHub client connection."""
+        release_shared_github(self._api)
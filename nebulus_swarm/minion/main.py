@@ -356,7 +356,7 @@ class Minion:
         questions_asked = 0
 
         while True:
-            result: AgentResult = agent.run()
+            result: AgentResult = await agent.run_async()
 
             logger.info(f"Agent finished: {result.status.value} - {result.summary}")
             logger.info(f"Turns used: {result.turns_used}")
@@ -425,7 +425,7 @@ class Minion:
                     )
 
                 self.reporter.update_status("working")
-                # Loop continues - agent.run() resumes with injected context
+                # Loop continues - agent.run_async() resumes with injected context
 
             elif result.status == AgentStatus.BLOCKED:
                 # Blocked without a question - terminal failure
@@ -1,6 +1,7 @@
 """Minion skill system."""
 
 from nebulus_swarm.minion.skills.loader import SkillLoader
+from nebulus_swarm.minion.skills.matcher import TriggerIndex
 from nebulus_swarm.minion.skills.schema import Skill, SkillTriggers
 from nebulus_swarm.minion.skills.validator import (
     SkillValidator,
@@ -14,6 +15,7 @@ __all__ = [
     "SkillTriggers",
     "SkillLoader",
     "SkillValidator",
+    "TriggerIndex",
     "ValidationResult",
     "is_skill_change",
     "validate_skill_changes",
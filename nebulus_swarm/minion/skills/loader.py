@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 
 import yaml
 
+from nebulus_swarm.minion.skills.matcher import TriggerIndex
 from nebulus_swarm.minion.skills.schema import Skill
 
 logger = logging.getLogger(__name__)
@@ -29,6 +30,7 @@ class SkillLoader:
         self.workspace = workspace
         self.skills_dir = workspace / SKILLS_DIR
         self._skills: Dict[str, Skill] = {}
+        self._index = TriggerIndex([])
         self._loaded = False
 
     def load_skills(self) -> None:
@@ -46,6 +48,7 @@ class SkillLoader:
             # Load all YAML files in directory
             self._load_all_yaml_files()
 
+        self._index = TriggerIndex(self._skills.values())
         self._loaded = True
         logger.info(f"Loaded {len(self._skills)} skills")
 
@@ -163,12 +166,8 @@ class SkillLoader:
         if not self._loaded:
             self.load_skills()
 
-        matches = []
-        for skill in self._skills.values():
-            if skill.matches_issue(title, body, labels, files):
-                matches.append(skill)
-
-        return matches
+        names = self._index.match(title, body, labels, files)
+        return [skill for name, skill in self._skills.items() if name in names]
 
     def get_combined_instructions(self, skill_names: List[str]) -> str:
         """Get combined instructions for multiple skills.
@@ -0,0 +1,148 @@
+"""Compiled trigger index for matching skills against issues."""
+
+import fnmatch
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Set
+
+from nebulus_swarm.minion.skills.schema import Skill
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """Build a regex matching any of ``words``, preferring the longest.
+
+    The alternation is factored into a character trie, so the engine
+    follows one branch per input character instead of trying every word
+    at every position.
+
+    Args:
+        words: Non-empty literal strings.
+
+    Returns:
+        Regex source string.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        branches = [
+            re.escape(char) + render(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            # A word ends here; the optional group keeps matches greedy
+            return f"(?:{body})?"
+        return body
+
+    return render(trie)
+
+
+class TriggerIndex:
+    """Inverted index over the triggers of a set of skills.
+
+    Built once per skill load. Keywords are compiled into a single regex,
+    labels into a hash map and file patterns into a glob set, so matching
+    an issue is one pass over its text however many skills are loaded.
+    Matches agree with ``Skill.matches_issue``.
+    """
+
+    def __init__(self, skills: Iterable[Skill]):
+        """Build the index.
+
+        Args:
+            skills: Skills to index.
+        """
+        keyword_skills: Dict[str, Set[str]] = {}
+        self._always: Set[str] = set()
+        self._labels: Dict[str, Set[str]] = {}
+        self._globs: Dict[str, Set[str]] = {}
+
+        for skill in skills:
+            for keyword in skill.triggers.keywords:
+                keyword = keyword.lower()
+                if keyword:
+                    keyword_skills.setdefault(keyword, set()).add(skill.name)
+                else:
+                    # An empty keyword is a substring of every issue
+                    self._always.add(skill.name)
+            for label in skill.triggers.labels:
+                self._labels.setdefault(label, set()).add(skill.name)
+            for pattern in skill.triggers.file_patterns:
+                self._globs.setdefault(pattern, set()).add(skill.name)
+
+        # The scan reports only the longest keyword starting at each
+        # position, so each keyword also carries the skills of the
+        # keywords that are prefixes of it.
+        self._keywords: Dict[str, Set[str]] = {
+            keyword: set().union(
+                *(
+                    keyword_skills.get(keyword[:end], ())
+                    for end in range(1, len(keyword) + 1)
+                )
+            )
+            for keyword in keyword_skills
+        }
+        self._keyword_re: Optional[Pattern[str]] = (
+            re.compile(f"(?=({_trie_regex(keyword_skills)}))")
+            if keyword_skills
+            else None
+        )
+
+        self._glob_res: List[tuple] = [
+            (re.compile(fnmatch.translate(pattern)), names)
+            for pattern, names in self._globs.items()
+        ]
+        self._any_glob: Optional[Pattern[str]] = (
+            re.compile("|".join(f"(?:{p.pattern})" for p, _ in self._glob_res))
+            if self._glob_res
+            else None
+        )
+
+    def match(
+        self,
+        title: str,
+        body: str,
+        labels: List[str],
+        files: Optional[List[str]] = None,
+    ) -> Set[str]:
+        """Find the names of the skills that match an issue.
+
+        Args:
+            title: Issue title.
+            body: Issue body.
+            labels: Issue labels.
+            files: Optional list of files in the PR/issue.
+
+        Returns:
+            Set of matching skill names.
+        """
+        matched = set(self._always)
+
+        if self._keyword_re is not None:
+            text = f"{title} {body}".lower()
+            seen: Set[str] = set()
+            for m in self._keyword_re.finditer(text):
+                keyword = m.group(1)
+                if keyword not in seen:
+                    seen.add(keyword)
+                    matched |= self._keywords[keyword]
+
+        for label in labels:
+            matched |= self._labels.get(label, set())
+
+        if files and self._any_glob is not None:
+            for file in files:
+                if not self._any_glob.match(file):
+                    continue
+                for regex, names in self._glob_res:
+                    if not names <= matched and regex.match(file):
+                        matched |= names
+
+        return matched
@@ -2,23 +2,51 @@
 
 Provides tamper-evident semantic logging with hash chains and Ed25519 signing.
 Designed for regulated industries requiring audit trails.
+
+Entries are ordered by a monotonic ``seq`` column. The trail keeps the
+chain head (last seq and hash) in memory and appends through one writer
+connection under a lock, so an append is a single INSERT; ``PRAGMA
+data_version`` tells it when another process has appended and the head
+must be reloaded.
+
+Verification streams entries in seq order in fixed-size blocks, hashing
+blocks in parallel worker processes when asked. Each fully verified block
+is recorded as a signed checkpoint holding the Merkle root of its entry
+hashes, so the next verification resumes after the last checkpoint.
 """
 
 import hashlib
+import itertools
 import json
 import logging
+import multiprocessing
 import os
 import sqlite3
+import threading
 import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Entries per verification block (and per checkpoint)
+VERIFY_BLOCK_SIZE = 4096
+# Never fork a process that holds SQLite connections and a writer lock
+_POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Columns _verify_block reads, in order
+_VERIFY_COLUMNS = (
+    "id, event, task_id, timestamp, data, reasoning, previous_hash, entry_hash, seq"
+)
+
 
 class LogEvent(Enum):
     """Types of events in the audit trail."""
@@ -74,16 +102,81 @@ class SemanticLog:
 
     def compute_hash(self) -> str:
         """Compute hash of this log entry (excluding signature)."""
-        content = {
-            "id": self.id,
-            "event": self.event.value,
-            "task_id": self.task_id,
-            "timestamp": self.timestamp.isoformat(),
-            "data": self.data,
-            "reasoning": self.reasoning,
-            "previous_hash": self.previous_hash,
-        }
-        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+        return _hash_entry(
+            self.id,
+            self.event.value,
+            self.task_id,
+            self.timestamp.isoformat(),
+            self.data,
+            self.reasoning,
+            self.previous_hash,
+        )
+
+
+def _hash_entry(
+    entry_id: str,
+    event: str,
+    task_id: str,
+    timestamp: str,
+    data: Dict[str, Any],
+    reasoning: str,
+    previous_hash: str,
+) -> str:
+    """SHA-256 over an entry's canonical JSON (everything but the signature)."""
+    content = {
+        "id": entry_id,
+        "event": event,
+        "task_id": task_id,
+        "timestamp": timestamp,
+        "data": data,
+        "reasoning": reasoning,
+        "previous_hash": previous_hash,
+    }
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+
+def merkle_root(hashes: List[str]) -> str:
+    """Merkle root over hex digests; an odd node is paired with itself."""
+    level = list(hashes) or [""]
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [
+            hashlib.sha256((level[i] + level[i + 1]).encode()).hexdigest()
+            for i in range(0, len(level), 2)
+        ]
+    return level[0]
+
+
+def _verify_block(rows: List[tuple]) -> Tuple[List[str], str]:
+    """Recompute the entry hashes of one block of rows.
+
+    Runs in worker processes, so it takes plain tuples in _VERIFY_COLUMNS
+    order.
+
+    Returns:
+        (hash mismatch issues, Merkle root of the stored entry hashes).
+    """
+    issues = []
+    for entry_id, event, task_id, timestamp, data, reasoning, prev, stored, _ in rows:
+        computed = _hash_entry(
+            entry_id,
+            event,
+            task_id,
+            datetime.fromisoformat(timestamp).isoformat(),
+            json.loads(data),
+            reasoning or "",
+            prev or "",
+        )
+        if computed != stored:
+            issues.append(
+                f"Hash mismatch at {entry_id}: computed={computed[:8]}..., stored={stored[:8]}..."
+            )
+    return issues, merkle_root([row[7] for row in rows])
+
+
+# (event, task_id, data) or (event, task_id, data, reasoning)
+AuditEvent = Tuple[Any, ...]
 
 
 class AuditTrail:
@@ -106,9 +199,20 @@ class AuditTrail:
         """
         self.db_path = db_path
         self._signing_key = signing_key
+        self._private_key: Any = None
         self._ensure_dir()
         self._init_db()
 
+        # Single writer connection; the lock serializes appends so the
+        # cached chain head cannot fork
+        self._lock = threading.Lock()
+        self._writer = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False
+        )
+        self._head_seq = 0
+        self._head_hash = ""
+        self._data_version: Optional[int] = None
+
     def _ensure_dir(self) -> None:
         db_dir = os.path.dirname(self.db_path)
         if db_dir:
@@ -136,23 +240,47 @@ class AuditTrail:
                     reasoning TEXT,
                     previous_hash TEXT,
                     signature TEXT,
-                    entry_hash TEXT NOT NULL
+                    entry_hash TEXT NOT NULL,
+                    seq INTEGER
                 )
             """)
+            columns = {
+                row["name"] for row in conn.execute("PRAGMA table_info(audit_logs)")
+            }
+            if "seq" not in columns:
+                # Trails written before seq existed: insertion order is rowid
+                conn.execute("ALTER TABLE audit_logs ADD COLUMN seq INTEGER")
+                conn.execute("UPDATE audit_logs SET seq = rowid")
+            conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_seq ON audit_logs(seq)")
+            conn.execute("DROP INDEX IF EXISTS idx_task_id")
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_task_id ON audit_logs(task_id)"
+                "CREATE INDEX IF NOT EXISTS idx_task_seq ON audit_logs(task_id, seq)"
             )
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_timestamp ON audit_logs(timestamp)"
             )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS audit_checkpoints (
+                    last_seq INTEGER PRIMARY KEY,
+                    first_seq INTEGER NOT NULL,
+                    last_hash TEXT NOT NULL,
+                    merkle_root TEXT NOT NULL,
+                    signature TEXT,
+                    created_at TEXT NOT NULL
+                )
+            """)
 
-    def _get_last_hash(self) -> str:
-        """Get hash of the most recent log entry."""
-        with self._conn() as conn:
-            row = conn.execute(
-                "SELECT entry_hash FROM audit_logs ORDER BY timestamp DESC LIMIT 1"
-            ).fetchone()
-            return row["entry_hash"] if row else ""
+    def _refresh_head(self) -> None:
+        """Reload the chain head if another connection appended since our
+        last look. Call with the lock held, inside the write transaction."""
+        version = self._writer.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._data_version:
+            return
+        row = self._writer.execute(
+            "SELECT seq, entry_hash FROM audit_logs ORDER BY seq DESC LIMIT 1"
+        ).fetchone()
+        self._head_seq, self._head_hash = (row[0], row[1]) if row else (0, "")
+        self._data_version = version
 
     def _sign(self, content: str) -> str:
         """Sign content with Ed25519 key if available."""
@@ -165,8 +293,11 @@ class AuditTrail:
                 Ed25519PrivateKey,
             )
 
-            key = Ed25519PrivateKey.from_private_bytes(self._signing_key)
-            signature = key.sign(content.encode())
+            if self._private_key is None:
+                self._private_key = Ed25519PrivateKey.from_private_bytes(
+                    self._signing_key
+                )
+            signature = self._private_key.sign(content.encode())
             return base64.b64encode(signature).decode()
         except ImportError:
             logger.debug("cryptography not available, skipping signature")
@@ -175,6 +306,14 @@ class AuditTrail:
             logger.warning(f"Signing failed: {e}")
             return ""
 
+    def _signature_valid(self, content: str, signature: str) -> bool:
+        """Check a signature made by ``_sign`` with this trail's key.
+
+        Ed25519 signatures are deterministic, so re-signing must reproduce
+        it; without a key (or cryptography) both sides are empty.
+        """
+        return self._sign(content) == signature
+
     def log(
         self,
         event: LogEvent,
@@ -193,46 +332,81 @@ class AuditTrail:
         Returns:
             The created SemanticLog entry.
         """
-        entry = SemanticLog(
-            event=event,
-            task_id=task_id,
-            timestamp=datetime.now(),
-            data=data,
-            reasoning=reasoning,
-            previous_hash=self._get_last_hash(),
-        )
+        return self.log_many([(event, task_id, data, reasoning)])[0]
 
-        # Compute hash and sign
-        entry_hash = entry.compute_hash()
-        entry.signature = self._sign(entry_hash)
+    def log_many(self, events: Iterable[AuditEvent]) -> List[SemanticLog]:
+        """Append several entries to the chain in one transaction.
 
-        # Store in database
-        with self._conn() as conn:
-            conn.execute(
-                """INSERT INTO audit_logs
-                   (id, event, task_id, timestamp, data, reasoning, previous_hash, signature, entry_hash)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    entry.id,
-                    entry.event.value,
-                    entry.task_id,
-                    entry.timestamp.isoformat(),
-                    json.dumps(entry.data),
-                    entry.reasoning,
-                    entry.previous_hash,
-                    entry.signature,
-                    entry_hash,
-                ),
-            )
+        Args:
+            events: ``(event, task_id, data)`` or
+                ``(event, task_id, data, reasoning)`` tuples, in order.
 
-        logger.debug(f"Audit log: {event.value} for task {task_id}")
-        return entry
+        Returns:
+            The created SemanticLog entries, in order.
+        """
+        entries: List[SemanticLog] = []
+        with self._lock:
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                self._refresh_head()
+                seq, previous_hash = self._head_seq, self._head_hash
+                rows = []
+                for event, task_id, data, *rest in events:
+                    entry = SemanticLog(
+                        event=event,
+                        task_id=task_id,
+                        timestamp=datetime.now(),
+                        data=data,
+                        reasoning=rest[0] if rest else "",
+                        previous_hash=previous_hash,
+                    )
+                    # Compute hash and sign
+                    entry_hash = entry.compute_hash()
+                    entry.signature = self._sign(entry_hash)
+                    seq += 1
+                    rows.append(
+                        (
+                            entry.id,
+                            entry.event.value,
+                            entry.task_id,
+                            entry.timestamp.isoformat(),
+                            json.dumps(entry.data),
+                            entry.reasoning,
+                            entry.previous_hash,
+                            entry.signature,
+                            entry_hash,
+                            seq,
+                        )
+                    )
+                    entries.append(entry)
+                    previous_hash = entry_hash
+
+                self._writer.executemany(
+                    """INSERT INTO audit_logs
+                       (id, event, task_id, timestamp, data, reasoning, previous_hash, signature, entry_hash, seq)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    rows,
+                )
+                self._writer.execute("COMMIT")
+            except BaseException:
+                self._writer.execute("ROLLBACK")
+                raise
+            self._head_seq, self._head_hash = seq, previous_hash
+
+        for entry in entries:
+            logger.debug(f"Audit log: {entry.event.value} for task {entry.task_id}")
+        return entries
+
+    def close(self) -> None:
+        """Close the writer connection."""
+        with self._lock:
+            self._writer.close()
 
     def get_logs_for_task(self, task_id: str) -> List[SemanticLog]:
         """Get all log entries for a specific task."""
         with self._conn() as conn:
             rows = conn.execute(
-                "SELECT * FROM audit_logs WHERE task_id = ? ORDER BY timestamp",
+                "SELECT * FROM audit_logs WHERE task_id = ? ORDER BY seq",
                 (task_id,),
             ).fetchall()
             return [self._row_to_log(r) for r in rows]
@@ -241,7 +415,7 @@ class AuditTrail:
         """Get all log entries, most recent first."""
         with self._conn() as conn:
             rows = conn.execute(
-                "SELECT * FROM audit_logs ORDER BY timestamp DESC LIMIT ?",
+                "SELECT * FROM audit_logs ORDER BY seq DESC LIMIT ?",
                 (limit,),
             ).fetchall()
             return [self._row_to_log(r) for r in rows]
@@ -258,43 +432,164 @@ class AuditTrail:
             signature=row["signature"] or "",
         )
 
-    def verify_integrity(self) -> tuple[bool, List[str]]:
+    def verify_integrity(
+        self,
+        full: bool = False,
+        workers: int = 1,
+        block_size: int = VERIFY_BLOCK_SIZE,
+    ) -> tuple[bool, List[str]]:
         """Verify the hash chain integrity.
 
+        Entries are streamed in seq order, so memory use does not grow with
+        the trail. Unless ``full`` is set, verification resumes after the
+        latest checkpoint, once its signature and its anchor entry check
+        out. Every block verified cleanly is checkpointed for next time.
+
+        Args:
+            full: Verify from genesis, also checking stored checkpoints'
+                Merkle roots.
+            workers: Processes hashing blocks in parallel; 1 hashes inline.
+            block_size: Entries per block and per checkpoint.
+
         Returns:
             Tuple of (is_valid, list_of_issues).
         """
-        issues = []
-        with self._conn() as conn:
-            rows = conn.execute(
-                "SELECT * FROM audit_logs ORDER BY timestamp"
-            ).fetchall()
-
-        if not rows:
-            return True, []
-
-        previous_hash = ""
-        for row in rows:
-            log = self._row_to_log(row)
-            stored_hash = row["entry_hash"]
-
-            # Check previous hash chain
-            if log.previous_hash != previous_hash:
-                issues.append(
-                    f"Chain break at {log.id}: expected previous_hash={previous_hash[:8]}..., got {log.previous_hash[:8]}..."
+        issues: List[str] = []
+        checkpoints: List[tuple] = []
+        executor: Optional[ProcessPoolExecutor] = None
+        # Blocks hashed but not yet folded into the result, oldest first
+        pending: deque = deque()
+
+        def settle(block: tuple) -> None:
+            first_seq, last_seq, last_hash, full_block, chain_issues, result = block
+            hash_issues, root = (
+                result.result() if isinstance(result, Future) else result
+            )
+            issues.extend(chain_issues + hash_issues)
+            if issues:
+                return
+            stored = stored_roots.get(last_seq)
+            if stored is not None and stored[0] == first_seq:
+                if stored[1] != root:
+                    issues.append(
+                        f"Merkle root mismatch in checkpoint at seq {last_seq}"
+                    )
+            elif full_block:
+                content = f"{first_seq}:{last_seq}:{last_hash}:{root}"
+                checkpoints.append(
+                    (
+                        last_seq,
+                        first_seq,
+                        last_hash,
+                        root,
+                        self._sign(content),
+                        datetime.now().isoformat(),
+                    )
                 )
 
-            # Verify entry hash
-            computed_hash = log.compute_hash()
-            if computed_hash != stored_hash:
-                issues.append(
-                    f"Hash mismatch at {log.id}: computed={computed_hash[:8]}..., stored={stored_hash[:8]}..."
+        with self._conn() as conn:
+            start = None if full else self._resume_point(conn, issues)
+            after_seq, previous_hash = start or (0, "")
+            # last_seq -> (first_seq, merkle_root) of stored checkpoints
+            stored_roots: Dict[int, Tuple[int, str]] = {}
+            if full:
+                stored_roots = {
+                    row[0]: (row[1], row[2])
+                    for row in conn.execute(
+                        "SELECT last_seq, first_seq, merkle_root FROM audit_checkpoints"
+                    )
+                }
+
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                f"SELECT {_VERIFY_COLUMNS} FROM audit_logs WHERE seq > ? ORDER BY seq",
+                (after_seq,),
+            )
+            try:
+                while True:
+                    rows = list(itertools.islice(cursor, block_size))
+                    if not rows:
+                        break
+                    chain_issues = []
+                    for row in rows:
+                        entry_id, row_previous = row[0], row[6] or ""
+                        if row_previous != previous_hash:
+                            chain_issues.append(
+                                f"Chain break at {entry_id}: expected previous_hash={previous_hash[:8]}..., got {row_previous[:8]}..."
+                            )
+                        previous_hash = row[7]
+
+                    if workers > 1 and (executor or len(rows) == block_size):
+                        if executor is None:
+                            executor = ProcessPoolExecutor(
+                                max_workers=workers,
+                                mp_context=multiprocessing.get_context(
+                                    _POOL_START_METHOD
+                                ),
+                            )
+                        result: Any = executor.submit(_verify_block, rows)
+                    else:
+                        result = _verify_block(rows)
+                    pending.append(
+                        (
+                            rows[0][8],
+                            rows[-1][8],
+                            rows[-1][7],
+                            len(rows) == block_size,
+                            chain_issues,
+                            result,
+                        )
+                    )
+                    # Bound the blocks held in memory while workers hash
+                    while len(pending) > workers * 2:
+                        settle(pending.popleft())
+                while pending:
+                    settle(pending.popleft())
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+
+            if checkpoints:
+                conn.executemany(
+                    """INSERT OR IGNORE INTO audit_checkpoints
+                       (last_seq, first_seq, last_hash, merkle_root, signature, created_at)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    checkpoints,
                 )
 
-            previous_hash = stored_hash
-
         return len(issues) == 0, issues
 
+    def _resume_point(
+        self, conn: sqlite3.Connection, issues: List[str]
+    ) -> Optional[Tuple[int, str]]:
+        """Seq and entry hash to resume verification after, from the latest
+        checkpoint; None to start from genesis.
+
+        A checkpoint with a bad signature, or whose anchor entry no longer
+        carries the checkpointed hash, is reported as an issue and ignored.
+        """
+        checkpoint = conn.execute(
+            "SELECT * FROM audit_checkpoints ORDER BY last_seq DESC LIMIT 1"
+        ).fetchone()
+        if checkpoint is None:
+            return None
+        last_seq, last_hash = checkpoint["last_seq"], checkpoint["last_hash"]
+        content = (
+            f"{checkpoint['first_seq']}:{last_seq}:{last_hash}:"
+            f"{checkpoint['merkle_root']}"
+        )
+        if not self._signature_valid(content, checkpoint["signature"] or ""):
+            issues.append(f"Invalid signature on checkpoint at seq {last_seq}")
+            return None
+        anchor = conn.execute(
+            "SELECT entry_hash FROM audit_logs WHERE seq = ?", (last_seq,)
+        ).fetchone()
+        if anchor is None or anchor["entry_hash"] != last_hash:
+            issues.append(f"Checkpoint at seq {last_seq} no longer matches the trail")
+            return None
+        return last_seq, last_hash
+
     def export(self, task_id: Optional[str] = None) -> Dict[str, Any]:
         """Export audit trail as JSON-serializable dict.
 
@@ -106,6 +106,9 @@ class CommandParser:
         ],
     }
 
+    # Minion ids are "minion-<8 hex>"; also accept any id containing a digit
+    MINION_ID_PATTERN = re.compile(r"[0-9a-f]{8}|[a-z0-9-]*\d[a-z0-9-]*")
+
     def __init__(self, default_repo: Optional[str] = None):
         """Initialize parser.
 
@@ -134,6 +137,55 @@ class CommandParser:
         # No pattern matched
         return Command(type=CommandType.UNKNOWN, raw_text=text)
 
+    def parse_exact(self, text: str) -> Optional[Command]:
+        """Parse a message only if it is exactly a canonical command.
+
+        Unlike ``parse``, a pattern must match the whole message, so
+        "status" or "work on #42" match but "hey can you start on issue 42"
+        does not. Every captured argument must also be a real identifier
+        (see ``_captures_are_identifiers``), so context-dependent phrases
+        such as "kill it" are left to the LLM. Used to skip the LLM for
+        unambiguous commands.
+
+        Args:
+            text: Raw message text from Slack.
+
+        Returns:
+            Parsed Command, or None if no pattern matches the full text.
+        """
+        text = " ".join(text.strip().lower().split()).rstrip("?!.")
+
+        for cmd_type, patterns in self.PATTERNS.items():
+            for pattern in patterns:
+                match = re.fullmatch(pattern.strip("^$"), text, re.IGNORECASE)
+                if match and self._captures_are_identifiers(match):
+                    return self._build_command(cmd_type, match, text)
+
+        return None
+
+    def _captures_are_identifiers(self, match: re.Match) -> bool:
+        """Check that every captured argument is an unambiguous identifier.
+
+        Accepted: issue/PR numbers, ``owner/repo`` names, and minion ids
+        written with an explicit ``minion`` prefix. Anything else ("it",
+        "that", "all") refers to conversation context.
+
+        Args:
+            match: Full-text match from ``parse_exact``.
+
+        Returns:
+            True if the command can be built without context.
+        """
+        for index, value in enumerate(match.groups(), start=1):
+            if value is None or value.isdigit() or "/" in value:
+                continue
+            prefix = match.string[: match.start(index)]
+            if not prefix.endswith(("minion-", "minion ")):
+                return False
+            if not self.MINION_ID_PATTERN.fullmatch(value):
+                return False
+        return True
+
     def _build_command(
         self, cmd_type: CommandType, match: re.Match, raw_text: str
     ) -> Command:
@@ -1,20 +1,37 @@
 """GitHub issue queue scanner for Overlord."""
 
+import json
 import logging
+import re
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from github import Auth, Github
+from github import Github
 from github.GithubException import GithubException, RateLimitExceededException
 
+from nebulus_swarm.integrations.github_api import (
+    GitHubPriority,
+    get_shared_github,
+    release_shared_github,
+)
+
 logger = logging.getLogger(__name__)
 
 # Rate limit safety margin (don't operate if below this)
 RATE_LIMIT_THRESHOLD = 100
 # Minimum requests needed for a queue sweep
 REQUESTS_PER_SWEEP = 10
+# Requests budgeted for a repo we hold an ETag for (304s are free)
+CONDITIONAL_REQUESTS_PER_REPO = 1
+# Issues fetched per page of the issues endpoint
+ISSUES_PER_PAGE = 100
+# Seconds a scan request waits for budget before giving up on the sweep
+SCAN_ACQUIRE_TIMEOUT = 30.0
+# Issue details are read right before dispatch; keep them only briefly
+ISSUE_DETAILS_TTL = 60.0
 
 
 @dataclass
@@ -33,6 +50,40 @@ class QueuedIssue:
         return f"{self.repo}#{self.number}: {self.title}"
 
 
+@dataclass
+class QueueDelta:
+    """Changes in the ready queue since the previous scan."""
+
+    added: List[QueuedIssue] = field(default_factory=list)
+    removed: List[QueuedIssue] = field(default_factory=list)
+    updated: List[QueuedIssue] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        """True if nothing changed."""
+        return not (self.added or self.removed or self.updated)
+
+
+@dataclass
+class _RepoScan:
+    """Cached result of the last successful scan of one repo."""
+
+    etag: Optional[str]
+    issues: List[QueuedIssue]
+    scanned_at: float
+    pages: int = 1
+
+    @property
+    def conditional(self) -> bool:
+        """Whether the next scan may be a conditional request.
+
+        The ETag covers only the first page. A 304 on it says nothing about
+        later pages, where a newly labeled older issue can appear, so
+        multi-page results are always fetched in full.
+        """
+        return bool(self.etag) and self.pages == 1
+
+
 class GitHubQueue:
     """Scans GitHub repositories for issues ready to work on."""
 
@@ -59,36 +110,213 @@ class GitHubQueue:
         self.in_progress_label = in_progress_label
         self.high_priority_label = high_priority_label
 
-        auth = Auth.Token(token)
-        self._client = Github(auth=auth)
+        self._api = get_shared_github(token, client_factory=Github)
+        self._client = self._api.client
+
+        # Last scan per repo, for conditional requests and delta detection
+        self._scans: Dict[str, _RepoScan] = {}
+        self.last_delta = QueueDelta()
+        self.requests_made = 0
+        self.requests_not_modified = 0
+
+        # Scans run in worker threads while webhooks update the cache on
+        # the event loop. _lock guards _scans, _in_flight, last_delta and
+        # the counters and is never held across a request; _scan_lock
+        # serializes whole scans so concurrent sweeps don't interleave.
+        self._lock = threading.Lock()
+        self._scan_lock = threading.Lock()
+        # Webhook changes seen while a repo is being fetched, replayed over
+        # the fetched result: repo -> issue number -> issue (None if gone)
+        self._in_flight: Dict[str, Dict[int, Optional[QueuedIssue]]] = {}
 
     def scan_queue(self) -> List[QueuedIssue]:
         """Scan all watched repos for issues ready to work on.
 
+        Repos whose issue list is unchanged since the previous scan are
+        answered from cache via a conditional request, which GitHub does
+        not count against the rate limit. The changes found are kept in
+        ``last_delta``.
+
         Returns:
             List of QueuedIssue objects, sorted by priority then date.
         """
-        all_issues: List[QueuedIssue] = []
+        return self.scan_with_delta()[0]
+
+    def scan_with_delta(self) -> Tuple[List[QueuedIssue], QueueDelta]:
+        """Scan all watched repos and return the issues with their delta.
+
+        Safe to call from several threads; use this rather than reading
+        ``last_delta`` after ``scan_queue``, which another scan may have
+        replaced in between.
+
+        Returns:
+            Tuple of (issues sorted by priority then date, QueueDelta
+            relative to the previous scan).
+        """
+        with self._scan_lock:
+            with self._lock:
+                previous = {
+                    (issue.repo, issue.number): issue
+                    for scan in self._scans.values()
+                    for issue in scan.issues
+                }
+                for repo_name in self.watched_repos:
+                    self._in_flight[repo_name] = {}
+            all_issues: List[QueuedIssue] = []
+            failed: List[str] = []
 
-        for repo_name in self.watched_repos:
             try:
-                issues = self._scan_repo(repo_name)
-                all_issues.extend(issues)
-            except RateLimitExceededException:
-                logger.warning("GitHub rate limit exceeded, stopping scan")
-                break
-            except GithubException as e:
-                logger.error(f"Error scanning {repo_name}: {e}")
-                continue
+                for index, repo_name in enumerate(self.watched_repos):
+                    try:
+                        issues = self._scan_repo(repo_name)
+                        all_issues.extend(issues)
+                    except RateLimitExceededException:
+                        logger.warning("GitHub rate limit exceeded, stopping scan")
+                        failed.extend(self.watched_repos[index:])
+                        break
+                    except GithubException as e:
+                        logger.error(f"Error scanning {repo_name}: {e}")
+                        failed.append(repo_name)
+                        continue
+            finally:
+                with self._lock:
+                    seen_by_webhook = {
+                        (repo_name, number): issue
+                        for repo_name in self.watched_repos
+                        for number, issue in self._in_flight.pop(repo_name, {}).items()
+                    }
+
+            with self._lock:
+                # Repos that could not be scanned keep their cached issues
+                for repo_name in failed:
+                    if repo_name in self._scans:
+                        all_issues.extend(self._scans[repo_name].issues)
+
+                # Webhook deltas were already reported; don't repeat them
+                for key, issue in seen_by_webhook.items():
+                    if issue is None:
+                        previous.pop(key, None)
+                    else:
+                        previous[key] = issue
+
+                delta = self._diff(previous, all_issues)
+                self.last_delta = delta
 
         # Sort by priority (descending) then by created date (ascending)
         all_issues.sort(key=lambda i: (-i.priority, i.created_at))
 
-        return all_issues
+        return all_issues, delta
+
+    def scan_changes(self) -> QueueDelta:
+        """Scan watched repos and return only what changed.
+
+        Returns:
+            QueueDelta relative to the previous scan. The first scan
+            reports every ready issue as added.
+        """
+        return self.scan_with_delta()[1]
+
+    def cached_queue(self) -> List[QueuedIssue]:
+        """Ready issues as of the last scan or webhook, without API calls.
+
+        Returns:
+            List of QueuedIssue objects, sorted by priority then date.
+        """
+        with self._lock:
+            issues = [
+                issue
+                for repo_name, scan in self._scans.items()
+                if repo_name in self.watched_repos
+                for issue in scan.issues
+            ]
+        issues.sort(key=lambda i: (-i.priority, i.created_at))
+        return issues
+
+    def apply_issue_event(
+        self, repo_name: str, action: str, raw: Dict[str, Any]
+    ) -> QueueDelta:
+        """Apply an ``issues`` webhook payload to the cached queue.
+
+        The repo's ETag is kept: GitHub will answer the next conditional
+        scan with fresh data since the issue list changed upstream.
+
+        Args:
+            repo_name: Repository in owner/name format.
+            action: Webhook action (opened, labeled, closed, ...).
+            raw: The payload's ``issue`` object.
+
+        Returns:
+            QueueDelta describing the change, empty if none.
+        """
+        delta = QueueDelta()
+        if repo_name not in self.watched_repos:
+            return delta
+
+        label_names = {label["name"] for label in raw.get("labels", [])}
+        issue: Optional[QueuedIssue] = None
+        if (
+            action not in ("closed", "deleted", "transferred")
+            and raw.get("state", "open") == "open"
+            and self.work_label in label_names
+        ):
+            issue = self._to_queued(repo_name, raw)
+
+        number = raw["number"]
+        with self._lock:
+            scan = self._scans.get(repo_name)
+            if scan is None:
+                scan = self._scans[repo_name] = _RepoScan(
+                    etag=None, issues=[], scanned_at=0.0
+                )
+            old = next((i for i in scan.issues if i.number == number), None)
+            scan.issues = [i for i in scan.issues if i.number != number]
+            if issue is not None:
+                scan.issues.append(issue)
+            # A scan fetching this repo now may have read the old state
+            if repo_name in self._in_flight:
+                self._in_flight[repo_name][number] = issue
+
+        if old is None and issue is not None:
+            delta.added.append(issue)
+        elif old is not None and issue is None:
+            delta.removed.append(old)
+        elif old is not None and issue is not None and old != issue:
+            delta.updated.append(issue)
+        return delta
+
+    @staticmethod
+    def _diff(
+        previous: Dict[Tuple[str, int], QueuedIssue], current: List[QueuedIssue]
+    ) -> QueueDelta:
+        """Compare two scans.
+
+        Args:
+            previous: Issues from the last scan keyed by (repo, number).
+            current: Issues from this scan.
+
+        Returns:
+            QueueDelta of added, removed and updated issues.
+        """
+        delta = QueueDelta()
+        seen = set()
+        for issue in current:
+            key = (issue.repo, issue.number)
+            seen.add(key)
+            old = previous.get(key)
+            if old is None:
+                delta.added.append(issue)
+            elif old != issue:
+                delta.updated.append(issue)
+        delta.removed = [issue for key, issue in previous.items() if key not in seen]
+        return delta
 
     def _scan_repo(self, repo_name: str) -> List[QueuedIssue]:
         """Scan a single repo for ready issues.
 
+        Sends the ETag of the previous scan as ``If-None-Match`` when that
+        scan fit on one page; a 304 reuses the cached issues without
+        spending quota.
+
         Args:
             repo_name: Repository in owner/name format.
 
@@ -97,48 +325,140 @@ class GitHubQueue:
         """
         logger.debug(f"Scanning {repo_name} for {self.work_label} issues")
 
-        try:
-            repo = self._client.get_repo(repo_name)
-
-            # Get issues with the work label that aren't in progress
-            issues = repo.get_issues(
-                state="open",
-                labels=[self.work_label],
+        with self._lock:
+            cached = self._scans.get(repo_name)
+            headers = (
+                {"If-None-Match": cached.etag} if cached and cached.conditional else {}
             )
+        url: Optional[str] = f"/repos/{repo_name}/issues"
+        parameters: Optional[Dict[str, Any]] = {
+            "state": "open",
+            "labels": self.work_label,
+            "per_page": ISSUES_PER_PAGE,
+        }
 
-            queued = []
-            for issue in issues:
-                # Skip if already in progress
-                label_names = [label.name for label in issue.labels]
-                if self.in_progress_label in label_names:
-                    continue
-
-                # Skip pull requests (GitHub API returns PRs as issues)
-                if issue.pull_request is not None:
-                    continue
-
-                # Determine priority
-                priority = 1 if self.high_priority_label in label_names else 0
-
-                queued.append(
-                    QueuedIssue(
-                        repo=repo_name,
-                        number=issue.number,
-                        title=issue.title,
-                        labels=label_names,
-                        created_at=issue.created_at,
-                        priority=priority,
-                        body=issue.body or "",
-                    )
+        try:
+            status, response_headers, data = self._request(url, parameters, headers)
+            if status == 304 and cached is not None:
+                with self._lock:
+                    self.requests_not_modified += 1
+                    cached.scanned_at = time.time()
+                    # Webhook updates already landed in the cached issues
+                    issues = list(cached.issues)
+                logger.debug(f"{repo_name} unchanged since last scan")
+                return issues
+
+            etag = response_headers.get("etag")
+            raw_issues: List[Dict[str, Any]] = list(data or [])
+            pages = 1
+            url = self._next_page(response_headers)
+            while url:
+                _, response_headers, data = self._request(url, None, {})
+                raw_issues.extend(data or [])
+                pages += 1
+                url = self._next_page(response_headers)
+
+            queued = [
+                issue
+                for issue in (self._to_queued(repo_name, raw) for raw in raw_issues)
+                if issue is not None
+            ]
+            with self._lock:
+                # Replay webhook changes that arrived during the fetch
+                overrides = self._in_flight.get(repo_name, {})
+                queued = [i for i in queued if i.number not in overrides]
+                queued += [i for i in overrides.values() if i is not None]
+                self._scans[repo_name] = _RepoScan(
+                    etag=etag, issues=queued, scanned_at=time.time(), pages=pages
                 )
 
             logger.info(f"Found {len(queued)} ready issues in {repo_name}")
-            return queued
+            return list(queued)
 
         except GithubException as e:
             logger.error(f"Failed to scan {repo_name}: {e}")
             raise
 
+    def _request(
+        self,
+        url: str,
+        parameters: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+    ) -> Tuple[int, Dict[str, Any], Any]:
+        """Issue a GET through PyGithub's requester without status checks.
+
+        Args:
+            url: API path or absolute URL.
+            parameters: Query parameters.
+            headers: Extra request headers.
+
+        Returns:
+            Tuple of (status, lower-cased headers, decoded JSON or None).
+
+        Raises:
+            RateLimitExceededException: If the rate limit is exhausted or
+                no budget is granted within SCAN_ACQUIRE_TIMEOUT.
+            GithubException: On any other error status.
+        """
+        self._api.require(GitHubPriority.SCAN, timeout=SCAN_ACQUIRE_TIMEOUT)
+
+        status, raw_headers, body = self._client.requester.requestJson(
+            "GET", url, parameters=parameters, headers=headers
+        )
+        with self._lock:
+            self.requests_made += 1
+        response_headers = {k.lower(): v for k, v in (raw_headers or {}).items()}
+        self._record_rate(response_headers)
+
+        data = json.loads(body) if body else None
+        if status >= 400:
+            if status in (403, 429) and self._known_remaining() == 0:
+                raise RateLimitExceededException(status, data, response_headers)
+            raise GithubException(status, data, response_headers)
+        return status, response_headers, data
+
+    def _record_rate(self, headers: Dict[str, Any]) -> None:
+        """Feed remaining quota from response headers to the shared budget."""
+        self._api.record_headers(headers)
+
+    @staticmethod
+    def _next_page(headers: Dict[str, Any]) -> Optional[str]:
+        """Extract the rel="next" URL from a Link header."""
+        match = re.search(r'<([^>]+)>;\s*rel="next"', headers.get("link") or "")
+        return match.group(1) if match else None
+
+    def _to_queued(self, repo_name: str, raw: Dict[str, Any]) -> Optional[QueuedIssue]:
+        """Convert an issue from the REST API into a QueuedIssue.
+
+        Args:
+            repo_name: Repository in owner/name format.
+            raw: Issue JSON object.
+
+        Returns:
+            QueuedIssue, or None for pull requests and in-progress issues.
+        """
+        # Skip pull requests (GitHub API returns PRs as issues)
+        if raw.get("pull_request") is not None:
+            return None
+
+        # Skip if already in progress
+        label_names = [label["name"] for label in raw.get("labels", [])]
+        if self.in_progress_label in label_names:
+            return None
+
+        # Determine priority
+        priority = 1 if self.high_priority_label in label_names else 0
+
+        return QueuedIssue(
+            repo=repo_name,
+            number=raw["number"],
+            title=raw.get("title", ""),
+            labels=label_names,
+            created_at=datetime.fromisoformat(raw["created_at"].replace("Z", "+00:00")),
+            priority=priority,
+            body=raw.get("body") or "",
+        )
+
     def get_issue_details(self, repo_name: str, issue_number: int) -> Optional[dict]:
         """Fetch basic issue details for routing decisions.
 
@@ -149,14 +469,19 @@ class GitHubQueue:
         Returns:
             Dict with title, body, and labels, or None on error.
         """
-        try:
-            repo = self._client.get_repo(repo_name)
-            issue = repo.get_issue(issue_number)
+
+        def load() -> dict:
+            issue = self._api.get_repo(repo_name).get_issue(issue_number)
             return {
                 "title": issue.title,
                 "body": issue.body or "",
                 "labels": [label.name for label in issue.labels],
             }
+
+        try:
+            return self._api.cached(
+                ("issue", repo_name, issue_number), load, ttl=ISSUE_DETAILS_TTL
+            )
         except GithubException as e:
             logger.error(f"Failed to fetch {repo_name}#{issue_number}: {e}")
             return None
@@ -181,7 +506,9 @@ class GitHubQueue:
             True if successful.
         """
         try:
-            repo = self._client.get_repo(repo_name)
+            repo = self._api.get_repo(repo_name)
+            self._api.require(GitHubPriority.REVIEW, cost=3)
+            self._api.cache.invalidate("issue", repo_name, issue_number)
             issue = repo.get_issue(issue_number)
 
             # Add in-progress label
@@ -212,7 +539,9 @@ class GitHubQueue:
             True if successful.
         """
         try:
-            repo = self._client.get_repo(repo_name)
+            repo = self._api.get_repo(repo_name)
+            self._api.require(GitHubPriority.REVIEW, cost=4)
+            self._api.cache.invalidate("issue", repo_name, issue_number)
             issue = repo.get_issue(issue_number)
 
             # Remove in-progress label
@@ -257,7 +586,9 @@ class GitHubQueue:
             True if successful.
         """
         try:
-            repo = self._client.get_repo(repo_name)
+            repo = self._api.get_repo(repo_name)
+            self._api.require(GitHubPriority.REVIEW, cost=5)
+            self._api.cache.invalidate("issue", repo_name, issue_number)
             issue = repo.get_issue(issue_number)
 
             # Remove in-progress label
@@ -318,9 +649,15 @@ class GitHubQueue:
     def is_rate_limited(self) -> bool:
         """Check if we're currently rate limited.
 
+        Uses quota from recent response headers when known.
+
         Returns:
             True if remaining requests are below threshold.
         """
+        remaining = self._known_remaining()
+        if remaining is not None:
+            return remaining < RATE_LIMIT_THRESHOLD
+
         try:
             rate = self._client.get_rate_limit()
             if rate.core.remaining < RATE_LIMIT_THRESHOLD:
@@ -337,22 +674,42 @@ class GitHubQueue:
     def can_perform_sweep(self) -> bool:
         """Check if we have enough quota for a queue sweep.
 
+        Repos whose last scan fit on one page are budgeted at a single
+        request since an unchanged list costs nothing. Quota comes from the headers of the
+        last scan when available, avoiding a rate-limit API call.
+
         Returns:
             True if we have enough requests remaining.
         """
-        try:
-            rate = self._client.get_rate_limit()
-            # Need at least threshold + requests per sweep
-            needed = RATE_LIMIT_THRESHOLD + REQUESTS_PER_SWEEP * len(self.watched_repos)
-            if rate.core.remaining < needed:
-                logger.info(
-                    f"Insufficient quota for sweep: {rate.core.remaining} < {needed}"
-                )
+        with self._lock:
+            needed = RATE_LIMIT_THRESHOLD + sum(
+                CONDITIONAL_REQUESTS_PER_REPO
+                if repo_name in self._scans and self._scans[repo_name].conditional
+                else REQUESTS_PER_SWEEP
+                for repo_name in self.watched_repos
+            )
+
+        remaining = self._known_remaining()
+        if remaining is None:
+            try:
+                remaining = self._client.get_rate_limit().core.remaining
+            except GithubException as e:
+                logger.error(f"Failed to check quota: {e}")
                 return False
-            return True
-        except GithubException as e:
-            logger.error(f"Failed to check quota: {e}")
+
+        if remaining < needed:
+            logger.info(f"Insufficient quota for sweep: {remaining} < {needed}")
             return False
+        return True
+
+    def _known_remaining(self) -> Optional[int]:
+        """Remaining quota from response headers, if still current.
+
+        Returns:
+            Remaining requests, or None if unknown or the window has reset.
+        """
+        quota = self._api.quota()
+        return quota.remaining if quota is not None else None
 
     def wait_for_rate_limit(self, max_wait: int = 300) -> bool:
         """Wait for rate limit to reset if currently limited.
@@ -389,5 +746,5 @@ class GitHubQueue:
             return False
 
     def close(self) -> None:
-        """Close the GitHub client."""
-        self._client.close()
+        """Release the shared GitHub client."""
+        release_shared_github(self._api)
@@ -0,0 +1,219 @@
+"""Hedged LLM requests across equivalent endpoints of a ModelRouter tier.
+
+A request goes to the preferred endpoint first. If it has not completed
+within a deadline derived from that endpoint's recent p95 latency, a
+duplicate is sent to the next healthy endpoint in the same tier and
+whichever finishes first wins; the loser is cancelled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from nebulus_swarm.minion.agent.llm_client import (
+    AsyncLLMClient,
+    LLMConfig,
+    LLMResponse,
+)
+from nebulus_swarm.overlord.model_router import ModelEndpoint, ModelRouter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEDGE_DELAY = 10.0  # seconds, used until enough samples exist
+MIN_SAMPLES = 20
+LATENCY_WINDOW = 200
+HEDGE_PERCENTILE = 0.95
+
+
+class LatencyTracker:
+    """Rolling per-endpoint latency window with percentile lookup."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        """Initialize the tracker.
+
+        Args:
+            window: Number of recent samples kept per endpoint.
+        """
+        self._window = window
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Record a completed request's latency in seconds."""
+        samples = self._samples.get(endpoint)
+        if samples is None:
+            samples = self._samples[endpoint] = deque(maxlen=self._window)
+        samples.append(latency)
+
+    def percentile(self, endpoint: str, pct: float) -> Optional[float]:
+        """Nearest-rank percentile of recent latencies.
+
+        Args:
+            endpoint: Endpoint name.
+            pct: Percentile in (0, 1].
+
+        Returns:
+            Latency in seconds, or None if fewer than MIN_SAMPLES exist.
+        """
+        samples = self._samples.get(endpoint)
+        if not samples or len(samples) < MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(pct * len(ordered)))
+        return ordered[rank - 1]
+
+
+@dataclass
+class HedgeStats:
+    """Counters for hedged requests."""
+
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+
+
+class HedgedLLMClient:
+    """Async chat client that hedges slow requests within a router tier.
+
+    Args:
+        router: Model router supplying healthy endpoints.
+        tier: Tier whose endpoints are treated as equivalent.
+        prefer_local: Passed through to endpoint ordering.
+        default_delay: Hedge deadline before p95 data is available.
+        client_factory: Builds an AsyncLLMClient for an endpoint; mainly
+            for tests and for sharing an AsyncLLMPool.
+    """
+
+    def __init__(
+        self,
+        router: ModelRouter,
+        tier: str,
+        prefer_local: bool = True,
+        default_delay: float = DEFAULT_HEDGE_DELAY,
+        client_factory: Optional[Callable[[ModelEndpoint], AsyncLLMClient]] = None,
+    ):
+        self.router = router
+        self.tier = tier
+        self.prefer_local = prefer_local
+        self.default_delay = default_delay
+        self.latencies = LatencyTracker()
+        self.stats = HedgeStats()
+        self._client_factory = client_factory or self._default_client
+        self._clients: Dict[str, AsyncLLMClient] = {}
+
+    @staticmethod
+    def _default_client(endpoint: ModelEndpoint) -> AsyncLLMClient:
+        """Build a plain AsyncLLMClient for an endpoint."""
+        return AsyncLLMClient(
+            LLMConfig(base_url=endpoint.endpoint, model=endpoint.model)
+        )
+
+    def _client_for(self, endpoint: ModelEndpoint) -> AsyncLLMClient:
+        """Get (or create) the cached client for an endpoint."""
+        client = self._clients.get(endpoint.name)
+        if client is None:
+            client = self._clients[endpoint.name] = self._client_factory(endpoint)
+        return client
+
+    def hedge_delay(self, endpoint: ModelEndpoint) -> float:
+        """Deadline before a duplicate request is fired.
+
+        Args:
+            endpoint: The primary endpoint.
+
+        Returns:
+            Its recent p95 latency, or ``default_delay`` without enough data.
+        """
+        p95 = self.latencies.percentile(endpoint.name, HEDGE_PERCENTILE)
+        return p95 if p95 is not None else self.default_delay
+
+    async def _timed_chat(
+        self,
+        endpoint: ModelEndpoint,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+    ) -> LLMResponse:
+        """Run one request and record its latency.
+
+        A request cancelled because the other attempt won still records the
+        time it had run: that is a lower bound on its true latency, and
+        leaving it out would bias the p95 towards the fast requests.
+        """
+        started = time.monotonic()
+        try:
+            response = await self._client_for(endpoint).chat(messages, tools)
+        except asyncio.CancelledError:
+            self.latencies.record(endpoint.name, time.monotonic() - started)
+            raise
+        self.latencies.record(endpoint.name, time.monotonic() - started)
+        return response
+
+    async def chat(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> LLMResponse:
+        """Send a chat request, hedging to a second endpoint if it stalls.
+
+        Args:
+            messages: Conversation history.
+            tools: Optional tool definitions.
+
+        Returns:
+            The first successful LLMResponse.
+
+        Raises:
+            RuntimeError: If the tier has no healthy endpoints.
+        """
+        endpoints = self.router.get_healthy_endpoints(self.tier, self.prefer_local)
+        if not endpoints:
+            raise RuntimeError(f"No healthy endpoints in tier '{self.tier}'")
+
+        self.stats.requests += 1
+        primary = endpoints[0]
+        primary_task = asyncio.create_task(self._timed_chat(primary, messages, tools))
+        tasks = [primary_task]
+        try:
+            if len(endpoints) == 1:
+                return await primary_task
+
+            done, _ = await asyncio.wait(
+                {primary_task}, timeout=self.hedge_delay(primary)
+            )
+            if done and primary_task.exception() is None:
+                return primary_task.result()
+
+            backup = endpoints[1]
+            if done:
+                logger.warning(
+                    f"{primary.name} failed ({primary_task.exception()!r}), "
+                    f"retrying on {backup.name}"
+                )
+            else:
+                logger.info(f"{primary.name} slow, hedging request to {backup.name}")
+            self.stats.hedged += 1
+            backup_task = asyncio.create_task(self._timed_chat(backup, messages, tools))
+            tasks.append(backup_task)
+
+            pending = {task for task in tasks if not task.done()}
+            while pending:
+                finished, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in finished:
+                    if task.exception() is None:
+                        if task is backup_task:
+                            self.stats.hedge_wins += 1
+                        return task.result()
+
+            # Both attempts failed; surface the backup's error
+            raise backup_task.exception()  # type: ignore[misc]
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
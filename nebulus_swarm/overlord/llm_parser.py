@@ -1,20 +1,26 @@
 """LLM-powered command parser for Overlord."""
 
 import asyncio
+import contextlib
 import json
 import logging
 import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-
-from openai import AsyncOpenAI
+from typing import AsyncContextManager, Dict, List, Optional, Tuple
 
 from nebulus_swarm.config import OverlordLLMConfig
+from nebulus_swarm.lazy_import import lazy_import
 from nebulus_swarm.overlord.command_parser import Command, CommandParser, CommandType
+from nebulus_swarm.overlord.llm_pool import AsyncLLMPool, Priority
 
 logger = logging.getLogger(__name__)
 
+# Imported once a message needs the LLM; regex-parsed commands never load it
+AsyncOpenAI = lazy_import("openai", "AsyncOpenAI")
+
 
 @dataclass
 class ConversationEntry:
@@ -173,6 +179,7 @@ class ParseResult:
     command: Optional[Command] = None
     needs_clarification: bool = False
     clarification_message: Optional[str] = None
+    source: str = "llm"  # "rule", "cache", "llm" or "regex"
 
     @property
     def success(self) -> bool:
@@ -180,6 +187,114 @@ class ParseResult:
         return self.command is not None and not self.needs_clarification
 
 
+@dataclass
+class ParseStats:
+    """Counters for how messages were resolved."""
+
+    rule_hits: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    llm_calls: int = 0
+    regex_fallbacks: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of LLM-eligible messages answered without the LLM."""
+        hits = self.rule_hits + self.cache_hits
+        total = hits + self.cache_misses
+        return hits / total if total else 0.0
+
+
+# Context key for results that do not depend on conversation history
+ANY_CONTEXT = "*"
+
+
+def normalize_message(text: str) -> str:
+    """Normalize message text for cache lookup.
+
+    Lowercases, collapses whitespace and drops trailing punctuation so
+    "Status?" and "status" share an entry.
+    """
+    return " ".join(text.strip().lower().split()).rstrip("?!.")
+
+
+def context_hash(command: Optional[Command]) -> str:
+    """Hash the conversation context an LLM parse may depend on.
+
+    Only the last successful command is used, since that is what
+    follow-ups like "do the same for 43" or "stop that" refer to.
+
+    Args:
+        command: Last successful command in the channel, if any.
+
+    Returns:
+        Short stable string identifying the context.
+    """
+    if command is None:
+        return "none"
+    return (
+        f"{command.type.value}:{command.repo}:{command.issue_number}:"
+        f"{command.pr_number}:{command.minion_id}"
+    )
+
+
+class ParseCache:
+    """LRU cache of confident LLM parse results with a TTL."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 600.0):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum cached results; 0 disables caching.
+            ttl_seconds: Lifetime of a cached result.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, LLMParseResult]]" = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple[str, str]) -> Optional[LLMParseResult]:
+        """Look up a cached result, dropping it if expired.
+
+        Args:
+            key: (normalized text, context hash).
+
+        Returns:
+            Cached LLMParseResult or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: Tuple[str, str], result: LLMParseResult) -> None:
+        """Store a result, evicting the least recently used entry if full.
+
+        Args:
+            key: (normalized text, context hash).
+            result: LLM result to cache.
+        """
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+
 SYSTEM_PROMPT_TEMPLATE = '''You are the Nebulus Overlord's command interpreter. Parse user messages into structured commands.
 
 ## Available Commands
@@ -242,17 +357,21 @@ class LLMCommandParser:
         self,
         config: OverlordLLMConfig,
         default_repo: Optional[str] = None,
+        pool: Optional[AsyncLLMPool] = None,
     ):
         """Initialize parser.
 
         Args:
             config: LLM configuration.
             default_repo: Default repository for commands.
+            pool: Optional shared LLM pool. Parse requests then queue in
+                the interactive lane ahead of background work.
         """
         self.config = config
         self.default_repo = default_repo
 
         # LLM client
+        self._pool = pool
         self._client: Optional[AsyncOpenAI] = None
 
         # Context store
@@ -264,9 +383,18 @@ class LLMCommandParser:
         # Regex fallback
         self._regex_parser = CommandParser(default_repo=default_repo)
 
+        # Response cache and counters
+        self.cache = ParseCache(
+            max_entries=config.cache_size,
+            ttl_seconds=config.cache_ttl_seconds,
+        )
+        self.stats = ParseStats()
+
     @property
     def client(self) -> AsyncOpenAI:
         """Get or create OpenAI client."""
+        if self._pool is not None:
+            return self._pool.client
         if self._client is None:
             self._client = AsyncOpenAI(
                 base_url=self.config.base_url,
@@ -295,10 +423,33 @@ class LLMCommandParser:
         if not self.config.enabled:
             command = self._regex_parser.parse(text)
             self.context.add(channel_id, user_id, text, command)
-            return ParseResult(command=command)
+            return ParseResult(command=command, source="regex")
+
+        # Unambiguous commands never need the LLM
+        command = self._regex_parser.parse_exact(text)
+        if command is not None:
+            self.stats.rule_hits += 1
+            self.context.add(channel_id, user_id, text, command)
+            return ParseResult(command=command, source="rule")
+
+        normalized = normalize_message(text)
+        context_key = (
+            normalized,
+            context_hash(self.context.get_last_command(channel_id)),
+        )
+        cached = self.cache.get((normalized, ANY_CONTEXT)) or self.cache.get(
+            context_key
+        )
+        if cached is not None:
+            self.stats.cache_hits += 1
+            command = self._llm_result_to_command(cached, text)
+            self.context.add(channel_id, user_id, text, command)
+            return ParseResult(command=command, source="cache")
+        self.stats.cache_misses += 1
 
         try:
             # Try LLM with timeout
+            self.stats.llm_calls += 1
             llm_result = await asyncio.wait_for(
                 self._llm_parse(text, channel_id),
                 timeout=self.config.timeout,
@@ -309,6 +460,10 @@ class LLMCommandParser:
 
             # Check confidence
             if llm_result.confidence >= self.config.confidence_threshold:
+                if self._uses_context(llm_result, normalized):
+                    self.cache.put(context_key, llm_result)
+                else:
+                    self.cache.put((normalized, ANY_CONTEXT), llm_result)
                 self.context.add(channel_id, user_id, text, command)
                 return ParseResult(command=command)
 
@@ -338,6 +493,31 @@ class LLMCommandParser:
             logger.warning(f"LLM parse failed: {e}, falling back to regex")
             return self._regex_fallback(text, channel_id, user_id)
 
+    @staticmethod
+    def _uses_context(result: LLMParseResult, normalized: str) -> bool:
+        """Check whether a result depends on conversation history.
+
+        A result is self-contained when every identifier it carries appears
+        in the message itself; otherwise (e.g. "stop that" resolving to an
+        issue number) it is only valid under the same context.
+
+        Args:
+            result: LLM parsing result.
+            normalized: Normalized message text.
+
+        Returns:
+            True if the result must be cached per context.
+        """
+        numbers = set(re.findall(r"\d+", normalized))
+        for number in (result.issue_number, result.pr_number):
+            if number is not None and str(number) not in numbers:
+                return True
+        if result.minion_id and result.minion_id.lower() not in normalized:
+            return True
+        if result.repo and result.repo.lower() not in normalized:
+            return True
+        return False
+
     async def _llm_parse(self, text: str, channel_id: str) -> LLMParseResult:
         """Call LLM to parse message.
 
@@ -366,17 +546,24 @@ class LLMCommandParser:
         )
 
         # Call LLM
-        response = await self.client.chat.completions.create(
-            model=self.config.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1,  # Low temperature for consistency
-            max_tokens=200,
-        )
+        async with self._slot():
+            response = await self.client.chat.completions.create(
+                model=self.config.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.1,  # Low temperature for consistency
+                max_tokens=200,
+            )
 
         # Parse response
         content = response.choices[0].message.content or ""
         return self._parse_llm_response(content)
 
+    def _slot(self) -> AsyncContextManager[None]:
+        """Hold an interactive pool slot, or nothing without a pool."""
+        if self._pool is None:
+            return contextlib.nullcontext()
+        return self._pool.slot(Priority.INTERACTIVE)
+
     def _parse_llm_response(self, content: str) -> LLMParseResult:
         """Parse LLM response JSON.
 
@@ -452,9 +639,10 @@ class LLMCommandParser:
         Returns:
             ParseResult from regex parser.
         """
+        self.stats.regex_fallbacks += 1
         command = self._regex_parser.parse(text)
         self.context.add(channel_id, user_id, text, command)
-        return ParseResult(command=command)
+        return ParseResult(command=command, source="regex")
 
     def format_help(self) -> str:
         """Generate help text.
@@ -465,7 +653,10 @@ class LLMCommandParser:
         return self._regex_parser.format_help()
 
     async def close(self) -> None:
-        """Clean up resources."""
+        """Clean up resources.
+
+        A shared pool's client belongs to the pool and stays open.
+        """
         if self._client:
             await self._client.close()
             self._client = None
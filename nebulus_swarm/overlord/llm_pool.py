@@ -1,18 +1,55 @@
-"""LLM connection pool for concurrent Minion access."""
+"""LLM connection pool for concurrent Minion access.
 
+``LLMPool`` serves threaded callers; ``AsyncLLMPool`` is the asyncio
+counterpart with the same priority lanes, limiter and statistics.
+"""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
 import logging
 import os
+import random
 import threading
+import time
 from dataclasses import dataclass
+from enum import IntEnum
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Tuple
+
+from nebulus_swarm.lazy_import import lazy_import
 
-from openai import OpenAI
+if TYPE_CHECKING:
+    from nebulus_swarm.integrations.health_client import HealthClient, HealthStatus
 
 logger = logging.getLogger(__name__)
 
+# The pool only needs the SDK once a pool is constructed
+AsyncOpenAI = lazy_import("openai", "AsyncOpenAI")
+OpenAI = lazy_import("openai", "OpenAI")
+
 DEFAULT_CONCURRENCY = 2
 BACKOFF_BASE = 1.0
 BACKOFF_MAX = 30.0
 
+# AIMD tuning
+DECREASE_FACTOR = 0.5  # multiplicative decrease on 429/503/timeouts
+LATENCY_DECREASE_FACTOR = 0.9  # gentler decrease when latency drifts up
+LATENCY_TOLERANCE = 2.0  # short-term latency may reach 2x the baseline
+SHORT_EWMA_ALPHA = 0.3
+LONG_EWMA_ALPHA = 0.05
+
+# HTTP status codes that indicate the backend is overloaded
+OVERLOAD_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class Priority(IntEnum):
+    """Request priority lanes. Lower values are served first."""
+
+    INTERACTIVE = 0  # interactive atom sessions, Slack parsing
+    NORMAL = 1
+    BACKGROUND = 2  # minion work
+
 
 @dataclass
 class PoolConfig:
@@ -24,6 +61,9 @@ class PoolConfig:
     timeout: int = 600
     max_concurrency: int = DEFAULT_CONCURRENCY
     acquire_timeout: float = 60.0  # seconds to wait for a slot
+    adaptive: bool = False  # grow/shrink the limit between min and max
+    min_concurrency: int = 1
+    health_interval: float = 15.0  # seconds between health polls
 
     @classmethod
     def from_env(cls, **overrides) -> "PoolConfig":
@@ -47,6 +87,17 @@ class PoolConfig:
                 )
             ),
             acquire_timeout=float(overrides.get("acquire_timeout", "60.0")),
+            adaptive=str(
+                overrides.get("adaptive", os.environ.get("ATOM_LLM_ADAPTIVE", "false"))
+            ).lower()
+            == "true",
+            min_concurrency=int(
+                overrides.get(
+                    "min_concurrency",
+                    os.environ.get("ATOM_LLM_MIN_CONCURRENCY", "1"),
+                )
+            ),
+            health_interval=float(overrides.get("health_interval", "15.0")),
         )
 
 
@@ -59,21 +110,167 @@ class PoolStats:
     total_requests: int = 0
     total_errors: int = 0
     total_retries: int = 0
+    limit: int = 0
+    total_overloads: int = 0
+
+
+def is_overload_error(exc: Optional[BaseException]) -> bool:
+    """Check whether an exception means the backend is saturated.
+
+    Rate limits, gateway/unavailable responses and timeouts all count.
+
+    Args:
+        exc: Exception raised by the OpenAI client.
+
+    Returns:
+        True if the pool should back off.
+    """
+    if exc is None:
+        return False
+    if isinstance(exc, TimeoutError):
+        return True
+    if type(exc).__name__ in ("APITimeoutError", "RateLimitError"):
+        return True
+    status = getattr(exc, "status_code", None)
+    return status in OVERLOAD_STATUS_CODES
+
+
+def is_transient_error(exc: Optional[BaseException]) -> bool:
+    """Check whether a failed request is worth retrying.
+
+    Overload signals plus dropped connections qualify; client errors such
+    as bad requests or auth failures do not.
+
+    Args:
+        exc: Exception raised by the OpenAI client.
+
+    Returns:
+        True if the request may succeed on retry.
+    """
+    if is_overload_error(exc):
+        return True
+    if isinstance(exc, ConnectionError):
+        return True
+    return type(exc).__name__ == "APIConnectionError"
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for a retry attempt.
+
+    Args:
+        attempt: Zero-based retry number.
+
+    Returns:
+        Seconds to sleep, uniform in [0, min(BACKOFF_MAX, BACKOFF_BASE * 2^attempt)].
+    """
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2**attempt)))
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit with a latency-gradient guard.
+
+    The limit grows by roughly one slot per window of successful requests
+    while short-term latency stays within ``LATENCY_TOLERANCE`` of the
+    long-term baseline, shrinks gently when latency drifts up, and halves
+    on overload errors. Platform health caps the effective limit.
+
+    Not thread-safe; callers hold their own lock.
+    """
 
+    def __init__(
+        self,
+        min_limit: int,
+        max_limit: int,
+        initial: Optional[int] = None,
+        adaptive: bool = True,
+    ):
+        """Initialize the limiter.
 
-class LLMPool:
-    """Thread-safe connection pool for OpenAI-compatible LLM backends."""
+        Args:
+            min_limit: Lowest limit the pool may shrink to.
+            max_limit: Highest limit the pool may grow to.
+            initial: Starting limit. Defaults to max_limit.
+            adaptive: When False the limit only follows health caps.
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        start = self.max_limit if initial is None else initial
+        self._limit = float(min(max(start, self.min_limit), self.max_limit))
+        self.adaptive = adaptive
+        self._health_ceiling = self.max_limit
+        self._short_latency: Optional[float] = None
+        self._long_latency: Optional[float] = None
 
-    def __init__(self, config: PoolConfig):
+    @property
+    def limit(self) -> int:
+        """Effective concurrency limit."""
+        return max(self.min_limit, min(int(self._limit), self._health_ceiling))
+
+    def on_success(self, latency: float) -> None:
+        """Record a successful request and its latency in seconds."""
+        if self._short_latency is None or self._long_latency is None:
+            self._short_latency = self._long_latency = latency
+            return
+        self._short_latency += SHORT_EWMA_ALPHA * (latency - self._short_latency)
+        self._long_latency += LONG_EWMA_ALPHA * (latency - self._long_latency)
+        if not self.adaptive:
+            return
+        if self._short_latency > self._long_latency * LATENCY_TOLERANCE:
+            self._limit = max(self.min_limit, self._limit * LATENCY_DECREASE_FACTOR)
+        else:
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+
+    def on_overload(self) -> None:
+        """Back off after a 429/503/timeout."""
+        if self.adaptive:
+            self._limit = max(self.min_limit, self._limit * DECREASE_FACTOR)
+
+    def apply_health(self, status: "HealthStatus") -> None:
+        """Cap the limit from platform VRAM/thermal signals.
+
+        Args:
+            status: Latest platform health status.
+        """
+        if not status.available:
+            self._health_ceiling = self.max_limit
+        elif status.is_critical:
+            self._health_ceiling = self.min_limit
+        elif status.is_throttled or status.vram_pressure:
+            self._health_ceiling = max(self.min_limit, self.max_limit // 2)
+        else:
+            self._health_ceiling = self.max_limit
+
+
+class _BasePool:
+    """State shared by the threaded and asyncio pools.
+
+    Holds the configuration, the adaptive limiter, priority queue and
+    statistics. Critical sections are short and never await, so a plain
+    threading lock protects them for both flavours.
+    """
+
+    def __init__(
+        self,
+        config: PoolConfig,
+        health_client: Optional["HealthClient"] = None,
+    ):
         self.config = config
-        self._semaphore = threading.Semaphore(config.max_concurrency)
         self._lock = threading.Lock()
         self._stats = PoolStats()
-        self._client = OpenAI(
-            base_url=config.base_url,
-            api_key=config.api_key,
-            timeout=config.timeout,
+        self._limiter = AdaptiveLimiter(
+            min_limit=config.min_concurrency,
+            max_limit=config.max_concurrency,
+            initial=(
+                min(config.max_concurrency, DEFAULT_CONCURRENCY)
+                if config.adaptive
+                else config.max_concurrency
+            ),
+            adaptive=config.adaptive,
         )
+        self._queue: List[Tuple[int, int]] = []
+        self._tickets = itertools.count()
+        self._health_client = health_client
+        self._last_health_check = 0.0
         self._shutdown = False
 
     @property
@@ -86,46 +283,282 @@ class LLMPool:
                 total_requests=self._stats.total_requests,
                 total_errors=self._stats.total_errors,
                 total_retries=self._stats.total_retries,
+                limit=self._limiter.limit,
+                total_overloads=self._stats.total_overloads,
             )
 
-    def acquire(self) -> bool:
-        """Acquire a slot from the pool. Returns True if acquired, False on timeout."""
+    @property
+    def limit(self) -> int:
+        """Current effective concurrency limit."""
+        with self._lock:
+            return self._limiter.limit
+
+    def _can_proceed(self, ticket: Tuple[int, int]) -> bool:
+        """Check whether a waiter is at the head and a slot is free."""
+        return self._queue[0] == ticket and self._stats.active < self._limiter.limit
+
+    def _enqueue(self, priority: Priority) -> Tuple[int, int]:
+        """Add a waiter to the priority queue. Caller holds the lock."""
+        ticket = (int(priority), next(self._tickets))
+        heapq.heappush(self._queue, ticket)
+        self._stats.waiting += 1
+        return ticket
+
+    def _grant(self) -> None:
+        """Hand the head waiter a slot. Caller holds the lock."""
+        heapq.heappop(self._queue)
+        self._stats.waiting -= 1
+        self._stats.active += 1
+        self._stats.total_requests += 1
+
+    def _abandon(self, ticket: Tuple[int, int]) -> None:
+        """Drop a waiter that gave up. Caller holds the lock."""
+        self._queue.remove(ticket)
+        heapq.heapify(self._queue)
+        self._stats.waiting -= 1
+
+    def _wake_waiters(self) -> None:
+        """Re-evaluate waiters after the limit or active count changed."""
+
+    def record_success(self, latency: float) -> None:
+        """Record a completed request so the limiter can adapt.
+
+        Args:
+            latency: Request duration in seconds.
+        """
+        with self._lock:
+            self._limiter.on_success(latency)
+        self._wake_waiters()
+
+    def record_error(self, exc: Optional[BaseException] = None) -> None:
+        """Record an error (e.g. 429, 503).
+
+        Args:
+            exc: The exception raised, used to detect overload signals.
+        """
+        with self._lock:
+            self._stats.total_errors += 1
+            if is_overload_error(exc):
+                self._stats.total_overloads += 1
+                self._limiter.on_overload()
+                logger.info(
+                    f"LLM pool backing off after {type(exc).__name__}: "
+                    f"limit now {self._limiter.limit}"
+                )
+
+    def record_retry(self) -> None:
+        """Record a retry attempt."""
+        with self._lock:
+            self._stats.total_retries += 1
+
+    def _health_due(self) -> bool:
+        """Check (and claim) whether a health poll is due."""
+        if self._health_client is None or not self._health_client.enabled:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_health_check < self.config.health_interval:
+                return False
+            self._last_health_check = now
+        return True
+
+    def _apply_health(self, status: "HealthStatus") -> None:
+        """Feed a health reading to the limiter."""
+        with self._lock:
+            self._limiter.apply_health(status)
+        self._wake_waiters()
+
+
+class LLMPool(_BasePool):
+    """Thread-safe connection pool for OpenAI-compatible LLM backends.
+
+    Slots are granted in priority order (see ``Priority``), FIFO within a
+    lane, up to the limit maintained by an ``AdaptiveLimiter``.
+    """
+
+    def __init__(
+        self,
+        config: PoolConfig,
+        health_client: Optional["HealthClient"] = None,
+    ):
+        super().__init__(config, health_client)
+        self._cond = threading.Condition(self._lock)
+        # No hidden SDK retries: callers retry through the pool so every
+        # overload reaches record_error() and the limiter immediately
+        self._client = OpenAI(
+            base_url=config.base_url,
+            api_key=config.api_key,
+            timeout=config.timeout,
+            max_retries=0,
+        )
+
+    def acquire(self, priority: Priority = Priority.NORMAL) -> bool:
+        """Acquire a slot from the pool. Returns True if acquired, False on timeout.
+
+        Args:
+            priority: Lane to queue in; higher-priority waiters go first.
+        """
+        if self._shutdown:
+            return False
+        if self._health_due():
+            self._apply_health(self._health_client.get_status())
+        deadline = time.monotonic() + self.config.acquire_timeout
+        with self._cond:
+            ticket = self._enqueue(priority)
+            while not self._can_proceed(ticket):
+                remaining = deadline - time.monotonic()
+                if self._shutdown or remaining <= 0:
+                    self._abandon(ticket)
+                    # Our departure may unblock the next waiter
+                    self._cond.notify_all()
+                    return False
+                self._cond.wait(remaining)
+            self._grant()
+            # The next waiter may fit under the limit as well
+            self._cond.notify_all()
+            return True
+
+    def release(self) -> None:
+        """Release a slot back to the pool."""
+        with self._cond:
+            self._stats.active = max(0, self._stats.active - 1)
+            self._cond.notify_all()
+
+    def _wake_waiters(self) -> None:
+        """Re-evaluate waiters after the limit or active count changed."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def shutdown(self) -> None:
+        """Mark pool as shut down — no new acquisitions."""
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+
+    @property
+    def client(self) -> OpenAI:
+        """Get the shared OpenAI client."""
+        return self._client
+
+
+class AsyncLLMPool(_BasePool):
+    """asyncio connection pool for OpenAI-compatible LLM backends.
+
+    Same priority lanes, adaptive limit and statistics as ``LLMPool``,
+    but waiters suspend on an event-loop future instead of blocking a
+    thread. Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        config: PoolConfig,
+        health_client: Optional["HealthClient"] = None,
+    ):
+        super().__init__(config, health_client)
+        self._changed: Optional[asyncio.Event] = None
+        # Created on first use so an idle pool doesn't import the SDK
+        self._client: Optional[AsyncOpenAI] = None
+
+    def _event(self) -> asyncio.Event:
+        """Event set whenever waiters should re-check their turn."""
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        return self._changed
+
+    def _wake_waiters(self) -> None:
+        """Re-evaluate waiters after the limit or active count changed."""
+        if self._changed is not None:
+            self._changed.set()
+
+    async def acquire(self, priority: Priority = Priority.NORMAL) -> bool:
+        """Acquire a slot from the pool. Returns True if acquired, False on timeout.
+
+        Args:
+            priority: Lane to queue in; higher-priority waiters go first.
+        """
         if self._shutdown:
             return False
+        if self._health_due():
+            status = await asyncio.to_thread(self._health_client.get_status)
+            self._apply_health(status)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.acquire_timeout
+        event = self._event()
         with self._lock:
-            self._stats.waiting += 1
+            ticket = self._enqueue(priority)
         try:
-            acquired = self._semaphore.acquire(timeout=self.config.acquire_timeout)
-            if acquired:
+            while True:
                 with self._lock:
-                    self._stats.active += 1
-                    self._stats.total_requests += 1
-            return acquired
-        finally:
+                    if self._shutdown:
+                        self._abandon(ticket)
+                        return False
+                    if self._can_proceed(ticket):
+                        self._grant()
+                        break
+                    event.clear()
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    with self._lock:
+                        self._abandon(ticket)
+                    return False
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    continue
+        except asyncio.CancelledError:
             with self._lock:
-                self._stats.waiting -= 1
+                if ticket in self._queue:
+                    self._abandon(ticket)
+            raise
+        finally:
+            # Departure or grant may unblock the next waiter
+            self._wake_waiters()
+        return True
 
     def release(self) -> None:
         """Release a slot back to the pool."""
         with self._lock:
             self._stats.active = max(0, self._stats.active - 1)
-        self._semaphore.release()
+        self._wake_waiters()
 
-    def record_error(self) -> None:
-        """Record an error (e.g. 429, 503)."""
-        with self._lock:
-            self._stats.total_errors += 1
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: Priority = Priority.NORMAL) -> AsyncIterator[None]:
+        """Hold a slot for one request, recording its outcome.
 
-    def record_retry(self) -> None:
-        """Record a retry attempt."""
-        with self._lock:
-            self._stats.total_retries += 1
+        Args:
+            priority: Lane to queue in; higher-priority waiters go first.
+
+        Raises:
+            RuntimeError: If no slot frees up within ``acquire_timeout``.
+        """
+        if not await self.acquire(priority):
+            raise RuntimeError("LLM pool: timed out waiting for slot")
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self.record_error(e)
+            raise
+        else:
+            self.record_success(time.monotonic() - started)
+        finally:
+            self.release()
 
     def shutdown(self) -> None:
         """Mark pool as shut down — no new acquisitions."""
         self._shutdown = True
+        self._wake_waiters()
 
     @property
-    def client(self) -> OpenAI:
-        """Get the shared OpenAI client."""
+    def client(self) -> AsyncOpenAI:
+        """Get the shared AsyncOpenAI client."""
+        if self._client is None:
+            # No hidden SDK retries: callers retry through the pool so every
+            # overload reaches record_error() and the limiter immediately
+            self._client = AsyncOpenAI(
+                base_url=self.config.base_url,
+                api_key=self.config.api_key,
+                timeout=self.config.timeout,
+                max_retries=0,
+            )
         return self._client
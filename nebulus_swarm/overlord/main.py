@@ -1,6 +1,7 @@
 """Overlord main entry point and orchestration."""
 
 import asyncio
+import json
 import os
 import signal
 from dataclasses import dataclass, field
@@ -12,6 +13,7 @@ from aiohttp import web
 from croniter import croniter
 
 from nebulus_swarm.config import SwarmConfig
+from nebulus_swarm.integrations.health_client import get_health_client
 from nebulus_swarm.logging import (
     LogContext,
     configure_logging,
@@ -21,11 +23,21 @@ from nebulus_swarm.logging import (
 from nebulus_swarm.models.minion import Minion, MinionStatus
 from nebulus_swarm.overlord.command_parser import CommandType
 from nebulus_swarm.overlord.llm_parser import LLMCommandParser
+from nebulus_swarm.overlord.llm_pool import AsyncLLMPool, PoolConfig
 from nebulus_swarm.overlord.docker_manager import DockerManager
 from nebulus_swarm.overlord.github_queue import GitHubQueue
 from nebulus_swarm.overlord.model_router import ModelRouter
 from nebulus_swarm.overlord.slack_bot import SlackBot
 from nebulus_swarm.overlord.state import OverlordState
+from nebulus_swarm.overlord.webhooks import (
+    DELIVERY_HEADER,
+    EVENT_HEADER,
+    SIGNATURE_HEADER,
+    WEBHOOK_PATH,
+    DeliveryLog,
+    parse_event,
+    verify_signature,
+)
 from nebulus_swarm.reviewer.workflow import ReviewConfig, ReviewWorkflow
 
 logger = get_logger(__name__)
@@ -83,9 +95,21 @@ class Overlord:
             stub_mode=stub_mode,
         )
 
+        # Command parsing queues in the pool's interactive lane and backs
+        # off when the platform reports thermal or VRAM pressure
+        self.llm_pool = AsyncLLMPool(
+            PoolConfig.from_env(
+                base_url=config.overlord_llm.base_url,
+                model=config.overlord_llm.model,
+                timeout=config.overlord_llm.timeout,
+                acquire_timeout=config.overlord_llm.timeout,
+            ),
+            health_client=get_health_client(),
+        )
         self.parser = LLMCommandParser(
             config=config.overlord_llm,
             default_repo=config.github.default_repo,
+            pool=self.llm_pool,
         )
 
         self.slack = SlackBot(
@@ -144,6 +168,10 @@ class Overlord:
         # Queue processing state
         self._paused = False
 
+        # Serializes dispatch between cron sweeps and webhook deliveries
+        self._dispatch_lock = asyncio.Lock()
+        self._webhook_deliveries = DeliveryLog()
+
     async def _handle_message(self, user_id: str, text: str, channel_id: str) -> str:
         """Handle incoming Slack message.
 
@@ -181,6 +209,9 @@ class Overlord:
 
         handler = handlers.get(command.type, self._handle_unknown)
         try:
+            if command.type in (CommandType.WORK, CommandType.QUEUE):
+                # These call GitHub and may wait on the rate-limit budget
+                return await asyncio.to_thread(handler, command)
             return handler(command)
         except Exception as e:
             logger.exception(f"Error handling command: {e}")
@@ -492,6 +523,49 @@ class Overlord:
             }
         )
 
+    async def _history_handler(self, request: web.Request) -> web.Response:
+        """Handle paginated work history requests for the dashboard.
+
+        GET /history?repo=&status=&limit=&cursor= - Returns one page of
+        history, newest first, plus the cursor for the next page.
+        """
+        query = request.query
+        try:
+            limit = int(query.get("limit", "50"))
+            page = await asyncio.to_thread(
+                self.state.get_work_history_page,
+                repo=query.get("repo") or None,
+                status=query.get("status") or None,
+                limit=limit,
+                cursor=query.get("cursor") or None,
+            )
+        except ValueError as e:
+            return web.json_response({"ok": False, "error": str(e)}, status=400)
+        return web.json_response(page)
+
+    async def _history_repos_handler(self, request: web.Request) -> web.Response:
+        """Handle repo list requests for the dashboard.
+
+        GET /history/repos - Returns the repos that appear in work history.
+        """
+        repos = await asyncio.to_thread(self.state.get_distinct_repos)
+        return web.json_response({"repos": repos})
+
+    async def _metrics_handler(self, request: web.Request) -> web.Response:
+        """Handle work metrics requests for the dashboard.
+
+        GET /metrics?days= - Returns aggregated metrics for the period; all
+        time when ``days`` is omitted.
+        """
+        try:
+            days = int(request.query["days"]) if request.query.get("days") else None
+        except ValueError:
+            return web.json_response(
+                {"ok": False, "error": "days must be an integer"}, status=400
+            )
+        metrics = await asyncio.to_thread(self.state.get_metrics, days)
+        return web.json_response(metrics)
+
     async def _setup_health_server(self) -> None:
         """Set up health check HTTP server."""
         self._health_app = web.Application()
@@ -502,6 +576,11 @@ class Overlord:
             "/minion/answer/{minion_id}", self._answer_handler
         )
         self._health_app.router.add_get("/queue", self._queue_handler)
+        self._health_app.router.add_get("/history", self._history_handler)
+        self._health_app.router.add_get("/history/repos", self._history_repos_handler)
+        self._health_app.router.add_get("/metrics", self._metrics_handler)
+        if self.config.webhook.enabled:
+            self._health_app.router.add_post(WEBHOOK_PATH, self._webhook_handler)
 
         self._health_runner = web.AppRunner(self._health_app)
         await self._health_runner.setup()
@@ -510,6 +589,77 @@ class Overlord:
         await site.start()
         logger.info(f"Health check server started on port {self.config.health_port}")
 
+    async def _webhook_handler(self, request: web.Request) -> web.Response:
+        """Handle GitHub webhook deliveries.
+
+        POST /github/webhook - ``issues`` events update the queue cache and
+        dispatch new work immediately; ``pull_request`` events from outside
+        the swarm are queued for auto-review.
+        """
+        body = await request.read()
+        if not verify_signature(
+            self.config.webhook.secret, body, request.headers.get(SIGNATURE_HEADER)
+        ):
+            logger.warning("Rejected webhook with invalid signature")
+            return web.json_response(
+                {"ok": False, "error": "bad signature"}, status=401
+            )
+
+        delivery_id = request.headers.get(DELIVERY_HEADER, "")
+        if self._webhook_deliveries.seen(delivery_id):
+            return web.json_response({"ok": True, "duplicate": True})
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return web.json_response({"ok": False, "error": "invalid JSON"}, status=400)
+
+        event = parse_event(request.headers.get(EVENT_HEADER, ""), payload, delivery_id)
+        if event is None or event.event == "ping":
+            return web.json_response({"ok": True, "handled": False})
+
+        logger.info(
+            f"Webhook {event.event}.{event.action} for {event.repo}#{event.number}"
+        )
+
+        if event.event == "issues" and self.github_queue:
+            delta = self.github_queue.apply_issue_event(
+                event.repo, event.action, event.item
+            )
+            if delta.added or delta.updated:
+                self._last_queue_scan = self._queue_snapshot(
+                    self.github_queue.cached_queue()
+                )
+                if not self._paused:
+                    asyncio.create_task(
+                        self._dispatch_webhook_issues(self.github_queue.cached_queue())
+                    )
+
+        elif event.event == "pull_request":
+            if (
+                event.action in ("opened", "reopened", "synchronize")
+                and not event.head_ref.startswith("minion/")
+                and self._reviewer
+                and self.config.reviewer.auto_review
+            ):
+                asyncio.create_task(self._run_review_async(event.repo, event.number))
+
+        return web.json_response({"ok": True, "handled": True}, status=202)
+
+    async def _dispatch_webhook_issues(self, issues: list) -> None:
+        """Dispatch issues from a webhook delivery, logging any failure.
+
+        Runs as a background task, so an exception would otherwise only
+        surface as "Task exception was never retrieved".
+
+        Args:
+            issues: Ready issues sorted by priority.
+        """
+        try:
+            await self._dispatch_issues(issues, source="Webhook")
+        except Exception as e:
+            logger.exception(f"Webhook dispatch failed: {e}")
+
     async def _health_handler(self, request: web.Request) -> web.Response:
         """Handle health check requests."""
         active_minions = len(self.state.get_active_minions())
@@ -618,8 +768,11 @@ class Overlord:
 
                 # Mark issue as in-review on GitHub
                 if self.github_queue and pr_number:
-                    self.github_queue.mark_in_review(
-                        minion.repo, minion.issue_number, pr_number
+                    await asyncio.to_thread(
+                        self.github_queue.mark_in_review,
+                        minion.repo,
+                        minion.issue_number,
+                        pr_number,
                     )
 
                 # Notify Slack
@@ -696,8 +849,11 @@ class Overlord:
 
                 # Mark issue as needs-attention on GitHub
                 if self.github_queue:
-                    self.github_queue.mark_failed(
-                        minion.repo, minion.issue_number, error_msg
+                    await asyncio.to_thread(
+                        self.github_queue.mark_failed,
+                        minion.repo,
+                        minion.issue_number,
+                        error_msg,
                     )
 
                 # Notify Slack
@@ -887,7 +1043,11 @@ class Overlord:
             return False
 
     async def _sweep_queue(self) -> None:
-        """Sweep GitHub queue and spawn minions for pending work."""
+        """Sweep GitHub queue and spawn minions for pending work.
+
+        With webhooks enabled this is a reconciliation backstop for missed
+        deliveries; new work is normally dispatched on delivery.
+        """
         if self._paused:
             logger.info("Queue sweep skipped - processing paused")
             return
@@ -908,23 +1068,52 @@ class Overlord:
         logger.info("Starting queue sweep")
 
         try:
-            issues = self.github_queue.scan_queue()
+            issues, delta = await asyncio.to_thread(self.github_queue.scan_with_delta)
+            if not delta.is_empty:
+                logger.info(
+                    f"Queue changed: +{len(delta.added)} -{len(delta.removed)} "
+                    f"~{len(delta.updated)}"
+                )
 
             # Cache scan results for dashboard
-            self._last_queue_scan = [
-                {
-                    "repo": issue.repo,
-                    "number": issue.number,
-                    "title": issue.title,
-                    "priority": issue.priority,
-                }
-                for issue in issues
-            ]
+            self._last_queue_scan = self._queue_snapshot(issues)
 
             if not issues:
                 logger.info("Queue sweep complete - no pending issues")
                 return
 
+            await self._dispatch_issues(issues)
+
+        except Exception as e:
+            logger.exception(f"Queue sweep failed: {e}")
+
+    @staticmethod
+    def _queue_snapshot(issues: list) -> list[dict]:
+        """Summarize queued issues for the dashboard."""
+        return [
+            {
+                "repo": issue.repo,
+                "number": issue.number,
+                "title": issue.title,
+                "priority": issue.priority,
+            }
+            for issue in issues
+        ]
+
+    async def _dispatch_issues(self, issues: list, source: str = "Cron") -> int:
+        """Spawn minions for the highest-priority issues that fit.
+
+        Shared by cron sweeps and webhook deliveries; the dispatch lock keeps
+        them from racing for the same slots.
+
+        Args:
+            issues: Ready issues sorted by priority.
+            source: Trigger name shown in Slack notifications.
+
+        Returns:
+            Number of minions spawned.
+        """
+        async with self._dispatch_lock:
             # Calculate available slots
             active_count = len(self.state.get_active_minions())
             available_slots = self.config.minions.max_concurrent - active_count
@@ -933,20 +1122,22 @@ class Overlord:
                 logger.info(
                     f"Queue sweep: {len(issues)} pending, but no available slots"
                 )
-                return
+                return 0
+
+            candidates = [
+                issue
+                for issue in issues
+                if not self.state.get_minion_by_issue(issue.repo, issue.number)
+            ][:available_slots]
+            if not candidates:
+                return 0
 
             # Warm up LLM before spawning minions
             await self._warm_up_llm()
 
             # Spawn minions for top priority issues
             spawned = 0
-            for issue in issues[:available_slots]:
-                # Check if already working on this issue
-                existing = self.state.get_minion_by_issue(issue.repo, issue.number)
-                if existing:
-                    logger.debug(f"Skipping {issue} - already in progress")
-                    continue
-
+            for issue in candidates:
                 try:
                     # Route model selection
                     model_override = self.router.select_model(
@@ -968,14 +1159,16 @@ class Overlord:
                     self.state.add_minion(minion)
 
                     # Mark issue as in-progress on GitHub
-                    self.github_queue.mark_in_progress(issue.repo, issue.number)
+                    await asyncio.to_thread(
+                        self.github_queue.mark_in_progress, issue.repo, issue.number
+                    )
 
                     # Notify Slack
                     model_info = (
                         f" (model: `{model_override.name}`)" if model_override else ""
                     )
                     await self.slack.post_message(
-                        f"🤖 Cron: Spawning minion `{minion_id}` for {issue}{model_info}"
+                        f"🤖 {source}: Spawning minion `{minion_id}` for {issue}{model_info}"
                     )
 
                     spawned += 1
@@ -985,9 +1178,7 @@ class Overlord:
                     logger.error(f"Failed to spawn minion for {issue}: {e}")
 
             logger.info(f"Queue sweep complete - spawned {spawned} minions")
-
-        except Exception as e:
-            logger.exception(f"Queue sweep failed: {e}")
+            return spawned
 
     async def _shutdown(self, drain_minions: bool = True) -> None:
         """Perform graceful shutdown.
@@ -1070,6 +1261,7 @@ class Overlord:
             await self.parser.close()
         except Exception as e:
             logger.warning(f"Error closing LLM parser: {e}")
+        self.llm_pool.shutdown()
 
         # Final Slack notification
         try:
@@ -1155,6 +1347,7 @@ class Overlord:
             f"Queue processing: {'paused' if self._paused else 'active'}\n"
             f"Max concurrent minions: {self.config.minions.max_concurrent}\n"
             f"Cron: {cron_status}\n"
+            f"Webhooks: {'enabled' if self.config.webhook.enabled else 'disabled'}\n"
             f"Watched repos: {repos_status}"
         )
 
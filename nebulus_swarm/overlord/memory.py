@@ -2,10 +2,17 @@
 
 Canonical implementation lives in nebulus-core. Falls back to a local
 copy when nebulus-core is not installed.
+
+The local store keeps two tiers. Raw entries live in ``memory`` for
+RAW_RETENTION_DAYS; ``compact()`` then folds them into ``memory_rollup``,
+one row per (category, project, content) with a count and first/last seen
+times. Search and history queries read both tiers.
 """
 
 from __future__ import annotations
 
+import inspect
+
 try:
     from nebulus_core.memory.overlord import (
         DEFAULT_DB_PATH,
@@ -15,7 +22,10 @@ try:
     )
 except ImportError:
     # Fallback: local implementation (kept for standalone atom installs)
+    import hashlib
     import json
+    import logging
+    import re
     import sqlite3
     import uuid
     from contextlib import contextmanager
@@ -50,6 +60,52 @@ except ImportError:
 
     DEFAULT_DB_PATH = Path.home() / ".atom" / "overlord" / "memory.db"
 
+    logger = logging.getLogger(__name__)
+
+    # Recency boost added to BM25 relevance for a brand-new entry; it halves
+    # every RECENCY_HALF_LIFE_DAYS so recent matches win near-ties
+    RECENCY_WEIGHT = 1.0
+    RECENCY_HALF_LIFE_DAYS = 30.0
+
+    # Raw entries younger than this are never compacted into rollups
+    RAW_RETENTION_DAYS = 7
+    # Raw rows folded into rollups per compact() call (one transaction)
+    COMPACT_BATCH_SIZE = 500
+
+    # Runs of letters/digits, matching FTS5's unicode61 tokenizer
+    _TOKEN_RE = re.compile(r"[^\W_]+")
+
+    def _fts_query(query: str, match_any: bool = False) -> Optional[str]:
+        """Translate free text into an FTS5 MATCH expression.
+
+        Each whitespace-separated word becomes a quoted prefix phrase, so
+        "v0.1.0" matches the token run v0 1 0 and "releas" matches
+        "released". Operators and punctuation in user input are never
+        interpreted.
+
+        Args:
+            query: Free-text query.
+            match_any: OR the words together instead of requiring all.
+
+        Returns:
+            MATCH expression, or None if the query has no searchable tokens.
+        """
+        phrases = []
+        for word in query.split():
+            tokens = _TOKEN_RE.findall(word)
+            if tokens:
+                phrases.append(f'"{" ".join(tokens)}"*')
+        if not phrases:
+            return None
+        return (" OR " if match_any else " AND ").join(phrases)
+
+    def _rollup_id(category: str, project: Optional[str], content: str) -> str:
+        """Stable rollup id; content differing only in case or spacing
+        shares a rollup."""
+        normalized = " ".join(content.lower().split())
+        key = f"{category}\0{project or ''}\0{normalized}"
+        return "rollup-" + hashlib.sha1(key.encode()).hexdigest()
+
     class OverlordMemory:
         """Cross-project memory store backed by SQLite."""
 
@@ -62,6 +118,7 @@ except ImportError:
             """
             self.db_path = db_path or DEFAULT_DB_PATH
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._fts = True
             self._init_db()
 
         @contextmanager
@@ -76,7 +133,7 @@ except ImportError:
                 conn.close()
 
         def _init_db(self) -> None:
-            """Create the memory table and indexes if they don't exist."""
+            """Create the memory table, indexes and full-text index."""
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
@@ -91,16 +148,20 @@ except ImportError:
                     )
                     """
                 )
+                # Filter-then-sort indexes; they supersede the old
+                # single-column project/category indexes
+                cursor.execute("DROP INDEX IF EXISTS idx_memory_project")
+                cursor.execute("DROP INDEX IF EXISTS idx_memory_category")
                 cursor.execute(
                     """
-                    CREATE INDEX IF NOT EXISTS idx_memory_project
-                    ON memory(project)
+                    CREATE INDEX IF NOT EXISTS idx_memory_project_ts
+                    ON memory(project, timestamp DESC)
                     """
                 )
                 cursor.execute(
                     """
-                    CREATE INDEX IF NOT EXISTS idx_memory_category
-                    ON memory(category)
+                    CREATE INDEX IF NOT EXISTS idx_memory_category_ts
+                    ON memory(category, timestamp DESC)
                     """
                 )
                 cursor.execute(
@@ -109,6 +170,99 @@ except ImportError:
                     ON memory(timestamp DESC)
                     """
                 )
+                # Compacted tier: one row per repeated observation
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS memory_rollup (
+                        id TEXT PRIMARY KEY,
+                        category TEXT NOT NULL,
+                        project TEXT,
+                        content TEXT NOT NULL,
+                        metadata TEXT DEFAULT '{}',
+                        count INTEGER NOT NULL,
+                        first_seen TEXT NOT NULL,
+                        last_seen TEXT NOT NULL
+                    )
+                    """
+                )
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_memory_rollup_project_ts
+                    ON memory_rollup(project, last_seen DESC)
+                    """
+                )
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_memory_rollup_category_ts
+                    ON memory_rollup(category, last_seen DESC)
+                    """
+                )
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_memory_rollup_last_seen
+                    ON memory_rollup(last_seen DESC)
+                    """
+                )
+                self._fts = self._init_fts(cursor, "memory") and self._init_fts(
+                    cursor, "memory_rollup"
+                )
+
+        @staticmethod
+        def _init_fts(cursor: sqlite3.Cursor, table: str) -> bool:
+            """Create the FTS5 index over ``table``.content and its sync
+            triggers.
+
+            The index is an external-content table keyed by the table's
+            rowid, so content is not stored twice. It is backfilled once
+            when first created on an existing database.
+
+            Args:
+                cursor: Cursor inside the schema transaction.
+                table: ``memory`` or ``memory_rollup``.
+
+            Returns:
+                False if this SQLite build lacks FTS5.
+            """
+            fts = f"{table}_fts"
+            exists = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (fts,),
+            ).fetchone()
+            try:
+                cursor.execute(
+                    f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {fts}
+                    USING fts5(content, content='{table}', content_rowid='rowid')
+                    """
+                )
+            except sqlite3.OperationalError as e:
+                logger.warning(f"FTS5 unavailable, memory search uses LIKE: {e}")
+                return False
+
+            cursor.executescript(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {fts}_insert
+                AFTER INSERT ON {table} BEGIN
+                    INSERT INTO {fts}(rowid, content)
+                    VALUES (new.rowid, new.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS {fts}_delete
+                AFTER DELETE ON {table} BEGIN
+                    INSERT INTO {fts}({fts}, rowid, content)
+                    VALUES ('delete', old.rowid, old.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS {fts}_update
+                AFTER UPDATE OF content ON {table} BEGIN
+                    INSERT INTO {fts}({fts}, rowid, content)
+                    VALUES ('delete', old.rowid, old.content);
+                    INSERT INTO {fts}(rowid, content)
+                    VALUES (new.rowid, new.content);
+                END;
+                """
+            )
+            if not exists:
+                cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+            return True
 
         def remember(
             self,
@@ -164,38 +318,97 @@ except ImportError:
             category: Optional[str] = None,
             project: Optional[str] = None,
             limit: int = 20,
+            match_any: bool = False,
         ) -> list[MemoryEntry]:
             """Search memories by content text with optional filters.
 
+            Text queries use the FTS5 index: every word must match (or any
+            word, with ``match_any``) as a token prefix, and results are
+            ranked by BM25 relevance plus a recency boost. An empty query
+            lists entries newest first. Raw entries and rollups are searched
+            together; a rollup is dated by its last occurrence.
+
             Args:
-                query: Text to search for (SQLite LIKE pattern).
+                query: Free-text query.
                 category: Optional category filter.
                 project: Optional project filter.
                 limit: Maximum number of results.
+                match_any: Match entries containing any query word.
+
+            Returns:
+                List of matching MemoryEntry objects, best match first.
+            """
+            match = _fts_query(query, match_any) if query and self._fts else None
+            parts = [
+                self._tier_select(table, match, query, category, project)
+                for table in ("memory", "memory_rollup")
+            ]
+            sql = " UNION ALL ".join(part for part, _ in parts)
+            params = [param for _, tier_params in parts for param in tier_params]
+            order = "score, timestamp DESC" if match else "timestamp DESC"
+            # A compound ORDER BY lets SQLite merge the tiers' index scans
+            sql = f"{sql} ORDER BY {order} LIMIT ?"
+            params.append(limit)
+
+            with self._get_connection() as conn:
+                rows = conn.execute(sql, params).fetchall()
+                return [self._row_to_entry(row) for row in rows]
+
+        @staticmethod
+        def _tier_select(
+            table: str,
+            match: Optional[str],
+            query: str,
+            category: Optional[str],
+            project: Optional[str],
+        ) -> tuple[str, list[object]]:
+            """One tier's half of a search as a SELECT with uniform columns.
+
+            Args:
+                table: ``memory`` or ``memory_rollup``.
+                match: FTS5 MATCH expression, or None.
+                query: Raw query, used with LIKE when FTS is unavailable.
+                category: Optional category filter.
+                project: Optional project filter.
 
             Returns:
-                List of matching MemoryEntry objects, newest first.
+                (sql, params) for the tier.
             """
-            if query:
-                sql = "SELECT * FROM memory WHERE content LIKE ?"
-                params: list[object] = [f"%{query}%"]
+            if table == "memory":
+                timestamp = "m.timestamp"
+                columns = "m.timestamp AS timestamp, 1 AS count, NULL AS first_seen"
+            else:
+                timestamp = "m.last_seen"
+                columns = "m.last_seen AS timestamp, m.count, m.first_seen"
+            columns = f"m.id, m.category, m.project, m.content, m.metadata, {columns}"
+
+            if match:
+                # bm25() is negative, lower is better; subtract the boost
+                sql = (
+                    f"SELECT {columns}, bm25({table}_fts) - ? / (1.0 + max(0.0,"
+                    f" julianday('now') - julianday({timestamp})) / ?) AS score"
+                    f" FROM {table}_fts f JOIN {table} m ON m.rowid = f.rowid"
+                    f" WHERE {table}_fts MATCH ?"
+                )
+                params: list[object] = [
+                    RECENCY_WEIGHT,
+                    RECENCY_HALF_LIFE_DAYS,
+                    match,
+                ]
+            elif query:
+                sql = f"SELECT {columns} FROM {table} m WHERE content LIKE ?"
+                params = [f"%{query}%"]
             else:
-                sql = "SELECT * FROM memory WHERE 1=1"
-                params: list[object] = []
+                sql = f"SELECT {columns} FROM {table} m WHERE 1=1"
+                params = []
 
             if category:
-                sql += " AND category = ?"
+                sql += " AND m.category = ?"
                 params.append(category)
             if project:
-                sql += " AND project = ?"
+                sql += " AND m.project = ?"
                 params.append(project)
-
-            sql += " ORDER BY timestamp DESC LIMIT ?"
-            params.append(limit)
-
-            with self._get_connection() as conn:
-                rows = conn.execute(sql, params).fetchall()
-                return [self._row_to_entry(row) for row in rows]
+            return sql, params
 
         def forget(self, entry_id: str) -> bool:
             """Delete a specific memory.
@@ -206,14 +419,15 @@ except ImportError:
             Returns:
                 True if the entry was found and deleted, False otherwise.
             """
+            table = "memory_rollup" if entry_id.startswith("rollup-") else "memory"
             with self._get_connection() as conn:
-                cursor = conn.execute("DELETE FROM memory WHERE id = ?", (entry_id,))
+                cursor = conn.execute(f"DELETE FROM {table} WHERE id = ?", (entry_id,))
                 return cursor.rowcount > 0
 
         def get_project_history(
             self, project: str, limit: int = 20
         ) -> list[MemoryEntry]:
-            """Get all memories for a project, newest first.
+            """Get all memories for a project, raw and rolled up, newest first.
 
             Args:
                 project: Project name.
@@ -222,12 +436,7 @@ except ImportError:
             Returns:
                 List of MemoryEntry objects.
             """
-            with self._get_connection() as conn:
-                rows = conn.execute(
-                    "SELECT * FROM memory WHERE project = ? ORDER BY timestamp DESC LIMIT ?",
-                    (project, limit),
-                ).fetchall()
-                return [self._row_to_entry(row) for row in rows]
+            return self.search("", project=project, limit=limit)
 
         def get_recent(self, limit: int = 20) -> list[MemoryEntry]:
             """Get most recent memories across all projects.
@@ -238,15 +447,11 @@ except ImportError:
             Returns:
                 List of MemoryEntry objects, newest first.
             """
-            with self._get_connection() as conn:
-                rows = conn.execute(
-                    "SELECT * FROM memory ORDER BY timestamp DESC LIMIT ?",
-                    (limit,),
-                ).fetchall()
-                return [self._row_to_entry(row) for row in rows]
+            return self.search("", limit=limit)
 
         def prune(self, older_than_days: int) -> int:
-            """Delete entries older than the specified number of days.
+            """Delete entries, raw or rolled up, last seen before the
+            specified number of days.
 
             Args:
                 older_than_days: Delete entries older than this many days.
@@ -259,21 +464,124 @@ except ImportError:
             ).isoformat()
 
             with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "DELETE FROM memory WHERE timestamp < ?", (cutoff,)
+                raw = conn.execute("DELETE FROM memory WHERE timestamp < ?", (cutoff,))
+                rollups = conn.execute(
+                    "DELETE FROM memory_rollup WHERE last_seen < ?", (cutoff,)
                 )
-                return cursor.rowcount
+                return raw.rowcount + rollups.rowcount
+
+        def compact(
+            self,
+            raw_days: int = RAW_RETENTION_DAYS,
+            batch_size: int = COMPACT_BATCH_SIZE,
+        ) -> int:
+            """Fold the oldest raw entries past the raw window into rollups.
+
+            Handles at most ``batch_size`` entries in one transaction, so a
+            background caller can run it repeatedly until it returns 0
+            without holding the database for long. Entries with the same
+            category, project and content (ignoring case and spacing) share
+            a rollup; it keeps the count, first and last occurrence, and the
+            latest entry's content and metadata.
+
+            Args:
+                raw_days: Keep raw entries younger than this many days.
+                batch_size: Maximum raw entries compacted by this call.
+
+            Returns:
+                Number of raw entries compacted.
+            """
+            cutoff = (datetime.now(timezone.utc) - timedelta(days=raw_days)).isoformat()
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    "SELECT rowid, * FROM memory WHERE timestamp < ?"
+                    " ORDER BY timestamp LIMIT ?",
+                    (cutoff, batch_size),
+                ).fetchall()
+                if not rows:
+                    return 0
+
+                rollups: dict[str, dict[str, object]] = {}
+                for row in rows:
+                    rollup_id = _rollup_id(
+                        row["category"], row["project"], row["content"]
+                    )
+                    rollup = rollups.setdefault(
+                        rollup_id,
+                        {
+                            "id": rollup_id,
+                            "category": row["category"],
+                            "project": row["project"],
+                            "count": 0,
+                            "first_seen": row["timestamp"],
+                        },
+                    )
+                    # Rows arrive oldest first, so the last one is the exemplar
+                    rollup["count"] = int(rollup["count"]) + 1
+                    rollup["content"] = row["content"]
+                    rollup["metadata"] = row["metadata"] or "{}"
+                    rollup["last_seen"] = row["timestamp"]
+
+                conn.executemany(
+                    """
+                    INSERT INTO memory_rollup
+                        (id, category, project, content, metadata, count,
+                         first_seen, last_seen)
+                    VALUES (:id, :category, :project, :content, :metadata, :count,
+                            :first_seen, :last_seen)
+                    ON CONFLICT(id) DO UPDATE SET
+                        count = count + excluded.count,
+                        first_seen = min(first_seen, excluded.first_seen),
+                        content = CASE WHEN excluded.last_seen >= last_seen
+                            THEN excluded.content ELSE content END,
+                        metadata = CASE WHEN excluded.last_seen >= last_seen
+                            THEN excluded.metadata ELSE metadata END,
+                        last_seen = max(last_seen, excluded.last_seen)
+                    """,
+                    list(rollups.values()),
+                )
+                conn.executemany(
+                    "DELETE FROM memory WHERE rowid = ?",
+                    [(row["rowid"],) for row in rows],
+                )
+            logger.debug(
+                f"Compacted {len(rows)} memory entries into {len(rollups)} rollups"
+            )
+            return len(rows)
 
         def _row_to_entry(self, row: sqlite3.Row) -> MemoryEntry:
-            """Convert a database row to a MemoryEntry."""
+            """Convert a database row to a MemoryEntry.
+
+            Rollups carry ``{"rollup": {"count", "first_seen", "last_seen"}}``
+            in their metadata, beside the latest occurrence's own metadata.
+            """
+            metadata = json.loads(row["metadata"]) if row["metadata"] else {}
+            if row["first_seen"] is not None:
+                metadata["rollup"] = {
+                    "count": row["count"],
+                    "first_seen": row["first_seen"],
+                    "last_seen": row["timestamp"],
+                }
             return MemoryEntry(
                 id=row["id"],
                 timestamp=row["timestamp"],
                 category=row["category"],
                 project=row["project"],
                 content=row["content"],
-                metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+                metadata=metadata,
             )
 
 
-__all__ = ["DEFAULT_DB_PATH", "MemoryEntry", "OverlordMemory", "VALID_CATEGORIES"]
+# nebulus-core's store may predate the match_any search option
+SUPPORTS_MATCH_ANY = "match_any" in inspect.signature(OverlordMemory.search).parameters
+# ... and the rollup tier
+SUPPORTS_COMPACTION = callable(getattr(OverlordMemory, "compact", None))
+
+__all__ = [
+    "DEFAULT_DB_PATH",
+    "MemoryEntry",
+    "OverlordMemory",
+    "SUPPORTS_COMPACTION",
+    "SUPPORTS_MATCH_ANY",
+    "VALID_CATEGORIES",
+]
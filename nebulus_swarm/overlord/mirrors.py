@@ -2,16 +2,21 @@
 
 Provides init, sync, and status operations for local bare-clone
 mirrors used by the Overlord for safe read-only repository access.
+Multi-project operations fan out over a bounded thread pool.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import subprocess
-from dataclasses import dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 
 from nebulus_swarm.overlord.registry import OverlordConfig
 
@@ -20,6 +25,11 @@ logger = logging.getLogger(__name__)
 DEFAULT_MIRROR_ROOT = Path.home() / ".nebulus" / "mirrors"
 WORKTREE_ROOT = Path.home() / ".nebulus" / "worktrees"
 
+# Metrics of the latest sync, stored inside each bare clone
+SYNC_STATS_FILE = "nebulus-sync.json"
+
+T = TypeVar("T")
+
 
 @dataclass
 class MirrorState:
@@ -28,6 +38,20 @@ class MirrorState:
     exists: bool
     last_fetch: Optional[datetime] = None
     ref_count: int = 0
+    last_sync_ok: Optional[bool] = None
+    last_sync_seconds: Optional[float] = None
+    last_bytes_fetched: Optional[int] = None
+
+
+@dataclass
+class MirrorSyncResult:
+    """Outcome and metrics of a single mirror fetch."""
+
+    name: str
+    success: bool
+    duration_seconds: float = 0.0
+    bytes_fetched: int = 0
+    error: str = ""
 
 
 class MirrorManager:
@@ -45,6 +69,7 @@ class MirrorManager:
     ) -> None:
         self.config = config
         self.mirror_root = mirror_root or DEFAULT_MIRROR_ROOT
+        self.settings = config.mirrors
 
     def _mirror_path(self, name: str) -> Path:
         """Get the mirror directory path for a project.
@@ -92,12 +117,17 @@ class MirrorManager:
         self.mirror_root.mkdir(parents=True, exist_ok=True)
         remote_url = self._remote_url(project.remote)
 
+        cmd = ["git", "clone", "--bare"]
+        if self.settings.filter_blobs:
+            cmd.append("--filter=blob:none")
+        cmd.extend([remote_url, str(mirror_path)])
+
         try:
             subprocess.run(
-                ["git", "clone", "--bare", remote_url, str(mirror_path)],
+                cmd,
                 capture_output=True,
                 text=True,
-                timeout=120,
+                timeout=self.settings.timeout_seconds,
                 check=True,
             )
             logger.info(f"Cloned mirror: {name} -> {mirror_path}")
@@ -112,13 +142,12 @@ class MirrorManager:
     def init_all(self) -> dict[str, bool]:
         """Initialize bare-clone mirrors for all registered projects.
 
+        Clones run in parallel, bounded by ``mirrors.concurrency``.
+
         Returns:
             Dict mapping project name to success boolean.
         """
-        results: dict[str, bool] = {}
-        for name in self.config.projects:
-            results[name] = self.init_project(name)
-        return results
+        return self._run_parallel(self.init_project, list(self.config.projects))
 
     def sync_project(self, name: str) -> bool:
         """Fetch updates for a single project mirror.
@@ -129,28 +158,62 @@ class MirrorManager:
         Returns:
             True if fetch succeeded, False on error.
         """
+        return self.sync_project_detailed(name).success
+
+    def sync_project_detailed(self, name: str) -> MirrorSyncResult:
+        """Fetch updates for a single project mirror and record metrics.
+
+        The fetch honours the per-project timeout, ``--prune`` and (for
+        partial clones) ``--filter=blob:none`` settings. Timing and
+        bytes fetched are persisted next to the mirror so ``status`` can
+        report them later.
+
+        Args:
+            name: Project name from the registry.
+
+        Returns:
+            MirrorSyncResult describing the fetch.
+        """
         mirror_path = self._mirror_path(name)
         if not mirror_path.exists():
             logger.error(f"Mirror not found: {mirror_path}. Run init first.")
-            return False
+            return MirrorSyncResult(name=name, success=False, error="not initialized")
+
+        cmd = ["git", "fetch", "--all"]
+        if self.settings.prune:
+            cmd.append("--prune")
+        if self.settings.filter_blobs and self._is_partial_clone(mirror_path):
+            cmd.append("--filter=blob:none")
 
+        size_before = self._objects_size(mirror_path)
+        started = time.monotonic()
+        error = ""
         try:
             subprocess.run(
-                ["git", "fetch", "--all", "--prune"],
+                cmd,
                 cwd=str(mirror_path),
                 capture_output=True,
                 text=True,
-                timeout=120,
+                timeout=self.settings.timeout_seconds,
                 check=True,
             )
             logger.info(f"Synced mirror: {name}")
-            return True
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to sync {name}: {e.stderr.strip()}")
-            return False
+            error = (e.stderr or "").strip()
+            logger.error(f"Failed to sync {name}: {error}")
         except subprocess.TimeoutExpired:
+            error = f"timed out after {self.settings.timeout_seconds}s"
             logger.error(f"Sync timed out for {name}")
-            return False
+
+        result = MirrorSyncResult(
+            name=name,
+            success=not error,
+            duration_seconds=time.monotonic() - started,
+            bytes_fetched=max(0, self._objects_size(mirror_path) - size_before),
+            error=error,
+        )
+        self._write_sync_stats(mirror_path, result)
+        return result
 
     def sync_all(self) -> dict[str, bool]:
         """Fetch updates for all project mirrors.
@@ -158,10 +221,22 @@ class MirrorManager:
         Returns:
             Dict mapping project name to success boolean.
         """
-        results: dict[str, bool] = {}
-        for name in self.config.projects:
-            results[name] = self.sync_project(name)
-        return results
+        return {
+            name: result.success for name, result in self.sync_all_detailed().items()
+        }
+
+    def sync_all_detailed(self) -> dict[str, MirrorSyncResult]:
+        """Fetch updates for all project mirrors in parallel.
+
+        At most ``mirrors.concurrency`` fetches run at once, so a full
+        sync takes roughly as long as the slowest mirror.
+
+        Returns:
+            Dict mapping project name to MirrorSyncResult, in registry order.
+        """
+        return self._run_parallel(
+            self.sync_project_detailed, list(self.config.projects)
+        )
 
     def status(self) -> dict[str, MirrorState]:
         """Get the state of all project mirrors.
@@ -169,21 +244,113 @@ class MirrorManager:
         Returns:
             Dict mapping project name to MirrorState.
         """
-        states: dict[str, MirrorState] = {}
-        for name in self.config.projects:
-            mirror_path = self._mirror_path(name)
-            if not mirror_path.exists():
-                states[name] = MirrorState(exists=False)
-                continue
-
-            last_fetch = self._get_last_fetch(mirror_path)
-            ref_count = self._count_refs(mirror_path)
-            states[name] = MirrorState(
-                exists=True,
-                last_fetch=last_fetch,
-                ref_count=ref_count,
-            )
-        return states
+        return self._run_parallel(self._project_state, list(self.config.projects))
+
+    def _project_state(self, name: str) -> MirrorState:
+        """Collect the state of a single project mirror.
+
+        Args:
+            name: Project name from the registry.
+
+        Returns:
+            MirrorState for the project.
+        """
+        mirror_path = self._mirror_path(name)
+        if not mirror_path.exists():
+            return MirrorState(exists=False)
+
+        stats = self._read_sync_stats(mirror_path)
+        return MirrorState(
+            exists=True,
+            last_fetch=self._get_last_fetch(mirror_path),
+            ref_count=self._count_refs(mirror_path),
+            last_sync_ok=stats.get("success"),
+            last_sync_seconds=stats.get("duration_seconds"),
+            last_bytes_fetched=stats.get("bytes_fetched"),
+        )
+
+    def _run_parallel(self, func: Callable[[str], T], names: list[str]) -> dict[str, T]:
+        """Run a per-project operation across a bounded thread pool.
+
+        Args:
+            func: Operation taking a project name.
+            names: Project names to process.
+
+        Returns:
+            Dict mapping project name to the operation's result, in input order.
+        """
+        if not names:
+            return {}
+        workers = max(1, min(self.settings.concurrency, len(names)))
+        if workers == 1:
+            return {name: func(name) for name in names}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {name: pool.submit(func, name) for name in names}
+            return {name: futures[name].result() for name in names}
+
+    @staticmethod
+    def _is_partial_clone(mirror_path: Path) -> bool:
+        """Check whether a bare clone was created with an object filter.
+
+        Args:
+            mirror_path: Path to the bare clone.
+
+        Returns:
+            True if the clone has a promisor remote.
+        """
+        try:
+            text = (mirror_path / "config").read_text()
+        except OSError:
+            return False
+        return "partialclonefilter" in text.lower()
+
+    @staticmethod
+    def _objects_size(mirror_path: Path) -> int:
+        """Total size in bytes of the object store of a bare clone.
+
+        Args:
+            mirror_path: Path to the bare clone.
+
+        Returns:
+            Bytes on disk under ``objects/``, or 0 if unreadable.
+        """
+        total = 0
+        for root, _dirs, files in os.walk(mirror_path / "objects"):
+            for filename in files:
+                try:
+                    total += os.stat(os.path.join(root, filename)).st_size
+                except OSError:
+                    continue
+        return total
+
+    @staticmethod
+    def _write_sync_stats(mirror_path: Path, result: MirrorSyncResult) -> None:
+        """Persist the metrics of the latest sync inside the mirror.
+
+        Args:
+            mirror_path: Path to the bare clone.
+            result: Result of the sync.
+        """
+        try:
+            (mirror_path / SYNC_STATS_FILE).write_text(json.dumps(asdict(result)))
+        except OSError as e:
+            logger.debug("Could not write sync stats for %s: %s", mirror_path, e)
+
+    @staticmethod
+    def _read_sync_stats(mirror_path: Path) -> dict[str, Any]:
+        """Load the metrics of the latest sync, if any.
+
+        Args:
+            mirror_path: Path to the bare clone.
+
+        Returns:
+            Stats dict, empty if no sync has been recorded.
+        """
+        try:
+            data = json.loads((mirror_path / SYNC_STATS_FILE).read_text())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
 
     @staticmethod
     def _get_last_fetch(mirror_path: Path) -> Optional[datetime]:
@@ -42,7 +42,7 @@ _BRIEF_TEMPLATE = """\
 - Do NOT modify files outside the project scope
 
 ## Verification
-- [ ] All existing tests pass: `pytest tests/ -v`
+- [ ] Affected tests pass: `python -m nebulus_swarm.reviewer.impact --run` (runs the full suite when the change is risky; use `pytest tests/ -v` if the module is unavailable)
 - [ ] New code has test coverage
 - [ ] No lint errors: `ruff check .`
 - [ ] Changes are committed to a feature branch
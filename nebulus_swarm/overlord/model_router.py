@@ -142,21 +142,32 @@ class ModelRouter:
         Returns:
             Healthy endpoint or None.
         """
-        candidates = [ep for ep in self.endpoints.values() if ep.tier == tier]
+        healthy = self.get_healthy_endpoints(tier, prefer_local)
+        return healthy[0] if healthy else None
 
-        if not candidates:
-            return None
+    def get_healthy_endpoints(
+        self, tier: str, prefer_local: bool = True
+    ) -> list[ModelEndpoint]:
+        """List the healthy endpoints of a tier in preference order.
+
+        Used for hedging, where a duplicate request goes to the next
+        equivalent endpoint.
+
+        Args:
+            tier: Target tier.
+            prefer_local: Whether to prefer local endpoints.
+
+        Returns:
+            Healthy endpoints, most preferred first.
+        """
+        candidates = [ep for ep in self.endpoints.values() if ep.tier == tier]
 
         # Sort: local first if preferred, then by name for stability
         candidates.sort(
             key=lambda ep: (not prefer_local or ep.endpoint != "local", ep.name)
         )
 
-        for endpoint in candidates:
-            if self._is_healthy(endpoint):
-                return endpoint
-
-        return None
+        return [ep for ep in candidates if self._is_healthy(ep)]
 
     def _is_healthy(self, endpoint: ModelEndpoint) -> bool:
         """Check if endpoint is healthy (with caching).
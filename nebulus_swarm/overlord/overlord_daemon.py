@@ -17,11 +17,14 @@ from typing import TYPE_CHECKING, Optional
 
 from croniter import croniter
 
+from nebulus_swarm.config import OverlordLLMConfig
+from nebulus_swarm.integrations.health_client import get_health_client
 from nebulus_swarm.overlord.autonomy import AutonomyEngine
 from nebulus_swarm.overlord.detectors import DetectionEngine
 from nebulus_swarm.overlord.dispatch import DispatchEngine
 from nebulus_swarm.overlord.graph import DependencyGraph
-from nebulus_swarm.overlord.memory import OverlordMemory
+from nebulus_swarm.overlord.llm_pool import AsyncLLMPool, PoolConfig
+from nebulus_swarm.overlord.memory import SUPPORTS_COMPACTION, OverlordMemory
 from nebulus_swarm.overlord.model_router import ModelRouter
 from nebulus_swarm.overlord.notifications import NotificationManager
 from nebulus_swarm.overlord.proposal_manager import ProposalManager, ProposalStore
@@ -42,6 +45,9 @@ DEFAULT_PROPOSALS_DB = os.path.expanduser("~/.atom/overlord/proposals.db")
 # PID file for daemon lifecycle management
 DEFAULT_PID_FILE = os.path.expanduser("~/.atom/overlord/daemon.pid")
 
+# Seconds between memory compaction passes
+MEMORY_COMPACTION_INTERVAL = 3600
+
 
 class OverlordDaemon:
     """Persistent daemon process with scheduled sweeps and Slack integration."""
@@ -71,10 +77,22 @@ class OverlordDaemon:
             dispatch=self.dispatch,
             memory=self.memory,
         )
+        # The Slack chat fallback queues in the pool's interactive lane
+        # and backs off when the platform reports thermal or VRAM pressure
+        llm_config = OverlordLLMConfig()
+        self.llm_pool = AsyncLLMPool(
+            PoolConfig.from_env(
+                base_url=llm_config.base_url,
+                model=llm_config.model,
+                timeout=llm_config.timeout,
+            ),
+            health_client=get_health_client(),
+        )
         self.command_router = SlackCommandRouter(
             config,
             proposal_manager=self.proposal_manager,
             workspace_root=config.workspace_root,
+            pool=self.llm_pool,
         )
         self.detection_engine = DetectionEngine(config, self.graph, self.autonomy)
         notif_config = config.notifications
@@ -156,6 +174,10 @@ class OverlordDaemon:
         # Start proposal cleanup loop
         tasks.append(asyncio.create_task(self._cleanup_loop()))
 
+        # Fold aged memory entries into rollups in the background
+        if SUPPORTS_COMPACTION:
+            tasks.append(asyncio.create_task(self._memory_compaction_loop()))
+
         # Wait for shutdown
         await self._shutdown_event.wait()
         logger.info("Shutdown signal received, stopping...")
@@ -337,12 +359,53 @@ class OverlordDaemon:
         except asyncio.CancelledError:
             pass
 
+    async def _memory_compaction_loop(self) -> None:
+        """Periodically compact aged memory entries into rollups.
+
+        Each pass runs ``compact`` batch by batch off the event loop until
+        nothing is left, so a large backlog never blocks the database for
+        long.
+        """
+        try:
+            while not self._shutdown_event.is_set():
+                try:
+                    await asyncio.wait_for(
+                        self._shutdown_event.wait(),
+                        timeout=MEMORY_COMPACTION_INTERVAL,
+                    )
+                    break
+                except asyncio.TimeoutError:
+                    pass
+                await self.compact_memory()
+        except asyncio.CancelledError:
+            pass
+
+    async def compact_memory(self) -> int:
+        """Run memory compaction to completion.
+
+        Returns:
+            Number of raw entries compacted.
+        """
+        total = 0
+        try:
+            while not self._shutdown_event.is_set():
+                compacted = await asyncio.to_thread(self.memory.compact)
+                if not compacted:
+                    break
+                total += compacted
+        except Exception:
+            logger.exception("Memory compaction failed")
+        if total:
+            logger.info("Compacted %d memory entries into rollups", total)
+        return total
+
     async def shutdown(self) -> None:
         """Graceful shutdown: stop Slack, close connections, remove PID file."""
         self._running = False
         self._remove_pid_file()
         if self.slack_bot:
             await self.slack_bot.stop()
+        self.llm_pool.shutdown()
         logger.info("Daemon shutdown complete")
 
     def _signal_shutdown(self) -> None:
@@ -1,7 +1,8 @@
 """GitHub issue sync for the Overlord work queue.
 
 Separated from work_queue.py to isolate subprocess/gh CLI dependency.
-Syncs GitHub issues (by label) into the work queue via `gh issue list`.
+Syncs GitHub issues (by label) into the work queue via `gh issue list`,
+fetching projects concurrently and applying the results in one transaction.
 """
 
 from __future__ import annotations
@@ -9,15 +10,22 @@ from __future__ import annotations
 import json
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
 
 from nebulus_swarm.overlord.registry import OverlordConfig
-from nebulus_swarm.overlord.work_queue import WorkQueue
+from nebulus_swarm.overlord.work_queue import GitHubIssueRecord, WorkQueue
 
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on issues fetched per project; gh defaults to 30, which
+# would make reconciliation treat older issues as closed. A project that
+# returns this many issues may be truncated and is not reconciled.
+ISSUE_LIST_LIMIT = 1000
+
+
 @dataclass
 class SyncResult:
     """Summary of a GitHub sync operation."""
@@ -25,6 +33,8 @@ class SyncResult:
     new_count: int = 0
     updated_count: int = 0
     skipped_count: int = 0
+    closed_count: int = 0
+    reopened_count: int = 0
     errors: list[str] = field(default_factory=list)
 
 
@@ -35,23 +45,31 @@ def sync_github_issues(
     label: str = "nebulus-ready",
     project_filter: Optional[str] = None,
     token_budget: Optional[int] = None,
+    concurrency: int = 4,
+    reconcile: bool = True,
 ) -> SyncResult:
     """Sync GitHub issues into the work queue.
 
-    For each project with a remote, runs `gh issue list` to find issues
-    with the given label and upserts them into the queue.
+    Runs `gh issue list` for every project with a remote concurrently,
+    then applies all issues to the queue in one transaction.
 
     Args:
         queue: The work queue to sync into.
         config: Overlord config with project definitions.
         label: GitHub label to filter issues by.
         project_filter: Optional single project to sync.
+        token_budget: Default token budget for newly created tasks.
+        concurrency: Maximum parallel `gh` invocations.
+        reconcile: Fail backlog tasks whose issue is no longer open with
+            the label. Only projects fetched successfully and completely
+            (fewer than ISSUE_LIST_LIMIT issues) are reconciled.
 
     Returns:
         SyncResult with counts and any errors.
     """
     result = SyncResult()
 
+    projects = []
     for name, proj in config.projects.items():
         if project_filter and name != project_filter:
             continue
@@ -60,45 +78,78 @@ def sync_github_issues(
             result.skipped_count += 1
             continue
 
-        try:
-            issues = _run_gh_issue_list(proj.remote, label)
-        except Exception as e:
-            msg = f"{name}: gh CLI error: {e}"
-            logger.error(msg)
-            result.errors.append(msg)
-            continue
-
-        external_source = f"github:{proj.remote}"
+        projects.append((name, proj.remote))
 
-        for issue in issues:
-            issue_number = str(issue.get("number", ""))
-            title = issue.get("title", "Untitled")
-            body = issue.get("body") or ""
-            labels = [lbl.get("name", "") for lbl in issue.get("labels", [])]
-            priority = _map_labels_to_priority(labels)
+    if not projects:
+        return result
 
+    records: list[GitHubIssueRecord] = []
+    fetched_sources: list[str] = []
+    workers = max(1, min(concurrency, len(projects)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_gh_issue_list, remote, label) for _, remote in projects
+        ]
+        for (name, remote), future in zip(projects, futures):
             try:
-                task_id, is_new = queue.upsert_from_github(
-                    external_id=issue_number,
-                    external_source=external_source,
-                    title=title,
-                    project=name,
-                    description=body,
-                    priority=priority,
-                    token_budget=token_budget,
-                )
-                if is_new:
-                    result.new_count += 1
-                else:
-                    result.updated_count += 1
+                issues = future.result()
             except Exception as e:
-                msg = f"{name}#{issue_number}: upsert error: {e}"
+                msg = f"{name}: gh CLI error: {e}"
                 logger.error(msg)
                 result.errors.append(msg)
+                continue
 
+            external_source = f"github:{remote}"
+            if len(issues) >= ISSUE_LIST_LIMIT:
+                logger.warning(
+                    f"{name}: {len(issues)} issues returned, list may be "
+                    "truncated; skipping reconciliation"
+                )
+            else:
+                fetched_sources.append(external_source)
+            records.extend(_to_record(issue, name, external_source) for issue in issues)
+
+    try:
+        upserted = queue.bulk_upsert_from_github(
+            records,
+            reconcile_sources=fetched_sources if reconcile else None,
+            token_budget=token_budget,
+        )
+    except Exception as e:
+        msg = f"upsert error: {e}"
+        logger.error(msg)
+        result.errors.append(msg)
+        return result
+
+    result.new_count = len(upserted.new_ids)
+    result.updated_count = len(upserted.updated_ids)
+    result.closed_count = len(upserted.closed_ids)
+    result.reopened_count = len(upserted.reopened_ids)
     return result
 
 
+def _to_record(issue: dict, project: str, external_source: str) -> GitHubIssueRecord:
+    """Convert a `gh issue list` entry into a GitHubIssueRecord.
+
+    Args:
+        issue: Issue dict with number, title, body, labels keys.
+        project: Project name.
+        external_source: Source identifier (e.g. "github:owner/repo").
+
+    Returns:
+        GitHubIssueRecord ready for bulk upsert.
+    """
+    labels = [lbl.get("name", "") for lbl in issue.get("labels", [])]
+    return GitHubIssueRecord(
+        external_id=str(issue.get("number", "")),
+        external_source=external_source,
+        title=issue.get("title", "Untitled"),
+        project=project,
+        description=issue.get("body") or "",
+        priority=_map_labels_to_priority(labels),
+    )
+
+
 def _run_gh_issue_list(remote: str, label: str) -> list[dict]:
     """Run `gh issue list` and return parsed JSON.
 
@@ -122,6 +173,10 @@ def _run_gh_issue_list(remote: str, label: str) -> list[dict]:
         "number,title,body,labels",
         "--label",
         label,
+        "--state",
+        "open",
+        "--limit",
+        str(ISSUE_LIST_LIMIT),
     ]
 
     proc = subprocess.run(
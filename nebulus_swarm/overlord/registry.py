@@ -102,6 +102,16 @@ class CostControlConfig:
     default_task_budget_tokens: int = 100000
 
 
+@dataclass
+class MirrorConfig:
+    """Configuration for bare-clone mirror sync."""
+
+    concurrency: int = 4
+    timeout_seconds: int = 120
+    prune: bool = True
+    filter_blobs: bool = False
+
+
 @dataclass
 class OverlordConfig:
     """Top-level Overlord configuration."""
@@ -116,6 +126,7 @@ class OverlordConfig:
     notifications: NotificationConfig = field(default_factory=NotificationConfig)
     workers: dict[str, dict[str, object]] = field(default_factory=dict)
     cost_controls: CostControlConfig = field(default_factory=CostControlConfig)
+    mirrors: MirrorConfig = field(default_factory=MirrorConfig)
 
 
 def load_config(path: Optional[Path] = None) -> OverlordConfig:
@@ -212,6 +223,19 @@ def load_config(path: Optional[Path] = None) -> OverlordConfig:
         else CostControlConfig()
     )
 
+    # Parse mirror sync settings
+    raw_mirrors = raw.get("mirrors", {})
+    mirrors = (
+        MirrorConfig(
+            concurrency=max(1, int(raw_mirrors.get("concurrency", 4))),
+            timeout_seconds=int(raw_mirrors.get("timeout_seconds", 120)),
+            prune=bool(raw_mirrors.get("prune", True)),
+            filter_blobs=bool(raw_mirrors.get("filter_blobs", False)),
+        )
+        if isinstance(raw_mirrors, dict)
+        else MirrorConfig()
+    )
+
     # Parse workspace_root — explicit from YAML or auto-detected from project paths
     raw_ws = raw.get("workspace_root")
     if raw_ws:
@@ -241,6 +265,7 @@ def load_config(path: Optional[Path] = None) -> OverlordConfig:
         notifications=notifications,
         workers=workers,
         cost_controls=cost_controls,
+        mirrors=mirrors,
     )
 
 
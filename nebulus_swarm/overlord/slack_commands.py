@@ -10,20 +10,25 @@ to async Slack handlers via asyncio.to_thread().
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 from pathlib import Path
 import re
 import time
 from typing import TYPE_CHECKING, Optional
 
-from openai import AsyncOpenAI
-
 from nebulus_swarm.config import OverlordLLMConfig
+from nebulus_swarm.lazy_import import lazy_import
 from nebulus_swarm.overlord.autonomy import AutonomyEngine, get_autonomy_summary
 from nebulus_swarm.overlord.detectors import DetectionEngine
 from nebulus_swarm.overlord.dispatch import DispatchEngine
 from nebulus_swarm.overlord.graph import DependencyGraph
-from nebulus_swarm.overlord.memory import VALID_CATEGORIES, OverlordMemory
+from nebulus_swarm.overlord.llm_pool import Priority
+from nebulus_swarm.overlord.memory import (
+    SUPPORTS_MATCH_ANY,
+    VALID_CATEGORIES,
+    OverlordMemory,
+)
 from nebulus_swarm.overlord.model_router import ModelRouter
 from nebulus_swarm.overlord.release import (
     ReleaseCoordinator,
@@ -35,11 +40,14 @@ from nebulus_swarm.overlord.task_parser import TaskParser
 from nebulus_swarm.overlord.worker_claude import ClaudeWorker
 
 if TYPE_CHECKING:
+    from nebulus_swarm.overlord.llm_pool import AsyncLLMPool
     from nebulus_swarm.overlord.proposal_manager import ProposalManager
     from nebulus_swarm.overlord.registry import OverlordConfig
 
 logger = logging.getLogger(__name__)
 
+AsyncOpenAI = lazy_import("openai", "AsyncOpenAI")
+
 # Command patterns
 _RE_STATUS = re.compile(r"^status(?:\s+(\S+))?$", re.IGNORECASE)
 _RE_SCAN = re.compile(r"^scan(?:\s+(\S+))?$", re.IGNORECASE)
@@ -79,6 +87,7 @@ class SlackCommandRouter:
         config: OverlordConfig,
         proposal_manager: Optional[ProposalManager] = None,
         workspace_root: Optional[Path] = None,
+        pool: Optional[AsyncLLMPool] = None,
     ):
         """Initialize the command router with the full Phase 2 stack.
 
@@ -87,6 +96,8 @@ class SlackCommandRouter:
             proposal_manager: Optional proposal manager for approval workflows.
             workspace_root: Root directory of the workspace. Used to locate
                 conductor/tracks.md, OVERLORD.md, and other governance files.
+            pool: Optional shared LLM pool for the chat fallback, used in
+                the interactive lane.
         """
         self.config = config
         self.workspace_root = workspace_root
@@ -104,6 +115,7 @@ class SlackCommandRouter:
 
         # LLM chat fallback
         self._llm_config = OverlordLLMConfig()
+        self._llm_pool = pool
         self._llm_client: Optional[AsyncOpenAI] = None
         self._chat_history: dict[str, list[dict[str, str]]] = {}
         self._ecosystem_cache: Optional[list] = None
@@ -835,6 +847,8 @@ class SlackCommandRouter:
     @property
     def _client(self) -> AsyncOpenAI:
         """Get or create the AsyncOpenAI client (lazy init)."""
+        if self._llm_pool is not None:
+            return self._llm_pool.client
         if self._llm_client is None:
             self._llm_client = AsyncOpenAI(
                 base_url=self._llm_config.base_url,
@@ -843,6 +857,21 @@ class SlackCommandRouter:
             )
         return self._llm_client
 
+    async def _chat_completion(self, messages: list[dict[str, str]]):
+        """Send a chat fallback request, in the pool's interactive lane if shared."""
+        slot = (
+            self._llm_pool.slot(Priority.INTERACTIVE)
+            if self._llm_pool is not None
+            else contextlib.nullcontext()
+        )
+        async with slot:
+            return await self._client.chat.completions.create(
+                model=self._llm_config.model,
+                messages=messages,
+                max_tokens=512,
+                temperature=0.7,
+            )
+
     async def _get_ecosystem(self) -> list:
         """Return cached ecosystem scan results, refreshing if stale."""
         now = time.monotonic()
@@ -921,7 +950,11 @@ class SlackCommandRouter:
         try:
             # Gather context
             ecosystem = await self._get_ecosystem()
-            memory_results = await asyncio.to_thread(self.memory.search, text, limit=5)
+            # Free-form chat: rank entries sharing any word with the message
+            search_options = {"match_any": True} if SUPPORTS_MATCH_ANY else {}
+            memory_results = await asyncio.to_thread(
+                self.memory.search, text, limit=5, **search_options
+            )
 
             system_prompt = self._build_system_prompt(ecosystem, memory_results)
 
@@ -935,13 +968,7 @@ class SlackCommandRouter:
 
             # Call LLM
             response = await asyncio.wait_for(
-                self._client.chat.completions.create(
-                    model=self._llm_config.model,
-                    messages=messages,
-                    max_tokens=512,
-                    temperature=0.7,
-                ),
-                timeout=15.0,
+                self._chat_completion(messages), timeout=15.0
             )
 
             content = response.choices[0].message.content or ""
@@ -3,14 +3,133 @@
 import os
 import sqlite3
 from contextlib import contextmanager
-from datetime import datetime
-from typing import TYPE_CHECKING, Generator, List, Optional
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional
 
 from nebulus_swarm.models.minion import Minion, MinionStatus
 
 if TYPE_CHECKING:
     from nebulus_swarm.overlord.evaluator import EvaluationResult
 
+# Maximum page size for get_work_history_page
+MAX_HISTORY_PAGE = 500
+
+# Work history indexes, one per filter combination (see _init_db)
+HISTORY_INDEXES = {
+    "idx_history_completed_at": "completed_at",
+    "idx_history_repo_completed": "repo, completed_at",
+    "idx_history_status_completed": "status, completed_at",
+    "idx_history_repo_status_completed": "repo, status, completed_at",
+}
+
+# Error type of a failed run: the text before the first colon
+_ERROR_TYPE_SQL = (
+    "CASE WHEN instr({m}, ':') > 0"
+    " THEN trim(substr({m}, 1, instr({m}, ':') - 1)) ELSE 'unknown' END"
+)
+
+# Daily rollups kept current by triggers on every work_history insert
+_ROLLUP_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS work_history_daily (
+    day TEXT NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    duration_total INTEGER NOT NULL,
+    duration_count INTEGER NOT NULL,
+    duration_min INTEGER,
+    duration_max INTEGER,
+    PRIMARY KEY (day, status)
+);
+CREATE TABLE IF NOT EXISTS work_history_repos (
+    repo TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS work_history_daily_durations (
+    day TEXT NOT NULL,
+    duration_seconds INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (day, duration_seconds)
+);
+CREATE TABLE IF NOT EXISTS work_history_daily_errors (
+    day TEXT NOT NULL,
+    error_type TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    last_message TEXT NOT NULL,
+    last_at TEXT NOT NULL,
+    PRIMARY KEY (day, error_type)
+);
+CREATE TRIGGER IF NOT EXISTS work_history_daily_insert
+AFTER INSERT ON work_history BEGIN
+    INSERT INTO work_history_daily (day, status, count, duration_total,
+        duration_count, duration_min, duration_max)
+    VALUES (substr(new.completed_at, 1, 10), new.status, 1,
+        coalesce(new.duration_seconds, 0), new.duration_seconds IS NOT NULL,
+        new.duration_seconds, new.duration_seconds)
+    ON CONFLICT(day, status) DO UPDATE SET
+        count = count + 1,
+        duration_total = duration_total + excluded.duration_total,
+        duration_count = duration_count + excluded.duration_count,
+        duration_min = min(coalesce(duration_min, excluded.duration_min),
+            coalesce(excluded.duration_min, duration_min)),
+        duration_max = max(coalesce(duration_max, excluded.duration_max),
+            coalesce(excluded.duration_max, duration_max));
+END;
+CREATE TRIGGER IF NOT EXISTS work_history_daily_durations_insert
+AFTER INSERT ON work_history WHEN new.duration_seconds IS NOT NULL
+BEGIN
+    INSERT INTO work_history_daily_durations (day, duration_seconds, count)
+    VALUES (substr(new.completed_at, 1, 10), new.duration_seconds, 1)
+    ON CONFLICT(day, duration_seconds) DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS work_history_repos_insert
+AFTER INSERT ON work_history BEGIN
+    INSERT OR IGNORE INTO work_history_repos (repo) VALUES (new.repo);
+END;
+CREATE TRIGGER IF NOT EXISTS work_history_daily_errors_insert
+AFTER INSERT ON work_history
+WHEN new.status != 'completed' AND coalesce(new.error_message, '') != ''
+BEGIN
+    INSERT INTO work_history_daily_errors (day, error_type, count,
+        last_message, last_at)
+    VALUES (substr(new.completed_at, 1, 10),
+        {_ERROR_TYPE_SQL.format(m="new.error_message")}, 1,
+        new.error_message, new.completed_at)
+    ON CONFLICT(day, error_type) DO UPDATE SET
+        count = count + 1,
+        last_message = CASE WHEN excluded.last_at >= last_at
+            THEN excluded.last_message ELSE last_message END,
+        last_at = max(last_at, excluded.last_at);
+END;
+"""
+
+# Rebuilds the duration histogram; also run alone when upgrading a
+# database whose other rollups predate it
+_DURATIONS_BACKFILL = """
+INSERT OR REPLACE INTO work_history_daily_durations
+SELECT substr(completed_at, 1, 10) AS day, duration_seconds, count(*)
+FROM work_history WHERE duration_seconds IS NOT NULL
+GROUP BY day, duration_seconds
+"""
+
+# Backfills the rollups from existing history, once
+_ROLLUP_BACKFILL = f"""
+INSERT OR IGNORE INTO work_history_repos SELECT DISTINCT repo FROM work_history;
+INSERT INTO work_history_daily
+SELECT substr(completed_at, 1, 10) AS day, status, count(*),
+    coalesce(sum(duration_seconds), 0), count(duration_seconds),
+    min(duration_seconds), max(duration_seconds)
+FROM work_history GROUP BY day, status;
+{_DURATIONS_BACKFILL};
+INSERT INTO work_history_daily_errors
+SELECT day, error_type, count(*), error_message, max(completed_at)
+FROM (
+    SELECT substr(completed_at, 1, 10) AS day, completed_at, error_message,
+        {_ERROR_TYPE_SQL.format(m="error_message")} AS error_type
+    FROM work_history
+    WHERE status != 'completed' AND coalesce(error_message, '') != ''
+)
+GROUP BY day, error_type;
+"""
+
 
 class OverlordState:
     """Manages persistent state for the Overlord."""
@@ -89,12 +208,45 @@ class OverlordState:
                 ON minions(status)
             """
             )
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_history_repo
-                ON work_history(repo)
-            """
-            )
+            # History is paged newest first by (completed_at, id); each
+            # index ends in completed_at, and SQLite appends the rowid (id),
+            # so every filter combination reads its page straight off an
+            # index. These supersede the single-column repo index and the
+            # (completed_at, duration_seconds) index, whose trailing column
+            # would break the (completed_at, id) order; metrics read the
+            # partial first day of a range through idx_history_completed_at
+            # and take the median from the duration rollup instead.
+            cursor.execute("DROP INDEX IF EXISTS idx_history_repo")
+            cursor.execute("DROP INDEX IF EXISTS idx_history_completed")
+            for name, columns in HISTORY_INDEXES.items():
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS {name} ON work_history({columns})"
+                )
+
+            rollups_exist = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table'"
+                " AND name = 'work_history_daily'"
+            ).fetchone()
+            repos_exist = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table'"
+                " AND name = 'work_history_repos'"
+            ).fetchone()
+            durations_exist = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table'"
+                " AND name = 'work_history_daily_durations'"
+            ).fetchone()
+            cursor.executescript(_ROLLUP_SCHEMA)
+            if not rollups_exist:
+                cursor.executescript(_ROLLUP_BACKFILL)
+            else:
+                # Rollups added after the database was created
+                if not repos_exist:
+                    cursor.execute(
+                        "INSERT OR IGNORE INTO work_history_repos"
+                        " SELECT DISTINCT repo FROM work_history"
+                    )
+                if not durations_exist:
+                    cursor.execute(_DURATIONS_BACKFILL)
 
             # Evaluations table - evaluation results for PRs
             cursor.execute(
@@ -279,36 +431,243 @@ class OverlordState:
         Returns:
             List of work history records as dicts.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+        return self.get_work_history_page(repo=repo, status=status, limit=limit)[
+            "items"
+        ]
 
-            query = "SELECT * FROM work_history WHERE 1=1"
-            params: list = []
+    def get_work_history_page(
+        self,
+        repo: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get one page of work history, newest first.
+
+        Pages are keyed on (completed_at, id), so each page is a bounded
+        index range scan however deep into the history it is.
+
+        Args:
+            repo: Filter by repository name.
+            status: Filter by status (e.g., 'completed', 'failed', 'timeout').
+            limit: Page size, capped at MAX_HISTORY_PAGE.
+            cursor: ``next_cursor`` of the previous page; None for the first.
 
-            if repo:
-                query += " AND repo = ?"
-                params.append(repo)
-            if status:
-                query += " AND status = ?"
-                params.append(status)
+        Returns:
+            Dict with ``items`` (records as dicts) and ``next_cursor`` (None
+            on the last page).
 
-            query += " ORDER BY completed_at DESC LIMIT ?"
-            params.append(limit)
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        limit = max(1, min(limit, MAX_HISTORY_PAGE))
+        query = "SELECT * FROM work_history WHERE 1=1"
+        params: list = []
+
+        if repo:
+            query += " AND repo = ?"
+            params.append(repo)
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        if cursor:
+            completed_at, _, last_id = cursor.rpartition("|")
+            if not completed_at or not last_id.isdigit():
+                raise ValueError(f"Invalid history cursor: {cursor!r}")
+            query += " AND (completed_at, id) < (?, ?)"
+            params.extend([completed_at, int(last_id)])
+
+        # One extra row tells whether another page follows
+        query += " ORDER BY completed_at DESC, id DESC LIMIT ?"
+        params.append(limit + 1)
 
-            cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+        with self._get_connection() as conn:
+            rows = [dict(row) for row in conn.execute(query, params).fetchall()]
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = f"{rows[-1]['completed_at']}|{rows[-1]['id']}"
+        return {"items": rows, "next_cursor": next_cursor}
 
     def get_distinct_repos(self) -> List[str]:
         """Get list of distinct repositories from work history.
 
+        Reads the repo list that a trigger maintains on insert, rather than
+        scanning the history.
+
         Returns:
             Sorted list of unique repo names.
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT DISTINCT repo FROM work_history ORDER BY repo")
+            cursor.execute("SELECT repo FROM work_history_repos ORDER BY repo")
             return [row["repo"] for row in cursor.fetchall()]
 
+    def get_metrics(self, days: Optional[int] = None) -> Dict[str, Any]:
+        """Aggregate work history metrics.
+
+        Whole days come from the daily rollup tables; only the partial
+        first day of a time range is aggregated from work_history, over the
+        completed_at index. The median is found by walking the per-day
+        duration histogram, so its cost grows with the number of distinct
+        (day, duration) pairs in range rather than with the number of runs;
+        it is not constant time.
+
+        Args:
+            days: Number of days to look back. None for all time.
+
+        Returns:
+            Dict with total, completed, failed, timeout counts,
+            completion_rate, avg/median/min/max duration, daily_stats and
+            error_types.
+        """
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat() if days else None
+        first_day = cutoff[:10] if cutoff else ""
+        next_day = (
+            (datetime.fromisoformat(first_day) + timedelta(days=1)).date().isoformat()
+            if cutoff
+            else ""
+        )
+
+        with self._get_connection() as conn:
+            status_rows = conn.execute(
+                """
+                SELECT day, status, count, duration_total, duration_count,
+                    duration_min, duration_max
+                FROM work_history_daily WHERE day > ?
+            """,
+                (first_day,),
+            ).fetchall()
+            error_rows = conn.execute(
+                """
+                SELECT error_type, count, last_message, last_at
+                FROM work_history_daily_errors WHERE day > ?
+            """,
+                (first_day,),
+            ).fetchall()
+            if cutoff:
+                status_rows += conn.execute(
+                    """
+                    SELECT substr(completed_at, 1, 10) AS day, status,
+                        count(*) AS count,
+                        coalesce(sum(duration_seconds), 0) AS duration_total,
+                        count(duration_seconds) AS duration_count,
+                        min(duration_seconds) AS duration_min,
+                        max(duration_seconds) AS duration_max
+                    FROM work_history
+                    WHERE completed_at >= ? AND completed_at < ?
+                    GROUP BY status
+                """,
+                    (cutoff, next_day),
+                ).fetchall()
+                error_rows += conn.execute(
+                    f"""
+                    SELECT error_type, count(*) AS count,
+                        error_message AS last_message, max(completed_at) AS last_at
+                    FROM (
+                        SELECT completed_at, error_message,
+                            {_ERROR_TYPE_SQL.format(m="error_message")} AS error_type
+                        FROM work_history
+                        WHERE completed_at >= ? AND completed_at < ?
+                            AND status != 'completed'
+                            AND coalesce(error_message, '') != ''
+                    )
+                    GROUP BY error_type
+                """,
+                    (cutoff, next_day),
+                ).fetchall()
+
+            totals: Dict[str, int] = {}
+            daily: Dict[str, Dict[str, Any]] = {}
+            duration_total = duration_count = 0
+            # Per-group extremes; the overall ones are their min/max
+            minimums: List[int] = []
+            maximums: List[int] = []
+            for row in status_rows:
+                totals[row["status"]] = totals.get(row["status"], 0) + row["count"]
+                day = daily.setdefault(
+                    row["day"],
+                    {"completed": 0, "failed": 0, "timeout": 0, "total": 0, "n": 0},
+                )
+                day[row["status"]] = day.get(row["status"], 0) + row["count"]
+                day["total"] += row["duration_total"]
+                day["n"] += row["duration_count"]
+                duration_total += row["duration_total"]
+                duration_count += row["duration_count"]
+                if row["duration_min"] is not None:
+                    minimums.append(row["duration_min"])
+                    maximums.append(row["duration_max"])
+
+            median = 0
+            if duration_count:
+                histogram: Dict[int, int] = {}
+                bins = conn.execute(
+                    """
+                    SELECT duration_seconds, sum(count) AS count
+                    FROM work_history_daily_durations WHERE day > ?
+                    GROUP BY duration_seconds
+                """,
+                    (first_day,),
+                ).fetchall()
+                if cutoff:
+                    bins += conn.execute(
+                        """
+                        SELECT duration_seconds, count(*) AS count
+                        FROM work_history
+                        WHERE completed_at >= ? AND completed_at < ?
+                            AND duration_seconds IS NOT NULL
+                        GROUP BY duration_seconds
+                    """,
+                        (cutoff, next_day),
+                    ).fetchall()
+                for row in bins:
+                    duration = row["duration_seconds"]
+                    histogram[duration] = histogram.get(duration, 0) + row["count"]
+                # Same element as sorting every duration and taking [n // 2]
+                remaining = duration_count // 2
+                for duration in sorted(histogram):
+                    remaining -= histogram[duration]
+                    if remaining < 0:
+                        median = duration
+                        break
+
+        error_types: Dict[str, Dict[str, Any]] = {}
+        latest: Dict[str, str] = {}
+        for row in error_rows:
+            info = error_types.setdefault(
+                row["error_type"], {"count": 0, "last_message": ""}
+            )
+            info["count"] += row["count"]
+            if row["last_at"] >= latest.get(row["error_type"], ""):
+                latest[row["error_type"]] = row["last_at"]
+                info["last_message"] = row["last_message"]
+
+        total = sum(totals.values())
+        completed = totals.get("completed", 0)
+        return {
+            "total": total,
+            "completed": completed,
+            "failed": totals.get("failed", 0),
+            "timeout": totals.get("timeout", 0),
+            "completion_rate": completed / total if total > 0 else 0,
+            "avg_duration": duration_total / duration_count if duration_count else 0,
+            "median_duration": median,
+            "min_duration": min(minimums, default=0),
+            "max_duration": max(maximums, default=0),
+            "daily_stats": [
+                {
+                    "date": day,
+                    "completed": stats["completed"],
+                    "failed": stats["failed"],
+                    "timeout": stats["timeout"],
+                    "avg_duration": stats["total"] / stats["n"] if stats["n"] else 0,
+                }
+                for day, stats in sorted(daily.items())
+            ],
+            "error_types": error_types,
+        }
+
     def save_evaluation(self, result: "EvaluationResult") -> None:
         """Save an evaluation result to the database.
 
@@ -0,0 +1,201 @@
+"""GitHub webhook verification, parsing and local replay.
+
+The Overlord's health server exposes ``POST /github/webhook``. Deliveries
+are HMAC-verified against ``GITHUB_WEBHOOK_SECRET`` and turned into
+WebhookEvent objects; ``issues`` events update the GitHubQueue cache and
+trigger dispatch immediately, leaving the cron sweep as a backstop.
+
+Recorded payloads can be replayed against a running Overlord::
+
+    python -m nebulus_swarm.overlord.webhooks http://localhost:8080 \\
+        --secret "$GITHUB_WEBHOOK_SECRET" payloads/*.json
+
+Each file holds ``{"event": "issues", "payload": {...}}``.
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import logging
+import sys
+import urllib.error
+import urllib.request
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_PATH = "/github/webhook"
+SIGNATURE_HEADER = "X-Hub-Signature-256"
+EVENT_HEADER = "X-GitHub-Event"
+DELIVERY_HEADER = "X-GitHub-Delivery"
+SUPPORTED_EVENTS = frozenset({"issues", "pull_request", "ping"})
+# Delivery IDs remembered to drop GitHub's redeliveries
+DELIVERY_HISTORY = 500
+
+
+def sign_payload(secret: str, body: bytes) -> str:
+    """Compute the X-Hub-Signature-256 header value for a body.
+
+    Args:
+        secret: Webhook secret.
+        body: Raw request body.
+
+    Returns:
+        Signature in ``sha256=<hex>`` form.
+    """
+    digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check a delivery's HMAC signature in constant time.
+
+    Args:
+        secret: Webhook secret.
+        body: Raw request body.
+        signature: Value of the X-Hub-Signature-256 header.
+
+    Returns:
+        True if the signature matches.
+    """
+    if not secret or not signature:
+        return False
+    return hmac.compare_digest(sign_payload(secret, body), signature)
+
+
+@dataclass
+class WebhookEvent:
+    """A parsed GitHub webhook delivery."""
+
+    event: str
+    action: str
+    repo: str
+    number: int = 0
+    delivery_id: str = ""
+    head_ref: str = ""
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def item(self) -> Dict[str, Any]:
+        """The issue or pull request object from the payload."""
+        key = "pull_request" if self.event == "pull_request" else "issue"
+        return self.payload.get(key) or {}
+
+
+def parse_event(
+    event: str, payload: Dict[str, Any], delivery_id: str = ""
+) -> Optional[WebhookEvent]:
+    """Build a WebhookEvent from a delivery.
+
+    Args:
+        event: Value of the X-GitHub-Event header.
+        payload: Decoded JSON body.
+        delivery_id: Value of the X-GitHub-Delivery header.
+
+    Returns:
+        WebhookEvent, or None for unsupported events.
+    """
+    if event not in SUPPORTED_EVENTS:
+        return None
+
+    parsed = WebhookEvent(
+        event=event,
+        action=payload.get("action", ""),
+        repo=(payload.get("repository") or {}).get("full_name", ""),
+        delivery_id=delivery_id,
+        payload=payload,
+    )
+    item = parsed.item
+    parsed.number = int(item.get("number") or 0)
+    if event == "pull_request":
+        parsed.head_ref = (item.get("head") or {}).get("ref", "")
+    return parsed
+
+
+class DeliveryLog:
+    """Bounded memory of recent delivery IDs."""
+
+    def __init__(self, size: int = DELIVERY_HISTORY):
+        """Initialize the log.
+
+        Args:
+            size: Number of delivery IDs remembered.
+        """
+        self._size = size
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+
+    def seen(self, delivery_id: str) -> bool:
+        """Record a delivery ID and report whether it was already seen."""
+        if not delivery_id:
+            return False
+        if delivery_id in self._seen:
+            return True
+        self._seen[delivery_id] = None
+        while len(self._seen) > self._size:
+            self._seen.popitem(last=False)
+        return False
+
+
+def replay_payload(
+    url: str, secret: str, event: str, payload: Dict[str, Any], timeout: float = 10
+) -> int:
+    """POST a recorded payload to a webhook receiver, signed like GitHub.
+
+    Args:
+        url: Overlord base URL or full webhook URL.
+        secret: Webhook secret.
+        event: GitHub event name.
+        payload: Payload to send.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        HTTP status code of the response.
+    """
+    if not url.rstrip("/").endswith(WEBHOOK_PATH):
+        url = url.rstrip("/") + WEBHOOK_PATH
+    body = json.dumps(payload).encode()
+    request = urllib.request.Request(
+        url,
+        data=body,
+        method="POST",
+        headers={
+            "Content-Type": "application/json",
+            EVENT_HEADER: event,
+            DELIVERY_HEADER: str(uuid.uuid4()),
+            SIGNATURE_HEADER: sign_payload(secret, body),
+        },
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Replay recorded webhook payloads against a running Overlord."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("url", help="Overlord base URL, e.g. http://localhost:8080")
+    parser.add_argument("files", nargs="+", type=Path, help="Recorded payload files")
+    parser.add_argument("--secret", required=True, help="Webhook secret")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for path in args.files:
+        record = json.loads(path.read_text())
+        status = replay_payload(
+            args.url, args.secret, record["event"], record["payload"]
+        )
+        print(f"{path}: {record['event']} -> {status}")
+        if status >= 300:
+            failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
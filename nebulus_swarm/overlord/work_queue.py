@@ -29,6 +29,10 @@ VALID_STATUSES = frozenset(
 # Valid task priorities
 VALID_PRIORITIES = frozenset({"low", "medium", "high", "critical"})
 
+# task_log reasons written by GitHub reconciliation
+RECONCILE_CLOSED_REASON = "Issue closed or unlabeled"
+RECONCILE_REOPENED_REASON = "Issue reopened or relabeled"
+
 # State machine: source -> set of valid targets
 TRANSITIONS: dict[str, set[str]] = {
     "backlog": {"active", "failed"},
@@ -75,6 +79,28 @@ class TaskLogEntry:
     reason: Optional[str] = None
 
 
+@dataclass
+class GitHubIssueRecord:
+    """A GitHub issue to be upserted into the queue."""
+
+    external_id: str
+    external_source: str
+    title: str
+    project: str
+    description: Optional[str] = None
+    priority: str = "medium"
+
+
+@dataclass
+class BulkUpsertResult:
+    """Outcome of a bulk GitHub upsert."""
+
+    new_ids: list[str] = field(default_factory=list)
+    updated_ids: list[str] = field(default_factory=list)
+    closed_ids: list[str] = field(default_factory=list)
+    reopened_ids: list[str] = field(default_factory=list)
+
+
 @dataclass
 class DispatchResultRecord:
     """A record of a dispatch execution against a task."""
@@ -908,10 +934,206 @@ class WorkQueue:
                 )
                 return task_id, True
 
+    def bulk_upsert_from_github(
+        self,
+        issues: list[GitHubIssueRecord],
+        *,
+        reconcile_sources: Optional[list[str]] = None,
+        token_budget: Optional[int] = None,
+        changed_by: str = "github-sync",
+    ) -> BulkUpsertResult:
+        """Upsert many GitHub issues in a single transaction.
+
+        Same update semantics as ``upsert_from_github`` (status is never
+        overwritten). Backlog tasks from any of ``reconcile_sources`` whose
+        issue is absent from ``issues`` (closed or unlabeled upstream) are
+        moved to failed in the same transaction. Conversely, a task that
+        reconciliation failed is moved back to backlog once its issue is
+        listed again; tasks that failed for any other reason keep their
+        status.
+
+        Args:
+            issues: Issues to insert or update.
+            reconcile_sources: External sources that were fully fetched and
+                may be reconciled.
+            token_budget: Token budget for newly created tasks.
+            changed_by: Actor recorded in the audit log for reconciliation.
+
+        Returns:
+            BulkUpsertResult with new, updated, closed and reopened task IDs.
+        """
+        result = BulkUpsertResult()
+        sources = sorted(
+            {issue.external_source for issue in issues} | set(reconcile_sources or [])
+        )
+        if not sources:
+            return result
+
+        now = datetime.now(timezone.utc).isoformat()
+        placeholders = ", ".join("?" for _ in sources)
+
+        with self._get_connection() as conn:
+            existing = {
+                (row["external_source"], row["external_id"]): (
+                    row["id"],
+                    row["status"],
+                )
+                for row in conn.execute(
+                    f"""
+                    SELECT id, external_id, external_source, status FROM tasks
+                    WHERE external_source IN ({placeholders})
+                    """,
+                    sources,
+                )
+            }
+
+            rows = []
+            seen = set()
+            for issue in issues:
+                key = (issue.external_source, issue.external_id)
+                if key in seen:
+                    continue
+                seen.add(key)
+                if key in existing:
+                    task_id = existing[key][0]
+                    result.updated_ids.append(task_id)
+                else:
+                    task_id = str(uuid.uuid4())
+                    result.new_ids.append(task_id)
+                rows.append(
+                    (
+                        task_id,
+                        issue.external_id,
+                        issue.external_source,
+                        issue.project,
+                        issue.title,
+                        issue.description,
+                        issue.priority,
+                        token_budget,
+                        now,
+                        now,
+                    )
+                )
+
+            conn.executemany(
+                """
+                INSERT INTO tasks (
+                    id, external_id, external_source, project, title,
+                    description, status, priority, complexity,
+                    retry_count, token_budget, created_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, 'backlog', ?, 'medium', 0, ?, ?, ?)
+                ON CONFLICT(external_id, external_source) DO UPDATE SET
+                    title = excluded.title,
+                    description = excluded.description,
+                    priority = excluded.priority,
+                    updated_at = excluded.updated_at
+                """,
+                rows,
+            )
+
+            self._reopen_reconciled(conn, existing, seen, now, changed_by, result)
+
+            reconcile = set(reconcile_sources or [])
+            result.closed_ids = [
+                task_id
+                for key, (task_id, status) in existing.items()
+                if key[0] in reconcile and key not in seen and status == "backlog"
+            ]
+            if result.closed_ids:
+                conn.executemany(
+                    "UPDATE tasks SET status = 'failed', updated_at = ? WHERE id = ?",
+                    [(now, task_id) for task_id in result.closed_ids],
+                )
+                conn.executemany(
+                    """
+                    INSERT INTO task_log
+                        (task_id, old_status, new_status, changed_by, timestamp, reason)
+                    VALUES (?, 'backlog', 'failed', ?, ?, ?)
+                    """,
+                    [
+                        (task_id, changed_by, now, RECONCILE_CLOSED_REASON)
+                        for task_id in result.closed_ids
+                    ],
+                )
+
+        logger.info(
+            "Bulk GitHub upsert: %d new, %d updated, %d closed, %d reopened",
+            len(result.new_ids),
+            len(result.updated_ids),
+            len(result.closed_ids),
+            len(result.reopened_ids),
+        )
+        return result
+
+    @staticmethod
+    def _reopen_reconciled(
+        conn: sqlite3.Connection,
+        existing: dict[tuple[str, str], tuple[str, str]],
+        seen: set[tuple[str, str]],
+        now: str,
+        changed_by: str,
+        result: BulkUpsertResult,
+    ) -> None:
+        """Move tasks failed by reconciliation back to backlog.
+
+        Only tasks whose latest log entry is the reconciliation failure are
+        restored, so genuine failures are not retried behind the user's
+        back. The retry count is left untouched.
+
+        Args:
+            conn: Open connection; the caller owns the transaction.
+            existing: (source, external_id) -> (task_id, status) before upsert.
+            seen: Keys of the issues listed in this sync.
+            now: Timestamp for the update.
+            changed_by: Actor recorded in the audit log.
+            result: Receives the reopened task IDs.
+        """
+        failed = [
+            task_id
+            for key, (task_id, status) in existing.items()
+            if key in seen and status == "failed"
+        ]
+        if not failed:
+            return
+
+        placeholders = ", ".join("?" for _ in failed)
+        result.reopened_ids = [
+            row["task_id"]
+            for row in conn.execute(
+                f"""
+                SELECT l.task_id FROM task_log l
+                WHERE l.task_id IN ({placeholders})
+                  AND l.id = (SELECT MAX(id) FROM task_log WHERE task_id = l.task_id)
+                  AND l.new_status = 'failed' AND l.reason = ?
+                """,
+                [*failed, RECONCILE_CLOSED_REASON],
+            )
+        ]
+        if not result.reopened_ids:
+            return
+
+        conn.executemany(
+            "UPDATE tasks SET status = 'backlog', updated_at = ? WHERE id = ?",
+            [(now, task_id) for task_id in result.reopened_ids],
+        )
+        conn.executemany(
+            """
+            INSERT INTO task_log
+                (task_id, old_status, new_status, changed_by, timestamp, reason)
+            VALUES (?, 'failed', 'backlog', ?, ?, ?)
+            """,
+            [
+                (task_id, changed_by, now, RECONCILE_REOPENED_REASON)
+                for task_id in result.reopened_ids
+            ],
+        )
+
 
 __all__ = [
+    "BulkUpsertResult",
     "DEFAULT_DB_PATH",
     "DispatchResultRecord",
+    "GitHubIssueRecord",
     "Task",
     "TaskLogEntry",
     "TRANSITIONS",
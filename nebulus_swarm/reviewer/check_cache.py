@@ -0,0 +1,219 @@
+"""On-disk cache of automated check results.
+
+Each CheckResult is stored under a key derived from the check name, the
+version of the tool that produced it and the git blob hashes of the files
+the check reads. Re-reviewing an unchanged commit, or a revision that only
+touched files a check does not read, returns the stored result instead of
+running the tool again.
+"""
+
+import hashlib
+import json
+import logging
+import subprocess
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from nebulus_swarm.reviewer.checks import CheckResult, CheckStatus
+
+logger = logging.getLogger(__name__)
+
+# Lives beside ~/.nebulus/mirrors so review caches share the mirrors' disk
+DEFAULT_CACHE_DIR = Path.home() / ".nebulus" / "check-cache"
+# Entries kept per check before the oldest are pruned
+MAX_ENTRIES_PER_CHECK = 500
+# Bump when a check's logic changes in a way that invalidates stored results
+CHECKS_VERSION = "1"
+
+# Commands reporting the version of each external tool
+TOOL_VERSION_COMMANDS: Dict[str, List[str]] = {
+    "pytest": ["python3", "-m", "pytest", "--version"],
+    "ruff": ["ruff", "--version"],
+    "complexity": ["radon", "--version"],
+}
+
+# Results that depend on the environment rather than the inputs
+_UNCACHEABLE_PREFIXES = ("Timed out", "Error", "Tests timed out")
+# Checks whose failures are always rerun: a failing test may be flaky
+_RERUN_FAILURES = frozenset({"pytest"})
+
+
+def _is_cacheable(check: str, result: CheckResult) -> bool:
+    if result.message.startswith(_UNCACHEABLE_PREFIXES):
+        return False
+    if check in _RERUN_FAILURES and result.status == CheckStatus.FAILED:
+        return False
+    # "tool not available" skips would mask a later install
+    return not (
+        result.status == CheckStatus.SKIPPED and "not available" in result.message
+    )
+
+
+class CheckCache:
+    """Stores CheckResults keyed by (check, tool version, input blob hashes)."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Storage directory; defaults to DEFAULT_CACHE_DIR.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self._versions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def tool_version(self, check: str) -> str:
+        """Version string of the tool behind a check, looked up once.
+
+        Args:
+            check: Check id as used in DEFAULT_CHECK_TIMEOUTS.
+
+        Returns:
+            Tool version output, or CHECKS_VERSION for in-process checks.
+        """
+        with self._lock:
+            if check in self._versions:
+                return self._versions[check]
+
+        version = f"checks-{CHECKS_VERSION}"
+        cmd = TOOL_VERSION_COMMANDS.get(check)
+        if cmd:
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                version = (result.stdout or result.stderr).strip() or "unknown"
+            except (OSError, subprocess.TimeoutExpired):
+                version = "missing"
+
+        with self._lock:
+            self._versions[check] = version
+        return version
+
+    @staticmethod
+    def hash_files(repo_path: Path, paths: Iterable[str]) -> Dict[str, str]:
+        """Git blob hashes for files in a working tree.
+
+        Uses one ``git hash-object`` call; falls back to hashing in-process
+        outside a git checkout. Missing files hash to ``"-"``.
+
+        Args:
+            repo_path: Repository root.
+            paths: Repo-relative paths.
+
+        Returns:
+            Dict mapping each path to its blob hash.
+        """
+        paths = sorted(set(paths))
+        hashes = {path: "-" for path in paths}
+        existing = [path for path in paths if (repo_path / path).is_file()]
+        if not existing:
+            return hashes
+
+        try:
+            result = subprocess.run(
+                ["git", "hash-object", "--stdin-paths"],
+                cwd=repo_path,
+                input="\n".join(existing),
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            blobs = result.stdout.split()
+            if result.returncode == 0 and len(blobs) == len(existing):
+                hashes.update(zip(existing, blobs))
+                return hashes
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+        for path in existing:
+            data = (repo_path / path).read_bytes()
+            header = f"blob {len(data)}\0".encode()
+            hashes[path] = hashlib.sha1(header + data).hexdigest()
+        return hashes
+
+    def key(self, check: str, repo_path: Path, inputs: Iterable[str]) -> str:
+        """Cache key for a check over a set of input files.
+
+        Args:
+            check: Check id.
+            repo_path: Repository root.
+            inputs: Repo-relative files the check reads.
+
+        Returns:
+            Hex digest identifying the check's inputs.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{check}\0{self.tool_version(check)}\0".encode())
+        for path, blob in self.hash_files(repo_path, inputs).items():
+            digest.update(f"{path}\0{blob}\n".encode())
+        return digest.hexdigest()
+
+    def _path(self, check: str, key: str) -> Path:
+        return self.cache_dir / check / f"{key}.json"
+
+    def get(self, check: str, key: str) -> Optional[CheckResult]:
+        """Look up a stored result.
+
+        Args:
+            check: Check id.
+            key: Key from ``key()``.
+
+        Returns:
+            The stored CheckResult marked as cached, or None.
+        """
+        path = self._path(check, key)
+        try:
+            data = json.loads(path.read_text())
+            result = CheckResult(**{**data, "status": CheckStatus(data["status"])})
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Ignoring corrupt check cache entry {path}: {e}")
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        result.cached = True
+        return result
+
+    def put(self, check: str, key: str, result: CheckResult) -> None:
+        """Store a result unless it reflects the environment (timeouts etc.)
+        or is a test failure that may be flaky.
+
+        Args:
+            check: Check id.
+            key: Key from ``key()``.
+            result: Result to store.
+        """
+        if not _is_cacheable(check, result):
+            return
+        path = self._path(check, key)
+        data = asdict(result)
+        data["status"] = result.status.value
+        data["cached"] = False
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{time.monotonic_ns()}.tmp")
+            tmp.write_text(json.dumps(data))
+            tmp.replace(path)
+            self._prune(path.parent)
+        except OSError as e:
+            logger.warning(f"Could not write check cache entry: {e}")
+
+    @staticmethod
+    def _prune(directory: Path) -> None:
+        """Drop the oldest entries beyond MAX_ENTRIES_PER_CHECK."""
+        entries = list(directory.glob("*.json"))
+        if len(entries) <= MAX_ENTRIES_PER_CHECK:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for stale in entries[: len(entries) - MAX_ENTRIES_PER_CHECK]:
+            stale.unlink(missing_ok=True)
@@ -1,15 +1,64 @@
 """Automated checks runner for PR review."""
 
+import bisect
 import logging
+import multiprocessing
+import os
 import re
+import signal
 import subprocess
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Pattern, Set, Tuple
+
+from nebulus_swarm.reviewer.impact import (
+    ImpactAnalyzer,
+    ImpactSelection,
+    suite_inputs,
+    xdist_available,
+)
+
+if TYPE_CHECKING:
+    from nebulus_swarm.reviewer.check_cache import CheckCache
 
 logger = logging.getLogger(__name__)
 
+# Per-check timeouts in seconds, keyed by check id
+DEFAULT_CHECK_TIMEOUTS: Dict[str, float] = {
+    "pytest": 300.0,
+    "ruff": 60.0,
+    "security": 60.0,
+    "complexity": 60.0,
+    "file_sizes": 30.0,
+    "skills": 60.0,
+}
+# Display names used when a check has to be reported without its own result
+CHECK_NAMES: Dict[str, str] = {
+    "pytest": "Tests (pytest)",
+    "ruff": "Linting (ruff)",
+    "security": "Security Patterns",
+    "complexity": "Complexity",
+    "file_sizes": "File Sizes",
+    "skills": "Skill Changes",
+}
+# Extra wait so a subprocess's own timeout is reported before ours
+TIMEOUT_GRACE = 2.0
+# Linter configuration read by ruff besides the files it checks
+RUFF_CONFIG_FILES = ("pyproject.toml", "ruff.toml", ".ruff.toml")
+# Below this many files the security scan runs in-thread; a process pool
+# costs more to start than the scan itself
+PROCESS_POOL_MIN_FILES = 50
+# The pool is created from a worker thread while other checks run; forking
+# a multi-threaded process can deadlock the child, so never use "fork"
+POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
 
 class CheckStatus(Enum):
     """Status of an automated check."""
@@ -29,6 +78,8 @@ class CheckResult:
     message: str
     details: Optional[str] = None
     file_issues: List[str] = field(default_factory=list)
+    duration: float = 0.0  # wall time in seconds
+    cached: bool = False  # served from CheckCache
 
 
 @dataclass
@@ -36,6 +87,7 @@ class ChecksReport:
     """Complete report of all automated checks."""
 
     results: List[CheckResult] = field(default_factory=list)
+    wall_time: float = 0.0  # seconds for the whole run
 
     @property
     def all_passed(self) -> bool:
@@ -75,7 +127,11 @@ class ChecksReport:
 
         for result in self.results:
             emoji = status_emoji.get(result.status, "❓")
-            lines.append(f"- {emoji} **{result.name}**: {result.message}")
+            if result.cached:
+                timing = " (cached)"
+            else:
+                timing = f" ({result.duration:.1f}s)" if result.duration else ""
+            lines.append(f"- {emoji} **{result.name}**: {result.message}{timing}")
 
             if result.file_issues:
                 for issue in result.file_issues[:5]:  # Limit to 5 issues
@@ -88,10 +144,51 @@ class ChecksReport:
             f"**Summary:** {self.passed_count} passed, "
             f"{self.failed_count} failed, {self.warning_count} warnings"
         )
+        if self.wall_time:
+            lines[-1] += f" in {self.wall_time:.1f}s"
 
         return "\n".join(lines)
 
 
+def _kill_tree(proc: subprocess.Popen) -> None:
+    """Kill a process started with ``start_new_session`` and its children."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        # No process groups on this platform, or the group already exited
+        proc.kill()
+
+
+def _scan_file(
+    full_path: str, display_path: str, patterns: List[Tuple[Pattern[str], str]]
+) -> List[str]:
+    """Scan one file for security patterns.
+
+    Module-level so it can run in a process pool.
+
+    Args:
+        full_path: Path to read.
+        display_path: Path used in reported issues.
+        patterns: Compiled patterns with their descriptions.
+
+    Returns:
+        Issues as ``path:line: description`` strings.
+    """
+    try:
+        content = Path(full_path).read_text()
+    except Exception as e:
+        logger.warning(f"Error checking {display_path}: {e}")
+        return []
+
+    line_starts = [0] + [m.end() for m in re.finditer("\n", content)]
+    issues = []
+    for pattern, description in patterns:
+        for match in pattern.finditer(content):
+            line_num = bisect.bisect_right(line_starts, match.start())
+            issues.append(f"{display_path}:{line_num}: {description}")
+    return issues
+
+
 class CheckRunner:
     """Runs automated checks on a repository."""
 
@@ -109,49 +206,267 @@ class CheckRunner:
         (r"BEGIN\s+(RSA|DSA|EC)\s+PRIVATE\s+KEY", "Private key in code"),
     ]
 
-    def __init__(self, repo_path: str):
+    def __init__(
+        self,
+        repo_path: str,
+        timeouts: Optional[Dict[str, float]] = None,
+        test_impact: bool = True,
+        shard_tests: bool = False,
+        cache: Optional["CheckCache"] = None,
+    ):
         """Initialize check runner.
 
         Args:
             repo_path: Path to the repository root.
+            timeouts: Per-check timeout overrides, keyed like
+                DEFAULT_CHECK_TIMEOUTS.
+            test_impact: Run only tests affected by the changed files
+                (see ``nebulus_swarm.reviewer.impact``).
+            shard_tests: Shard the pytest run across cores when
+                pytest-xdist is installed.
+            cache: Optional result cache; a check whose inputs are
+                unchanged returns its stored result.
         """
         self.repo_path = Path(repo_path)
-
-    def run_all_checks(self, changed_files: List[str]) -> ChecksReport:
-        """Run all automated checks.
+        self.timeouts = {**DEFAULT_CHECK_TIMEOUTS, **(timeouts or {})}
+        self.test_impact = test_impact
+        self.shard_tests = shard_tests
+        self.cache = cache
+        self._selections: Dict[Tuple[str, ...], ImpactSelection] = {}
+        self._procs: Dict[str, Set[subprocess.Popen]] = {}
+        self._procs_lock = threading.Lock()
+        # Checks abandoned at their deadline; their results are never cached
+        self._abandoned: Set[str] = set()
+
+    def run_all_checks(
+        self, changed_files: List[str], renamed_from: Optional[List[str]] = None
+    ) -> ChecksReport:
+        """Run all automated checks concurrently.
+
+        Every check starts at once on its own thread; subprocess-based
+        checks release the GIL while they wait. Each check is bounded by its
+        own timeout. A check that has not returned by then is reported as
+        failed and its subprocess tree is killed, so nothing keeps running
+        in the worktree after the report is returned. Results keep the
+        fixed check order.
 
         Args:
             changed_files: List of changed file paths.
+            renamed_from: Old paths of renamed files. Only test selection
+                sees them, so a rename runs the tests of the old path.
 
         Returns:
             ChecksReport with all results.
         """
-        report = ChecksReport()
-
+        test_changes = changed_files + list(renamed_from or [])
         # Filter to Python files
         python_files = [f for f in changed_files if f.endswith(".py")]
 
-        # Run checks
-        report.results.append(self.check_pytest())
-        report.results.append(self.check_ruff(python_files))
-        report.results.append(self.check_security_patterns(python_files))
-        report.results.append(self.check_complexity(python_files))
-        report.results.append(self.check_file_sizes(changed_files))
-        report.results.append(self.check_skill_changes(changed_files))
+        ruff_inputs = python_files + [
+            name for name in RUFF_CONFIG_FILES if (self.repo_path / name).is_file()
+        ]
+        checks: List[Tuple[str, Callable[[], List[str]], Callable[[], CheckResult]]] = [
+            (
+                "pytest",
+                lambda: self._pytest_inputs(test_changes),
+                lambda: self.check_pytest(test_changes),
+            ),
+            ("ruff", lambda: ruff_inputs, lambda: self.check_ruff(python_files)),
+            (
+                "security",
+                lambda: python_files,
+                lambda: self.check_security_patterns(python_files),
+            ),
+            (
+                "complexity",
+                lambda: python_files,
+                lambda: self.check_complexity(python_files),
+            ),
+            (
+                "file_sizes",
+                lambda: changed_files,
+                lambda: self.check_file_sizes(changed_files),
+            ),
+            (
+                "skills",
+                lambda: changed_files,
+                lambda: self.check_skill_changes(changed_files),
+            ),
+        ]
+
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(
+            max_workers=len(checks), thread_name_prefix="check"
+        )
+        futures = [
+            (key, executor.submit(self._timed, self._cached, key, inputs, fn))
+            for key, inputs, fn in checks
+        ]
+
+        report = ChecksReport()
+        for key, future in futures:
+            timeout = self.timeouts[key]
+            remaining = started + timeout + TIMEOUT_GRACE - time.monotonic()
+            try:
+                result = future.result(timeout=max(remaining, 0))
+            except FutureTimeoutError:
+                future.cancel()
+                logger.warning(f"Check '{key}' exceeded {timeout:.0f}s, abandoning")
+                with self._procs_lock:
+                    self._abandoned.add(key)
+                self._kill(key)
+                result = CheckResult(
+                    name=CHECK_NAMES[key],
+                    status=CheckStatus.FAILED,
+                    message=f"Timed out after {timeout:.0f}s",
+                    duration=time.monotonic() - started,
+                )
+            except Exception as e:
+                result = CheckResult(
+                    name=CHECK_NAMES[key],
+                    status=CheckStatus.FAILED,
+                    message=f"Error running check: {e}",
+                    duration=time.monotonic() - started,
+                )
+            report.results.append(result)
 
+        # Killed checks return shortly; don't hold the report for them
+        executor.shutdown(wait=False, cancel_futures=True)
+        report.wall_time = time.monotonic() - started
         return report
 
-    def check_pytest(self) -> CheckResult:
-        """Run pytest and check for failures."""
+    def _run(
+        self, key: str, cmd: List[str], timeout: float
+    ) -> subprocess.CompletedProcess:
+        """Run a check's command in its own process group.
+
+        Like ``subprocess.run(capture_output=True, text=True)``, but the
+        process is registered under the check id so ``_kill`` can stop its
+        whole tree when ``run_all_checks`` abandons the check.
+
+        Args:
+            key: Check id.
+            cmd: Command and arguments.
+            timeout: Seconds before the process tree is killed.
+
+        Returns:
+            CompletedProcess with captured output.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command exceeds ``timeout``.
+            FileNotFoundError: If the executable does not exist.
+        """
+        proc = subprocess.Popen(
+            cmd,
+            cwd=self.repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            start_new_session=True,
+        )
+        with self._procs_lock:
+            self._procs.setdefault(key, set()).add(proc)
         try:
-            # Use subprocess.run with list args (no shell injection)
-            result = subprocess.run(
-                ["python3", "-m", "pytest", "--tb=no", "-q"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=300,
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill_tree(proc)
+            proc.communicate()
+            raise
+        finally:
+            with self._procs_lock:
+                self._procs[key].discard(proc)
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+    def _kill(self, key: str) -> None:
+        """Kill the process trees of an abandoned check."""
+        with self._procs_lock:
+            procs = list(self._procs.get(key, ()))
+        for proc in procs:
+            _kill_tree(proc)
+
+    @staticmethod
+    def _timed(check: Callable[..., CheckResult], *args) -> CheckResult:
+        """Run a check and record its wall time on the result."""
+        started = time.monotonic()
+        result = check(*args)
+        result.duration = time.monotonic() - started
+        return result
+
+    def _cached(
+        self,
+        key: str,
+        inputs: Callable[[], List[str]],
+        check: Callable[[], CheckResult],
+    ) -> CheckResult:
+        """Run a check through the result cache, if one is configured.
+
+        Args:
+            key: Check id.
+            inputs: Returns the repo-relative files the check reads.
+            check: Runs the check.
+
+        Returns:
+            Stored result when the inputs are unchanged, else a fresh one.
+        """
+        if self.cache is None:
+            return check()
+        cache_key = self.cache.key(key, self.repo_path, inputs())
+        hit = self.cache.get(key, cache_key)
+        if hit is not None:
+            logger.info(f"Check '{key}' unchanged, reusing cached result")
+            return hit
+        result = check()
+        with self._procs_lock:
+            abandoned = key in self._abandoned
+        # A killed check returns whatever its dead subprocess left behind
+        if not abandoned:
+            self.cache.put(key, cache_key, result)
+        return result
+
+    def _select_tests(self, changed_files: List[str]) -> ImpactSelection:
+        """Impact selection for a change set, computed once per runner."""
+        signature = tuple(sorted(changed_files))
+        if signature not in self._selections:
+            self._selections[signature] = ImpactAnalyzer(self.repo_path).select(
+                changed_files
             )
+        return self._selections[signature]
+
+    def _pytest_inputs(self, changed_files: List[str]) -> List[str]:
+        """Files a pytest run depends on: the selected tests' dependencies
+        plus every non-Python file (configuration, data the tests read), or
+        every file in the tree for a full-suite run."""
+        files = suite_inputs(self.repo_path)
+        if changed_files and self.test_impact:
+            selection = self._select_tests(changed_files)
+            if not selection.full_suite:
+                other = [f for f in files if not f.endswith(".py")]
+                return sorted(selection.dependencies) + other + selection.tests
+        return files
+
+    def check_pytest(self, changed_files: Optional[List[str]] = None) -> CheckResult:
+        """Run pytest and check for failures.
+
+        Args:
+            changed_files: When given and test impact is enabled, only the
+                tests affected by these files run; the full suite runs if
+                the selection is unsafe or empty.
+        """
+        timeout = self.timeouts["pytest"]
+        cmd = ["python3", "-m", "pytest", "--tb=no", "-q"]
+        scope = ""
+        if changed_files and self.test_impact:
+            selection = self._select_tests(changed_files)
+            logger.info(f"Test impact: {selection.reason}")
+            if not selection.full_suite:
+                cmd += selection.tests
+                scope = f" ({len(selection.tests)} affected test files)"
+        if self.shard_tests and xdist_available():
+            cmd += ["-n", "auto"]
+
+        try:
+            # List args, no shell (no injection)
+            result = self._run("pytest", cmd, timeout)
 
             if result.returncode == 0:
                 # Parse passed count from output
@@ -160,7 +475,7 @@ class CheckRunner:
                 return CheckResult(
                     name="Tests (pytest)",
                     status=CheckStatus.PASSED,
-                    message=f"{passed} tests passed",
+                    message=f"{passed} tests passed{scope}",
                 )
             elif result.returncode == 5:
                 # No tests collected
@@ -176,7 +491,7 @@ class CheckRunner:
                 return CheckResult(
                     name="Tests (pytest)",
                     status=CheckStatus.FAILED,
-                    message=f"{failed} tests failed",
+                    message=f"{failed} tests failed{scope}",
                     details=result.stdout[-500:] if result.stdout else None,
                 )
 
@@ -184,7 +499,7 @@ class CheckRunner:
             return CheckResult(
                 name="Tests (pytest)",
                 status=CheckStatus.FAILED,
-                message="Tests timed out (>5 minutes)",
+                message=f"Tests timed out (>{timeout:.0f}s)",
             )
         except FileNotFoundError:
             return CheckResult(
@@ -209,13 +524,11 @@ class CheckRunner:
             )
 
         try:
-            # Use subprocess.run with list args (no shell injection)
-            result = subprocess.run(
+            # List args, no shell (no injection)
+            result = self._run(
+                "ruff",
                 ["ruff", "check", "--output-format=text"] + python_files,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=60,
+                self.timeouts["ruff"],
             )
 
             if result.returncode == 0:
@@ -252,7 +565,11 @@ class CheckRunner:
             )
 
     def check_security_patterns(self, python_files: List[str]) -> CheckResult:
-        """Check for security anti-patterns."""
+        """Check for security anti-patterns.
+
+        Large file sets are scanned in a process pool since the regex scan
+        is CPU-bound.
+        """
         if not python_files:
             return CheckResult(
                 name="Security Patterns",
@@ -260,23 +577,34 @@ class CheckRunner:
                 message="No Python files changed",
             )
 
-        issues = []
-
-        for filepath in python_files:
-            full_path = self.repo_path / filepath
-            if not full_path.exists():
-                continue
-
-            try:
-                content = full_path.read_text()
-                for pattern, description in self.SECURITY_PATTERNS:
-                    matches = re.finditer(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        # Find line number
-                        line_num = content[: match.start()].count("\n") + 1
-                        issues.append(f"{filepath}:{line_num}: {description}")
-            except Exception as e:
-                logger.warning(f"Error checking {filepath}: {e}")
+        patterns = [
+            (re.compile(pattern, re.IGNORECASE), description)
+            for pattern, description in self.SECURITY_PATTERNS
+        ]
+        targets = [
+            (str(self.repo_path / filepath), filepath)
+            for filepath in python_files
+            if (self.repo_path / filepath).exists()
+        ]
+
+        if len(targets) >= PROCESS_POOL_MIN_FILES:
+            workers = min(os.cpu_count() or 1, 8)
+            context = multiprocessing.get_context(POOL_START_METHOD)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                per_file = list(
+                    pool.map(
+                        _scan_file,
+                        [full for full, _ in targets],
+                        [display for _, display in targets],
+                        [patterns] * len(targets),
+                        chunksize=max(1, len(targets) // (workers * 4)),
+                    )
+                )
+        else:
+            per_file = [
+                _scan_file(full, display, patterns) for full, display in targets
+            ]
+        issues = [issue for file_issues in per_file for issue in file_issues]
 
         if not issues:
             return CheckResult(
@@ -302,13 +630,11 @@ class CheckRunner:
             )
 
         try:
-            # Use subprocess.run with list args (no shell injection)
-            result = subprocess.run(
+            # List args, no shell (no injection)
+            result = self._run(
+                "complexity",
                 ["radon", "cc", "-s", "-a"] + python_files,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=60,
+                self.timeouts["complexity"],
             )
 
             if result.returncode != 0:
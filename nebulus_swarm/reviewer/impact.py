@@ -0,0 +1,569 @@
+"""Test impact selection — run only the tests a change can affect.
+
+An ImpactMap records, for every test file, the repository files it
+depends on. It is built from the static import graph (cheap, always
+available) and, when present, a per-test coverage run, which also catches
+dynamic imports and data-driven code paths. Maps are cached per commit in
+the repository's git common directory; for Overlord worktrees that is the
+bare mirror, so every worktree of a project shares them.
+
+The full suite still runs when the map cannot be built, a risky file
+changes (conftest, packaging, pytest configuration, test fixtures), a file
+is deleted or renamed away, a changed file is not in the map, or the
+selection comes out empty.
+
+Workers run the selection from a worktree with::
+
+    python -m nebulus_swarm.reviewer.impact --run
+"""
+
+import argparse
+import ast
+import importlib.util
+import json
+import logging
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Directory inside the git common dir holding cached maps
+CACHE_DIRNAME = "nebulus-impact"
+# A coverage map older than this many commits no longer reflects the code
+MAX_COVERAGE_AGE_COMMITS = 50
+# Branches tried, in order, when no base ref is given
+DEFAULT_BASE_REFS = ("develop", "main", "master")
+
+# Changes to these files can affect any test
+RISKY_FILENAMES = frozenset(
+    {
+        "conftest.py",
+        "pyproject.toml",
+        "setup.py",
+        "setup.cfg",
+        "pytest.ini",
+        "tox.ini",
+        "noxfile.py",
+    }
+)
+RISKY_PREFIXES = ("requirements",)
+SKIP_DIRS = frozenset(
+    {".git", ".venv", "venv", "node_modules", "__pycache__", "build", "dist"}
+)
+
+
+def is_test_file(path: str) -> bool:
+    """Check whether a repo-relative path is a pytest test module."""
+    name = PurePosixPath(path).name
+    return name.endswith(".py") and (
+        name.startswith("test_") or name.endswith("_test.py")
+    )
+
+
+def _in_test_dir(path: str) -> bool:
+    return any(part in ("tests", "test") for part in PurePosixPath(path).parts[:-1])
+
+
+def is_risky_change(path: str) -> bool:
+    """Check whether a changed file forces a full test run.
+
+    Args:
+        path: Repo-relative path.
+
+    Returns:
+        True for test configuration, packaging files and non-Python files
+        under test directories (fixtures, snapshots).
+    """
+    name = PurePosixPath(path).name
+    if name in RISKY_FILENAMES or name.startswith(RISKY_PREFIXES):
+        return True
+    return _in_test_dir(path) and not name.endswith(".py")
+
+
+@dataclass
+class ImpactSelection:
+    """Tests chosen for a set of changed files."""
+
+    tests: List[str] = field(default_factory=list)
+    full_suite: bool = False
+    reason: str = ""
+    # Files the selected tests depend on (empty for a full-suite run)
+    dependencies: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class ImpactMap:
+    """Test file -> repository files it depends on, at one commit."""
+
+    commit: str
+    tests: Dict[str, Set[str]] = field(default_factory=dict)
+    source: str = "imports"
+
+    def affected_tests(self, changed_files: Iterable[str]) -> List[str]:
+        """Tests depending on any of the changed files.
+
+        Args:
+            changed_files: Repo-relative paths.
+
+        Returns:
+            Sorted test file paths.
+        """
+        changed = set(changed_files)
+        return sorted(test for test, deps in self.tests.items() if deps & changed)
+
+    def known_files(self) -> Set[str]:
+        """Every file the map knows about: test files and their dependencies."""
+        known = set(self.tests)
+        for deps in self.tests.values():
+            known.update(deps)
+        return known
+
+    def merge(self, other: "ImpactMap") -> None:
+        """Union another map's dependencies into this one."""
+        for test, deps in other.tests.items():
+            self.tests.setdefault(test, set()).update(deps)
+        self.source = f"{self.source}+{other.source}"
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "commit": self.commit,
+            "source": self.source,
+            "tests": {test: sorted(deps) for test, deps in self.tests.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "ImpactMap":
+        return cls(
+            commit=str(data["commit"]),
+            source=str(data.get("source", "imports")),
+            tests={test: set(deps) for test, deps in dict(data["tests"]).items()},
+        )
+
+
+def _git(repo: Path, *args: str) -> Optional[str]:
+    """Run a git command, returning stripped stdout or None on failure."""
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=repo, capture_output=True, text=True, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _cache_dir(repo: Path) -> Optional[Path]:
+    """Map cache location inside the git common dir (the mirror for worktrees)."""
+    common = _git(repo, "rev-parse", "--git-common-dir")
+    if common is None:
+        return None
+    return (repo / common).resolve() / CACHE_DIRNAME
+
+
+def _python_files(repo: Path) -> List[str]:
+    files = []
+    for path in repo.rglob("*.py"):
+        rel = path.relative_to(repo)
+        if not SKIP_DIRS.intersection(rel.parts[:-1]):
+            files.append(rel.as_posix())
+    return files
+
+
+def suite_inputs(repo: Path) -> List[str]:
+    """Files that can influence a full test run: everything git sees in the
+    working tree, tracked or untracked, including data files tests read.
+
+    Args:
+        repo: Repository root.
+
+    Returns:
+        Repo-relative paths.
+    """
+    listed = _git(repo, "ls-files", "--cached", "--others", "--exclude-standard")
+    if listed is not None:
+        return sorted(set(listed.splitlines()))
+    files = []
+    for path in repo.rglob("*"):
+        rel = path.relative_to(repo)
+        if path.is_file() and not SKIP_DIRS.intersection(rel.parts[:-1]):
+            files.append(rel.as_posix())
+    return sorted(files)
+
+
+def _module_index(files: List[str]) -> Dict[str, Set[str]]:
+    """Map dotted module names to candidate files.
+
+    Every dotted suffix of a path is indexed, since test directories are
+    often put on sys.path directly. An ambiguous name resolves to all of its
+    candidates, which can only over-select tests.
+    """
+    index: Dict[str, Set[str]] = {}
+    for rel in files:
+        parts = list(PurePosixPath(rel).with_suffix("").parts)
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        if parts and parts[0] == "src":
+            parts = parts[1:]
+        for start in range(len(parts)):
+            index.setdefault(".".join(parts[start:]), set()).add(rel)
+    return index
+
+
+def _imports(repo: Path, rel: str) -> List[str]:
+    """Absolute dotted names imported by a file, relative imports resolved."""
+    try:
+        tree = ast.parse((repo / rel).read_text(), filename=rel)
+    except (SyntaxError, UnicodeDecodeError, OSError):
+        return []
+
+    package = list(PurePosixPath(rel).parent.parts)
+    if package and package[0] == "src":
+        package = package[1:]
+    names: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package[: len(package) - node.level + 1]
+                module = ".".join(base + ([node.module] if node.module else []))
+            else:
+                module = node.module or ""
+            names.append(module)
+            names.extend(f"{module}.{alias.name}" for alias in node.names)
+    return [name for name in names if name]
+
+
+def _resolve(name: str, index: Dict[str, Set[str]]) -> Set[str]:
+    """Files executed by importing a dotted name, package inits included."""
+    parts = name.split(".")
+    files: Set[str] = set()
+    for end in range(1, len(parts) + 1):
+        files.update(index.get(".".join(parts[:end]), ()))
+    return files
+
+
+def build_import_map(repo: Path, commit: str = "") -> ImpactMap:
+    """Build an ImpactMap from the static import graph.
+
+    Args:
+        repo: Repository root.
+        commit: Commit the working tree is at.
+
+    Returns:
+        Map from each test file to everything it transitively imports.
+    """
+    files = _python_files(repo)
+    index = _module_index(files)
+    graph = {
+        rel: {dep for name in _imports(repo, rel) for dep in _resolve(name, index)}
+        for rel in files
+    }
+
+    impact = ImpactMap(commit=commit, source="imports")
+    for test in (rel for rel in files if is_test_file(rel)):
+        seen = {test}
+        stack = [test]
+        while stack:
+            for dep in graph.get(stack.pop(), ()):
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.append(dep)
+        impact.tests[test] = seen
+    return impact
+
+
+def build_coverage_map(repo: Path, commit: str = "", timeout: int = 1800) -> ImpactMap:
+    """Build an ImpactMap from a per-test coverage run of the full suite.
+
+    Requires ``coverage`` in the environment; returns an empty map without it.
+
+    Args:
+        repo: Repository root.
+        commit: Commit the working tree is at.
+        timeout: Maximum seconds for the test run.
+
+    Returns:
+        Map from each test file to the repository files it executed.
+    """
+    impact = ImpactMap(commit=commit, source="coverage")
+    try:
+        from coverage import CoverageData
+    except ImportError:
+        logger.info("coverage not installed; skipping coverage impact map")
+        return impact
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = Path(tmp) / ".coverage"
+        rcfile = Path(tmp) / "coveragerc"
+        rcfile.write_text(
+            f"[run]\ndynamic_context = test_function\ndata_file = {data_file}\n"
+        )
+        try:
+            subprocess.run(
+                [sys.executable, "-m", "coverage", "run", f"--rcfile={rcfile}"]
+                + ["-m", "pytest", "-q", "--tb=no", "-p", "no:cacheprovider"],
+                cwd=repo,
+                capture_output=True,
+                timeout=timeout,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Coverage run failed: {e}")
+            return impact
+
+        data = CoverageData(basename=str(data_file))
+        data.read()
+        test_modules = _module_index(
+            [rel for rel in _python_files(repo) if is_test_file(rel)]
+        )
+        root = repo.resolve()
+        for measured in data.measured_files():
+            try:
+                rel = Path(measured).resolve().relative_to(root).as_posix()
+            except ValueError:
+                continue
+            contexts = set()
+            for line_contexts in data.contexts_by_lineno(measured).values():
+                contexts.update(line_contexts)
+            for context in contexts:
+                test = _context_test_file(context, test_modules)
+                if test:
+                    impact.tests.setdefault(test, {test}).add(rel)
+    return impact
+
+
+def _context_test_file(
+    context: str, test_modules: Dict[str, Set[str]]
+) -> Optional[str]:
+    """Map a coverage test_function context to its test file."""
+    parts = context.split(".")
+    for end in range(len(parts), 0, -1):
+        tests = test_modules.get(".".join(parts[:end]))
+        if tests:
+            return min(tests)
+    return None
+
+
+class ImpactAnalyzer:
+    """Loads, caches and queries impact maps for one repository."""
+
+    def __init__(self, repo_path: Path):
+        """Initialize the analyzer.
+
+        Args:
+            repo_path: Repository root (a clone or a mirror worktree).
+        """
+        self.repo_path = Path(repo_path)
+        self._cache_dir = _cache_dir(self.repo_path)
+
+    def _cache_file(self, kind: str, commit: str) -> Optional[Path]:
+        if self._cache_dir is None or not commit:
+            return None
+        return self._cache_dir / f"{kind}-{commit}.json"
+
+    def _load(self, path: Optional[Path]) -> Optional[ImpactMap]:
+        if path is None or not path.exists():
+            return None
+        try:
+            return ImpactMap.from_dict(json.loads(path.read_text()))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable impact map {path}: {e}")
+            return None
+
+    def _save(self, path: Optional[Path], impact: ImpactMap) -> None:
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(impact.to_dict()))
+        except OSError as e:
+            logger.warning(f"Could not cache impact map: {e}")
+
+    def _latest_coverage_map(self, head: str) -> Optional[ImpactMap]:
+        """Newest cached coverage map that is an ancestor of HEAD and recent."""
+        if self._cache_dir is None or not self._cache_dir.exists():
+            return None
+        candidates = sorted(
+            self._cache_dir.glob("coverage-*.json"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for path in candidates:
+            commit = path.stem.split("-", 1)[1]
+            distance = _git(self.repo_path, "rev-list", "--count", f"{commit}..{head}")
+            if distance is None or int(distance) > MAX_COVERAGE_AGE_COMMITS:
+                continue
+            return self._load(path)
+        return None
+
+    def load_map(self) -> Optional[ImpactMap]:
+        """Get the impact map for HEAD, building and caching it if needed.
+
+        Returns:
+            The import map, merged with a recent coverage map when one is
+            cached, or None if no map could be built.
+        """
+        head = _git(self.repo_path, "rev-parse", "HEAD") or ""
+        path = self._cache_file("imports", head)
+        impact = self._load(path)
+        if impact is None:
+            started = time.monotonic()
+            try:
+                impact = build_import_map(self.repo_path, head)
+            except OSError as e:
+                logger.warning(f"Could not build import map: {e}")
+                return None
+            logger.info(
+                f"Built import map for {len(impact.tests)} test files "
+                f"in {time.monotonic() - started:.1f}s"
+            )
+            self._save(path, impact)
+
+        coverage_map = self._latest_coverage_map(head) if head else None
+        if coverage_map is not None:
+            impact.merge(coverage_map)
+        return impact
+
+    def record_coverage(self) -> ImpactMap:
+        """Run the suite under coverage and cache the map for HEAD.
+
+        Returns:
+            The coverage map (empty if coverage is unavailable).
+        """
+        head = _git(self.repo_path, "rev-parse", "HEAD") or ""
+        impact = build_coverage_map(self.repo_path, head)
+        if impact.tests:
+            self._save(self._cache_file("coverage", head), impact)
+        return impact
+
+    def select(self, changed_files: List[str]) -> ImpactSelection:
+        """Choose the tests to run for a set of changed files.
+
+        Args:
+            changed_files: Repo-relative paths changed by the work under test.
+
+        Returns:
+            ImpactSelection; ``full_suite`` is set when selection is unsafe.
+        """
+        risky = [f for f in changed_files if is_risky_change(f)]
+        if risky:
+            return ImpactSelection(
+                full_suite=True, reason=f"risky change: {', '.join(risky[:3])}"
+            )
+
+        impact = self.load_map()
+        if impact is None or not impact.tests:
+            return ImpactSelection(full_suite=True, reason="no impact map")
+
+        # A deleted or renamed-away file can break its importers, and the
+        # map may not record them (e.g. the import was already guarded)
+        removed = [f for f in changed_files if not (self.repo_path / f).exists()]
+        if removed:
+            return ImpactSelection(
+                full_suite=True,
+                reason=f"deleted or renamed: {', '.join(removed[:3])}",
+            )
+
+        # Changed or new test files always run, even if not in the map yet
+        new_tests = {f for f in changed_files if is_test_file(f)}
+        known = impact.known_files()
+        unmapped = [f for f in changed_files if f not in known and f not in new_tests]
+        if unmapped:
+            return ImpactSelection(
+                full_suite=True,
+                reason=f"not in impact map: {', '.join(unmapped[:3])}",
+            )
+
+        tests = set(impact.affected_tests(changed_files)) | new_tests
+        if not tests:
+            return ImpactSelection(full_suite=True, reason="no affected tests found")
+        dependencies = set(tests)
+        for test in tests:
+            dependencies.update(impact.tests.get(test, ()))
+        return ImpactSelection(
+            tests=sorted(tests),
+            reason=f"{len(tests)} of {len(impact.tests)} test files affected "
+            f"({impact.source})",
+            dependencies=dependencies,
+        )
+
+    def changed_files(self, base: Optional[str] = None) -> List[str]:
+        """Files changed since the merge base with ``base``, including
+        uncommitted and untracked files.
+
+        Args:
+            base: Base ref; defaults to the first of DEFAULT_BASE_REFS found.
+
+        Returns:
+            Repo-relative paths.
+        """
+        refs = [base] if base else list(DEFAULT_BASE_REFS)
+        merge_base = None
+        for ref in refs:
+            merge_base = _git(self.repo_path, "merge-base", ref, "HEAD")
+            if merge_base:
+                break
+        merge_base = merge_base or "HEAD"
+
+        changed = set()
+        for output in (
+            # --no-renames lists a rename's old path too, so it reads as deleted
+            _git(self.repo_path, "diff", "--name-only", "--no-renames", merge_base),
+            _git(self.repo_path, "ls-files", "--others", "--exclude-standard"),
+        ):
+            changed.update(line for line in (output or "").splitlines() if line)
+        return sorted(changed)
+
+
+def xdist_available() -> bool:
+    """Check whether pytest-xdist can shard test runs."""
+    return importlib.util.find_spec("xdist") is not None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Select (and optionally run) the tests affected by local changes."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--repo", type=Path, default=Path("."), help="Repo root")
+    parser.add_argument("--base", help="Base ref (default: develop/main/master)")
+    parser.add_argument("--run", action="store_true", help="Run the selection")
+    parser.add_argument(
+        "--shard", action="store_true", help="Shard across cores (pytest-xdist)"
+    )
+    parser.add_argument(
+        "--record-coverage",
+        action="store_true",
+        help="Run the full suite under coverage and cache the map for HEAD",
+    )
+    args = parser.parse_args(argv)
+
+    analyzer = ImpactAnalyzer(args.repo)
+    if args.record_coverage:
+        impact = analyzer.record_coverage()
+        print(f"Recorded coverage map for {len(impact.tests)} test files")
+        return 0
+
+    selection = analyzer.select(analyzer.changed_files(args.base))
+    if selection.full_suite:
+        print(f"Full suite: {selection.reason}")
+    else:
+        print(f"Selected: {selection.reason}")
+        for test in selection.tests:
+            print(f"  {test}")
+
+    if not args.run:
+        return 0
+
+    cmd = [sys.executable, "-m", "pytest", "-q"]
+    if not selection.full_suite:
+        cmd += selection.tests
+    if args.shard and xdist_available():
+        cmd += ["-n", "auto"]
+    return subprocess.run(cmd, cwd=args.repo).returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,10 +3,11 @@
 import json
 import logging
 import re
-from typing import Optional
-
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
+from nebulus_swarm.lazy_import import lazy_import
 from nebulus_swarm.reviewer.pr_reviewer import (
     InlineComment,
     PRDetails,
@@ -14,8 +15,18 @@ from nebulus_swarm.reviewer.pr_reviewer import (
     ReviewResult,
 )
 
+if TYPE_CHECKING:
+    from nebulus_swarm.overlord.llm_pool import LLMPool
+
 logger = logging.getLogger(__name__)
 
+OpenAI = lazy_import("openai", "OpenAI")
+
+# Parallel chunk reviews for large PRs
+DEFAULT_REVIEW_WORKERS = 4
+
+HUNK_HEADER = re.compile(r"^@@ ", re.MULTILINE)
+
 # System prompt for code review
 CODE_REVIEW_PROMPT = """You are an expert code reviewer. Analyze the pull request and provide a thorough review.
 
@@ -46,6 +57,144 @@ Guidelines for decision:
 Be concise but thorough. Focus on actionable feedback."""
 
 
+@dataclass
+class DiffChunk:
+    """A slice of a PR diff small enough for one review prompt."""
+
+    index: int
+    sections: List[Tuple[str, str]] = field(default_factory=list)  # (path, patch)
+
+    @property
+    def line_count(self) -> int:
+        return sum(patch.count("\n") + 1 for _, patch in self.sections)
+
+    @property
+    def paths(self) -> List[str]:
+        """Files touched by this chunk, in order, without duplicates."""
+        return list(dict.fromkeys(path for path, _ in self.sections))
+
+    def render(self) -> str:
+        """Format the chunk as markdown diff blocks."""
+        return "\n".join(
+            f"\n### {path}\n```diff\n{patch}\n```" for path, patch in self.sections
+        )
+
+
+def _split_patch(patch: str, max_lines: int) -> List[str]:
+    """Split one file's patch at hunk boundaries into pieces of <= max_lines.
+
+    A single hunk longer than max_lines is cut into fixed-size slices.
+    """
+    starts = [m.start() for m in HUNK_HEADER.finditer(patch)] or [0]
+    if starts[0] != 0:
+        starts.insert(0, 0)
+    hunks = [
+        patch[start:end].rstrip("\n")
+        for start, end in zip(starts, starts[1:] + [len(patch)])
+    ]
+
+    pieces: List[str] = []
+    current: List[str] = []
+    for hunk in hunks:
+        lines = hunk.split("\n")
+        if len(current) + len(lines) > max_lines and current:
+            pieces.append("\n".join(current))
+            current = []
+        while len(lines) > max_lines:
+            pieces.append("\n".join(lines[:max_lines]))
+            lines = lines[max_lines:]
+        current.extend(lines)
+    if current:
+        pieces.append("\n".join(current))
+    return pieces
+
+
+def split_diff(pr_details: PRDetails, max_lines: int = 500) -> List[DiffChunk]:
+    """Split a PR's diff into review chunks of at most max_lines each.
+
+    Small files are packed together; large files are split at hunk
+    boundaries so every changed line lands in exactly one chunk.
+
+    Args:
+        pr_details: PR whose files carry patches.
+        max_lines: Maximum diff lines per chunk.
+
+    Returns:
+        Chunks in file order. Empty if the PR has no textual diff.
+    """
+    chunks: List[DiffChunk] = []
+    current = DiffChunk(index=0)
+    used = 0
+
+    for f in pr_details.files:
+        if not f.patch:
+            continue
+        for piece in _split_patch(f.patch, max_lines):
+            size = piece.count("\n") + 1
+            if used + size > max_lines and current.sections:
+                chunks.append(current)
+                current = DiffChunk(index=len(chunks))
+                used = 0
+            current.sections.append((f.filename, piece))
+            used += size
+
+    if current.sections:
+        chunks.append(current)
+    return chunks
+
+
+def _dedupe(items: List[str]) -> List[str]:
+    """Drop repeated entries, keeping first occurrences in order."""
+    return list(dict.fromkeys(items))
+
+
+def merge_reviews(chunks: List[DiffChunk], results: List[ReviewResult]) -> ReviewResult:
+    """Reduce per-chunk reviews into one ReviewResult.
+
+    The strictest decision wins, confidence is the line-weighted mean, and
+    issues, suggestions and inline comments are concatenated without
+    duplicates. Inline comments on files outside their chunk are dropped.
+
+    Args:
+        chunks: Reviewed chunks.
+        results: Review for each chunk, in the same order.
+
+    Returns:
+        Combined review.
+    """
+    decisions = {r.decision for r in results}
+    if ReviewDecision.REQUEST_CHANGES in decisions:
+        decision = ReviewDecision.REQUEST_CHANGES
+    elif ReviewDecision.COMMENT in decisions:
+        decision = ReviewDecision.COMMENT
+    else:
+        decision = ReviewDecision.APPROVE
+
+    weights = [max(chunk.line_count, 1) for chunk in chunks]
+    confidence = sum(w * r.confidence for w, r in zip(weights, results)) / sum(weights)
+
+    comments = {}
+    for chunk, result in zip(chunks, results):
+        paths = set(chunk.paths)
+        for comment in result.inline_comments:
+            if comment.path in paths:
+                comments.setdefault((comment.path, comment.line, comment.body), comment)
+
+    summary_lines = [f"Reviewed in {len(chunks)} parts:"]
+    for chunk, result in zip(chunks, results):
+        files = ", ".join(f"`{path}`" for path in chunk.paths)
+        summary_lines.append(f"- {files}: {result.summary}")
+
+    return ReviewResult(
+        decision=decision,
+        summary="\n".join(summary_lines),
+        confidence=confidence,
+        issues=_dedupe([i for r in results for i in r.issues]),
+        suggestions=_dedupe([s for r in results for s in r.suggestions]),
+        inline_comments=sorted(comments.values(), key=lambda c: (c.path, c.line)),
+    )
+
+
 class LLMReviewer:
     """Uses LLM to review PR code changes."""
 
@@ -55,6 +204,8 @@ class LLMReviewer:
         model: str,
         api_key: str = "not-needed",
         timeout: int = 120,
+        max_workers: int = DEFAULT_REVIEW_WORKERS,
+        pool: Optional["LLMPool"] = None,
     ):
         """Initialize LLM reviewer.
 
@@ -63,30 +214,81 @@ class LLMReviewer:
             model: Model name to use.
             api_key: API key (may be "not-needed" for local models).
             timeout: Request timeout in seconds.
+            max_workers: Chunks of a large PR reviewed in parallel.
+            pool: Optional LLM connection pool; chunk requests then share
+                its client and concurrency limit.
         """
         self.model = model
-        self.client = OpenAI(
-            base_url=base_url,
-            api_key=api_key,
-            timeout=timeout,
-        )
+        self.max_workers = max(1, max_workers)
+        self._pool = pool
+        if pool:
+            # The pool's client does not retry; keep the SDK's default retries
+            # since review requests have no retry loop of their own
+            self.client = pool.client.with_options(max_retries=2)
+        else:
+            self.client = OpenAI(
+                base_url=base_url,
+                api_key=api_key,
+                timeout=timeout,
+            )
 
     def review_pr(
         self, pr_details: PRDetails, max_diff_lines: int = 500
     ) -> ReviewResult:
         """Review a pull request using LLM.
 
+        A diff that fits in max_diff_lines is reviewed with a single prompt.
+        Larger diffs are split into chunks (see ``split_diff``) that are
+        reviewed in parallel and merged with ``merge_reviews``, so the whole
+        PR is covered.
+
         Args:
             pr_details: PR details to review.
-            max_diff_lines: Maximum diff lines to send to LLM.
+            max_diff_lines: Maximum diff lines per LLM prompt.
 
         Returns:
             ReviewResult with LLM analysis.
         """
         logger.info(f"Starting LLM review of {pr_details.repo}#{pr_details.number}")
 
-        # Build the review prompt
-        user_prompt = self._build_review_prompt(pr_details, max_diff_lines)
+        chunks = split_diff(pr_details, max_diff_lines)
+        if len(chunks) <= 1:
+            user_prompt = self._build_review_prompt(pr_details, max_diff_lines)
+            return self._review(user_prompt)
+
+        logger.info(
+            f"Reviewing {pr_details.repo}#{pr_details.number} in {len(chunks)} "
+            f"chunks ({self.max_workers} parallel)"
+        )
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(chunks))
+        ) as executor:
+            results = list(
+                executor.map(
+                    lambda chunk: self._review(
+                        self._build_chunk_prompt(pr_details, chunk, len(chunks))
+                    ),
+                    chunks,
+                )
+            )
+        return merge_reviews(chunks, results)
+
+    def _review(self, user_prompt: str) -> ReviewResult:
+        """Send one review prompt and parse the response.
+
+        Args:
+            user_prompt: Prompt describing the changes to review.
+
+        Returns:
+            Parsed ReviewResult, or a zero-confidence COMMENT on failure.
+        """
+        if self._pool and not self._pool.acquire():
+            return ReviewResult(
+                decision=ReviewDecision.COMMENT,
+                summary="LLM review failed: timed out waiting for LLM pool slot",
+                confidence=0.0,
+                issues=["Review error: LLM pool timeout"],
+            )
 
         try:
             response = self.client.chat.completions.create(
@@ -109,6 +311,9 @@ class LLMReviewer:
                 confidence=0.0,
                 issues=[f"Review error: {e}"],
             )
+        finally:
+            if self._pool:
+                self._pool.release()
 
     def _build_review_prompt(self, pr_details: PRDetails, max_lines: int) -> str:
         """Build the user prompt for review.
@@ -131,6 +336,32 @@ class LLMReviewer:
 
         return "\n".join(parts)
 
+    def _build_chunk_prompt(
+        self, pr_details: PRDetails, chunk: DiffChunk, total: int
+    ) -> str:
+        """Build the user prompt for one chunk of a large PR.
+
+        Args:
+            pr_details: PR details.
+            chunk: Chunk to review.
+            total: Number of chunks in the PR.
+
+        Returns:
+            Formatted prompt string.
+        """
+        parts = [
+            "# Pull Request Review Request",
+            "",
+            pr_details.get_diff_summary(),
+            "",
+            f"## Code Changes (part {chunk.index + 1} of {total})",
+            "Other parts of this PR are reviewed separately; review only the "
+            "changes below.",
+            chunk.render(),
+        ]
+
+        return "\n".join(parts)
+
     def _parse_review_response(self, content: str) -> ReviewResult:
         """Parse LLM response into ReviewResult.
 
@@ -1,16 +1,33 @@
 """PR Reviewer service for examining Minion-created pull requests."""
 
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from github import Auth, Github
+from github import Github
+from github.File import File
 from github.GithubException import GithubException
+from github.PaginatedList import PaginatedList
+
+from nebulus_swarm.integrations.github_api import (
+    GitHubPriority,
+    get_shared_github,
+    release_shared_github,
+)
 
 logger = logging.getLogger(__name__)
 
+# Page size for the PR files listing (GitHub's maximum)
+FILES_PER_PAGE = 100
+# GitHub lists at most this many files for a pull request
+MAX_PR_FILES = 3000
+# Parallel requests used to fetch PR metadata and file pages
+DEFAULT_FETCH_WORKERS = 4
+
 
 class ReviewDecision(Enum):
     """Review decision types."""
@@ -29,6 +46,7 @@ class FileChange:
     additions: int
     deletions: int
     patch: Optional[str] = None  # The diff patch
+    previous_filename: Optional[str] = None  # Old path of a renamed file
 
     @property
     def total_changes(self) -> int:
@@ -145,19 +163,25 @@ class ReviewResult:
 class PRReviewer:
     """Service for reviewing pull requests."""
 
-    def __init__(self, token: str):
+    def __init__(self, token: str, fetch_workers: int = DEFAULT_FETCH_WORKERS):
         """Initialize PR reviewer.
 
         Args:
             token: GitHub personal access token.
+            fetch_workers: Parallel requests used by get_pr_details.
         """
         self.token = token
-        auth = Auth.Token(token)
-        self._client = Github(auth=auth)
+        self.fetch_workers = max(1, fetch_workers)
+        self._api = get_shared_github(token, client_factory=Github)
+        self._client = self._api.client
 
     def get_pr_details(self, repo_name: str, pr_number: int) -> PRDetails:
         """Fetch details about a pull request.
 
+        The PR metadata and the first page of files are requested together;
+        once the file count is known the remaining pages are fetched in
+        parallel.
+
         Args:
             repo_name: Repository in owner/name format.
             pr_number: Pull request number.
@@ -170,21 +194,33 @@ class PRReviewer:
         """
         logger.info(f"Fetching PR details for {repo_name}#{pr_number}")
 
-        repo = self._client.get_repo(repo_name)
-        pr = repo.get_pull(pr_number)
-
-        # Get file changes
-        files = []
-        for f in pr.get_files():
-            files.append(
-                FileChange(
-                    filename=f.filename,
-                    status=f.status,
-                    additions=f.additions,
-                    deletions=f.deletions,
-                    patch=f.patch,
-                )
+        repo = self._api.get_repo(repo_name)
+
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as pool:
+            pr_future = pool.submit(self._get_pull, repo, pr_number)
+            first_page = pool.submit(self._get_files_page, repo, pr_number, 0)
+            pr = pr_future.result()
+
+            page_count = math.ceil(min(pr.changed_files, MAX_PR_FILES) / FILES_PER_PAGE)
+            rest = [
+                pool.submit(self._get_files_page, repo, pr_number, page)
+                for page in range(1, page_count)
+            ]
+            raw_files = first_page.result()
+            for future in rest:
+                raw_files.extend(future.result())
+
+        files = [
+            FileChange(
+                filename=f.filename,
+                status=f.status,
+                additions=f.additions,
+                deletions=f.deletions,
+                patch=f.patch,
+                previous_filename=f.previous_filename,
             )
+            for f in raw_files
+        ]
 
         # Try to find linked issue from PR body
         linked_issue = self._extract_linked_issue(pr.body or "")
@@ -205,6 +241,31 @@ class PRReviewer:
             linked_issue=linked_issue,
         )
 
+    def _get_pull(self, repo: Any, pr_number: int) -> Any:
+        """Fetch pull request metadata."""
+        self._api.require(GitHubPriority.REVIEW)
+        return repo.get_pull(pr_number)
+
+    def _get_files_page(self, repo: Any, pr_number: int, page: int) -> List[Any]:
+        """Fetch one page of a pull request's changed files.
+
+        Args:
+            repo: PyGithub Repository.
+            pr_number: Pull request number.
+            page: Zero-based page index.
+
+        Returns:
+            List of PyGithub File objects.
+        """
+        self._api.require(GitHubPriority.REVIEW)
+        files = PaginatedList(
+            File,
+            self._client.requester,
+            f"{repo.url}/pulls/{pr_number}/files",
+            {"per_page": FILES_PER_PAGE},
+        )
+        return files.get_page(page)
+
     def _extract_linked_issue(self, body: str) -> Optional[int]:
         """Extract linked issue number from PR body.
 
@@ -237,7 +298,8 @@ class PRReviewer:
         Returns:
             Dict mapping check name to status (success, failure, pending).
         """
-        repo = self._client.get_repo(repo_name)
+        repo = self._api.get_repo(repo_name)
+        self._api.require(GitHubPriority.REVIEW, cost=4)
         pr = repo.get_pull(pr_number)
 
         # Get the latest commit
@@ -283,7 +345,8 @@ class PRReviewer:
             True if review was posted successfully.
         """
         try:
-            repo = self._client.get_repo(repo_name)
+            repo = self._api.get_repo(repo_name)
+            self._api.require(GitHubPriority.REVIEW, cost=2)
             pr = repo.get_pull(pr_number)
 
             # Build review body
@@ -345,7 +408,8 @@ class PRReviewer:
             True if merge was successful.
         """
         try:
-            repo = self._client.get_repo(repo_name)
+            repo = self._api.get_repo(repo_name, priority=GitHubPriority.WRITE)
+            self._api.require(GitHubPriority.WRITE, cost=2)
             pr = repo.get_pull(pr_number)
 
             if not pr.mergeable:
@@ -361,5 +425,5 @@ class PRReviewer:
             return False
 
     def close(self) -> None:
-        """Close the GitHub client."""
-        self._client.close()
+        """Release the shared GitHub client."""
+        release_shared_github(self._api)
@@ -2,8 +2,10 @@
 
 import logging
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
+from nebulus_swarm.reviewer.check_cache import CheckCache
 from nebulus_swarm.reviewer.checks import CheckRunner, ChecksReport
 from nebulus_swarm.reviewer.llm_review import LLMReviewer, create_review_summary
 from nebulus_swarm.reviewer.pr_reviewer import (
@@ -25,10 +27,13 @@ class ReviewConfig:
     llm_model: str
     llm_api_key: str = "not-needed"
     llm_timeout: int = 120
-    max_diff_lines: int = 500
+    max_diff_lines: int = 500  # per LLM prompt; larger diffs are chunked
+    llm_max_workers: int = 4  # chunks reviewed in parallel
     auto_merge_enabled: bool = False
     merge_method: str = "squash"
     run_local_checks: bool = True
+    cache_checks: bool = True  # reuse check results for unchanged inputs
+    check_cache_dir: Optional[str] = None  # defaults to ~/.nebulus/check-cache
     min_confidence_for_approve: float = 0.8
 
 
@@ -81,6 +86,7 @@ class ReviewWorkflow:
         self.config = config
         self._pr_reviewer: Optional[PRReviewer] = None
         self._llm_reviewer: Optional[LLMReviewer] = None
+        self._check_cache: Optional[CheckCache] = None
 
     @property
     def pr_reviewer(self) -> PRReviewer:
@@ -98,6 +104,7 @@ class ReviewWorkflow:
                 model=self.config.llm_model,
                 api_key=self.config.llm_api_key,
                 timeout=self.config.llm_timeout,
+                max_workers=self.config.llm_max_workers,
             )
         return self._llm_reviewer
 
@@ -206,9 +213,15 @@ class ReviewWorkflow:
         Returns:
             ChecksReport with all check results.
         """
-        runner = CheckRunner(repo_path)
+        if self.config.cache_checks and self._check_cache is None:
+            cache_dir = self.config.check_cache_dir
+            self._check_cache = CheckCache(Path(cache_dir) if cache_dir else None)
+        runner = CheckRunner(repo_path, cache=self._check_cache)
         changed_files = [f.filename for f in pr_details.files]
-        return runner.run_all_checks(changed_files)
+        renamed_from = [
+            f.previous_filename for f in pr_details.files if f.previous_filename
+        ]
+        return runner.run_all_checks(changed_files, renamed_from)
 
     def _post_review(
         self,
@@ -3,6 +3,8 @@
 import json
 from datetime import datetime
 
+import pytest
+
 from nebulus_swarm.overlord.audit_trail import (
     AuditTrail,
     LogEvent,
@@ -87,6 +89,86 @@ class TestAuditTrail:
         assert logs[0].previous_hash != ""
 
 
+class TestAppends:
+    def test_log_many_chains_in_order(self, tmp_path):
+        trail = AuditTrail(str(tmp_path / "audit.db"))
+        first = trail.log(LogEvent.TASK_RECEIVED, "task-1", {})
+        batch = trail.log_many(
+            [
+                (LogEvent.TASK_DISPATCHED, "task-1", {"n": 1}),
+                (LogEvent.TASK_COMPLETE, "task-1", {"n": 2}, "done"),
+            ]
+        )
+
+        assert batch[0].previous_hash == first.compute_hash()
+        assert batch[1].previous_hash == batch[0].compute_hash()
+        assert batch[1].reasoning == "done"
+        assert trail.verify_integrity() == (True, [])
+
+    def test_order_follows_seq_not_timestamp(self, tmp_path):
+        import sqlite3
+
+        trail = AuditTrail(str(tmp_path / "audit.db"))
+        trail.log(LogEvent.TASK_RECEIVED, "task-1", {})
+        trail.log(LogEvent.TASK_COMPLETE, "task-1", {})
+        # Clock stepped back between appends
+        conn = sqlite3.connect(str(tmp_path / "audit.db"))
+        conn.execute("UPDATE audit_logs SET timestamp = '2000-01-01' WHERE seq = 2")
+        conn.commit()
+        conn.close()
+
+        logs = trail.get_logs_for_task("task-1")
+        assert [log.event for log in logs] == [
+            LogEvent.TASK_RECEIVED,
+            LogEvent.TASK_COMPLETE,
+        ]
+
+    def test_trails_sharing_a_database_do_not_fork(self, tmp_path):
+        path = str(tmp_path / "audit.db")
+        first, second = AuditTrail(path), AuditTrail(path)
+        first.log(LogEvent.TASK_RECEIVED, "task-1", {})
+        second.log(LogEvent.TASK_DISPATCHED, "task-1", {})
+        first.log(LogEvent.TASK_COMPLETE, "task-1", {})
+
+        assert first.verify_integrity() == (True, [])
+
+    def test_concurrent_appends_keep_one_chain(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        trail = AuditTrail(str(tmp_path / "audit.db"))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(
+                pool.map(
+                    lambda n: trail.log(LogEvent.WORKER_RESULT, f"t-{n}", {}),
+                    range(64),
+                )
+            )
+
+        assert trail.verify_integrity() == (True, [])
+        assert len(trail.get_all_logs()) == 64
+
+    def test_legacy_trail_gets_seq(self, tmp_path):
+        import sqlite3
+
+        path = str(tmp_path / "audit.db")
+        AuditTrail(path).log(LogEvent.TASK_RECEIVED, "task-1", {})
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            """
+            CREATE TABLE legacy AS SELECT id, event, task_id, timestamp, data,
+                reasoning, previous_hash, signature, entry_hash FROM audit_logs;
+            DROP TABLE audit_logs;
+            ALTER TABLE legacy RENAME TO audit_logs;
+            """
+        )
+        conn.commit()
+        conn.close()
+
+        trail = AuditTrail(path)
+        trail.log(LogEvent.TASK_COMPLETE, "task-1", {})
+        assert trail.verify_integrity() == (True, [])
+
+
 class TestIntegrity:
     def test_verify_empty_trail(self, tmp_path):
         trail = AuditTrail(str(tmp_path / "audit.db"))
@@ -122,6 +204,94 @@ class TestIntegrity:
         assert len(issues) >= 1
 
 
+def _filled_trail(tmp_path, count=5, signing_key=None):
+    trail = AuditTrail(str(tmp_path / "audit.db"), signing_key)
+    trail.log_many(
+        (LogEvent.WORKER_RESULT, f"task-{n}", {"n": n}) for n in range(count)
+    )
+    return trail
+
+
+def _execute(tmp_path, sql):
+    import sqlite3
+
+    conn = sqlite3.connect(str(tmp_path / "audit.db"))
+    conn.execute(sql)
+    conn.commit()
+    conn.close()
+
+
+class TestCheckpointedVerification:
+    def test_full_blocks_are_checkpointed(self, tmp_path):
+        trail = _filled_trail(tmp_path)
+        assert trail.verify_integrity(block_size=2) == (True, [])
+
+        with trail._conn() as conn:
+            seqs = [
+                r[0] for r in conn.execute("SELECT last_seq FROM audit_checkpoints")
+            ]
+        assert seqs == [2, 4]
+
+    def test_resumes_after_last_checkpoint(self, tmp_path):
+        trail = _filled_trail(tmp_path)
+        trail.verify_integrity(block_size=2)
+        # Content edits inside checkpointed blocks are only seen by a full run
+        _execute(tmp_path, "UPDATE audit_logs SET data = '{}' WHERE seq = 1")
+
+        assert trail.verify_integrity(block_size=2) == (True, [])
+        is_valid, issues = trail.verify_integrity(full=True, block_size=2)
+        assert is_valid is False
+        assert "Hash mismatch" in issues[0]
+
+    def test_appends_after_checkpoint_are_verified(self, tmp_path):
+        trail = _filled_trail(tmp_path)
+        trail.verify_integrity(block_size=2)
+        trail.log(LogEvent.TASK_COMPLETE, "task-9", {})
+        _execute(tmp_path, """UPDATE audit_logs SET data = '{"n": 1}' WHERE seq = 6""")
+
+        is_valid, issues = trail.verify_integrity(block_size=2)
+        assert is_valid is False
+        assert "Hash mismatch" in issues[0]
+
+    def test_moved_anchor_invalidates_checkpoint(self, tmp_path):
+        trail = _filled_trail(tmp_path)
+        trail.verify_integrity(block_size=2)
+        _execute(tmp_path, "UPDATE audit_logs SET entry_hash = 'x' WHERE seq = 4")
+
+        is_valid, issues = trail.verify_integrity(block_size=2)
+        assert is_valid is False
+        assert "no longer matches" in issues[0]
+
+    def test_forged_checkpoint_rejected(self, tmp_path):
+        pytest.importorskip("cryptography")
+        key = generate_signing_key()
+        trail = _filled_trail(tmp_path, signing_key=key)
+        trail.verify_integrity(block_size=2)
+        _execute(tmp_path, "UPDATE audit_checkpoints SET signature = 'forged'")
+
+        is_valid, issues = trail.verify_integrity(block_size=2)
+        assert is_valid is False
+        assert "Invalid signature" in issues[0]
+
+    def test_full_run_checks_merkle_roots(self, tmp_path):
+        trail = _filled_trail(tmp_path)
+        trail.verify_integrity(block_size=2)
+        _execute(tmp_path, "UPDATE audit_checkpoints SET merkle_root = 'x'")
+
+        is_valid, issues = trail.verify_integrity(full=True, block_size=2)
+        assert is_valid is False
+        assert "Merkle root mismatch" in issues[0]
+
+    def test_parallel_blocks_match_inline(self, tmp_path):
+        trail = _filled_trail(tmp_path, count=9)
+        _execute(tmp_path, "UPDATE audit_logs SET reasoning = 'x' WHERE seq = 7")
+
+        inline = trail.verify_integrity(full=True, block_size=2)
+        parallel = trail.verify_integrity(full=True, workers=2, block_size=2)
+        assert parallel == inline
+        assert inline[0] is False
+
+
 class TestExport:
     def test_export_all(self, tmp_path):
         trail = AuditTrail(str(tmp_path / "audit.db"))
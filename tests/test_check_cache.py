@@ -0,0 +1,175 @@
+"""Tests for the on-disk check result cache."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from nebulus_swarm.reviewer.check_cache import CheckCache
+from nebulus_swarm.reviewer.checks import (
+    CheckResult,
+    CheckRunner,
+    ChecksReport,
+    CheckStatus,
+)
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "a.py").write_text("X = 1\n")
+    (root / "pkg" / "b.py").write_text("Y = 2\n")
+    _git(root, "init", "-q")
+    return root
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CheckCache(tmp_path / "cache")
+    # Pin tool versions so tests don't probe installed tools
+    cache._versions.update({"pytest": "t", "ruff": "t", "complexity": "t"})
+    return cache
+
+
+class TestCheckCache:
+    """Tests for CheckCache."""
+
+    def test_git_and_fallback_hashes_agree(self, repo):
+        via_git = CheckCache.hash_files(repo, ["pkg/a.py", "missing.py"])
+        with patch("subprocess.run", side_effect=OSError):
+            fallback = CheckCache.hash_files(repo, ["pkg/a.py", "missing.py"])
+
+        assert via_git == fallback
+        assert via_git["missing.py"] == "-"
+
+    def test_key_changes_only_with_inputs(self, repo, cache):
+        key_a = cache.key("ruff", repo, ["pkg/a.py"])
+        (repo / "pkg" / "b.py").write_text("Y = 3\n")
+
+        assert cache.key("ruff", repo, ["pkg/a.py"]) == key_a
+
+        (repo / "pkg" / "a.py").write_text("X = 2\n")
+        assert cache.key("ruff", repo, ["pkg/a.py"]) != key_a
+
+    def test_roundtrip_marks_cached(self, cache):
+        result = CheckResult(
+            name="Linting", status=CheckStatus.FAILED, message="2 errors"
+        )
+        cache.put("ruff", "k", result)
+
+        hit = cache.get("ruff", "k")
+
+        assert hit.status == CheckStatus.FAILED
+        assert hit.message == "2 errors"
+        assert hit.cached is True
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_environment_results_not_stored(self, cache):
+        cache.put(
+            "pytest",
+            "k1",
+            CheckResult(name="Tests", status=CheckStatus.FAILED, message="Timed out"),
+        )
+        cache.put(
+            "ruff",
+            "k2",
+            CheckResult(
+                name="Linting",
+                status=CheckStatus.SKIPPED,
+                message="Ruff not available",
+            ),
+        )
+
+        assert cache.get("pytest", "k1") is None
+        assert cache.get("ruff", "k2") is None
+
+    def test_test_failures_not_stored(self, cache):
+        failed = CheckResult(
+            name="Tests", status=CheckStatus.FAILED, message="1 failed"
+        )
+        cache.put("pytest", "k1", failed)
+        cache.put("ruff", "k2", failed)
+
+        assert cache.get("pytest", "k1") is None
+        assert cache.get("ruff", "k2") is not None
+
+    def test_corrupt_entry_is_a_miss(self, cache):
+        path = cache.cache_dir / "ruff" / "k.json"
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        assert cache.get("ruff", "k") is None
+
+
+class TestCheckRunnerCache:
+    """Tests for CheckRunner with a CheckCache."""
+
+    def test_only_checks_with_changed_inputs_rerun(self, repo, cache):
+        runner = CheckRunner(repo, test_impact=False, cache=cache)
+        calls = []
+
+        def fake(name):
+            def check(files):
+                calls.append(name)
+                return CheckResult(name=name, status=CheckStatus.PASSED, message="ok")
+
+            return check
+
+        with (
+            patch.object(runner, "check_pytest", side_effect=fake("pytest")),
+            patch.object(runner, "check_ruff", side_effect=fake("ruff")),
+            patch.object(runner, "check_security_patterns", side_effect=fake("sec")),
+            patch.object(runner, "check_complexity", side_effect=fake("cx")),
+            patch.object(runner, "check_file_sizes", side_effect=fake("size")),
+            patch.object(runner, "check_skill_changes", side_effect=fake("skills")),
+        ):
+            runner.run_all_checks(["pkg/a.py"])
+            assert len(calls) == 6
+
+            calls.clear()
+            report = runner.run_all_checks(["pkg/a.py"])
+            assert calls == []
+            assert all(r.cached for r in report.results)
+
+            # b.py is not a changed file but is part of the full-suite inputs
+            (repo / "pkg" / "b.py").write_text("Y = 3\n")
+            calls.clear()
+            runner.run_all_checks(["pkg/a.py"])
+            assert calls == ["pytest"]
+
+            # So is data a test reads, whatever its extension
+            (repo / "pkg" / "data.json").write_text("{}")
+            calls.clear()
+            runner.run_all_checks(["pkg/a.py"])
+            assert calls == ["pytest"]
+
+    def test_abandoned_check_not_stored(self, repo, cache):
+        runner = CheckRunner(repo, test_impact=False, cache=cache)
+        runner._abandoned.add("ruff")
+        result = CheckResult(name="Linting", status=CheckStatus.FAILED, message="x")
+
+        runner._cached("ruff", lambda: ["pkg/a.py"], lambda: result)
+
+        key = cache.key("ruff", repo, ["pkg/a.py"])
+        assert cache.get("ruff", key) is None
+
+    def test_summary_marks_cached_results(self):
+        report = ChecksReport(
+            results=[
+                CheckResult(
+                    name="Linting",
+                    status=CheckStatus.PASSED,
+                    message="No issues",
+                    duration=0.01,
+                    cached=True,
+                )
+            ]
+        )
+
+        assert "No issues (cached)" in report.get_summary()
@@ -0,0 +1,100 @@
+"""Cold-start benchmarks for the atom CLI.
+
+Each command runs in a fresh interpreter so the measurement includes every
+import it pays for. The budget is generous to absorb slow CI machines; the
+heavy-module check is the precise regression signal.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Seconds a command may take from interpreter start to exit
+STARTUP_BUDGET = float(os.environ.get("ATOM_STARTUP_BUDGET", "3.0"))
+
+HEAVY_MODULES = (
+    "chromadb",
+    "sentence_transformers",
+    "transformers",
+    "docker",
+    "github",
+    "streamlit",
+    "openai",
+    "mcp",
+)
+
+_RUNNER = """
+import json, sys
+from nebulus_atom.main import app
+sys.argv = ["atom", *sys.argv[1:]]
+try:
+    app()
+except SystemExit:
+    pass
+heavy = [m for m in json.loads(sys.stdin.read()) if m in sys.modules]
+sys.stderr.write("HEAVY=" + json.dumps(heavy) + "\\n")
+"""
+
+
+def _run_cli(args: list, home: Path) -> tuple:
+    """Run an atom command in a fresh interpreter.
+
+    Returns:
+        (elapsed seconds, heavy modules imported, completed process).
+    """
+    env = dict(os.environ, HOME=str(home), PYTHONPATH=str(REPO_ROOT))
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", _RUNNER, *args],
+        input=json.dumps(HEAVY_MODULES),
+        capture_output=True,
+        text=True,
+        cwd=home,
+        env=env,
+        timeout=60,
+    )
+    elapsed = time.perf_counter() - start
+    marker = [line for line in proc.stderr.splitlines() if line.startswith("HEAVY=")]
+    assert marker, proc.stderr
+    return elapsed, json.loads(marker[-1][len("HEAVY=") :]), proc
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["--help"], ["overlord", "status"], ["mirror", "status"]],
+    ids=["help", "overlord-status", "mirror-status"],
+)
+def test_command_cold_start(args, tmp_path):
+    elapsed, heavy, proc = _run_cli(args, tmp_path)
+
+    assert heavy == [], f"atom {' '.join(args)} imported {heavy}"
+    assert elapsed < STARTUP_BUDGET, (
+        f"atom {' '.join(args)} took {elapsed:.2f}s (budget {STARTUP_BUDGET}s)"
+    )
+    assert "Traceback" not in proc.stderr
+
+
+def test_agent_modules_import_without_optional_stack():
+    """The agent imports without chromadb, docker or the MCP SDK."""
+    code = (
+        "import json, sys\n"
+        "import nebulus_atom.controllers.agent_controller\n"
+        "print(json.dumps([m for m in %r if m in sys.modules]))\n"
+        % (["chromadb", "sentence_transformers", "docker", "mcp"],)
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert json.loads(proc.stdout.strip().splitlines()[-1]) == []
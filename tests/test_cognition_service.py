@@ -1,5 +1,7 @@
 """Tests for CognitionService."""
 
+from unittest.mock import patch
+
 import pytest
 
 from nebulus_atom.services.cognition_service import (
@@ -7,6 +9,7 @@ from nebulus_atom.services.cognition_service import (
     CognitionServiceManager,
 )
 from nebulus_atom.models.cognition import TaskComplexity
+from nebulus_atom.models.failure_memory import FailureContext, FailurePattern
 
 
 class TestCognitionService:
@@ -231,6 +234,43 @@ class TestCognitionService:
         result = service.analyze_task("refactor the entire authentication system")
         assert result.needs_planning
 
+    # === Memoization ===
+
+    def test_analysis_memoized_by_normalized_input(self, service):
+        """Inputs differing only in case and padding reuse the analysis."""
+        with patch.object(service, "_analyze", wraps=service._analyze) as analyze:
+            first = service.analyze_task("Delete the old logs")
+            second = service.analyze_task("  delete the OLD logs ")
+
+        assert analyze.call_count == 1
+        assert second.potential_risks == first.potential_risks
+        assert "OLD" in second.reasoning_chain[0].thought
+
+    def test_memoized_results_are_independent(self, service):
+        """Mutating a returned result does not leak into later calls."""
+        first = service.analyze_task("refactor the database layer")
+        first.potential_risks.append("extra")
+        first.clarification_questions[0].question = "changed"
+
+        second = service.analyze_task("refactor the database layer")
+
+        assert "extra" not in second.potential_risks
+        assert second.clarification_questions[0].question != "changed"
+
+    def test_failure_context_change_invalidates(self, service):
+        """A different failure context is analyzed afresh."""
+        context = FailureContext(
+            patterns=[FailurePattern("run_shell_command", "timeout", 4)],
+            warning_messages=["run_shell_command often times out"],
+        )
+
+        plain = service.analyze_task("run the tests")
+        warned = service.analyze_task("run the tests", failure_context=context)
+
+        assert "run_shell_command often times out" in warned.potential_risks
+        assert warned.confidence < plain.confidence
+        assert service.analyze_task("run the tests").confidence == plain.confidence
+
 
 class TestCognitionServiceManager:
     """Test cases for CognitionServiceManager."""
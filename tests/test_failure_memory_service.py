@@ -1,5 +1,8 @@
 """Tests for failure memory models and service."""
 
+import sqlite3
+from unittest.mock import patch
+
 import pytest
 
 from nebulus_atom.models.failure_memory import (
@@ -236,6 +239,54 @@ class TestFailureMemoryServiceDB:
         ctx = service.build_failure_context(None)
         assert len(ctx.patterns) == 2
 
+    def test_counts_persist_across_instances(self, service):
+        service.record_failure("s1", "read_file", "No such file")
+        service.record_failure("s1", "read_file", "No such file")
+        service.mark_resolved("read_file", "file_not_found")
+        service.close()
+
+        reloaded = FailureMemoryService(db_path=service.db_path)
+        pattern = reloaded.query_similar_failures("read_file", "file_not_found")
+        assert (pattern.occurrence_count, pattern.resolved_count) == (2, 1)
+
+        conn = sqlite3.connect(service.db_path)
+        rows = conn.execute(
+            "SELECT resolved FROM failures ORDER BY timestamp"
+        ).fetchall()
+        conn.close()
+        assert rows == [(0,), (1,)]
+
+    def test_reads_do_not_touch_database(self, service):
+        service.record_failure("s1", "read_file", "No such file")
+        service.flush()
+
+        with patch(
+            "nebulus_atom.services.failure_memory_service.sqlite3.connect",
+            side_effect=AssertionError("database opened"),
+        ):
+            ctx = service.build_failure_context()
+            pattern = service.query_similar_failures("read_file")
+
+        assert ctx.patterns[0].occurrence_count == 1
+        assert pattern.occurrence_count == 1
+
+    def test_mark_resolved_all_resolved(self, service):
+        service.record_failure("s1", "read_file", "No such file")
+
+        assert service.mark_resolved("read_file", "file_not_found")
+        assert not service.mark_resolved("read_file", "file_not_found")
+
+    def test_pattern_index(self, service):
+        conn = sqlite3.connect(service.db_path)
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM failures "
+            "WHERE tool_name = ? AND error_type = ? AND resolved = 0 "
+            "ORDER BY timestamp DESC LIMIT 1",
+            ("t", "e"),
+        ).fetchall()
+        conn.close()
+        assert "idx_failures_pattern" in plan[0][3]
+
 
 # ── CognitionService Integration ─────────────────────────────────────
 
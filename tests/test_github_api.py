@@ -0,0 +1,178 @@
+"""Tests for the shared rate-limit-aware GitHub client."""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from github.GithubException import RateLimitExceededException
+
+from nebulus_swarm.integrations.github_api import (
+    GitHubPriority,
+    RequestBudget,
+    SharedGitHub,
+    TTLCache,
+    get_shared_github,
+    release_shared_github,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _reset_in(seconds: float) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+class TestRequestBudget:
+    """Tests for the priority token bucket."""
+
+    def test_burst_then_paced(self):
+        clock = FakeClock()
+        budget = RequestBudget(burst=2, clock=clock)
+        budget.update(remaining=3600, limit=5000, reset_at=_reset_in(3600))
+
+        assert budget.acquire(timeout=0)
+        assert budget.acquire(timeout=0)
+        assert budget.acquire(timeout=0) is False
+
+        clock.now += 1.0  # refill rate is ~1 request/second
+        assert budget.acquire(timeout=0)
+
+    def test_scan_respects_reserve(self):
+        budget = RequestBudget(burst=20)
+        budget.update(remaining=100, limit=5000, reset_at=_reset_in(3600))
+
+        assert budget.acquire(GitHubPriority.SCAN, timeout=0.1) is False
+        assert budget.acquire(GitHubPriority.WRITE, timeout=0)
+
+    def test_reserve_fails_fast_when_reset_is_beyond_timeout(self):
+        budget = RequestBudget(burst=20)
+        budget.update(remaining=50, limit=5000, reset_at=_reset_in(3600))
+
+        started = time.monotonic()
+        assert budget.acquire(GitHubPriority.SCAN, timeout=5) is False
+        assert time.monotonic() - started < 1
+
+    def test_local_accounting_decrements_quota(self):
+        budget = RequestBudget(burst=20)
+        budget.update(remaining=200, limit=5000, reset_at=_reset_in(3600))
+
+        budget.acquire(GitHubPriority.REVIEW, cost=3)
+
+        assert budget.quota.remaining == 197
+
+    def test_write_served_before_waiting_scan(self):
+        budget = RequestBudget(burst=1)
+        budget.update(remaining=4000, limit=5000, reset_at=_reset_in(3600))
+        budget.acquire(timeout=0)  # drain the bucket
+        order = []
+
+        def take(priority):
+            budget.acquire(priority, timeout=10)
+            order.append(priority)
+
+        scan = threading.Thread(target=take, args=(GitHubPriority.SCAN,))
+        scan.start()
+        time.sleep(0.05)
+        write = threading.Thread(target=take, args=(GitHubPriority.WRITE,))
+        write.start()
+        scan.join(timeout=10)
+        write.join(timeout=10)
+
+        assert order == [GitHubPriority.WRITE, GitHubPriority.SCAN]
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_hit_until_expiry(self):
+        clock = FakeClock()
+        cache = TTLCache(clock=clock)
+        loader = MagicMock(side_effect=[1, 2])
+
+        assert cache.get_or_load(("k",), loader, ttl=10) == 1
+        assert cache.get_or_load(("k",), loader, ttl=10) == 1
+        clock.now += 11
+        assert cache.get_or_load(("k",), loader, ttl=10) == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_invalidate_prefix(self):
+        cache = TTLCache()
+        cache.get_or_load(("issue", "o/r", 1), lambda: "a", ttl=60)
+        cache.get_or_load(("issue", "o/r", 2), lambda: "b", ttl=60)
+        cache.get_or_load(("repo", "o/r"), lambda: "c", ttl=60)
+
+        cache.invalidate("issue", "o/r", 1)
+
+        assert cache.get_or_load(("issue", "o/r", 1), lambda: "x", ttl=60) == "x"
+        assert cache.get_or_load(("issue", "o/r", 2), lambda: "x", ttl=60) == "b"
+
+
+class TestSharedGitHub:
+    """Tests for SharedGitHub and the per-token registry."""
+
+    def test_pooled_client_and_cached_repo(self):
+        factory = MagicMock()
+        shared = SharedGitHub("t", client_factory=factory, pool_size=7)
+
+        shared.get_repo("owner/repo")
+        shared.get_repo("owner/repo")
+
+        assert factory.call_args.kwargs["pool_size"] == 7
+        factory.return_value.get_repo.assert_called_once_with("owner/repo")
+
+    def test_record_headers_updates_quota(self):
+        shared = SharedGitHub("t", client_factory=MagicMock())
+        reset = int(time.time()) + 600
+
+        shared.record_headers(
+            {
+                "x-ratelimit-remaining": "42",
+                "x-ratelimit-limit": "5000",
+                "x-ratelimit-reset": str(reset),
+            }
+        )
+
+        assert shared.quota().remaining == 42
+
+    def test_quota_synced_from_requester(self):
+        factory = MagicMock()
+        factory.return_value.requester.rate_limiting = (321, 5000)
+        factory.return_value.requester.rate_limiting_resettime = int(time.time()) + 600
+        shared = SharedGitHub("t", client_factory=factory)
+
+        assert shared.quota().remaining == 321
+
+    def test_require_raises_instead_of_waiting_for_reset(self):
+        shared = SharedGitHub("t", client_factory=MagicMock())
+        shared.budget.update(remaining=10, limit=5000, reset_at=_reset_in(3600))
+
+        started = time.monotonic()
+        with pytest.raises(RateLimitExceededException):
+            shared.require(GitHubPriority.REVIEW)
+        assert time.monotonic() - started < 1
+        assert shared.acquire(GitHubPriority.WRITE)
+
+    def test_registry_shares_and_closes_on_last_release(self):
+        factory = MagicMock()
+
+        first = get_shared_github("tok", client_factory=factory)
+        second = get_shared_github("tok", client_factory=factory)
+        assert first is second
+        factory.assert_called_once()
+
+        release_shared_github(first)
+        factory.return_value.close.assert_not_called()
+        release_shared_github(second)
+        factory.return_value.close.assert_called_once()
+
+        assert get_shared_github("tok", client_factory=factory) is not first
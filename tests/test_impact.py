@@ -0,0 +1,200 @@
+"""Tests for test impact selection."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from nebulus_swarm.reviewer.checks import CheckRunner, CheckStatus
+from nebulus_swarm.reviewer.impact import (
+    ImpactAnalyzer,
+    ImpactSelection,
+    _context_test_file,
+    _module_index,
+    build_import_map,
+    is_risky_change,
+)
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    files = {
+        "pkg/__init__.py": "",
+        "pkg/a.py": "X = 1\n",
+        "pkg/b.py": "from .a import X\n",
+        "pkg/c.py": "Y = 2\n",
+        "tests/test_a.py": "from pkg.a import X\n",
+        "tests/test_b.py": "import pkg.b\n",
+        "tests/test_c.py": "from pkg import c\n",
+    }
+    for rel, content in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(
+        tmp_path,
+        "-c",
+        "user.name=t",
+        "-c",
+        "user.email=t@example.com",
+        "commit",
+        "-qm",
+        "init",
+    )
+    return tmp_path
+
+
+class TestImportMap:
+    """Tests for the static import graph."""
+
+    def test_transitive_and_relative_imports(self, repo):
+        impact = build_import_map(repo)
+
+        assert impact.affected_tests(["pkg/a.py"]) == [
+            "tests/test_a.py",
+            "tests/test_b.py",
+        ]
+        assert impact.affected_tests(["pkg/c.py"]) == ["tests/test_c.py"]
+
+    def test_package_init_affects_importers(self, repo):
+        impact = build_import_map(repo)
+
+        assert len(impact.affected_tests(["pkg/__init__.py"])) == 3
+
+
+class TestImpactAnalyzer:
+    """Tests for ImpactAnalyzer.select."""
+
+    def test_selects_affected_tests(self, repo):
+        selection = ImpactAnalyzer(repo).select(["pkg/b.py"])
+
+        assert selection.full_suite is False
+        assert selection.tests == ["tests/test_b.py"]
+
+    def test_changed_test_always_selected(self, repo):
+        (repo / "tests" / "test_new.py").write_text("def test_x(): pass\n")
+
+        selection = ImpactAnalyzer(repo).select(["tests/test_new.py"])
+
+        assert selection.tests == ["tests/test_new.py"]
+
+    def test_risky_change_runs_full_suite(self, repo):
+        selection = ImpactAnalyzer(repo).select(["pkg/a.py", "tests/conftest.py"])
+
+        assert selection.full_suite is True
+        assert "conftest" in selection.reason
+
+    def test_deleted_module_runs_full_suite(self, repo):
+        (repo / "pkg" / "c.py").unlink()
+
+        selection = ImpactAnalyzer(repo).select(["pkg/c.py"])
+
+        assert selection.full_suite is True
+        assert "deleted or renamed: pkg/c.py" in selection.reason
+
+    def test_unmapped_file_runs_full_suite(self, repo):
+        (repo / "pkg" / "data.json").write_text("{}")
+
+        selection = ImpactAnalyzer(repo).select(["pkg/b.py", "pkg/data.json"])
+
+        assert selection.full_suite is True
+        assert "not in impact map: pkg/data.json" in selection.reason
+
+    def test_changed_files_list_rename_source(self, repo):
+        _git(repo, "mv", "pkg/c.py", "pkg/c2.py")
+
+        changed = ImpactAnalyzer(repo).changed_files("HEAD")
+
+        assert changed == ["pkg/c.py", "pkg/c2.py"]
+
+    def test_map_cached_per_commit(self, repo):
+        ImpactAnalyzer(repo).select(["pkg/a.py"])
+        assert list((repo / ".git" / "nebulus-impact").glob("imports-*.json"))
+
+        with patch("nebulus_swarm.reviewer.impact.build_import_map") as build:
+            ImpactAnalyzer(repo).select(["pkg/a.py"])
+
+        build.assert_not_called()
+
+    def test_changed_files_include_untracked(self, repo):
+        (repo / "pkg" / "a.py").write_text("X = 3\n")
+        (repo / "pkg" / "d.py").write_text("")
+
+        changed = ImpactAnalyzer(repo).changed_files("HEAD")
+
+        assert changed == ["pkg/a.py", "pkg/d.py"]
+
+
+class TestHelpers:
+    """Tests for module helpers."""
+
+    def test_risky_changes(self):
+        assert is_risky_change("pyproject.toml")
+        assert is_risky_change("requirements-dev.txt")
+        assert is_risky_change("tests/fixtures/data.json")
+        assert not is_risky_change("docs/readme.md")
+        assert not is_risky_change("pkg/a.py")
+
+    def test_coverage_context_maps_to_test_file(self):
+        index = _module_index(["tests/test_a.py"])
+
+        assert _context_test_file("test_a.TestX.test_y", index) == "tests/test_a.py"
+        assert _context_test_file("tests.test_a.test_z", index) == "tests/test_a.py"
+        assert _context_test_file("other.thing", index) is None
+
+
+class TestCheckPytestImpact:
+    """Tests for CheckRunner.check_pytest with impact selection."""
+
+    def test_runs_only_selected_tests(self):
+        completed = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="3 passed in 0.1s", stderr=""
+        )
+        selection = ImpactSelection(tests=["tests/test_a.py"])
+        runner = CheckRunner("/fake/repo")
+        with (
+            patch.object(ImpactAnalyzer, "__init__", return_value=None),
+            patch.object(ImpactAnalyzer, "select", return_value=selection),
+            patch.object(CheckRunner, "_run", return_value=completed) as run,
+        ):
+            result = runner.check_pytest(["pkg/a.py"])
+
+        assert run.call_args.args[1][-1] == "tests/test_a.py"
+        assert result.status == CheckStatus.PASSED
+        assert "1 affected test files" in result.message
+
+    def test_empty_selection_runs_full_suite(self):
+        completed = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="9 passed in 0.1s", stderr=""
+        )
+        runner = CheckRunner("/fake/repo")
+        with (
+            patch.object(ImpactAnalyzer, "__init__", return_value=None),
+            patch.object(ImpactAnalyzer, "select", return_value=ImpactSelection()),
+            patch.object(CheckRunner, "_run", return_value=completed) as run,
+        ):
+            result = runner.check_pytest(["docs/readme.md"])
+
+        assert run.call_args.args[1][-1] == "-q"
+        assert result.status == CheckStatus.PASSED
+
+    def test_renamed_from_reaches_selection_only(self):
+        runner = CheckRunner("/fake/repo")
+        with (
+            patch.object(CheckRunner, "check_pytest") as pytest_check,
+            patch.object(CheckRunner, "check_ruff") as ruff_check,
+            patch.object(CheckRunner, "check_complexity"),
+            patch.object(CheckRunner, "check_file_sizes"),
+            patch.object(CheckRunner, "check_skill_changes"),
+        ):
+            runner.run_all_checks(["pkg/c2.py"], renamed_from=["pkg/c.py"])
+
+        pytest_check.assert_called_once_with(["pkg/c2.py", "pkg/c.py"])
+        ruff_check.assert_called_once_with(["pkg/c2.py"])
@@ -0,0 +1,78 @@
+"""Tests for deferred imports of optional dependencies."""
+
+import copy
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from nebulus_swarm.lazy_import import LazyImport, lazy_import
+
+
+class TestLazyImport:
+    """Tests for the LazyImport proxy."""
+
+    def test_module_is_imported_on_first_attribute(self):
+        sys.modules.pop("colorsys", None)
+        proxy = lazy_import("colorsys")
+
+        assert not proxy.loaded
+        assert "colorsys" not in sys.modules
+        assert proxy.rgb_to_hsv(1, 0, 0) == (0.0, 1.0, 1.0)
+        assert proxy.loaded
+        assert "colorsys" in sys.modules
+
+    def test_attribute_proxy_is_callable(self):
+        proxy = lazy_import("collections", "OrderedDict")
+
+        assert proxy(a=1) == {"a": 1}
+        assert proxy.resolve() is __import__("collections").OrderedDict
+
+    def test_missing_dependency_raises_on_use(self):
+        proxy = lazy_import("nebulus_no_such_module")
+
+        with pytest.raises(ImportError):
+            proxy.anything
+
+    def test_private_lookups_do_not_import(self):
+        proxy = LazyImport("nebulus_no_such_module")
+
+        copy.copy(proxy)
+        assert not hasattr(proxy, "__wrapped__")
+        assert not proxy.loaded
+        assert "deferred" in repr(proxy)
+
+
+class TestDeferredServices:
+    """Services that bind optional dependencies lazily."""
+
+    def test_docker_service_binding_is_patchable(self):
+        import os
+
+        from nebulus_atom.services.docker_service import DockerService
+
+        with (
+            patch("nebulus_atom.services.docker_service.docker") as mock_docker,
+            patch.dict(os.environ, {"SANDBOX_MODE": "true"}),
+        ):
+            service = DockerService()
+
+        assert service.client is mock_docker.from_env.return_value
+
+    def test_managers_construct_services_on_first_use(self):
+        from nebulus_atom.services.failure_memory_service import (
+            FailureMemoryServiceManager,
+        )
+        from nebulus_atom.services.telemetry_service import TelemetryServiceManager
+
+        failure_manager = FailureMemoryServiceManager()
+        telemetry_manager = TelemetryServiceManager()
+        assert failure_manager.service is None
+        assert telemetry_manager.service is None
+
+        with patch(
+            "nebulus_atom.services.failure_memory_service.FailureMemoryService"
+        ) as mock_cls:
+            assert failure_manager.get_service() is mock_cls.return_value
+            assert failure_manager.get_service() is mock_cls.return_value
+        mock_cls.assert_called_once_with()
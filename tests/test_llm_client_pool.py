@@ -1,14 +1,14 @@
 """Tests for LLM client integration with connection pool."""
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 # Skip if openai not available
 pytest.importorskip("openai")
 
-from nebulus_swarm.minion.agent.llm_client import LLMClient, LLMConfig
-from nebulus_swarm.overlord.llm_pool import LLMPool, PoolConfig
+from nebulus_swarm.minion.agent.llm_client import AsyncLLMClient, LLMClient, LLMConfig
+from nebulus_swarm.overlord.llm_pool import AsyncLLMPool, LLMPool, PoolConfig
 
 
 @pytest.fixture
@@ -44,6 +44,7 @@ def mock_pool(pool_config):
     pool.release = Mock()
     pool.record_error = Mock()
     pool.record_retry = Mock()
+    pool.record_success = Mock()
     pool.client = MagicMock()  # Mock OpenAI client
     return pool
 
@@ -58,6 +59,7 @@ def test_standalone_mode_no_pool(llm_config):
             base_url=llm_config.base_url,
             api_key=llm_config.api_key,
             timeout=llm_config.timeout,
+            max_retries=0,
         )
 
         # Should not have pool
@@ -241,3 +243,176 @@ def test_chat_with_tools_uses_pool(llm_config, mock_pool):
     assert response.has_tool_calls
     assert len(response.tool_calls) == 1
     assert response.tool_calls[0]["name"] == "test_tool"
+
+
+def test_pool_records_latency_on_success(llm_config, mock_pool):
+    """Test that successful chats report latency to the pool."""
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = "ok"
+    mock_response.choices[0].message.tool_calls = None
+    mock_response.choices[0].finish_reason = "stop"
+    mock_response.usage = None
+    mock_pool.client.chat.completions.create = Mock(return_value=mock_response)
+
+    client = LLMClient(llm_config, pool=mock_pool)
+    client.chat([{"role": "user", "content": "test"}])
+
+    mock_pool.record_success.assert_called_once()
+    assert mock_pool.record_success.call_args[0][0] >= 0
+
+
+def test_pool_error_passes_exception(llm_config, mock_pool):
+    """Test that the raised exception is handed to record_error."""
+    error = TimeoutError("slow backend")
+    mock_pool.client.chat.completions.create = Mock(side_effect=error)
+    llm_config.max_retries = 0
+
+    client = LLMClient(llm_config, pool=mock_pool)
+    with pytest.raises(TimeoutError):
+        client.chat([{"role": "user", "content": "test"}])
+
+    mock_pool.record_error.assert_called_once_with(error)
+
+
+def test_priority_passed_to_pool(llm_config, mock_pool):
+    """Test that the client's priority lane is used on acquire."""
+    from nebulus_swarm.overlord.llm_pool import Priority
+
+    mock_pool.acquire.return_value = False
+    client = LLMClient(llm_config, pool=mock_pool, priority=Priority.BACKGROUND)
+
+    with pytest.raises(RuntimeError):
+        client.chat([{"role": "user", "content": "test"}])
+
+    mock_pool.acquire.assert_called_once_with(Priority.BACKGROUND)
+
+
+@pytest.fixture
+def mock_async_pool(pool_config):
+    """Create a mock async pool for testing."""
+    pool = Mock(spec=AsyncLLMPool)
+    pool.config = pool_config
+    pool.acquire = AsyncMock(return_value=True)
+    pool.release = Mock()
+    pool.record_error = Mock()
+    pool.record_success = Mock()
+    pool.client = MagicMock()
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_pool(llm_config, mock_async_pool):
+    """Test that AsyncLLMClient acquires, awaits the call and releases."""
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = "Async response"
+    mock_response.choices[0].message.tool_calls = None
+    mock_response.choices[0].finish_reason = "stop"
+    mock_response.usage = None
+    mock_async_pool.client.chat.completions.create = AsyncMock(
+        return_value=mock_response
+    )
+
+    client = AsyncLLMClient(llm_config, pool=mock_async_pool)
+    result = await client.simple_chat("test prompt")
+
+    assert result == "Async response"
+    mock_async_pool.acquire.assert_awaited_once()
+    mock_async_pool.release.assert_called_once()
+    mock_async_pool.record_success.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_client_acquire_timeout_raises(llm_config, mock_async_pool):
+    """Test that AsyncLLMClient raises when the pool times out."""
+    mock_async_pool.acquire.return_value = False
+
+    client = AsyncLLMClient(llm_config, pool=mock_async_pool)
+    with pytest.raises(RuntimeError, match="LLM pool: timed out waiting for slot"):
+        await client.chat([{"role": "user", "content": "test"}])
+
+    mock_async_pool.release.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_client_records_error(llm_config, mock_async_pool):
+    """Test that errors are reported and the slot released."""
+    error = TimeoutError("slow")
+    mock_async_pool.client.chat.completions.create = AsyncMock(side_effect=error)
+    llm_config.max_retries = 0
+
+    client = AsyncLLMClient(llm_config, pool=mock_async_pool)
+    with pytest.raises(TimeoutError):
+        await client.chat([{"role": "user", "content": "test"}])
+
+    mock_async_pool.record_error.assert_called_once_with(error)
+    mock_async_pool.release.assert_called_once()
+
+
+def _ok_response():
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = "ok"
+    response.choices[0].message.tool_calls = None
+    response.choices[0].finish_reason = "stop"
+    response.usage = None
+    return response
+
+
+def test_transient_error_is_retried(llm_config, mock_pool):
+    """Test that a transient failure is retried with backoff."""
+    mock_pool.client.chat.completions.create = Mock(
+        side_effect=[TimeoutError("slow"), _ok_response()]
+    )
+
+    client = LLMClient(llm_config, pool=mock_pool)
+    with patch("nebulus_swarm.minion.agent.llm_client.time.sleep") as mock_sleep:
+        response = client.chat([{"role": "user", "content": "test"}])
+
+    assert response.content == "ok"
+    mock_sleep.assert_called_once()
+    mock_pool.record_retry.assert_called_once()
+    # The slot is released between attempts
+    assert mock_pool.acquire.call_count == 2
+    assert mock_pool.release.call_count == 2
+
+
+def test_retries_exhausted_raises(llm_config, mock_pool):
+    """Test that the last transient error surfaces after max_retries."""
+    mock_pool.client.chat.completions.create = Mock(side_effect=TimeoutError("slow"))
+
+    client = LLMClient(llm_config, pool=mock_pool)
+    with patch("nebulus_swarm.minion.agent.llm_client.time.sleep"):
+        with pytest.raises(TimeoutError):
+            client.chat([{"role": "user", "content": "test"}])
+
+    assert mock_pool.client.chat.completions.create.call_count == 3
+    assert mock_pool.record_retry.call_count == 2
+
+
+def test_non_transient_error_not_retried(llm_config, mock_pool):
+    """Test that client errors fail fast."""
+    mock_pool.client.chat.completions.create = Mock(side_effect=ValueError("bad"))
+
+    client = LLMClient(llm_config, pool=mock_pool)
+    with pytest.raises(ValueError):
+        client.chat([{"role": "user", "content": "test"}])
+
+    mock_pool.record_retry.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_transient_error_is_retried(llm_config, mock_async_pool):
+    """Test that AsyncLLMClient retries transient failures."""
+    mock_async_pool.client.chat.completions.create = AsyncMock(
+        side_effect=[ConnectionError("reset"), _ok_response()]
+    )
+    mock_async_pool.record_retry = Mock()
+
+    client = AsyncLLMClient(llm_config, pool=mock_async_pool)
+    with patch("nebulus_swarm.minion.agent.llm_client.asyncio.sleep", new=AsyncMock()):
+        response = await client.chat([{"role": "user", "content": "test"}])
+
+    assert response.content == "ok"
+    mock_async_pool.record_retry.assert_called_once()
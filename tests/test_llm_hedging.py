@@ -0,0 +1,186 @@
+"""Tests for hedged LLM requests across router endpoints."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("openai")
+
+from nebulus_swarm.minion.agent.llm_client import LLMResponse  # noqa: E402
+from nebulus_swarm.overlord.llm_hedging import (  # noqa: E402
+    MIN_SAMPLES,
+    HedgedLLMClient,
+    LatencyTracker,
+)
+from nebulus_swarm.overlord.model_router import ModelRouter  # noqa: E402
+from nebulus_swarm.overlord.registry import OverlordConfig  # noqa: E402
+
+
+def _router() -> ModelRouter:
+    config = OverlordConfig(
+        models={
+            "tabby": {
+                "endpoint": "http://tabby:5000/v1",
+                "model": "qwen",
+                "tier": "local",
+            },
+            "vllm": {
+                "endpoint": "http://vllm:8000/v1",
+                "model": "qwen",
+                "tier": "local",
+            },
+        }
+    )
+    return ModelRouter(config)
+
+
+class FakeClient:
+    """Async client stub with a fixed delay and optional failure."""
+
+    def __init__(self, name: str, delay: float, error: Exception = None):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.cancelled = False
+
+    async def chat(self, messages, tools=None):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return LLMResponse(content=self.name, tool_calls=[], finish_reason="stop")
+
+
+def _hedged(clients: dict, delay: float = 0.05) -> HedgedLLMClient:
+    return HedgedLLMClient(
+        _router(),
+        tier="local",
+        default_delay=delay,
+        client_factory=lambda ep: clients[ep.name],
+    )
+
+
+class TestLatencyTracker:
+    """Tests for the rolling latency window."""
+
+    def test_no_percentile_without_samples(self):
+        tracker = LatencyTracker()
+        tracker.record("a", 1.0)
+        assert tracker.percentile("a", 0.95) is None
+        assert tracker.percentile("missing", 0.95) is None
+
+    def test_p95(self):
+        tracker = LatencyTracker()
+        for i in range(1, 101):
+            tracker.record("a", float(i))
+        assert tracker.percentile("a", 0.95) == 95.0
+
+    def test_window_is_bounded(self):
+        tracker = LatencyTracker(window=MIN_SAMPLES)
+        for _ in range(MIN_SAMPLES):
+            tracker.record("a", 100.0)
+        for _ in range(MIN_SAMPLES):
+            tracker.record("a", 1.0)
+        assert tracker.percentile("a", 0.95) == 1.0
+
+
+class TestHedgedLLMClient:
+    """Tests for HedgedLLMClient.chat."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_not_hedged(self):
+        clients = {"tabby": FakeClient("tabby", 0), "vllm": FakeClient("vllm", 0)}
+        hedged = _hedged(clients)
+
+        response = await hedged.chat([{"role": "user", "content": "hi"}])
+
+        assert response.content == "tabby"
+        assert hedged.stats.hedged == 0
+
+    @pytest.mark.asyncio
+    async def test_stuck_primary_is_hedged_and_cancelled(self):
+        clients = {
+            "tabby": FakeClient("tabby", 10.0),
+            "vllm": FakeClient("vllm", 0.01),
+        }
+        hedged = _hedged(clients)
+
+        response = await hedged.chat([{"role": "user", "content": "hi"}])
+        await asyncio.sleep(0)
+
+        assert response.content == "vllm"
+        assert hedged.stats.hedged == 1
+        assert hedged.stats.hedge_wins == 1
+        assert clients["tabby"].cancelled is True
+
+    @pytest.mark.asyncio
+    async def test_cancelled_primary_latency_is_recorded(self):
+        clients = {
+            "tabby": FakeClient("tabby", 10.0),
+            "vllm": FakeClient("vllm", 0.01),
+        }
+        hedged = _hedged(clients)
+
+        await hedged.chat([{"role": "user", "content": "hi"}])
+        await asyncio.sleep(0)
+
+        samples = hedged.latencies._samples["tabby"]
+        assert len(samples) == 1
+        assert samples[0] >= 0.05  # at least the hedge delay
+
+    @pytest.mark.asyncio
+    async def test_primary_can_still_win_after_hedge(self):
+        clients = {
+            "tabby": FakeClient("tabby", 0.08),
+            "vllm": FakeClient("vllm", 10.0),
+        }
+        hedged = _hedged(clients, delay=0.02)
+
+        response = await hedged.chat([{"role": "user", "content": "hi"}])
+        await asyncio.sleep(0)
+
+        assert response.content == "tabby"
+        assert hedged.stats.hedged == 1
+        assert hedged.stats.hedge_wins == 0
+        assert clients["vllm"].cancelled is True
+
+    @pytest.mark.asyncio
+    async def test_primary_failure_falls_over(self):
+        clients = {
+            "tabby": FakeClient("tabby", 0, error=ConnectionError("down")),
+            "vllm": FakeClient("vllm", 0),
+        }
+        hedged = _hedged(clients, delay=5.0)
+
+        response = await hedged.chat([{"role": "user", "content": "hi"}])
+
+        assert response.content == "vllm"
+
+    @pytest.mark.asyncio
+    async def test_both_fail_raises(self):
+        clients = {
+            "tabby": FakeClient("tabby", 0, error=ConnectionError("down")),
+            "vllm": FakeClient("vllm", 0, error=ValueError("bad")),
+        }
+        hedged = _hedged(clients)
+
+        with pytest.raises(ValueError):
+            await hedged.chat([{"role": "user", "content": "hi"}])
+
+    @pytest.mark.asyncio
+    async def test_no_endpoints_raises(self):
+        hedged = HedgedLLMClient(ModelRouter(OverlordConfig()), tier="local")
+        with pytest.raises(RuntimeError, match="No healthy endpoints"):
+            await hedged.chat([{"role": "user", "content": "hi"}])
+
+    def test_hedge_delay_uses_p95(self):
+        hedged = _hedged({}, delay=7.0)
+        endpoint = hedged.router.endpoints["tabby"]
+        assert hedged.hedge_delay(endpoint) == 7.0
+
+        for _ in range(MIN_SAMPLES):
+            hedged.latencies.record("tabby", 2.0)
+        assert hedged.hedge_delay(endpoint) == 2.0
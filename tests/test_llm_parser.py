@@ -2,21 +2,28 @@
 
 import asyncio
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 pytest.importorskip("openai")
 
 from nebulus_swarm.config import OverlordLLMConfig
-from nebulus_swarm.overlord.command_parser import Command, CommandType
+from nebulus_swarm.overlord.command_parser import (
+    Command,
+    CommandParser,
+    CommandType,
+)
 from nebulus_swarm.overlord.llm_parser import (
     ContextStore,
     ConversationEntry,
     LLMCommandParser,
     LLMParseResult,
+    ParseCache,
     ParseResult,
+    normalize_message,
 )
+from nebulus_swarm.overlord.llm_pool import AsyncLLMPool, PoolConfig, Priority
 
 
 class TestConversationEntry:
@@ -245,10 +252,11 @@ class TestLLMCommandParser:
 
         # Mock the LLM client to raise an error
         with patch.object(parser, "_llm_parse", side_effect=Exception("LLM error")):
-            result = await parser.parse("status", "channel1", "user1")
+            result = await parser.parse("can you show status", "channel1", "user1")
 
         assert result.success is True
         assert result.command.type == CommandType.STATUS
+        assert result.source == "regex"
 
     @pytest.mark.asyncio
     async def test_parse_regex_fallback_on_timeout(self):
@@ -262,7 +270,7 @@ class TestLLMCommandParser:
             return LLMParseResult()
 
         with patch.object(parser, "_llm_parse", side_effect=slow_parse):
-            result = await parser.parse("queue", "channel1", "user1")
+            result = await parser.parse("whats in the queue today", "channel1", "user1")
 
         assert result.success is True
         assert result.command.type == CommandType.QUEUE
@@ -335,7 +343,7 @@ class TestLLMCommandParser:
             )
 
         with patch.object(parser, "_llm_parse", side_effect=mock_parse):
-            result = await parser.parse("status", "channel1", "user1")
+            result = await parser.parse("can you show status", "channel1", "user1")
 
         # Should fall back to regex which will parse "status"
         assert result.success is True
@@ -444,3 +452,169 @@ class TestLLMCommandParser:
         assert len(history) == 2
         assert history[0].message == "status"
         assert history[1].message == "work on #42"
+
+    @pytest.mark.asyncio
+    async def test_llm_parse_uses_interactive_pool_lane(self):
+        """Test parse requests go through a shared pool's interactive lane."""
+        pool = AsyncLLMPool(PoolConfig(base_url="http://llm", model="m"))
+        response = MagicMock()
+        response.choices[0].message.content = '{"command": "STATUS"}'
+        pool._client = MagicMock()
+        pool._client.chat.completions.create = AsyncMock(return_value=response)
+        parser = LLMCommandParser(
+            OverlordLLMConfig(enabled=True), "owner/repo", pool=pool
+        )
+
+        with patch.object(pool, "acquire", wraps=pool.acquire) as acquire:
+            result = await parser._llm_parse("how are things", "channel1")
+        await parser.close()
+
+        assert result.command == "STATUS"
+        acquire.assert_called_once_with(Priority.INTERACTIVE)
+        assert pool.stats.total_requests == 1
+        assert pool.stats.active == 0
+        pool._client.close.assert_not_called()
+
+
+class TestParseCache:
+    """Tests for ParseCache."""
+
+    def test_put_and_get(self):
+        cache = ParseCache(max_entries=4)
+        result = LLMParseResult(command="STATUS", confidence=0.9)
+        cache.put(("what's up", "-"), result)
+
+        assert cache.get(("what's up", "-")) is result
+        assert cache.get(("what's up", "work:o/r:42:None:None")) is None
+
+    def test_lru_eviction(self):
+        cache = ParseCache(max_entries=2)
+        cache.put(("a", "-"), LLMParseResult())
+        cache.put(("b", "-"), LLMParseResult())
+        cache.get(("a", "-"))
+        cache.put(("c", "-"), LLMParseResult())
+
+        assert cache.get(("b", "-")) is None
+        assert cache.get(("a", "-")) is not None
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self):
+        cache = ParseCache(ttl_seconds=10)
+        with patch("nebulus_swarm.overlord.llm_parser.time.monotonic") as clock:
+            clock.return_value = 100.0
+            cache.put(("a", "-"), LLMParseResult())
+            clock.return_value = 111.0
+            assert cache.get(("a", "-")) is None
+
+    def test_zero_size_disables(self):
+        cache = ParseCache(max_entries=0)
+        cache.put(("a", "-"), LLMParseResult())
+        assert len(cache) == 0
+
+    def test_normalize_message(self):
+        assert normalize_message("  What's   UP?? ") == "what's up"
+
+
+class TestParseShortCircuit:
+    """Tests for the rule pre-classifier and response cache."""
+
+    @pytest.mark.asyncio
+    async def test_exact_command_skips_llm(self):
+        parser = LLMCommandParser(OverlordLLMConfig(enabled=True), "owner/repo")
+
+        with patch.object(parser, "_llm_parse") as llm:
+            result = await parser.parse("Work on #42", "channel1", "user1")
+
+        llm.assert_not_called()
+        assert result.source == "rule"
+        assert result.command.type == CommandType.WORK
+        assert result.command.issue_number == 42
+        assert parser.stats.rule_hits == 1
+
+    @pytest.mark.parametrize("text", ["kill it", "kill that", "kill all"])
+    def test_context_dependent_phrases_not_exact(self, text):
+        parser = CommandParser("owner/repo")
+
+        assert parser.parse_exact(text) is None
+
+    @pytest.mark.parametrize(
+        "text, minion_id, issue",
+        [
+            ("kill minion-1a2b3c4d", "1a2b3c4d", None),
+            ("kill minion deadbeef", "deadbeef", None),
+            ("stop #42", None, 42),
+        ],
+    )
+    def test_identifier_arguments_are_exact(self, text, minion_id, issue):
+        command = CommandParser("owner/repo").parse_exact(text)
+
+        assert command.type == CommandType.STOP
+        assert command.minion_id == minion_id
+        assert command.issue_number == issue
+
+    @pytest.mark.asyncio
+    async def test_kill_it_goes_to_llm(self):
+        parser = LLMCommandParser(OverlordLLMConfig(enabled=True), "owner/repo")
+
+        async def mock_parse(*args):
+            return LLMParseResult(command="STOP", issue_number=42, confidence=0.9)
+
+        with patch.object(parser, "_llm_parse", side_effect=mock_parse) as llm:
+            result = await parser.parse("kill it", "channel1", "user1")
+
+        llm.assert_called_once()
+        assert result.source == "llm"
+        assert result.command.issue_number == 42
+
+    @pytest.mark.asyncio
+    async def test_repeated_message_served_from_cache(self):
+        parser = LLMCommandParser(OverlordLLMConfig(enabled=True), "owner/repo")
+        calls = []
+
+        async def mock_parse(*args):
+            calls.append(args)
+            return LLMParseResult(command="STATUS", confidence=0.9)
+
+        with patch.object(parser, "_llm_parse", side_effect=mock_parse):
+            first = await parser.parse("what's up", "channel1", "user1")
+            second = await parser.parse("What's up?", "channel1", "user1")
+
+        assert len(calls) == 1
+        assert first.source == "llm"
+        assert second.source == "cache"
+        assert second.command.type == CommandType.STATUS
+        assert parser.stats.cache_hits == 1
+        assert parser.stats.cache_misses == 1
+        assert parser.stats.hit_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_on_context(self):
+        parser = LLMCommandParser(OverlordLLMConfig(enabled=True), "owner/repo")
+        calls = []
+
+        async def mock_parse(*args):
+            calls.append(args)
+            return LLMParseResult(command="STOP", issue_number=42, confidence=0.9)
+
+        with patch.object(parser, "_llm_parse", side_effect=mock_parse):
+            await parser.parse("stop that", "channel1", "user1")
+            await parser.parse("work on #43", "channel1", "user1")
+            await parser.parse("stop that", "channel1", "user1")
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_low_confidence_not_cached(self):
+        parser = LLMCommandParser(OverlordLLMConfig(enabled=True), "owner/repo")
+
+        async def mock_parse(*args):
+            return LLMParseResult(
+                command="UNKNOWN", confidence=0.2, clarification="Which one?"
+            )
+
+        with patch.object(parser, "_llm_parse", side_effect=mock_parse) as llm:
+            await parser.parse("take a look", "channel1", "user1")
+            await parser.parse("take a look", "channel1", "user1")
+
+        assert llm.call_count == 2
+        assert len(parser.cache) == 0
@@ -1,5 +1,6 @@
 """Tests for LLM connection pool."""
 
+import asyncio
 import threading
 import time
 
@@ -8,10 +9,17 @@ import pytest
 # Skip tests if openai is not installed
 openai = pytest.importorskip("openai")
 
+from nebulus_swarm.integrations.health_client import HealthStatus  # noqa: E402
 from nebulus_swarm.overlord.llm_pool import (  # noqa: E402
     DEFAULT_CONCURRENCY,
+    AdaptiveLimiter,
+    AsyncLLMPool,
     LLMPool,
     PoolConfig,
+    Priority,
+    backoff_delay,
+    is_overload_error,
+    is_transient_error,
 )
 
 
@@ -205,6 +213,8 @@ def test_pool_has_client():
     assert isinstance(client, openai.OpenAI)
     # OpenAI may add trailing slash
     assert "localhost:5000/v1" in str(client.base_url)
+    # Retries are owned by the callers so overloads reach the limiter
+    assert client.max_retries == 0
 
 
 def test_concurrent_access():
@@ -251,3 +261,280 @@ def test_concurrent_access():
     final_stats = pool.stats
     assert final_stats.active == 0
     assert final_stats.total_requests == 5
+
+
+def _health(thermal: int = 0, vram: float = 50.0) -> HealthStatus:
+    return HealthStatus(
+        thermal_level=thermal,
+        vram_percent=vram,
+        cpu_percent=50.0,
+        inference_latency_ms=100.0,
+    )
+
+
+def test_pool_config_adaptive_from_env(monkeypatch):
+    """Test adaptive settings are read from the environment."""
+    monkeypatch.setenv("ATOM_LLM_ADAPTIVE", "true")
+    monkeypatch.setenv("ATOM_LLM_MIN_CONCURRENCY", "2")
+    monkeypatch.setenv("ATOM_LLM_CONCURRENCY", "16")
+
+    config = PoolConfig.from_env()
+
+    assert config.adaptive is True
+    assert config.min_concurrency == 2
+    assert config.max_concurrency == 16
+
+
+def test_limiter_grows_while_latency_stable():
+    """Test additive increase when latency stays flat."""
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=8, initial=2)
+
+    for _ in range(20):
+        limiter.on_success(1.0)
+
+    assert limiter.limit > 2
+    assert limiter.limit <= 8
+
+
+def test_limiter_halves_on_overload():
+    """Test multiplicative decrease on 429/503/timeouts."""
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=8, initial=8)
+
+    limiter.on_overload()
+    assert limiter.limit == 4
+    limiter.on_overload()
+    limiter.on_overload()
+    limiter.on_overload()
+    assert limiter.limit == 1
+
+
+def test_limiter_shrinks_on_latency_spike():
+    """Test that a latency spike stops growth and shrinks the limit."""
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=8, initial=8)
+    for _ in range(10):
+        limiter.on_success(1.0)
+
+    for _ in range(10):
+        limiter.on_success(10.0)
+
+    assert limiter.limit < 8
+
+
+def test_limiter_fixed_when_not_adaptive():
+    """Test that a non-adaptive limiter keeps its limit."""
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=4, adaptive=False)
+
+    limiter.on_overload()
+    for _ in range(10):
+        limiter.on_success(1.0)
+
+    assert limiter.limit == 4
+
+
+def test_limiter_health_caps():
+    """Test that thermal and VRAM pressure cap the effective limit."""
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=8)
+
+    limiter.apply_health(_health(thermal=2))
+    assert limiter.limit == 4
+    limiter.apply_health(_health(vram=95.0))
+    assert limiter.limit == 4
+    limiter.apply_health(_health(thermal=3))
+    assert limiter.limit == 1
+    limiter.apply_health(_health())
+    assert limiter.limit == 8
+
+
+def test_is_overload_error():
+    """Test detection of overload signals from client exceptions."""
+
+    class RateLimitError(Exception):
+        status_code = 429
+
+    class Unavailable(Exception):
+        status_code = 503
+
+    class BadRequest(Exception):
+        status_code = 400
+
+    assert is_overload_error(RateLimitError())
+    assert is_overload_error(Unavailable())
+    assert is_overload_error(TimeoutError())
+    assert not is_overload_error(BadRequest())
+    assert not is_overload_error(ValueError())
+    assert not is_overload_error(None)
+
+
+def test_record_error_backs_off_on_overload():
+    """Test that an overload error shrinks an adaptive pool."""
+    config = PoolConfig(
+        base_url="http://localhost:5000/v1",
+        model="test-model",
+        max_concurrency=8,
+        adaptive=True,
+    )
+    pool = LLMPool(config)
+    assert pool.limit == 2
+
+    pool.record_error(TimeoutError())
+
+    stats = pool.stats
+    assert stats.limit == 1
+    assert stats.total_errors == 1
+    assert stats.total_overloads == 1
+
+
+def test_interactive_preempts_background():
+    """Test that interactive waiters are served before background ones."""
+    config = PoolConfig(
+        base_url="http://localhost:5000/v1",
+        model="test-model",
+        max_concurrency=1,
+        acquire_timeout=5.0,
+    )
+    pool = LLMPool(config)
+    pool.acquire()
+
+    order = []
+
+    def waiter(priority: Priority, name: str):
+        if pool.acquire(priority):
+            order.append(name)
+            pool.release()
+
+    background = threading.Thread(target=waiter, args=(Priority.BACKGROUND, "bg"))
+    background.start()
+    while pool.stats.waiting < 1:
+        time.sleep(0.01)
+    interactive = threading.Thread(
+        target=waiter, args=(Priority.INTERACTIVE, "interactive")
+    )
+    interactive.start()
+    while pool.stats.waiting < 2:
+        time.sleep(0.01)
+
+    pool.release()
+    background.join()
+    interactive.join()
+
+    assert order == ["interactive", "bg"]
+
+
+def test_health_client_caps_pool():
+    """Test that the pool polls the health client before granting slots."""
+    from unittest.mock import MagicMock
+
+    health = MagicMock()
+    health.enabled = True
+    health.get_status.return_value = _health(thermal=3)
+    config = PoolConfig(
+        base_url="http://localhost:5000/v1",
+        model="test-model",
+        max_concurrency=4,
+        acquire_timeout=0.1,
+    )
+    pool = LLMPool(config, health_client=health)
+
+    assert pool.acquire() is True
+    assert pool.acquire() is False
+    assert pool.stats.limit == 1
+    health.get_status.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_pool_acquire_and_release():
+    """Test acquiring and releasing a slot from the async pool."""
+    config = PoolConfig(base_url="http://localhost:5000/v1", model="test-model")
+    pool = AsyncLLMPool(config)
+
+    assert await pool.acquire() is True
+    assert pool.stats.active == 1
+    pool.release()
+
+    stats = pool.stats
+    assert stats.active == 0
+    assert stats.total_requests == 1
+    assert isinstance(pool.client, openai.AsyncOpenAI)
+    assert pool.client.max_retries == 0
+
+
+@pytest.mark.asyncio
+async def test_async_pool_times_out():
+    """Test that the async pool gives up after acquire_timeout."""
+    config = PoolConfig(
+        base_url="http://localhost:5000/v1",
+        model="test-model",
+        max_concurrency=1,
+        acquire_timeout=0.05,
+    )
+    pool = AsyncLLMPool(config)
+
+    assert await pool.acquire() is True
+    assert await pool.acquire() is False
+    assert pool.stats.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_async_pool_priority_order():
+    """Test that interactive waiters go before background ones."""
+    config = PoolConfig(
+        base_url="http://localhost:5000/v1",
+        model="test-model",
+        max_concurrency=1,
+        acquire_timeout=5.0,
+    )
+    pool = AsyncLLMPool(config)
+    await pool.acquire()
+    order = []
+
+    async def waiter(priority: Priority, name: str):
+        if await pool.acquire(priority):
+            order.append(name)
+            pool.release()
+
+    background = asyncio.create_task(waiter(Priority.BACKGROUND, "bg"))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(waiter(Priority.INTERACTIVE, "interactive"))
+    await asyncio.sleep(0)
+
+    pool.release()
+    await asyncio.gather(background, interactive)
+
+    assert order == ["interactive", "bg"]
+
+
+@pytest.mark.asyncio
+async def test_async_pool_cancelled_waiter_leaves_queue():
+    """Test that a cancelled waiter does not block the queue."""
+    config = PoolConfig(
+        base_url="http://localhost:5000/v1",
+        model="test-model",
+        max_concurrency=1,
+        acquire_timeout=5.0,
+    )
+    pool = AsyncLLMPool(config)
+    await pool.acquire()
+
+    task = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    pool.release()
+    assert pool.stats.waiting == 0
+    assert await pool.acquire() is True
+
+
+def test_is_transient_error():
+    """Test that dropped connections and overloads are retryable."""
+    assert is_transient_error(ConnectionError())
+    assert is_transient_error(TimeoutError())
+    assert not is_transient_error(ValueError())
+
+
+def test_backoff_delay_bounds():
+    """Test that jittered backoff stays within the exponential envelope."""
+    for attempt in range(10):
+        delay = backoff_delay(attempt)
+        assert 0 <= delay <= min(30.0, 2**attempt)
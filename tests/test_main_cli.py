@@ -91,7 +91,7 @@ class TestStartAgentFunction:
 class TestDocsCommand:
     """Tests for the 'docs' CLI command."""
 
-    @patch("nebulus_atom.main.DocService")
+    @patch("nebulus_atom.services.doc_service.DocService")
     def test_docs_list_shows_files(self, mock_svc_cls):
         mock_svc = MagicMock()
         mock_svc.list_docs.return_value = ["README.md", "ARCHITECTURE.md"]
@@ -102,7 +102,7 @@ class TestDocsCommand:
         assert "README.md" in result.output
         assert "ARCHITECTURE.md" in result.output
 
-    @patch("nebulus_atom.main.DocService")
+    @patch("nebulus_atom.services.doc_service.DocService")
     def test_docs_list_empty(self, mock_svc_cls):
         mock_svc = MagicMock()
         mock_svc.list_docs.return_value = []
@@ -112,7 +112,7 @@ class TestDocsCommand:
         assert result.exit_code == 0
         assert "No documentation files found" in result.output
 
-    @patch("nebulus_atom.main.DocService")
+    @patch("nebulus_atom.services.doc_service.DocService")
     def test_docs_read_valid_file(self, mock_svc_cls):
         mock_svc = MagicMock()
         mock_svc.read_doc.return_value = "# Hello\nThis is a doc."
@@ -122,7 +122,7 @@ class TestDocsCommand:
         assert result.exit_code == 0
         mock_svc.read_doc.assert_called_once_with("hello.md")
 
-    @patch("nebulus_atom.main.DocService")
+    @patch("nebulus_atom.services.doc_service.DocService")
     def test_docs_read_missing_filename(self, mock_svc_cls):
         mock_svc = MagicMock()
         mock_svc_cls.return_value = mock_svc
@@ -131,7 +131,7 @@ class TestDocsCommand:
         assert result.exit_code == 0
         assert "Filename required" in result.output
 
-    @patch("nebulus_atom.main.DocService")
+    @patch("nebulus_atom.services.doc_service.DocService")
     def test_docs_read_file_not_found(self, mock_svc_cls):
         mock_svc = MagicMock()
         mock_svc.read_doc.return_value = None
@@ -141,7 +141,7 @@ class TestDocsCommand:
         assert result.exit_code == 0
         assert "Could not read" in result.output
 
-    @patch("nebulus_atom.main.DocService")
+    @patch("nebulus_atom.services.doc_service.DocService")
     def test_docs_unknown_action(self, mock_svc_cls):
         mock_svc = MagicMock()
         mock_svc_cls.return_value = mock_svc
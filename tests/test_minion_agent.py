@@ -1,7 +1,9 @@
 """Tests for Minion agent components."""
 
+import asyncio
 import tempfile
 from pathlib import Path
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -12,6 +14,7 @@ from nebulus_swarm.minion.agent import (
     AgentStatus,
     LLMConfig,
     LLMResponse,
+    MinionAgent,
     ToolExecutor,
     ToolResult,
 )
@@ -325,6 +328,100 @@ class TestMinionAgent:
         assert error_result.success is False
         assert error_result.error == "File not found"
 
+    def _make_agent(self, tool_executor=None):
+        config = LLMConfig(base_url="http://localhost:5000/v1", model="test-model")
+        return MinionAgent(
+            llm_config=config,
+            system_prompt="Test prompt",
+            tools=[],
+            tool_executor=tool_executor
+            or (
+                lambda name, args: ToolResult(
+                    tool_call_id="1", name=name, success=True, output="ok"
+                )
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_async_completes(self):
+        """Test that run_async executes tools and finishes on task_complete."""
+        executed = []
+
+        def executor(name, args):
+            executed.append(name)
+            return ToolResult(tool_call_id="x", name=name, success=True, output="ok")
+
+        agent = self._make_agent(executor)
+        agent._async_llm = AsyncMock()
+        agent._async_llm.chat = AsyncMock(
+            side_effect=[
+                LLMResponse(
+                    content="",
+                    tool_calls=[{"id": "1", "name": "read_file", "arguments": "{}"}],
+                    finish_reason="tool_calls",
+                ),
+                LLMResponse(
+                    content="",
+                    tool_calls=[
+                        {
+                            "id": "2",
+                            "name": "task_complete",
+                            "arguments": '{"summary": "All done"}',
+                        }
+                    ],
+                    finish_reason="tool_calls",
+                ),
+            ]
+        )
+
+        result = await agent.run_async()
+
+        assert result.status == AgentStatus.COMPLETED
+        assert result.summary == "All done"
+        assert result.turns_used == 2
+        assert executed == ["read_file", "task_complete"]
+
+    @pytest.mark.asyncio
+    async def test_run_async_does_not_block_event_loop(self):
+        """Test that other tasks keep running during a slow completion."""
+        agent = self._make_agent()
+        ticks = 0
+
+        async def slow_chat(messages, tools):
+            await asyncio.sleep(0.1)
+            return LLMResponse(
+                content="",
+                tool_calls=[{"id": "1", "name": "task_complete", "arguments": "{}"}],
+                finish_reason="tool_calls",
+            )
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        agent._async_llm = AsyncMock()
+        agent._async_llm.chat = slow_chat
+        beat = asyncio.create_task(heartbeat())
+        result = await agent.run_async()
+        beat.cancel()
+
+        assert result.status == AgentStatus.COMPLETED
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_run_async_error_threshold(self):
+        """Test that repeated LLM failures stop run_async with ERROR."""
+        agent = self._make_agent()
+        agent._async_llm = AsyncMock()
+        agent._async_llm.chat = AsyncMock(side_effect=RuntimeError("bad reply"))
+
+        result = await agent.run_async()
+
+        assert result.status == AgentStatus.ERROR
+        assert result.turns_used == MinionAgent.DEFAULT_ERROR_THRESHOLD
+
 
 class TestSkillSchema:
     """Tests for skill schema."""
@@ -550,6 +647,80 @@ triggers:
             assert len(matches) == 1
             assert matches[0].name == "bugfix"
 
+    def test_find_matching_skills_by_label_and_file(self):
+        """Labels and file patterns match through the trigger index."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir)
+            skills_dir = workspace / ".nebulus" / "skills"
+            skills_dir.mkdir(parents=True)
+            (skills_dir / "docs.yaml").write_text(
+                """
+name: docs
+description: Docs
+instructions: Write docs
+triggers:
+  labels: [documentation]
+  file_patterns: ["*.md"]
+"""
+            )
+
+            loader = SkillLoader(workspace)
+
+            assert loader.find_matching_skills("x", "", ["documentation"]) != []
+            assert loader.find_matching_skills("x", "", [], ["README.md"]) != []
+            assert loader.find_matching_skills("x", "", [], ["main.py"]) == []
+
+
+class TestTriggerIndex:
+    """Tests for the compiled skill trigger index."""
+
+    def _skill(self, name, **triggers):
+        return Skill(
+            name=name,
+            description="",
+            instructions="",
+            triggers=SkillTriggers(**triggers),
+        )
+
+    def test_overlapping_keywords(self):
+        """Keywords that are prefixes or overlaps of each other all match."""
+        from nebulus_swarm.minion.skills import TriggerIndex
+
+        index = TriggerIndex(
+            [
+                self._skill("short", keywords=["test"]),
+                self._skill("long", keywords=["Testing"]),
+                self._skill("overlap", keywords=["ingest"]),
+                self._skill("other", keywords=["deploy"]),
+            ]
+        )
+
+        assert index.match("Testingest", "", []) == {"short", "long", "overlap"}
+        assert index.match("", "", []) == set()
+
+    def test_agrees_with_matches_issue(self):
+        """The index matches exactly the skills Skill.matches_issue accepts."""
+        from nebulus_swarm.minion.skills import TriggerIndex
+
+        skills = [
+            self._skill("a", keywords=["bug", "bugfix"], labels=["bug"]),
+            self._skill("b", keywords=["fix the"], file_patterns=["src/*.py"]),
+            self._skill("c", keywords=[""]),
+            self._skill("d", file_patterns=["*.md", "docs/*"]),
+        ]
+        index = TriggerIndex(skills)
+        issues = [
+            ("Fix", "the BUG", [], None),
+            ("Nothing", "here", ["bug"], ["README.md"]),
+            ("x", "y", [], ["src/app.py", "lib.c"]),
+        ]
+
+        for title, body, labels, files in issues:
+            expected = {
+                s.name for s in skills if s.matches_issue(title, body, labels, files)
+            }
+            assert index.match(title, body, labels, files) == expected
+
 
 class TestResponseParser:
     """Tests for response parser (JSON fallback for local LLMs)."""
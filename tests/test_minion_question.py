@@ -280,11 +280,13 @@ class TestMinionQuestionLoop:
             patch("nebulus_swarm.minion.main.ToolExecutor"),
         ):
             mock_agent = MockAgent.return_value
-            mock_agent.run.return_value = AgentResult(
-                status=AgentStatus.COMPLETED,
-                summary="Done",
-                files_changed=["src/main.py"],
-                turns_used=5,
+            mock_agent.run_async = AsyncMock(
+                return_value=AgentResult(
+                    status=AgentStatus.COMPLETED,
+                    summary="Done",
+                    files_changed=["src/main.py"],
+                    turns_used=5,
+                )
             )
 
             result = await minion._do_work()
@@ -320,7 +322,7 @@ class TestMinionQuestionLoop:
             patch("nebulus_swarm.minion.main.ToolExecutor"),
         ):
             mock_agent = MockAgent.return_value
-            mock_agent.run.side_effect = mock_run
+            mock_agent.run_async = AsyncMock(side_effect=mock_run)
             mock_agent.inject_message = MagicMock()
 
             minion.reporter.poll_answer = AsyncMock(return_value="Focus on /api/users")
@@ -363,7 +365,7 @@ class TestMinionQuestionLoop:
             patch("nebulus_swarm.minion.main.ToolExecutor"),
         ):
             mock_agent = MockAgent.return_value
-            mock_agent.run.side_effect = mock_run
+            mock_agent.run_async = AsyncMock(side_effect=mock_run)
             mock_agent.inject_message = MagicMock()
 
             # poll_answer returns None (timeout)
@@ -404,7 +406,7 @@ class TestMinionQuestionLoop:
             patch("nebulus_swarm.minion.main.ToolExecutor"),
         ):
             mock_agent = MockAgent.return_value
-            mock_agent.run.side_effect = mock_run
+            mock_agent.run_async = AsyncMock(side_effect=mock_run)
             mock_agent.inject_message = MagicMock()
 
             minion.reporter.poll_answer = AsyncMock(return_value=None)
@@ -428,11 +430,13 @@ class TestMinionQuestionLoop:
             patch("nebulus_swarm.minion.main.ToolExecutor"),
         ):
             mock_agent = MockAgent.return_value
-            mock_agent.run.return_value = AgentResult(
-                status=AgentStatus.BLOCKED,
-                summary="Cannot proceed",
-                blocker_type="missing_dependency",
-                turns_used=2,
+            mock_agent.run_async = AsyncMock(
+                return_value=AgentResult(
+                    status=AgentStatus.BLOCKED,
+                    summary="Cannot proceed",
+                    blocker_type="missing_dependency",
+                    turns_used=2,
+                )
             )
 
             result = await minion._do_work()
@@ -450,11 +454,13 @@ class TestMinionQuestionLoop:
             patch("nebulus_swarm.minion.main.ToolExecutor"),
         ):
             mock_agent = MockAgent.return_value
-            mock_agent.run.return_value = AgentResult(
-                status=AgentStatus.ERROR,
-                summary="Too many errors",
-                error="Connection refused",
-                turns_used=1,
+            mock_agent.run_async = AsyncMock(
+                return_value=AgentResult(
+                    status=AgentStatus.ERROR,
+                    summary="Too many errors",
+                    error="Connection refused",
+                    turns_used=1,
+                )
             )
 
             result = await minion._do_work()
@@ -490,7 +496,7 @@ class TestMinionQuestionLoop:
             patch("nebulus_swarm.minion.main.ToolExecutor"),
         ):
             mock_agent = MockAgent.return_value
-            mock_agent.run.side_effect = mock_run
+            mock_agent.run_async = AsyncMock(side_effect=mock_run)
             mock_agent.inject_message = MagicMock()
 
             # reporter.question returns False (failed to send)
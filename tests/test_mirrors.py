@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import subprocess
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 
-from nebulus_swarm.overlord.mirrors import MirrorManager
-from nebulus_swarm.overlord.registry import OverlordConfig, ProjectConfig
+from nebulus_swarm.overlord.mirrors import SYNC_STATS_FILE, MirrorManager
+from nebulus_swarm.overlord.registry import (
+    MirrorConfig,
+    OverlordConfig,
+    ProjectConfig,
+    load_config,
+)
 
 
 def _make_config(tmp_path: Path) -> OverlordConfig:
@@ -198,6 +205,143 @@ class TestSyncAll:
         assert results["nebulus-core"] is True
         assert results["nebulus-prime"] is True
 
+    def test_syncs_in_parallel(self, tmp_path: Path) -> None:
+        config = _make_config(tmp_path)
+        mirror_root = tmp_path / "mirrors"
+        (mirror_root / "nebulus-core.git").mkdir(parents=True)
+        (mirror_root / "nebulus-prime.git").mkdir(parents=True)
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_run(*args: object, **kwargs: object) -> MagicMock:
+            # Both fetches must be in flight at once to pass the barrier
+            barrier.wait()
+            return MagicMock(returncode=0)
+
+        mgr = MirrorManager(config, mirror_root=mirror_root)
+        with patch("subprocess.run", side_effect=fake_run):
+            results = mgr.sync_all()
+
+        assert results == {"nebulus-core": True, "nebulus-prime": True}
+
+    def test_concurrency_one_runs_serially(self, tmp_path: Path) -> None:
+        config = _make_config(tmp_path)
+        config.mirrors = MirrorConfig(concurrency=1)
+        mirror_root = tmp_path / "mirrors"
+        (mirror_root / "nebulus-core.git").mkdir(parents=True)
+        (mirror_root / "nebulus-prime.git").mkdir(parents=True)
+
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_run(*args: object, **kwargs: object) -> MagicMock:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return MagicMock(returncode=0)
+
+        mgr = MirrorManager(config, mirror_root=mirror_root)
+        with patch("subprocess.run", side_effect=fake_run):
+            mgr.sync_all()
+
+        assert peak == 1
+
+    @patch("subprocess.run")
+    def test_detailed_results_record_failures(
+        self, mock_run: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_run.side_effect = subprocess.TimeoutExpired(cmd="git", timeout=5)
+        config = _make_config(tmp_path)
+        config.mirrors = MirrorConfig(timeout_seconds=5)
+        mirror_root = tmp_path / "mirrors"
+        (mirror_root / "nebulus-core.git").mkdir(parents=True)
+
+        mgr = MirrorManager(config, mirror_root=mirror_root)
+        results = mgr.sync_all_detailed()
+
+        assert results["nebulus-core"].success is False
+        assert "timed out" in results["nebulus-core"].error
+        assert results["nebulus-prime"].error == "not initialized"
+        assert mock_run.call_args.kwargs["timeout"] == 5
+
+
+# --- sync options and metrics ---
+
+
+class TestSyncOptions:
+    """Tests for fetch flags and recorded sync metrics."""
+
+    @patch("subprocess.run")
+    def test_no_prune(self, mock_run: MagicMock, tmp_path: Path) -> None:
+        mock_run.return_value = MagicMock(returncode=0)
+        config = _make_config(tmp_path)
+        config.mirrors = MirrorConfig(prune=False)
+        mirror_root = tmp_path / "mirrors"
+        (mirror_root / "nebulus-core.git").mkdir(parents=True)
+
+        MirrorManager(config, mirror_root=mirror_root).sync_project("nebulus-core")
+
+        assert "--prune" not in mock_run.call_args[0][0]
+
+    @patch("subprocess.run")
+    def test_filter_blobs_on_clone(self, mock_run: MagicMock, tmp_path: Path) -> None:
+        mock_run.return_value = MagicMock(returncode=0)
+        config = _make_config(tmp_path)
+        config.mirrors = MirrorConfig(filter_blobs=True)
+
+        MirrorManager(config, mirror_root=tmp_path / "mirrors").init_project(
+            "nebulus-core"
+        )
+
+        assert "--filter=blob:none" in mock_run.call_args[0][0]
+
+    @patch("subprocess.run")
+    def test_filter_blobs_only_on_partial_clones(
+        self, mock_run: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0)
+        config = _make_config(tmp_path)
+        config.mirrors = MirrorConfig(filter_blobs=True)
+        mirror_root = tmp_path / "mirrors"
+        full = mirror_root / "nebulus-core.git"
+        full.mkdir(parents=True)
+        (full / "config").write_text("[core]\n\tbare = true\n")
+        partial = mirror_root / "nebulus-prime.git"
+        partial.mkdir(parents=True)
+        (partial / "config").write_text(
+            '[remote "origin"]\n\tpromisor = true\n\tpartialclonefilter = blob:none\n'
+        )
+
+        mgr = MirrorManager(config, mirror_root=mirror_root)
+        mgr.sync_project("nebulus-core")
+        assert "--filter=blob:none" not in mock_run.call_args[0][0]
+        mgr.sync_project("nebulus-prime")
+        assert "--filter=blob:none" in mock_run.call_args[0][0]
+
+    def test_records_bytes_fetched(self, tmp_path: Path) -> None:
+        config = _make_config(tmp_path)
+        mirror_root = tmp_path / "mirrors"
+        mirror_path = mirror_root / "nebulus-core.git"
+        (mirror_path / "objects" / "pack").mkdir(parents=True)
+
+        def fake_fetch(*args: object, **kwargs: object) -> MagicMock:
+            (mirror_path / "objects" / "pack" / "pack-1.pack").write_bytes(b"x" * 2048)
+            return MagicMock(returncode=0)
+
+        mgr = MirrorManager(config, mirror_root=mirror_root)
+        with patch("subprocess.run", side_effect=fake_fetch):
+            result = mgr.sync_project_detailed("nebulus-core")
+
+        assert result.success is True
+        assert result.bytes_fetched == 2048
+        assert result.duration_seconds >= 0
+        assert (mirror_path / SYNC_STATS_FILE).exists()
+
 
 # --- status ---
 
@@ -249,3 +393,60 @@ class TestMirrorStatus:
         assert states["nebulus-core"].exists is True
         assert states["nebulus-core"].last_fetch is not None
         assert isinstance(states["nebulus-core"].last_fetch, datetime)
+
+    @patch("subprocess.run")
+    def test_status_reports_last_sync_metrics(
+        self, mock_run: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout="abc HEAD\n")
+        config = _make_config(tmp_path)
+        mirror_root = tmp_path / "mirrors"
+        (mirror_root / "nebulus-core.git").mkdir(parents=True)
+
+        mgr = MirrorManager(config, mirror_root=mirror_root)
+        mgr.sync_project("nebulus-core")
+        states = mgr.status()
+
+        assert states["nebulus-core"].last_sync_ok is True
+        assert states["nebulus-core"].last_sync_seconds is not None
+        assert states["nebulus-core"].last_bytes_fetched == 0
+        assert list(states) == ["nebulus-core", "nebulus-prime"]
+
+    def test_status_without_sync_metrics(self, tmp_path: Path) -> None:
+        config = _make_config(tmp_path)
+        mirror_root = tmp_path / "mirrors"
+        (mirror_root / "nebulus-core.git").mkdir(parents=True)
+
+        with patch("subprocess.run", return_value=MagicMock(returncode=1)):
+            states = MirrorManager(config, mirror_root=mirror_root).status()
+
+        assert states["nebulus-core"].last_sync_ok is None
+        assert states["nebulus-core"].last_bytes_fetched is None
+
+
+# --- config ---
+
+
+class TestMirrorConfig:
+    """Tests for the mirrors section of overlord.yml."""
+
+    def test_defaults(self, tmp_path: Path) -> None:
+        config = _make_config(tmp_path)
+        assert config.mirrors.concurrency == 4
+        assert config.mirrors.prune is True
+        assert config.mirrors.filter_blobs is False
+
+    def test_parses_mirrors_section(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "overlord.yml"
+        config_file.write_text(
+            "mirrors:\n"
+            "  concurrency: 8\n"
+            "  timeout_seconds: 300\n"
+            "  prune: false\n"
+            "  filter_blobs: true\n"
+        )
+        mirrors = load_config(config_file).mirrors
+        assert mirrors.concurrency == 8
+        assert mirrors.timeout_seconds == 300
+        assert mirrors.prune is False
+        assert mirrors.filter_blobs is True
@@ -360,6 +360,33 @@ class TestGracefulShutdown:
         # Should return quickly
         await asyncio.wait_for(daemon._cleanup_loop(), timeout=2)
 
+    @pytest.mark.asyncio
+    async def test_compaction_loop_stops_on_shutdown(self, tmp_path: Path) -> None:
+        daemon = _make_daemon(tmp_path)
+        daemon._shutdown_event.set()
+        await asyncio.wait_for(daemon._memory_compaction_loop(), timeout=2)
+
+
+class TestMemoryCompaction:
+    """Tests for background memory compaction."""
+
+    @pytest.mark.asyncio
+    async def test_compacts_until_drained(self, tmp_path: Path) -> None:
+        daemon = _make_daemon(tmp_path)
+        daemon.memory = MagicMock()
+        daemon.memory.compact.side_effect = [500, 12, 0]
+
+        assert await daemon.compact_memory() == 512
+        assert daemon.memory.compact.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_compaction_errors_are_logged(self, tmp_path: Path) -> None:
+        daemon = _make_daemon(tmp_path)
+        daemon.memory = MagicMock()
+        daemon.memory.compact.side_effect = RuntimeError("locked")
+
+        assert await daemon.compact_memory() == 0
+
 
 # --- CLI Integration Tests ---
 
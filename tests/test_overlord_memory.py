@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -156,3 +157,133 @@ class TestEcosystemWideMemory:
         results = memory.search("develop-main")
         assert len(results) == 1
         assert results[0].project is None
+
+
+class TestFullTextSearch:
+    """Tests for FTS5-backed search ranking and sync."""
+
+    def test_prefix_match(self, memory: OverlordMemory) -> None:
+        memory.remember("release", "Core released to staging")
+        assert len(memory.search("releas")) == 1
+
+    def test_all_words_required_by_default(self, memory: OverlordMemory) -> None:
+        memory.remember("failure", "pytest timeout on prime")
+        memory.remember("failure", "ruff timeout on core")
+        results = memory.search("timeout prime")
+        assert [r.content for r in results] == ["pytest timeout on prime"]
+
+    def test_match_any_ranks_by_relevance(self, memory: OverlordMemory) -> None:
+        memory.remember("pattern", "deploy finished")
+        memory.remember("pattern", "deploy failed: flaky deploy step on prime")
+        memory.remember("pattern", "unrelated note")
+        results = memory.search("deploy prime", match_any=True)
+        assert [r.content for r in results] == [
+            "deploy failed: flaky deploy step on prime",
+            "deploy finished",
+        ]
+
+    def test_recency_breaks_relevance_ties(self, memory: OverlordMemory) -> None:
+        old_id = memory.remember("pattern", "cache warmed")
+        memory.remember("pattern", "cache warmed")
+        old = (datetime.now(timezone.utc) - timedelta(days=90)).isoformat()
+        with memory._get_connection() as conn:
+            conn.execute("UPDATE memory SET timestamp = ? WHERE id = ?", (old, old_id))
+        results = memory.search("cache")
+        assert results[-1].id == old_id
+
+    def test_query_syntax_is_not_interpreted(self, memory: OverlordMemory) -> None:
+        memory.remember("decision", "use NOT NULL columns")
+        assert len(memory.search('NOT "NULL')) == 1
+        assert memory.search("?!") == []
+
+    def test_forget_removes_from_index(self, memory: OverlordMemory) -> None:
+        entry_id = memory.remember("pattern", "ephemeral token")
+        memory.forget(entry_id)
+        assert memory.search("ephemeral") == []
+
+    def test_existing_rows_indexed_on_upgrade(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "legacy.db"
+        OverlordMemory(db_path=db_path).remember("pattern", "legacy entry")
+        with OverlordMemory(db_path=db_path)._get_connection() as conn:
+            conn.execute("DROP TABLE memory_fts")
+        assert len(OverlordMemory(db_path=db_path).search("legacy")) == 1
+
+
+def _insert_aged(
+    memory: OverlordMemory,
+    content: str,
+    days: float,
+    project: str | None = None,
+    category: str = "pattern",
+) -> None:
+    timestamp = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+    with memory._get_connection() as conn:
+        conn.execute(
+            "INSERT INTO memory (id, timestamp, category, project, content, metadata) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (str(uuid.uuid4()), timestamp, category, project, content, "{}"),
+        )
+
+
+class TestCompaction:
+    """Tests for compacting raw entries into rollups."""
+
+    def test_repeats_fold_into_one_rollup(self, memory: OverlordMemory) -> None:
+        for days in (30, 20, 10):
+            _insert_aged(memory, "Scheduled task 'scan' executed", days)
+        memory.remember("pattern", "Scheduled task 'scan' executed")
+
+        assert memory.compact() == 3
+
+        results = memory.search("scan")
+        assert len(results) == 2
+        rollup = next(r for r in results if "rollup" in r.metadata)
+        assert rollup.metadata["rollup"]["count"] == 3
+        assert rollup.metadata["rollup"]["first_seen"] < rollup.timestamp
+        assert memory.compact() == 0
+
+    def test_compaction_is_incremental(self, memory: OverlordMemory) -> None:
+        for days in range(10, 15):
+            _insert_aged(memory, "sweep done", days)
+
+        assert memory.compact(batch_size=2) == 2
+        assert memory.compact(batch_size=10) == 3
+
+        (rollup,) = memory.search("sweep")
+        assert rollup.metadata["rollup"]["count"] == 5
+
+    def test_rollups_keyed_by_project_and_category(
+        self, memory: OverlordMemory
+    ) -> None:
+        _insert_aged(memory, "deploy ok", 10, project="core")
+        _insert_aged(memory, "deploy ok", 10, project="prime")
+        _insert_aged(memory, "Deploy  OK", 11, project="core")
+        memory.compact()
+
+        history = memory.get_project_history("core")
+        assert len(history) == 1
+        assert history[0].metadata["rollup"]["count"] == 2
+        # The latest occurrence is the exemplar
+        assert history[0].content == "deploy ok"
+
+    def test_history_spans_both_tiers(self, memory: OverlordMemory) -> None:
+        _insert_aged(memory, "old release", 10, project="core")
+        memory.compact()
+        memory.remember("release", "new release", project="core")
+
+        history = memory.get_project_history("core")
+        assert [e.content for e in history] == ["new release", "old release"]
+        assert [e.content for e in memory.get_recent()] == [
+            "new release",
+            "old release",
+        ]
+
+    def test_prune_and_forget_cover_rollups(self, memory: OverlordMemory) -> None:
+        _insert_aged(memory, "ancient", 100)
+        _insert_aged(memory, "aging", 10)
+        memory.compact()
+
+        assert memory.prune(older_than_days=30) == 1
+        (rollup,) = memory.search("aging")
+        assert memory.forget(rollup.id) is True
+        assert memory.search("aging") == []
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
 from nebulus_swarm.overlord.model_router import (
     ModelEndpoint,
@@ -156,6 +157,34 @@ class TestInferTier:
         assert router._infer_tier("unknown-task", "medium") == "cloud-fast"
 
 
+class TestGetHealthyEndpoints:
+    """Tests for ModelRouter.get_healthy_endpoints."""
+
+    def test_lists_tier_endpoints_in_order(self, tmp_path: Path) -> None:
+        config = _make_config(
+            tmp_path,
+            vllm={"endpoint": "http://vllm:8000", "model": "q", "tier": "local"},
+            tabby={"endpoint": "http://tabby:5000", "model": "q", "tier": "local"},
+            sonnet={"endpoint": "https://api", "model": "s", "tier": "cloud-fast"},
+        )
+        router = ModelRouter(config)
+        names = [ep.name for ep in router.get_healthy_endpoints("local")]
+        assert names == ["tabby", "vllm"]
+
+    def test_skips_unhealthy(self, tmp_path: Path) -> None:
+        config = _make_config(
+            tmp_path,
+            tabby={"endpoint": "http://tabby:5000", "model": "q", "tier": "local"},
+            vllm={"endpoint": "http://vllm:8000", "model": "q", "tier": "local"},
+        )
+        router = ModelRouter(config)
+        with patch.object(
+            router, "_is_healthy", side_effect=lambda ep: ep.name != "tabby"
+        ):
+            names = [ep.name for ep in router.get_healthy_endpoints("local")]
+        assert names == ["vllm"]
+
+
 class TestSelectModel:
     """Tests for ModelRouter.select_model."""
 
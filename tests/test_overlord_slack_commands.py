@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from nebulus_swarm.overlord.llm_pool import AsyncLLMPool, PoolConfig, Priority
 from nebulus_swarm.overlord.registry import OverlordConfig, ProjectConfig
 from nebulus_swarm.overlord.slack_commands import (
     KNOWN_COMMANDS,
@@ -508,6 +509,31 @@ class TestLLMFallback:
             assert result == "Here's what I think..."
             mock_client.chat.completions.create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_llm_fallback_uses_interactive_pool_lane(
+        self, tmp_path: Path
+    ) -> None:
+        """A shared pool serves the fallback from its interactive lane."""
+        pool = AsyncLLMPool(PoolConfig(base_url="http://llm", model="m"))
+        pool._client = AsyncMock()
+        pool._client.chat.completions.create = AsyncMock(
+            return_value=_mock_llm_response("Pooled answer")
+        )
+        router = SlackCommandRouter(_make_config(tmp_path), pool=pool)
+
+        with (
+            patch.object(
+                router, "_get_ecosystem", new_callable=AsyncMock, return_value=[]
+            ),
+            patch.object(router.memory, "search", return_value=[]),
+            patch.object(pool, "acquire", wraps=pool.acquire) as acquire,
+        ):
+            result = await router.handle("How is the ecosystem?", "U123", "C456")
+
+        assert result == "Pooled answer"
+        acquire.assert_called_once_with(Priority.INTERACTIVE)
+        assert pool.stats.total_requests == 1
+
     @pytest.mark.asyncio
     async def test_llm_disabled_returns_unknown_command(self, tmp_path: Path) -> None:
         """When LLM is disabled, unrecognized text returns 'Unknown command'."""
@@ -620,6 +646,29 @@ class TestLLMFallback:
             system_msg = messages[0]["content"]
             assert "Tests failing on prime" in system_msg
 
+    @pytest.mark.asyncio
+    async def test_memory_context_omits_match_any_when_unsupported(
+        self, tmp_path: Path
+    ) -> None:
+        """Stores without match_any (older nebulus-core) get a plain search."""
+        router = _make_router(tmp_path)
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=_mock_llm_response("Noted.")
+        )
+        router._llm_client = mock_client
+
+        with (
+            patch.object(
+                router, "_get_ecosystem", new_callable=AsyncMock, return_value=[]
+            ),
+            patch.object(router.memory, "search", return_value=[]) as mock_search,
+            patch("nebulus_swarm.overlord.slack_commands.SUPPORTS_MATCH_ANY", False),
+        ):
+            await router.handle("Any issues?", "U123", "C456")
+
+        mock_search.assert_called_once_with("Any issues?", limit=5)
+
     @pytest.mark.asyncio
     async def test_known_commands_use_pattern_matching(self, tmp_path: Path) -> None:
         """Known commands like 'status' bypass LLM entirely."""
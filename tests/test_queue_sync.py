@@ -177,6 +177,94 @@ class TestSyncGithubIssues:
         assert task.external_source == "github:jlwestsr/nebulus-core"
         assert task.external_id == "42"
 
+    @patch("nebulus_swarm.overlord.queue_sync.subprocess.run")
+    def test_closed_issues_reconciled(self, mock_run, queue: WorkQueue) -> None:
+        """Backlog tasks whose issue disappeared are failed."""
+        mock_run.return_value = _gh_output(
+            [
+                {"number": 1, "title": "Keep", "body": "", "labels": []},
+                {"number": 2, "title": "Close", "body": "", "labels": []},
+            ]
+        )
+        config = _make_config({"core": "jlwestsr/nebulus-core"})
+        sync_github_issues(queue, config)
+
+        mock_run.return_value = _gh_output(
+            [{"number": 1, "title": "Keep", "body": "", "labels": []}]
+        )
+        result = sync_github_issues(queue, config)
+
+        assert result.closed_count == 1
+        statuses = {t.external_id: t.status for t in queue.list_tasks()}
+        assert statuses == {"1": "backlog", "2": "failed"}
+
+    @patch("nebulus_swarm.overlord.queue_sync.subprocess.run")
+    def test_truncated_list_not_reconciled(self, mock_run, queue: WorkQueue) -> None:
+        """A project returning ISSUE_LIST_LIMIT issues may be truncated."""
+        mock_run.return_value = _gh_output(
+            [{"number": 1, "title": "Old", "body": "", "labels": []}]
+        )
+        config = _make_config({"core": "jlwestsr/nebulus-core"})
+        sync_github_issues(queue, config)
+
+        mock_run.return_value = _gh_output(
+            [
+                {"number": n, "title": "New", "body": "", "labels": []}
+                for n in range(2, 5)
+            ]
+        )
+        with patch("nebulus_swarm.overlord.queue_sync.ISSUE_LIST_LIMIT", 3):
+            result = sync_github_issues(queue, config)
+
+        assert result.closed_count == 0
+        statuses = {t.external_id: t.status for t in queue.list_tasks()}
+        assert statuses["1"] == "backlog"
+
+    @patch("nebulus_swarm.overlord.queue_sync.subprocess.run")
+    def test_failed_fetch_not_reconciled(self, mock_run, queue: WorkQueue) -> None:
+        """A project whose gh call failed keeps its tasks."""
+        mock_run.return_value = _gh_output(
+            [{"number": 1, "title": "Task", "body": "", "labels": []}]
+        )
+        config = _make_config({"core": "jlwestsr/nebulus-core"})
+        sync_github_issues(queue, config)
+
+        failing = MagicMock(returncode=1, stdout="", stderr="network down")
+        mock_run.return_value = failing
+        result = sync_github_issues(queue, config)
+
+        assert result.closed_count == 0
+        assert queue.list_tasks()[0].status == "backlog"
+
+    @patch("nebulus_swarm.overlord.queue_sync.subprocess.run")
+    def test_projects_fetched_concurrently(self, mock_run, queue: WorkQueue) -> None:
+        """Each project is fetched once and all issues land in the queue."""
+
+        def fake_run(cmd, **kwargs):
+            remote = cmd[cmd.index("-R") + 1]
+            number = 1 if remote.endswith("core") else 2
+            return _gh_output(
+                [{"number": number, "title": remote, "body": "", "labels": []}]
+            )
+
+        mock_run.side_effect = fake_run
+        config = _make_config(
+            {
+                "core": "jlwestsr/nebulus-core",
+                "edge": "jlwestsr/nebulus-edge",
+            }
+        )
+
+        result = sync_github_issues(queue, config, concurrency=2)
+
+        assert result.new_count == 2
+        assert mock_run.call_count == 2
+        projects = {t.project: t.title for t in queue.list_tasks()}
+        assert projects == {
+            "core": "jlwestsr/nebulus-core",
+            "edge": "jlwestsr/nebulus-edge",
+        }
+
 
 class TestLabelMapping:
     def test_critical(self) -> None:
@@ -6,6 +6,8 @@ Covers: checks.py, pr_reviewer.py, llm_review.py, workflow.py
 import json
 import subprocess
 import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -20,7 +22,12 @@ from nebulus_swarm.reviewer.checks import (
     ChecksReport,
     CheckStatus,
 )
-from nebulus_swarm.reviewer.llm_review import LLMReviewer, create_review_summary
+from nebulus_swarm.reviewer.llm_review import (
+    LLMReviewer,
+    create_review_summary,
+    merge_reviews,
+    split_diff,
+)
 from nebulus_swarm.reviewer.pr_reviewer import (
     FileChange,
     InlineComment,
@@ -146,7 +153,7 @@ class TestCheckRunnerPytest:
         completed = subprocess.CompletedProcess(
             args=[], returncode=0, stdout="42 passed in 1.0s", stderr=""
         )
-        with patch("subprocess.run", return_value=completed):
+        with patch.object(CheckRunner, "_run", return_value=completed):
             runner = CheckRunner("/fake/repo")
             result = runner.check_pytest()
         assert result.status == CheckStatus.PASSED
@@ -156,7 +163,7 @@ class TestCheckRunnerPytest:
         completed = subprocess.CompletedProcess(
             args=[], returncode=5, stdout="no tests ran", stderr=""
         )
-        with patch("subprocess.run", return_value=completed):
+        with patch.object(CheckRunner, "_run", return_value=completed):
             runner = CheckRunner("/fake/repo")
             result = runner.check_pytest()
         assert result.status == CheckStatus.SKIPPED
@@ -165,21 +172,23 @@ class TestCheckRunnerPytest:
         completed = subprocess.CompletedProcess(
             args=[], returncode=1, stdout="3 failed, 10 passed", stderr=""
         )
-        with patch("subprocess.run", return_value=completed):
+        with patch.object(CheckRunner, "_run", return_value=completed):
             runner = CheckRunner("/fake/repo")
             result = runner.check_pytest()
         assert result.status == CheckStatus.FAILED
         assert "3" in result.message
 
     def test_pytest_timeout(self):
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("cmd", 300)):
+        with patch.object(
+            CheckRunner, "_run", side_effect=subprocess.TimeoutExpired("cmd", 300)
+        ):
             runner = CheckRunner("/fake/repo")
             result = runner.check_pytest()
         assert result.status == CheckStatus.FAILED
         assert "timed out" in result.message
 
     def test_pytest_not_found(self):
-        with patch("subprocess.run", side_effect=FileNotFoundError):
+        with patch.object(CheckRunner, "_run", side_effect=FileNotFoundError):
             runner = CheckRunner("/fake/repo")
             result = runner.check_pytest()
         assert result.status == CheckStatus.SKIPPED
@@ -190,7 +199,7 @@ class TestCheckRunnerRuff:
         completed = subprocess.CompletedProcess(
             args=[], returncode=0, stdout="", stderr=""
         )
-        with patch("subprocess.run", return_value=completed):
+        with patch.object(CheckRunner, "_run", return_value=completed):
             runner = CheckRunner("/fake/repo")
             result = runner.check_ruff(["a.py"])
         assert result.status == CheckStatus.PASSED
@@ -202,7 +211,7 @@ class TestCheckRunnerRuff:
             stdout="a.py:1:1: E501 line too long\na.py:2:1: F401 unused",
             stderr="",
         )
-        with patch("subprocess.run", return_value=completed):
+        with patch.object(CheckRunner, "_run", return_value=completed):
             runner = CheckRunner("/fake/repo")
             result = runner.check_ruff(["a.py"])
         assert result.status == CheckStatus.WARNING
@@ -214,7 +223,7 @@ class TestCheckRunnerRuff:
         assert result.status == CheckStatus.SKIPPED
 
     def test_ruff_not_found(self):
-        with patch("subprocess.run", side_effect=FileNotFoundError):
+        with patch.object(CheckRunner, "_run", side_effect=FileNotFoundError):
             runner = CheckRunner("/fake/repo")
             result = runner.check_ruff(["a.py"])
         assert result.status == CheckStatus.SKIPPED
@@ -266,7 +275,7 @@ class TestCheckRunnerComplexity:
             stdout="Average complexity: A (2.50)",
             stderr="",
         )
-        with patch("subprocess.run", return_value=completed):
+        with patch.object(CheckRunner, "_run", return_value=completed):
             runner = CheckRunner("/fake/repo")
             result = runner.check_complexity(["a.py"])
         assert result.status == CheckStatus.PASSED
@@ -279,7 +288,7 @@ class TestCheckRunnerComplexity:
             stdout="Average complexity: C (15.00)",
             stderr="",
         )
-        with patch("subprocess.run", return_value=completed):
+        with patch.object(CheckRunner, "_run", return_value=completed):
             runner = CheckRunner("/fake/repo")
             result = runner.check_complexity(["a.py"])
         assert result.status == CheckStatus.WARNING
@@ -290,7 +299,7 @@ class TestCheckRunnerComplexity:
         assert result.status == CheckStatus.SKIPPED
 
     def test_radon_not_found(self):
-        with patch("subprocess.run", side_effect=FileNotFoundError):
+        with patch.object(CheckRunner, "_run", side_effect=FileNotFoundError):
             runner = CheckRunner("/fake/repo")
             result = runner.check_complexity(["a.py"])
         assert result.status == CheckStatus.SKIPPED
@@ -368,6 +377,116 @@ class TestCheckRunnerRunAll:
             mock_ruff.assert_called_once_with(["app.py"])
 
 
+class TestCheckRunnerParallel:
+    def _patch_all(self, runner, delay=0.0, **overrides):
+        def make(name):
+            def check(*args):
+                time.sleep(overrides.get(name, delay))
+                return CheckResult(name=name, status=CheckStatus.PASSED, message="ok")
+
+            return check
+
+        names = [
+            "check_pytest",
+            "check_ruff",
+            "check_security_patterns",
+            "check_complexity",
+            "check_file_sizes",
+            "check_skill_changes",
+        ]
+        return [patch.object(runner, n, side_effect=make(n)) for n in names]
+
+    def test_checks_run_concurrently(self):
+        runner = CheckRunner("/fake/repo")
+        patches = self._patch_all(runner, delay=0.3)
+        for p in patches:
+            p.start()
+        try:
+            report = runner.run_all_checks(["a.py"])
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert len(report.results) == 6
+        assert report.wall_time < 1.0
+        assert all(r.duration >= 0.25 for r in report.results)
+        assert report.results[0].name == "check_pytest"
+
+    def test_slow_check_times_out_without_blocking_others(self):
+        runner = CheckRunner("/fake/repo", timeouts={"complexity": 0.1})
+        patches = self._patch_all(runner, check_complexity=1.0)
+        for p in patches:
+            p.start()
+        try:
+            with patch("nebulus_swarm.reviewer.checks.TIMEOUT_GRACE", 0.0):
+                started = time.monotonic()
+                report = runner.run_all_checks(["a.py"])
+                elapsed = time.monotonic() - started
+        finally:
+            for p in patches:
+                p.stop()
+
+        complexity = report.results[3]
+        assert complexity.name == "Complexity"
+        assert complexity.status == CheckStatus.FAILED
+        assert "Timed out" in complexity.message
+        assert elapsed < 0.9
+
+    def test_abandoned_check_process_tree_is_killed(self):
+        runner = CheckRunner(tempfile.gettempdir())
+        outcome = {}
+
+        def run():
+            # The backgrounded sleep holds stdout open; communicate() only
+            # returns once the whole process group is gone
+            outcome["result"] = runner._run(
+                "complexity", ["sh", "-c", "sleep 30 & wait"], timeout=60
+            )
+
+        worker = threading.Thread(target=run)
+        worker.start()
+        deadline = time.monotonic() + 5
+        while not runner._procs.get("complexity") and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        runner._kill("complexity")
+        worker.join(timeout=5)
+
+        assert not worker.is_alive()
+        assert outcome["result"].returncode != 0
+        assert not runner._procs["complexity"]
+
+    def test_process_pool_never_forks(self):
+        from nebulus_swarm.reviewer.checks import POOL_START_METHOD
+
+        assert POOL_START_METHOD in ("forkserver", "spawn")
+
+    def test_summary_includes_timings(self):
+        report = ChecksReport(
+            results=[
+                CheckResult("lint", CheckStatus.PASSED, "ok", duration=1.25),
+            ],
+            wall_time=2.5,
+        )
+        summary = report.get_summary()
+        assert "(1.2s)" in summary or "(1.3s)" in summary
+        assert "in 2.5s" in summary
+
+    def test_security_scan_uses_process_pool_for_many_files(self):
+        with tempfile.TemporaryDirectory() as td:
+            files = []
+            for i in range(60):
+                name = f"m{i}.py"
+                Path(td, name).write_text(
+                    "x = 1\n" + ("y = eval(z)\n" if i == 7 else "")
+                )
+                files.append(name)
+            runner = CheckRunner(td)
+            result = runner.check_security_patterns(files)
+        assert result.status == CheckStatus.WARNING
+        assert result.file_issues == ["m7.py:2: Use of eval() is dangerous"]
+
+
 # ---------------------------------------------------------------------------
 # pr_reviewer.py — dataclasses
 # ---------------------------------------------------------------------------
@@ -529,6 +648,46 @@ class TestExtractLinkedIssue:
         assert self._extract("") is None
 
 
+class TestGetPRDetails:
+    def _reviewer(self):
+        factory = MagicMock()
+        with patch("nebulus_swarm.reviewer.pr_reviewer.Github", factory):
+            reviewer = PRReviewer("token-details")
+        return reviewer, factory.return_value
+
+    def _file(self, name):
+        f = MagicMock()
+        f.filename = name
+        f.status = "modified"
+        f.additions = 1
+        f.deletions = 0
+        f.patch = "+x"
+        return f
+
+    def test_file_pages_fetched_after_count_known(self):
+        reviewer, client = self._reviewer()
+        pr = client.get_repo.return_value.get_pull.return_value
+        pr.changed_files = 250
+        pr.body = "Closes #3"
+        pages = {
+            0: [self._file(f"p0_{i}.py") for i in range(100)],
+            1: [self._file(f"p1_{i}.py") for i in range(100)],
+            2: [self._file(f"p2_{i}.py") for i in range(50)],
+        }
+
+        with patch.object(
+            reviewer, "_get_files_page", side_effect=lambda r, n, page: pages[page]
+        ) as get_page:
+            details = reviewer.get_pr_details("owner/repo", 5)
+
+        assert sorted(c.args[2] for c in get_page.call_args_list) == [0, 1, 2]
+        assert len(details.files) == 250
+        assert details.files[0].filename == "p0_0.py"
+        assert details.files[-1].filename == "p2_49.py"
+        assert details.linked_issue == 3
+        reviewer.close()
+
+
 # ---------------------------------------------------------------------------
 # llm_review.py — LLMReviewer parsing
 # ---------------------------------------------------------------------------
@@ -721,6 +880,175 @@ class TestLLMReviewerReviewPR:
         assert "LLM down" in result.issues[0]
 
 
+def _hunks(count, lines_per_hunk):
+    hunks = []
+    for h in range(count):
+        hunks.append(f"@@ -{h * 10},3 +{h * 10},3 @@")
+        hunks.extend(f"+h{h}l{i}" for i in range(lines_per_hunk - 1))
+    return "\n".join(hunks)
+
+
+def _pr_with_files(*files):
+    return PRDetails(
+        repo="owner/repo",
+        number=1,
+        title="Big PR",
+        body="",
+        author="dev",
+        base_branch="main",
+        head_branch="feat/x",
+        created_at=datetime(2026, 1, 1),
+        files=list(files),
+    )
+
+
+class TestSplitDiff:
+    def test_small_files_packed_into_one_chunk(self):
+        pr = _pr_with_files(
+            FileChange("a.py", "modified", 1, 0, patch="+a"),
+            FileChange("b.py", "modified", 1, 0, patch="+b"),
+        )
+        chunks = split_diff(pr, max_lines=100)
+        assert len(chunks) == 1
+        assert chunks[0].paths == ["a.py", "b.py"]
+
+    def test_large_file_split_at_hunks(self):
+        pr = _pr_with_files(
+            FileChange("big.py", "modified", 60, 0, patch=_hunks(6, 10))
+        )
+        chunks = split_diff(pr, max_lines=25)
+        assert [c.line_count for c in chunks] == [20, 20, 20]
+        assert all(c.sections[0][1].startswith("@@") for c in chunks)
+
+    def test_every_line_covered(self):
+        patch = _hunks(3, 40)  # single hunks exceed the limit
+        pr = _pr_with_files(FileChange("big.py", "modified", 120, 0, patch=patch))
+        chunks = split_diff(pr, max_lines=30)
+        assert all(c.line_count <= 30 for c in chunks)
+        rejoined = "\n".join(p for c in chunks for _, p in c.sections)
+        assert rejoined == patch
+
+    def test_files_without_patch_skipped(self):
+        pr = _pr_with_files(FileChange("img.png", "added", 0, 0))
+        assert split_diff(pr) == []
+
+
+class TestMergeReviews:
+    def test_strictest_decision_and_weighted_confidence(self):
+        pr = _pr_with_files(
+            FileChange("a.py", "modified", 30, 0, patch=_hunks(1, 30)),
+            FileChange("b.py", "modified", 10, 0, patch=_hunks(1, 10)),
+        )
+        chunks = split_diff(pr, max_lines=30)
+        results = [
+            ReviewResult(ReviewDecision.APPROVE, "a fine", confidence=0.9),
+            ReviewResult(
+                ReviewDecision.REQUEST_CHANGES,
+                "b buggy",
+                confidence=0.5,
+                issues=["bug in b"],
+            ),
+        ]
+
+        merged = merge_reviews(chunks, results)
+
+        assert merged.decision == ReviewDecision.REQUEST_CHANGES
+        assert merged.confidence == pytest.approx((30 * 0.9 + 10 * 0.5) / 40)
+        assert merged.issues == ["bug in b"]
+        assert "`a.py`: a fine" in merged.summary
+
+    def test_inline_comments_merged_and_filtered(self):
+        pr = _pr_with_files(
+            FileChange("a.py", "modified", 5, 0, patch=_hunks(1, 5)),
+            FileChange("b.py", "modified", 5, 0, patch=_hunks(1, 5)),
+        )
+        chunks = split_diff(pr, max_lines=5)
+        results = [
+            ReviewResult(
+                ReviewDecision.COMMENT,
+                "a",
+                inline_comments=[
+                    InlineComment("a.py", 3, "nit"),
+                    InlineComment("a.py", 3, "nit"),
+                    InlineComment("zzz.py", 1, "hallucinated"),
+                ],
+            ),
+            ReviewResult(
+                ReviewDecision.APPROVE,
+                "b",
+                inline_comments=[InlineComment("b.py", 1, "ok")],
+            ),
+        ]
+
+        merged = merge_reviews(chunks, results)
+
+        assert merged.decision == ReviewDecision.COMMENT
+        assert [(c.path, c.line) for c in merged.inline_comments] == [
+            ("a.py", 3),
+            ("b.py", 1),
+        ]
+
+
+class TestLLMReviewerChunkedReview:
+    def test_large_pr_reviewed_in_parallel_chunks(self):
+        with patch("nebulus_swarm.reviewer.llm_review.OpenAI") as mock_openai:
+            mock_client = mock_openai.return_value
+
+            def respond(**kwargs):
+                prompt = kwargs["messages"][1]["content"]
+                path = "a.py" if "### a.py" in prompt else "b.py"
+                response = MagicMock()
+                response.choices[0].message.content = json.dumps(
+                    {
+                        "decision": "APPROVE",
+                        "confidence": 0.9,
+                        "summary": f"{path} ok",
+                        "inline_comments": [{"path": path, "line": 2, "body": "x"}],
+                    }
+                )
+                return response
+
+            mock_client.chat.completions.create.side_effect = respond
+            reviewer = LLMReviewer(
+                base_url="http://localhost:5000/v1", model="test-model"
+            )
+            pr = _pr_with_files(
+                FileChange("a.py", "modified", 40, 0, patch=_hunks(1, 40)),
+                FileChange("b.py", "modified", 40, 0, patch=_hunks(1, 40)),
+            )
+
+            result = reviewer.review_pr(pr, max_diff_lines=50)
+
+        assert mock_client.chat.completions.create.call_count == 2
+        assert result.decision == ReviewDecision.APPROVE
+        assert {c.path for c in result.inline_comments} == {"a.py", "b.py"}
+        assert "part 1 of 2" in str(mock_client.chat.completions.create.call_args_list)
+
+    def test_failed_chunk_lowers_confidence(self):
+        with patch("nebulus_swarm.reviewer.llm_review.OpenAI") as mock_openai:
+            ok = MagicMock()
+            ok.choices[0].message.content = json.dumps(
+                {"decision": "APPROVE", "confidence": 1.0, "summary": "ok"}
+            )
+            mock_openai.return_value.chat.completions.create.side_effect = [
+                ok,
+                Exception("LLM down"),
+            ]
+            reviewer = LLMReviewer(
+                base_url="http://localhost:5000/v1", model="test-model", max_workers=1
+            )
+            pr = _pr_with_files(
+                FileChange("a.py", "modified", 40, 0, patch=_hunks(1, 40)),
+                FileChange("b.py", "modified", 40, 0, patch=_hunks(1, 40)),
+            )
+
+            result = reviewer.review_pr(pr, max_diff_lines=50)
+
+        assert result.decision == ReviewDecision.COMMENT
+        assert result.confidence == pytest.approx(0.5)
+        assert not result.can_auto_merge
+
+
 class TestAnalyzeSpecificFile:
     def test_analyze_success(self):
         with patch("nebulus_swarm.reviewer.llm_review.OpenAI") as mock_openai:
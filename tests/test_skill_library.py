@@ -54,3 +54,85 @@ def test_load_global_skill(temp_dirs):
         # Execute
         result = service.execute_skill("global.global_func", {})
         assert result == "world"
+
+
+def _age(path, seconds=60):
+    """Backdates a file so its mtime is outside the re-hash window."""
+    import os
+    import time
+
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_skill_module_imported_on_first_execution(temp_dirs):
+    local_dir, global_dir = temp_dirs
+    (global_dir / "lazy_skill.py").write_text(
+        "import sys\n"
+        "sys.lazy_skill_imports = getattr(sys, 'lazy_skill_imports', 0) + 1\n\n"
+        "def lazy_func(n: int, loud: bool = False):\n"
+        "    '''Doubles n.'''\n"
+        "    return n * 2\n"
+    )
+    import sys
+
+    service = SkillService(skills_dir=str(local_dir))
+    service.global_skills_dir = str(global_dir)
+    service.load_skills()
+
+    assert not hasattr(sys, "lazy_skill_imports")
+    (tool,) = service.get_tool_definitions()
+    assert tool["function"]["description"] == "Doubles n."
+    assert tool["function"]["parameters"]["properties"]["n"]["type"] == "integer"
+    assert tool["function"]["parameters"]["required"] == ["n"]
+
+    assert service.execute_skill("global.lazy_func", {"n": 4}) == "8"
+    assert service.execute_skill("global.lazy_func", {"n": 5}) == "10"
+    assert sys.lazy_skill_imports == 1
+    del sys.lazy_skill_imports
+
+
+def test_reload_parses_only_changed_files(temp_dirs):
+    local_dir, global_dir = temp_dirs
+    for n in range(3):
+        path = global_dir / f"skill_{n}.py"
+        path.write_text(f"def func_{n}():\n    return {n}\n")
+        _age(path)
+
+    service = SkillService(skills_dir=str(local_dir))
+    service.global_skills_dir = str(global_dir)
+    service.load_skills()
+    assert service.execute_skill("global.func_1", {}) == "1"
+
+    (global_dir / "skill_1.py").write_text("def func_1():\n    return 'new'\n")
+    import ast
+
+    with patch("nebulus_atom.services.skill_service.ast.parse", wraps=ast.parse) as p:
+        service.load_skills()
+
+    assert p.call_count == 1
+    assert service.execute_skill("global.func_1", {}) == "new"
+    assert len(service.get_tool_definitions()) == 3
+
+
+def test_tool_definitions_cached_on_disk(temp_dirs):
+    local_dir, global_dir = temp_dirs
+    path = global_dir / "cached_skill.py"
+    path.write_text("def cached_func(x):\n    return x\n")
+    _age(path)
+
+    first = SkillService(skills_dir=str(local_dir))
+    first.global_skills_dir = str(global_dir)
+    first.load_skills()
+
+    second = SkillService(skills_dir=str(local_dir))
+    second.global_skills_dir = str(global_dir)
+    with patch("nebulus_atom.services.skill_service.ast.parse") as p:
+        second.load_skills()
+
+    p.assert_not_called()
+    assert second.get_tool_definitions() == first.get_tool_definitions()
+
+    path.unlink()
+    second.load_skills()
+    assert second.skills == {}
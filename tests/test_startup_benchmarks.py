@@ -0,0 +1,107 @@
+"""Tests for the offline startup benchmark harness."""
+
+import json
+import urllib.request
+
+from benchmarks.startup import (
+    BASELINE_PATH,
+    BenchResult,
+    StubLLMServer,
+    find_regressions,
+    load_baselines,
+    measure_import,
+    parse_importtime,
+    save_baselines,
+)
+
+IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        300 |     json.decoder
+import time:       200 |        500 |   json
+import time:      1000 |       1700 | nebulus_atom.main
+some unrelated warning
+"""
+
+
+class TestParseImporttime:
+    """Tests for parse_importtime."""
+
+    def test_parses_records_and_depth(self):
+        records = parse_importtime(IMPORTTIME_SAMPLE)
+
+        assert [r.name for r in records] == [
+            "_io",
+            "json.decoder",
+            "json",
+            "nebulus_atom.main",
+        ]
+        assert [r.depth for r in records] == [1, 2, 1, 0]
+        assert records[-1].self_us == 1000
+        assert records[-1].cumulative_us == 1700
+
+    def test_measure_import_saves_tree(self, tmp_path):
+        out = tmp_path / "out"
+        out.mkdir()
+
+        seconds = measure_import("json", tmp_path, out)
+
+        assert 0 < seconds < 5
+        tree = (out / "importtime-json.txt").read_text()
+        assert any(r.name == "json" for r in parse_importtime(tree))
+
+
+class TestRegressions:
+    """Tests for baseline comparison."""
+
+    def test_needs_relative_and_absolute_slowdown(self):
+        baselines = {"a": 1.0, "b": 0.1, "c": 1.0}
+        results = {"a": 1.5, "b": 0.2, "c": 1.1, "new": 9.0}
+
+        regressions = find_regressions(
+            results, baselines, threshold=0.25, min_delta=0.2
+        )
+
+        # b doubled but only by 100ms; c is within 25%; new has no baseline
+        assert [r.name for r in regressions] == ["a"]
+        assert "+0.500s" in str(regressions[0])
+
+    def test_baselines_round_trip(self, tmp_path):
+        path = tmp_path / "baselines.json"
+        assert load_baselines(path) == {}
+
+        save_baselines({"a": 1.23456}, path)
+        save_baselines({"b": 2.0}, path)
+
+        assert load_baselines(path) == {"a": 1.2346, "b": 2.0}
+
+    def test_stored_baselines_are_well_formed(self):
+        baselines = load_baselines(BASELINE_PATH)
+
+        assert "minion:first-llm-call" in baselines
+        assert all(value > 0 for value in baselines.values())
+
+    def test_median(self):
+        assert BenchResult("x", [3.0, 1.0, 2.0]).median == 2.0
+
+
+class TestStubLLMServer:
+    """Tests for the stub LLM server."""
+
+    def test_records_first_request_and_completes_task(self):
+        with StubLLMServer() as stub:
+            request = urllib.request.Request(
+                f"{stub.base_url}/chat/completions",
+                data=json.dumps({"model": "bench", "messages": []}).encode(),
+                headers={"Content-Type": "application/json"},
+            )
+            with urllib.request.urlopen(request, timeout=5) as response:
+                body = json.load(response)
+
+            assert stub.first_request.is_set()
+            assert stub.first_request_at is not None
+            stub.reset()
+            assert not stub.first_request.is_set()
+
+        call = body["choices"][0]["message"]["tool_calls"][0]
+        assert call["function"]["name"] == "task_complete"
@@ -417,14 +417,135 @@ class TestGitHubQueue:
         """Test scanning when no issues are found."""
         from nebulus_swarm.overlord.github_queue import GitHubQueue
 
-        mock_repo = mock_github_class.return_value.get_repo.return_value
-        mock_repo.get_issues.return_value = []
+        requester = mock_github_class.return_value.requester
+        requester.requestJson.return_value = (200, {}, "[]")
 
         queue = GitHubQueue(token="test", watched_repos=["owner/repo"])
         issues = queue.scan_queue()
 
         assert issues == []
 
+    @patch("nebulus_swarm.overlord.github_queue.Github")
+    def test_scan_queue_conditional_request(self, mock_github_class):
+        """Test unchanged repos are served from cache via ETag."""
+        import json
+
+        from nebulus_swarm.overlord.github_queue import GitHubQueue
+
+        issue = {
+            "number": 7,
+            "title": "Fix bug",
+            "labels": [{"name": "nebulus-ready"}, {"name": "high-priority"}],
+            "created_at": "2026-01-01T00:00:00Z",
+            "body": None,
+        }
+        pr = dict(issue, number=8, pull_request={"url": "x"})
+        requester = mock_github_class.return_value.requester
+        requester.requestJson.side_effect = [
+            (200, {"ETag": '"abc"'}, json.dumps([issue, pr])),
+            (304, {"ETag": '"abc"'}, ""),
+        ]
+
+        queue = GitHubQueue(token="test", watched_repos=["owner/repo"])
+        first = queue.scan_queue()
+        assert [i.number for i in first] == [7]
+        assert first[0].priority == 1
+        assert [i.number for i in queue.last_delta.added] == [7]
+
+        second = queue.scan_queue()
+        assert [i.number for i in second] == [7]
+        assert queue.last_delta.is_empty
+        assert queue.requests_not_modified == 1
+        _, kwargs = requester.requestJson.call_args
+        assert kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+    @patch("nebulus_swarm.overlord.github_queue.Github")
+    def test_scan_changes_reports_removed(self, mock_github_class):
+        """Test scan_changes returns issues that left the queue."""
+        import json
+
+        from nebulus_swarm.overlord.github_queue import GitHubQueue
+
+        issue = {
+            "number": 7,
+            "title": "Fix bug",
+            "labels": [],
+            "created_at": "2026-01-01T00:00:00Z",
+        }
+        requester = mock_github_class.return_value.requester
+        requester.requestJson.side_effect = [
+            (200, {"ETag": '"a"'}, json.dumps([issue])),
+            (200, {"ETag": '"b"'}, "[]"),
+        ]
+
+        queue = GitHubQueue(token="test", watched_repos=["owner/repo"])
+        queue.scan_changes()
+        delta = queue.scan_changes()
+
+        assert [i.number for i in delta.removed] == [7]
+        assert delta.added == []
+
+    @patch("nebulus_swarm.overlord.github_queue.Github")
+    def test_scan_queue_follows_pagination(self, mock_github_class):
+        """Test additional pages are fetched via the Link header."""
+        import json
+
+        from nebulus_swarm.overlord.github_queue import GitHubQueue
+
+        def issue(number):
+            return {
+                "number": number,
+                "title": f"Issue {number}",
+                "labels": [],
+                "created_at": f"2026-01-0{number}T00:00:00Z",
+            }
+
+        link = '<https://api.github.com/repositories/1/issues?page=2>; rel="next"'
+        requester = mock_github_class.return_value.requester
+        requester.requestJson.side_effect = [
+            (200, {"Link": link}, json.dumps([issue(1)])),
+            (200, {}, json.dumps([issue(2)])),
+        ]
+
+        queue = GitHubQueue(token="test", watched_repos=["owner/repo"])
+        issues = queue.scan_queue()
+
+        assert [i.number for i in issues] == [1, 2]
+        assert requester.requestJson.call_count == 2
+
+    @patch("nebulus_swarm.overlord.github_queue.Github")
+    def test_multi_page_scan_is_not_conditional(self, mock_github_class):
+        """A 304 on page 1 cannot vouch for later pages, so refetch them."""
+        import json
+
+        from nebulus_swarm.overlord.github_queue import GitHubQueue
+
+        def issue(number):
+            return {
+                "number": number,
+                "title": f"Issue {number}",
+                "labels": [],
+                "created_at": f"2026-01-0{number}T00:00:00Z",
+            }
+
+        link = '<https://api.github.com/repositories/1/issues?page=2>; rel="next"'
+        requester = mock_github_class.return_value.requester
+        requester.requestJson.side_effect = [
+            (200, {"ETag": '"p1"', "Link": link}, json.dumps([issue(1)])),
+            (200, {}, json.dumps([issue(2)])),
+            (200, {"ETag": '"p1"', "Link": link}, json.dumps([issue(1)])),
+            (200, {}, json.dumps([issue(2), issue(3)])),
+        ]
+
+        queue = GitHubQueue(token="test", watched_repos=["owner/repo"])
+        queue.scan_queue()
+        issues = queue.scan_queue()
+
+        assert [i.number for i in issues] == [1, 2, 3]
+        assert [i.number for i in queue.last_delta.added] == [3]
+        first_page_call = requester.requestJson.call_args_list[2]
+        assert first_page_call.kwargs["headers"] == {}
+
     @patch("nebulus_swarm.overlord.github_queue.Github")
     def test_get_rate_limit(self, mock_github_class):
         """Test rate limit status retrieval."""
@@ -446,6 +567,26 @@ class TestGitHubQueue:
         assert "is_rate_limited" in rate_limit
         assert rate_limit["is_rate_limited"] is False  # 4500 > threshold
 
+    @patch("nebulus_swarm.overlord.github_queue.Github")
+    def test_mark_in_progress_fails_fast_when_budget_exhausted(self, mock_github_class):
+        """Label writes inside the reserve fail instead of waiting for reset."""
+        import time
+        from datetime import timedelta, timezone
+
+        from nebulus_swarm.overlord.github_queue import GitHubQueue
+
+        queue = GitHubQueue(token="test", watched_repos=["owner/repo"])
+        queue._api.budget.update(
+            remaining=10,
+            limit=5000,
+            reset_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+
+        started = time.monotonic()
+        assert queue.mark_in_progress("owner/repo", 7) is False
+        assert time.monotonic() - started < 1
+        mock_github_class.return_value.get_repo.return_value.get_issue.assert_not_called()
+
 
 class TestCronScheduler:
     """Tests for cron scheduling functionality."""
@@ -637,6 +778,28 @@ class TestRateLimiting:
         queue = GitHubQueue(token="test", watched_repos=["owner/repo"])
         assert queue.can_perform_sweep() is False
 
+    @patch("nebulus_swarm.overlord.github_queue.Github")
+    def test_can_perform_sweep_uses_response_headers(self, mock_github_class):
+        """Test quota from scan headers avoids a rate limit call."""
+        import time as time_module
+
+        from nebulus_swarm.overlord.github_queue import GitHubQueue
+
+        reset = str(int(time_module.time()) + 600)
+        requester = mock_github_class.return_value.requester
+        requester.requestJson.return_value = (
+            200,
+            {"ETag": '"a"', "X-RateLimit-Remaining": "150", "X-RateLimit-Reset": reset},
+            "[]",
+        )
+
+        queue = GitHubQueue(token="test", watched_repos=["owner/repo"])
+        queue.scan_queue()
+
+        # 150 covers the threshold plus one conditional request
+        assert queue.can_perform_sweep() is True
+        mock_github_class.return_value.get_rate_limit.assert_not_called()
+
 
 class TestLLMWarmup:
     """Tests for LLM warm-up functionality."""
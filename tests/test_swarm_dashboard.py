@@ -6,6 +6,7 @@ import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 # Mock slack_bolt before importing Overlord modules
 sys.modules.setdefault("slack_bolt", MagicMock())
@@ -152,6 +153,250 @@ class TestOverlordStateFilters:
         assert repos == []
 
 
+class TestOverlordStateHistoryPages:
+    """Tests for keyset-paginated work history and the cached repo list."""
+
+    def _make_state(self, db_path: str):
+        return TestOverlordStateFilters()._make_state(db_path)
+
+    def test_pages_walk_whole_history(self, tmp_path):
+        state = self._make_state(str(tmp_path / "test.db"))
+
+        seen, cursor = [], None
+        while True:
+            page = state.get_work_history_page(limit=2, cursor=cursor)
+            seen += [r["minion_id"] for r in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == ["m-5", "m-4", "m-3", "m-2", "m-1"]
+
+    def test_pages_break_completed_at_ties_by_id(self, tmp_path):
+        from nebulus_swarm.overlord.state import OverlordState
+
+        state = OverlordState(db_path=str(tmp_path / "test.db"))
+        conn = sqlite3.connect(str(tmp_path / "test.db"))
+        conn.executemany(
+            """INSERT INTO work_history
+               (minion_id, repo, issue_number, status, started_at, completed_at)
+               VALUES (?, 'o/r', 1, 'completed', '2026-01-01T00:00:00',
+                       '2026-01-01T01:00:00')""",
+            [(f"m-{n}",) for n in range(3)],
+        )
+        conn.commit()
+        conn.close()
+
+        first = state.get_work_history_page(limit=2)
+        second = state.get_work_history_page(limit=2, cursor=first["next_cursor"])
+
+        assert [r["minion_id"] for r in first["items"]] == ["m-2", "m-1"]
+        assert [r["minion_id"] for r in second["items"]] == ["m-0"]
+        assert second["next_cursor"] is None
+
+    def test_page_filters(self, tmp_path):
+        state = self._make_state(str(tmp_path / "test.db"))
+
+        page = state.get_work_history_page(repo="owner/repo-a", limit=1)
+        rest = state.get_work_history_page(
+            repo="owner/repo-a", limit=10, cursor=page["next_cursor"]
+        )
+
+        assert page["items"][0]["minion_id"] == "m-4"
+        assert [r["minion_id"] for r in rest["items"]] == ["m-2", "m-1"]
+
+    def test_invalid_cursor(self, tmp_path):
+        state = self._make_state(str(tmp_path / "test.db"))
+
+        with pytest.raises(ValueError):
+            state.get_work_history_page(cursor="not-a-cursor")
+
+    def test_pages_use_indexes(self, tmp_path):
+        state = self._make_state(str(tmp_path / "test.db"))
+        conn = sqlite3.connect(str(tmp_path / "test.db"))
+        plan = " ".join(
+            row[3]
+            for row in conn.execute(
+                """EXPLAIN QUERY PLAN SELECT * FROM work_history
+                   WHERE repo = ? AND (completed_at, id) < (?, ?)
+                   ORDER BY completed_at DESC, id DESC LIMIT 3""",
+                ("o/r", "2026-01-02", 3),
+            )
+        )
+        conn.close()
+
+        assert "idx_history_repo_completed" in plan
+        assert "TEMP B-TREE" not in plan
+        assert state.get_distinct_repos()
+
+    def test_repos_backfilled_on_upgrade(self, tmp_path):
+        from nebulus_swarm.overlord.state import OverlordState
+
+        db_path = str(tmp_path / "test.db")
+        self._make_state(db_path)
+        conn = sqlite3.connect(db_path)
+        conn.execute("DROP TABLE work_history_repos")
+        conn.close()
+
+        state = OverlordState(db_path=db_path)
+        assert state.get_distinct_repos() == ["owner/repo-a", "owner/repo-b"]
+
+
+class TestOverlordStateMetrics:
+    """Tests for SQL-side metrics and the daily rollups."""
+
+    def _make_state(self, db_path: str):
+        return TestOverlordStateFilters()._make_state(db_path)
+
+    def test_metrics_from_rollups(self, tmp_path):
+        state = self._make_state(str(tmp_path / "test.db"))
+
+        m = state.get_metrics()
+
+        assert (m["total"], m["completed"], m["failed"], m["timeout"]) == (5, 3, 1, 1)
+        assert m["median_duration"] == 480
+        assert (m["min_duration"], m["max_duration"]) == (180, 1800)
+        assert [d["date"] for d in m["daily_stats"]] == [
+            "2026-01-01",
+            "2026-01-02",
+            "2026-01-03",
+        ]
+        assert m["daily_stats"][0]["avg_duration"] == 240
+        assert m["error_types"]["git_error"]["count"] == 1
+        assert m["error_types"]["unknown"]["last_message"] == "No heartbeat"
+
+    def test_rollups_backfilled_on_upgrade(self, tmp_path):
+        from nebulus_swarm.overlord.state import OverlordState
+
+        db_path = str(tmp_path / "test.db")
+        expected = self._make_state(db_path).get_metrics()
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            """
+            DROP TABLE work_history_daily;
+            DROP TABLE work_history_daily_errors;
+            """
+        )
+        conn.close()
+
+        assert OverlordState(db_path=db_path).get_metrics() == expected
+
+    def test_record_completion_updates_rollups(self, tmp_path):
+        from datetime import datetime, timedelta
+
+        from nebulus_swarm.models.minion import Minion, MinionStatus
+        from nebulus_swarm.overlord.state import OverlordState
+
+        state = OverlordState(db_path=str(tmp_path / "test.db"))
+        minion = Minion(
+            id="m-9",
+            container_id="c",
+            repo="o/r",
+            issue_number=9,
+            status=MinionStatus.WORKING,
+            started_at=datetime.now() - timedelta(seconds=90),
+        )
+        state.record_completion(minion, MinionStatus.FAILED, error_message="oom: 4GB")
+
+        m = state.get_metrics(days=1)
+        assert m["failed"] == 1
+        assert m["error_types"] == {"oom": {"count": 1, "last_message": "oom: 4GB"}}
+
+    def test_time_range_counts_partial_first_day(self, tmp_path):
+        from datetime import datetime, timedelta
+
+        from nebulus_swarm.overlord.state import OverlordState
+
+        state = OverlordState(db_path=str(tmp_path / "test.db"))
+        now = datetime.now()
+        conn = sqlite3.connect(str(tmp_path / "test.db"))
+        for hours, status in ((1, "completed"), (47, "failed"), (49, "completed")):
+            at = (now - timedelta(hours=hours)).isoformat()
+            conn.execute(
+                """INSERT INTO work_history
+                   (minion_id, repo, issue_number, status, started_at,
+                    completed_at, duration_seconds)
+                   VALUES ('m', 'o/r', 1, ?, ?, ?, 60)""",
+                (status, at, at),
+            )
+        conn.commit()
+        conn.close()
+
+        m = state.get_metrics(days=2)
+        assert (m["total"], m["completed"], m["failed"]) == (2, 1, 1)
+        assert state.get_metrics()["total"] == 3
+
+    def test_no_row_cap(self, tmp_path):
+        from nebulus_swarm.overlord.state import OverlordState
+
+        state = OverlordState(db_path=str(tmp_path / "test.db"))
+        conn = sqlite3.connect(str(tmp_path / "test.db"))
+        conn.executemany(
+            """INSERT INTO work_history
+               (minion_id, repo, issue_number, status, started_at,
+                completed_at, duration_seconds)
+               VALUES ('m', 'o/r', ?, 'completed', '2026-01-01T00:00:00',
+                       '2026-01-01T01:00:00', ?)""",
+            [(n, n) for n in range(10050)],
+        )
+        conn.commit()
+        conn.close()
+
+        m = state.get_metrics()
+        assert m["total"] == 10050
+        assert m["median_duration"] == 5025
+
+    def test_median_matches_sorted_durations(self, tmp_path):
+        import random
+        from datetime import datetime, timedelta
+
+        from nebulus_swarm.overlord.state import OverlordState
+
+        db_path = str(tmp_path / "test.db")
+        state = OverlordState(db_path=db_path)
+        rng = random.Random(7)
+        now = datetime.now()
+        rows = []
+        for n in range(400):
+            at = (now - timedelta(hours=rng.uniform(0, 24 * 6))).isoformat()
+            duration = rng.choice([None, rng.randint(1, 50)])
+            rows.append((n, at, at, duration))
+        conn = sqlite3.connect(db_path)
+        conn.executemany(
+            """INSERT INTO work_history
+               (minion_id, repo, issue_number, status, started_at,
+                completed_at, duration_seconds)
+               VALUES ('m', 'o/r', ?, 'completed', ?, ?, ?)""",
+            rows,
+        )
+        conn.commit()
+        conn.close()
+
+        for days in (None, 1, 3):
+            cutoff = (now - timedelta(days=days)).isoformat() if days else ""
+            durations = sorted(
+                d for _, _, at, d in rows if d is not None and at >= cutoff
+            )
+            m = state.get_metrics(days=days)
+            assert m["median_duration"] == durations[len(durations) // 2]
+
+    def test_duration_histogram_backfilled_on_upgrade(self, tmp_path):
+        from nebulus_swarm.overlord.state import OverlordState
+
+        db_path = str(tmp_path / "test.db")
+        expected = self._make_state(db_path).get_metrics()
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            """
+            DROP TRIGGER work_history_daily_durations_insert;
+            DROP TABLE work_history_daily_durations;
+            """
+        )
+        conn.close()
+
+        assert OverlordState(db_path=db_path).get_metrics() == expected
+
+
 # ---------------------------------------------------------------------------
 # SwarmDataClient
 # ---------------------------------------------------------------------------
@@ -360,6 +605,57 @@ class TestSwarmDataClient:
         assert len(m["daily_stats"]) == 1
         assert "git_error" in m["error_types"]
 
+    def test_get_metrics_cached(self, tmp_path):
+        """get_metrics reuses results within the TTL."""
+        from nebulus_swarm.dashboard.data import SwarmDataClient
+
+        client = SwarmDataClient(state_db_path=str(tmp_path / "state.db"))
+        with (
+            patch(
+                "nebulus_swarm.dashboard.data.requests.get",
+                side_effect=requests.ConnectionError,
+            ),
+            patch.object(client.state, "get_metrics", return_value={"total": 1}) as get,
+        ):
+            client.get_metrics(days=7)
+            client.get_metrics(days=7)
+            client.get_metrics(days=30)
+
+        assert get.call_count == 2
+
+    @patch("nebulus_swarm.dashboard.data.requests.get")
+    def test_history_prefers_api(self, mock_get, tmp_path):
+        """History queries go to the Overlord API when it is reachable."""
+        from nebulus_swarm.dashboard.data import SwarmDataClient
+
+        mock_get.return_value.json.return_value = {
+            "items": [{"minion_id": "m-1"}],
+            "next_cursor": "2026-01-01T10:05:00|1",
+        }
+        client = SwarmDataClient(state_db_path=str(tmp_path / "missing" / "s.db"))
+
+        page = client.get_work_history_page(repo="o/r", limit=10)
+
+        assert page["next_cursor"] == "2026-01-01T10:05:00|1"
+        mock_get.assert_called_once_with(
+            "http://localhost:8080/history?repo=o%2Fr&limit=10", timeout=5
+        )
+        assert client._state is None
+
+    @patch("nebulus_swarm.dashboard.data.requests.get")
+    def test_history_falls_back_to_state(self, mock_get, tmp_path):
+        """History falls back to state.db when the Overlord is unreachable."""
+        from nebulus_swarm.dashboard.data import SwarmDataClient
+
+        mock_get.side_effect = requests.ConnectionError
+        db_path = str(tmp_path / "state.db")
+        TestOverlordStateFilters()._make_state(db_path)
+        client = SwarmDataClient(state_db_path=db_path)
+
+        assert len(client.get_work_history(limit=3)) == 3
+        assert client.get_distinct_repos() == ["owner/repo-a", "owner/repo-b"]
+        assert client.get_metrics()["total"] == 5
+
 
 # ---------------------------------------------------------------------------
 # Overlord: /queue endpoint and /status pending_questions
@@ -407,6 +703,56 @@ class TestOverlordQueueEndpoint:
         assert body["paused"] is True
 
 
+class TestOverlordHistoryEndpoints:
+    """Tests for the Overlord /history, /history/repos and /metrics endpoints."""
+
+    def _overlord(self, tmp_path):
+        from nebulus_swarm.overlord.main import Overlord
+
+        with patch.object(Overlord, "__init__", lambda self, *a, **kw: None):
+            overlord = Overlord.__new__(Overlord)
+            overlord.state = TestOverlordStateFilters()._make_state(
+                str(tmp_path / "state.db")
+            )
+        return overlord
+
+    @pytest.mark.asyncio
+    async def test_history_pages(self, tmp_path):
+        overlord = self._overlord(tmp_path)
+
+        request = MagicMock()
+        request.query = {"status": "completed", "limit": "2"}
+        body = json.loads((await overlord._history_handler(request)).body)
+        request.query = {"status": "completed", "cursor": body["next_cursor"]}
+        rest = json.loads((await overlord._history_handler(request)).body)
+
+        assert [r["minion_id"] for r in body["items"]] == ["m-5", "m-3"]
+        assert [r["minion_id"] for r in rest["items"]] == ["m-1"]
+        assert rest["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_history_bad_cursor(self, tmp_path):
+        overlord = self._overlord(tmp_path)
+
+        request = MagicMock()
+        request.query = {"cursor": "garbage"}
+        response = await overlord._history_handler(request)
+
+        assert response.status == 400
+
+    @pytest.mark.asyncio
+    async def test_repos_and_metrics(self, tmp_path):
+        overlord = self._overlord(tmp_path)
+
+        request = MagicMock()
+        request.query = {}
+        repos = json.loads((await overlord._history_repos_handler(request)).body)
+        metrics = json.loads((await overlord._metrics_handler(request)).body)
+
+        assert repos == {"repos": ["owner/repo-a", "owner/repo-b"]}
+        assert metrics["total"] == 5
+
+
 class TestOverlordStatusPendingQuestions:
     """Tests for pending_questions in /status response."""
 
@@ -0,0 +1,277 @@
+"""Tests for GitHub webhook intake."""
+
+import asyncio
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from nebulus_swarm.overlord.github_queue import GitHubQueue
+from nebulus_swarm.overlord.webhooks import (
+    DeliveryLog,
+    parse_event,
+    sign_payload,
+    verify_signature,
+)
+
+# Mock slack_bolt before importing Overlord modules (not installed in dev env)
+sys.modules.setdefault("slack_bolt", MagicMock())
+sys.modules.setdefault("slack_bolt.adapter", MagicMock())
+sys.modules.setdefault("slack_bolt.adapter.socket_mode", MagicMock())
+sys.modules.setdefault("slack_bolt.adapter.socket_mode.async_handler", MagicMock())
+sys.modules.setdefault("slack_bolt.async_app", MagicMock())
+
+SECRET = "s3cret"
+
+
+def _issue(number=7, labels=("nebulus-ready",), state="open"):
+    return {
+        "number": number,
+        "title": "Fix bug",
+        "body": "",
+        "state": state,
+        "labels": [{"name": name} for name in labels],
+        "created_at": "2026-01-01T00:00:00Z",
+    }
+
+
+def _issues_payload(action="labeled", **issue_kwargs):
+    return {
+        "action": action,
+        "repository": {"full_name": "owner/repo"},
+        "issue": _issue(**issue_kwargs),
+    }
+
+
+class TestSignature:
+    """Tests for HMAC verification."""
+
+    def test_valid_signature(self):
+        body = b'{"a": 1}'
+        assert verify_signature(SECRET, body, sign_payload(SECRET, body))
+
+    def test_tampered_body_rejected(self):
+        signature = sign_payload(SECRET, b'{"a": 1}')
+        assert not verify_signature(SECRET, b'{"a": 2}', signature)
+
+    def test_missing_secret_or_signature_rejected(self):
+        body = b"{}"
+        assert not verify_signature("", body, sign_payload("", body))
+        assert not verify_signature(SECRET, body, None)
+
+
+class TestParseEvent:
+    """Tests for parse_event."""
+
+    def test_issue_event(self):
+        event = parse_event("issues", _issues_payload(), "d-1")
+        assert event.repo == "owner/repo"
+        assert event.number == 7
+        assert event.action == "labeled"
+        assert event.item["title"] == "Fix bug"
+
+    def test_pull_request_head_ref(self):
+        payload = {
+            "action": "opened",
+            "repository": {"full_name": "owner/repo"},
+            "pull_request": {"number": 3, "head": {"ref": "feature/x"}},
+        }
+        event = parse_event("pull_request", payload)
+        assert event.number == 3
+        assert event.head_ref == "feature/x"
+
+    def test_unsupported_event(self):
+        assert parse_event("star", {}) is None
+
+    def test_delivery_log_drops_redeliveries(self):
+        log = DeliveryLog(size=2)
+        assert log.seen("a") is False
+        assert log.seen("a") is True
+        log.seen("b")
+        log.seen("c")
+        assert log.seen("a") is False
+
+
+@patch("nebulus_swarm.overlord.github_queue.Github")
+class TestApplyIssueEvent:
+    """Tests for GitHubQueue.apply_issue_event."""
+
+    def test_labeled_issue_added(self, mock_github_class):
+        queue = GitHubQueue(token="t", watched_repos=["owner/repo"])
+
+        delta = queue.apply_issue_event("owner/repo", "labeled", _issue())
+
+        assert [i.number for i in delta.added] == [7]
+        assert [i.number for i in queue.cached_queue()] == [7]
+
+    def test_closed_issue_removed(self, mock_github_class):
+        queue = GitHubQueue(token="t", watched_repos=["owner/repo"])
+        queue.apply_issue_event("owner/repo", "labeled", _issue())
+
+        delta = queue.apply_issue_event("owner/repo", "closed", _issue(state="closed"))
+
+        assert [i.number for i in delta.removed] == [7]
+        assert queue.cached_queue() == []
+
+    def test_in_progress_label_removes(self, mock_github_class):
+        queue = GitHubQueue(token="t", watched_repos=["owner/repo"])
+        queue.apply_issue_event("owner/repo", "labeled", _issue())
+
+        delta = queue.apply_issue_event(
+            "owner/repo", "labeled", _issue(labels=("nebulus-ready", "in-progress"))
+        )
+
+        assert len(delta.removed) == 1
+
+    def test_unwatched_repo_ignored(self, mock_github_class):
+        queue = GitHubQueue(token="t", watched_repos=["owner/repo"])
+
+        delta = queue.apply_issue_event("other/repo", "labeled", _issue())
+
+        assert delta.is_empty
+        assert queue.cached_queue() == []
+
+    def test_event_during_scan_survives(self, mock_github_class):
+        fetching = threading.Event()
+        release = threading.Event()
+
+        def request_json(*args, **kwargs):
+            fetching.set()
+            assert release.wait(5)
+            # The scan read issue 7 before the webhook labeled issue 8
+            return 200, {"ETag": '"a"'}, json.dumps([_issue(7)])
+
+        requester = mock_github_class.return_value.requester
+        requester.requestJson.side_effect = request_json
+        queue = GitHubQueue(token="t", watched_repos=["owner/repo"])
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            scan = pool.submit(queue.scan_with_delta)
+            assert fetching.wait(5)
+            event_delta = queue.apply_issue_event("owner/repo", "labeled", _issue(8))
+            release.set()
+            issues, scan_delta = scan.result(timeout=5)
+
+        assert [i.number for i in event_delta.added] == [8]
+        assert sorted(i.number for i in issues) == [7, 8]
+        assert sorted(i.number for i in queue.cached_queue()) == [7, 8]
+        # Issue 8 was reported by the webhook, not again by the scan
+        assert [i.number for i in scan_delta.added] == [7]
+
+
+class TestWebhookHandler:
+    """Tests for Overlord._webhook_handler."""
+
+    def _overlord(self):
+        from nebulus_swarm.overlord.main import Overlord
+
+        with patch.object(Overlord, "__init__", lambda self, *a, **kw: None):
+            overlord = Overlord.__new__(Overlord)
+        overlord.config = SimpleNamespace(
+            webhook=SimpleNamespace(secret=SECRET),
+            reviewer=SimpleNamespace(auto_review=True),
+        )
+        overlord._webhook_deliveries = DeliveryLog()
+        overlord._paused = False
+        overlord._reviewer = MagicMock()
+        overlord._last_queue_scan = []
+        overlord._dispatch_issues = AsyncMock(return_value=1)
+        overlord._run_review_async = AsyncMock()
+        with patch("nebulus_swarm.overlord.github_queue.Github"):
+            overlord.github_queue = GitHubQueue(token="t", watched_repos=["owner/repo"])
+        return overlord
+
+    def _request(self, event, payload, secret=SECRET, delivery="d-1"):
+        body = json.dumps(payload).encode()
+        request = MagicMock()
+        request.read = AsyncMock(return_value=body)
+        request.headers = {
+            "X-GitHub-Event": event,
+            "X-GitHub-Delivery": delivery,
+            "X-Hub-Signature-256": sign_payload(secret, body),
+        }
+        return request
+
+    @pytest.mark.asyncio
+    async def test_bad_signature_rejected(self):
+        overlord = self._overlord()
+        request = self._request("issues", _issues_payload(), secret="wrong")
+
+        response = await overlord._webhook_handler(request)
+
+        assert response.status == 401
+
+    @pytest.mark.asyncio
+    async def test_ready_issue_dispatched(self):
+        overlord = self._overlord()
+
+        response = await overlord._webhook_handler(
+            self._request("issues", _issues_payload())
+        )
+        await asyncio.sleep(0)
+
+        assert response.status == 202
+        overlord._dispatch_issues.assert_awaited_once()
+        issues = overlord._dispatch_issues.await_args.args[0]
+        assert [i.number for i in issues] == [7]
+        assert overlord._last_queue_scan[0]["number"] == 7
+
+    @pytest.mark.asyncio
+    async def test_dispatch_failure_is_logged(self, caplog):
+        overlord = self._overlord()
+        overlord._dispatch_issues.side_effect = RuntimeError("docker down")
+
+        await overlord._webhook_handler(self._request("issues", _issues_payload()))
+        await asyncio.sleep(0)
+
+        assert "Webhook dispatch failed: docker down" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_paused_does_not_dispatch(self):
+        overlord = self._overlord()
+        overlord._paused = True
+
+        await overlord._webhook_handler(self._request("issues", _issues_payload()))
+
+        overlord._dispatch_issues.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_delivery_ignored(self):
+        overlord = self._overlord()
+        request = self._request("issues", _issues_payload())
+
+        await overlord._webhook_handler(request)
+        response = await overlord._webhook_handler(request)
+
+        assert json.loads(response.body)["duplicate"] is True
+
+    @pytest.mark.asyncio
+    async def test_external_pr_reviewed(self):
+        overlord = self._overlord()
+        payload = {
+            "action": "opened",
+            "repository": {"full_name": "owner/repo"},
+            "pull_request": {"number": 3, "head": {"ref": "feature/x"}},
+        }
+
+        await overlord._webhook_handler(self._request("pull_request", payload))
+        await asyncio.sleep(0)
+
+        overlord._run_review_async.assert_awaited_once_with("owner/repo", 3)
+
+    @pytest.mark.asyncio
+    async def test_minion_pr_not_reviewed_twice(self):
+        overlord = self._overlord()
+        payload = {
+            "action": "opened",
+            "repository": {"full_name": "owner/repo"},
+            "pull_request": {"number": 3, "head": {"ref": "minion/issue-7"}},
+        }
+
+        await overlord._webhook_handler(self._request("pull_request", payload))
+
+        overlord._run_review_async.assert_not_called()
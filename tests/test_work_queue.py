@@ -10,6 +10,7 @@ import pytest
 
 from nebulus_swarm.overlord.work_queue import (
     DispatchResultRecord,
+    GitHubIssueRecord,
     TRANSITIONS,
     WorkQueue,
 )
@@ -427,6 +428,91 @@ class TestUpsertFromGithub:
         assert task.title == "Updated title"
 
 
+class TestBulkUpsertFromGithub:
+    """Tests for single-transaction GitHub upserts."""
+
+    def _record(self, number: str, title: str = "Task") -> GitHubIssueRecord:
+        return GitHubIssueRecord(
+            external_id=number,
+            external_source="github:org/repo",
+            title=title,
+            project="proj",
+        )
+
+    def test_inserts_and_updates(self, queue: WorkQueue) -> None:
+        existing_id, _ = queue.upsert_from_github("1", "github:org/repo", "Old", "proj")
+
+        result = queue.bulk_upsert_from_github(
+            [self._record("1", "New"), self._record("2")]
+        )
+
+        assert result.updated_ids == [existing_id]
+        assert len(result.new_ids) == 1
+        assert queue.get_task(existing_id).title == "New"
+        assert queue.get_task(result.new_ids[0]).status == "backlog"
+
+    def test_preserves_status(self, queue: WorkQueue) -> None:
+        task_id, _ = queue.upsert_from_github("1", "github:org/repo", "Task", "proj")
+        queue.transition(task_id, "active", "user")
+
+        queue.bulk_upsert_from_github([self._record("1", "Renamed")])
+
+        task = queue.get_task(task_id)
+        assert task.status == "active"
+        assert task.title == "Renamed"
+
+    def test_reconciles_missing_backlog_tasks(self, queue: WorkQueue) -> None:
+        gone_id, _ = queue.upsert_from_github("1", "github:org/repo", "Gone", "proj")
+        active_id, _ = queue.upsert_from_github("2", "github:org/repo", "Busy", "proj")
+        queue.transition(active_id, "active", "user")
+        other_id, _ = queue.upsert_from_github("3", "github:org/other", "X", "proj")
+
+        result = queue.bulk_upsert_from_github(
+            [], reconcile_sources=["github:org/repo"]
+        )
+
+        assert result.closed_ids == [gone_id]
+        assert queue.get_task(gone_id).status == "failed"
+        assert queue.get_task(active_id).status == "active"
+        assert queue.get_task(other_id).status == "backlog"
+        log = queue.get_task_log(gone_id)
+        assert log[-1].changed_by == "github-sync"
+
+    def test_relabeled_issue_returns_to_backlog(self, queue: WorkQueue) -> None:
+        task_id, _ = queue.upsert_from_github("1", "github:org/repo", "T", "proj")
+        queue.bulk_upsert_from_github([], reconcile_sources=["github:org/repo"])
+        assert queue.get_task(task_id).status == "failed"
+
+        result = queue.bulk_upsert_from_github(
+            [self._record("1")], reconcile_sources=["github:org/repo"]
+        )
+
+        assert result.reopened_ids == [task_id]
+        task = queue.get_task(task_id)
+        assert task.status == "backlog"
+        assert task.retry_count == 0
+        assert queue.get_task_log(task_id)[-1].new_status == "backlog"
+
+    def test_genuine_failure_not_reopened(self, queue: WorkQueue) -> None:
+        task_id, _ = queue.upsert_from_github("1", "github:org/repo", "T", "proj")
+        queue.transition(task_id, "failed", "minion", reason="tests failed")
+
+        result = queue.bulk_upsert_from_github(
+            [self._record("1")], reconcile_sources=["github:org/repo"]
+        )
+
+        assert result.reopened_ids == []
+        assert queue.get_task(task_id).status == "failed"
+
+    def test_no_reconcile_without_sources(self, queue: WorkQueue) -> None:
+        task_id, _ = queue.upsert_from_github("1", "github:org/repo", "Task", "proj")
+
+        result = queue.bulk_upsert_from_github([self._record("2")])
+
+        assert result.closed_ids == []
+        assert queue.get_task(task_id).status == "backlog"
+
+
 class TestTaskLog:
     """Tests for task audit log."""
 